@@ -0,0 +1,4 @@
+from exls.runtime.client import main
+
+if __name__ == "__main__":
+    main()
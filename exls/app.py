@@ -1,68 +1,69 @@
 import logging
+import time
 from importlib.metadata import version
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
 
 import typer
 
 from exls import config as cli_config
-from exls.auth.adapters.bundle import AuthBundle
-from exls.auth.adapters.ui.display.display import IOAuthFacade
-from exls.auth.app import login, logout
-from exls.auth.core.domain import AuthSession
-from exls.auth.core.service import AuthService, NotLoggedInWarning
-from exls.clusters.app import clusters_app
 from exls.logging import setup_logging
-from exls.management.app import management_app
-from exls.nodes.app import nodes_app
+from exls.profiling import Profiler, enable_profiling, profile_span
+from exls.shared.adapters.ui.lazy import LazySubcommand, LazyTyperGroup
 from exls.shared.adapters.ui.output.values import OutputFormat
-from exls.shared.adapters.ui.utils import (
-    get_app_state_from_ctx,
-    get_config_from_ctx,
-    help_if_no_subcommand,
-)
-from exls.shared.core.exceptions import ServiceError
+from exls.shared.adapters.ui.utils import help_if_no_subcommand
 from exls.state import AppState
-from exls.workspaces.app import workspaces_app
 
-NON_AUTH_COMMANDS = ["login", "logout"]
+if TYPE_CHECKING:
+    from exls.auth.adapters.bundle import AuthBundle
 
+NON_AUTH_COMMANDS = ["login", "logout", "daemon"]
 
-def _get_bundle(ctx: typer.Context) -> AuthBundle:
-    """Helper to instantiate the AuthBundle from the context."""
-    return AuthBundle(get_config_from_ctx(ctx), get_app_state_from_ctx(ctx))
-
-
-app = typer.Typer()
-
-# We add the login, logout, and request_node_agent_tokens commands to the root app to
-# use them without a subcommand.
-app.command()(login)
-app.command()(logout)
 
+def _get_bundle(ctx: typer.Context) -> "AuthBundle":
+    """Helper to instantiate the AuthBundle from the context."""
+    from exls.auth.adapters.bundle import AuthBundle
+    from exls.shared.adapters.ui.utils import (
+        get_app_state_from_ctx,
+        get_config_from_ctx,
+    )
 
-app.add_typer(
-    nodes_app,
-    name="nodes",
-    help="Manage nodes",
-)
-
-app.add_typer(
-    clusters_app,
-    name="clusters",
-    help="Manage clusters",
-)
+    return AuthBundle(get_config_from_ctx(ctx), get_app_state_from_ctx(ctx))
 
-app.add_typer(
-    workspaces_app,
-    name="workspaces",
-    help="Manage workspaces",
-)
 
-app.add_typer(
-    management_app,
-    name="management",
-    help="Manage SSH keys and monitoring",
-)
+class ExlsRootGroup(LazyTyperGroup):
+    """The root command group; subcommands are imported only when invoked."""
+
+    lazy_subcommands = {
+        # We add the login and logout commands to the root app to use them
+        # without a subcommand.
+        "login": LazySubcommand(import_path="exls.auth.app:login"),
+        "logout": LazySubcommand(import_path="exls.auth.app:logout"),
+        "nodes": LazySubcommand(
+            import_path="exls.nodes.app:nodes_app",
+            help="Manage nodes",
+        ),
+        "clusters": LazySubcommand(
+            import_path="exls.clusters.app:clusters_app",
+            help="Manage clusters",
+        ),
+        "workspaces": LazySubcommand(
+            import_path="exls.workspaces.app:workspaces_app",
+            help="Manage workspaces",
+        ),
+        "management": LazySubcommand(
+            import_path="exls.management.app:management_app",
+            help="Manage SSH keys and monitoring",
+        ),
+        "batch": LazySubcommand(import_path="exls.runtime.app:batch"),
+        "daemon": LazySubcommand(
+            import_path="exls.runtime.app:daemon_app",
+            help="Manage a background process that serves exls invocations",
+        ),
+    }
+
+
+app = typer.Typer(cls=ExlsRootGroup)
 
 
 def _version_callback(value: bool) -> None:
@@ -71,6 +72,24 @@ def _version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def _emit_profile(
+    profiler: Profiler,
+    command_name: Optional[str],
+    command_start: float,
+    profile_output: Optional[Path],
+) -> Callable[[], None]:
+    def _emit() -> None:
+        profiler.record(
+            command_name or "exls", "command", command_start, time.perf_counter()
+        )
+        if profile_output:
+            profiler.write_json(profile_output)
+        else:
+            typer.echo(profiler.render_waterfall(), err=True)
+
+    return _emit
+
+
 @app.callback(invoke_without_command=True)
 def __root(  # pyright: ignore[reportUnusedFunction]
     ctx: typer.Context,
@@ -97,31 +116,108 @@ def __root(  # pyright: ignore[reportUnusedFunction]
         "--format",
         help=f"Set the output format ({', '.join([f.value for f in OutputFormat])}).",
     ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        envvar="EXLS_PROFILE",
+        help="Time the startup phases, API calls and rendering and print a waterfall to stderr at exit.",
+    ),
+    profile_output: Optional[Path] = typer.Option(
+        None,
+        "--profile-output",
+        envvar="EXLS_PROFILE_OUTPUT",
+        help="Write the profile as JSON to this file instead of printing it. Implies --profile.",
+    ),
+    trace_http: Optional[Path] = typer.Option(
+        None,
+        "--trace-http",
+        envvar="EXLS_TRACE_HTTP",
+        help="Record the timings of all HTTP calls and write them as a Chrome trace (Perfetto) to this file.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        envvar="EXLS_NO_CACHE",
+        help="Do not use or update the on-disk cache of list responses, if it is enabled in the config (http.cache_enabled).",
+    ),
+    max_age: Optional[int] = typer.Option(
+        None,
+        "--max-age",
+        min=0,
+        help="Use cached list responses younger than this many seconds without asking the backend.",
+    ),
 ):
     """
     exalsius CLI - A tool for distributed training and infrastructure management
     """
-    setup_logging(log_level, log_file)
-    logging.debug(f"Set log level to {log_level}")
+    # Invocations that run inside another one (e.g. the lines of `exls batch`)
+    # inherit its state, including the logging setup and the access token.
+    inherited_state: Optional[AppState] = (
+        ctx.obj if isinstance(ctx.obj, AppState) else None
+    )
 
-    config: cli_config.AppConfig = cli_config.load_config()
+    profiler: Optional[Profiler] = (
+        enable_profiling() if profile or profile_output else None
+    )
+
+    if inherited_state is None:
+        with profile_span("setup logging"):
+            setup_logging(log_level, log_file)
+        logging.debug(f"Set log level to {log_level}")
+
+    with profile_span("load config"):
+        config: cli_config.AppConfig = (
+            inherited_state.config if inherited_state else cli_config.load_config()
+        )
     logging.debug(f"Loaded config: {config}")
 
+    if inherited_state is None:
+        from exls.shared.adapters import memo, retry
+
+        # The lines of a batch share the retry budget and the read memo of
+        # the batch.
+        retry.start_invocation(config.http.max_retries, config.http.retry_budget)
+        ctx.call_on_close(retry.log_retry_counters)
+        memo.start_invocation()
+        ctx.call_on_close(memo.finish_invocation)
+
+        if trace_http:
+            from exls.shared.adapters import http_trace
+
+            http_trace.start_recording()
+            ctx.call_on_close(lambda: http_trace.finish_recording(trace_http))
+
+    if profiler:
+        ctx.call_on_close(
+            _emit_profile(
+                profiler, ctx.invoked_subcommand, time.perf_counter(), profile_output
+            )
+        )
+
     help_if_no_subcommand(ctx)
 
     ctx.obj = AppState(
         config=config,
-        access_token=None,
+        access_token=inherited_state.access_token if inherited_state else None,
         message_output_format=format,
         object_output_format=format,
+        no_cache=no_cache,
+        cache_max_age_seconds=max_age,
     )
 
-    if ctx.invoked_subcommand not in NON_AUTH_COMMANDS:
-        bundle: AuthBundle = _get_bundle(ctx)
-        auth_service: AuthService = bundle.get_auth_service()
-        io_facade: IOAuthFacade = bundle.get_io_facade()
+    if ctx.invoked_subcommand not in NON_AUTH_COMMANDS and not ctx.obj.access_token:
+        from exls.auth.adapters.ui.display.display import IOAuthFacade
+        from exls.auth.core.domain import AuthSession
+        from exls.auth.core.service import AuthService, NotLoggedInWarning
+        from exls.shared.core.exceptions import ServiceError
+
+        with profile_span("construct auth bundle"):
+            bundle: AuthBundle = _get_bundle(ctx)
+            auth_service: AuthService = bundle.get_auth_service()
+            io_facade: IOAuthFacade = bundle.get_io_facade()
         try:
-            auth_session: AuthSession = auth_service.acquire_access_token()
+            with profile_span("acquire access token"):
+                auth_session: AuthSession = auth_service.acquire_access_token()
         except NotLoggedInWarning:
             io_facade.display_info_message(
                 "You are not logged in. Please log in.",
@@ -136,15 +232,10 @@ def __root(  # pyright: ignore[reportUnusedFunction]
             raise typer.Exit(1)
         # Set the access token in the context object
         ctx.obj.access_token = auth_session.token.access_token
-    else:
-        ctx.obj = AppState(
-            config=config,
-            access_token=None,
-            message_output_format=format,
-            object_output_format=format,
-        )
     logging.debug(f"Using config: {ctx.obj.config}")
 
 
 if __name__ == "__main__":
-    app()
+    from exls.runtime.client import main
+
+    main()
@@ -9,6 +9,10 @@ from exls.auth.adapters.auth0.commands import (
     ValidateTokenCommand,
 )
 from exls.auth.adapters.auth0.config import Auth0Config
+from exls.auth.adapters.auth0.jwks import (
+    JwksFetcherSignatureVerifier,
+    get_jwks_fetcher,
+)
 from exls.auth.adapters.auth0.requests import (
     AuthenticationRequest,
     FetchDeviceCodeRequest,
@@ -176,7 +180,16 @@ class Auth0Adapter(AuthOperations, DeviceCodeOperations):
             id_token=id_token,
             leeway=self._config.leeway,
         )
-        command: ValidateTokenCommand = ValidateTokenCommand(request=request)
+        command: ValidateTokenCommand = ValidateTokenCommand(
+            request=request,
+            signature_verifier=JwksFetcherSignatureVerifier(
+                get_jwks_fetcher(
+                    domain=self._config.domain,
+                    cache_dir=self._config.jwks_cache_dir,
+                    cache_ttl=self._config.jwks_cache_ttl_seconds,
+                )
+            ),
+        )
         try:
             response: ValidatedAuthUserResponse = command.execute()
             return _user_from_response(response=response)
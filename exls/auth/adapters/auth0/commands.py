@@ -1,11 +1,12 @@
 from enum import StrEnum
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from auth0.authentication.exceptions import (  # type: ignore[reportMissingTypeStubs]
     TokenValidationError,
 )
 from auth0.authentication.token_verifier import (
     AsymmetricSignatureVerifier,
+    SignatureVerifier,
     TokenVerifier,
 )
 
@@ -51,6 +52,9 @@ class KeyringKeys(StrEnum):
 class Auth0FetchDeviceCodeCommand(
     PostRequestWithResponseCommand[Auth0DeviceCodeResponse]
 ):
+    # Auth0 rate limits the device flow with 429s; the user starts over instead.
+    retried = False
+
     def __init__(self, request: FetchDeviceCodeRequest):
         super().__init__(model=Auth0DeviceCodeResponse)
         self.request: FetchDeviceCodeRequest = request
@@ -73,6 +77,10 @@ class Auth0FetchDeviceCodeCommand(
 class Auth0GetTokenFromDeviceCodeCommand(
     PostRequestWithResponseCommand[Auth0TokenResponse]
 ):
+    # Auth0 answers a "slow_down" with a 429, which the polling loop has to see
+    # to increase its interval.
+    retried = False
+
     def __init__(self, request: AuthenticationRequest):
         super().__init__(model=Auth0TokenResponse)
         self.request: AuthenticationRequest = request
@@ -92,19 +100,22 @@ class ValidateTokenCommand(BaseCommand[ValidatedAuthUserResponse]):
     def __init__(
         self,
         request: ValidateTokenRequest,
+        signature_verifier: Optional[SignatureVerifier] = None,
         deserializer: PydanticDeserializer[
             ValidatedAuthUserResponse
         ] = PydanticDeserializer(),
     ):
         self.request: ValidateTokenRequest = request
+        self.signature_verifier: Optional[SignatureVerifier] = signature_verifier
         self.deserializer: PydanticDeserializer[ValidatedAuthUserResponse] = (
             deserializer
         )
 
     def execute(self) -> ValidatedAuthUserResponse:
-        jwks_url: str = f"https://{self.request.domain}/.well-known/jwks.json"
         issuer: str = f"https://{self.request.domain}/"
-        sv: AsymmetricSignatureVerifier = AsymmetricSignatureVerifier(jwks_url)
+        sv: SignatureVerifier = self.signature_verifier or AsymmetricSignatureVerifier(
+            f"https://{self.request.domain}/.well-known/jwks.json"
+        )
         tv: TokenVerifier = TokenVerifier(
             signature_verifier=sv,
             issuer=issuer,
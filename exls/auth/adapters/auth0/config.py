@@ -1,8 +1,11 @@
+from pathlib import Path
 from typing import List, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from exls.defaults import CFG_DIR
+
 
 class Auth0Config(BaseSettings):
     model_config = SettingsConfigDict(
@@ -40,7 +43,18 @@ class Auth0Config(BaseSettings):
     )
     token_expiry_buffer_minutes: int = Field(
         default=7,
-        description="The buffer in minutes before the token expires. Default is 7 minutes.",
+        description=(
+            "The buffer in minutes before the token expires. Tokens expiring within "
+            "this buffer are refreshed before use. Default is 7 minutes."
+        ),
+    )
+    token_refresh_lock_dir: Path = Field(
+        default=CFG_DIR / "locks",
+        description="The directory of the lock files that serialize token refreshes",
+    )
+    token_refresh_lock_timeout_seconds: float = Field(
+        default=30,
+        description="How long to wait for a concurrent token refresh to finish",
     )
     device_code_poll_interval_seconds: int = Field(
         default=5,
@@ -58,6 +72,17 @@ class Auth0Config(BaseSettings):
         default=3600,
         description="The leeway in seconds to validate the token",
     )
+    jwks_cache_dir: Path = Field(
+        default=CFG_DIR / "jwks",
+        description="The directory the JSON web key sets are cached in",
+    )
+    jwks_cache_ttl_seconds: int = Field(
+        default=6 * 3600,
+        description=(
+            "How long a cached JSON web key set is used. Keys are refetched earlier "
+            "when a token references an unknown key id."
+        ),
+    )
     pkce_code_challenge_method: str = Field(
         default="S256",
         description="PKCE code challenge method",
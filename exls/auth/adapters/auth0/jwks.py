@@ -0,0 +1,155 @@
+import logging
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from auth0.authentication.exceptions import (  # type: ignore[reportMissingTypeStubs]
+    TokenValidationError,
+)
+from auth0.authentication.token_verifier import JwksFetcher, SignatureVerifier
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+from filelock import FileLock
+from pydantic import BaseModel, Field, ValidationError
+
+from exls.profiling import profile_span
+from exls.shared.adapters.file.commands import WriteBinaryFileAtomicallyCommand
+
+logger = logging.getLogger(__name__)
+
+JWKS_FETCH_TIMEOUT_SECONDS = 10
+JWKS_LOCK_TIMEOUT_SECONDS = 30
+
+
+class JwksCacheEntry(BaseModel):
+    jwks_url: str = Field(..., description="The URL the key set was fetched from")
+    fetched_at: float = Field(..., description="Unix time of the fetch")
+    jwks: Dict[str, Any] = Field(..., description="The JSON web key set")
+
+
+class PersistentJwksFetcher(JwksFetcher):
+    """
+    A JWKS fetcher that shares its cache across processes via a file.
+
+    The key set is kept in memory and in a JSON file for `cache_ttl` seconds.
+    It is only fetched again when the cache expired or a token references a
+    key id that is not in the cached set (i.e. the keys were rotated). Fetches
+    are serialized with a file lock, so concurrent processes that miss the
+    cache at the same time fetch the key set only once.
+    """
+
+    def __init__(self, jwks_url: str, cache_file: Path, cache_ttl: int):
+        super().__init__(jwks_url, cache_ttl)
+        self._cache_file: Path = cache_file
+        self._lock_file: Path = cache_file.with_suffix(".lock")
+        self._thread_lock: threading.Lock = threading.Lock()
+
+    def _read_cache_file(self) -> Optional[JwksCacheEntry]:
+        try:
+            entry: JwksCacheEntry = JwksCacheEntry.model_validate_json(
+                self._cache_file.read_bytes()
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as e:
+            logger.debug(f"Ignoring unreadable JWKS cache {self._cache_file}: {e}")
+            return None
+        if entry.jwks_url != self._jwks_url:
+            return None
+        return entry
+
+    def _is_expired(self, entry: JwksCacheEntry) -> bool:
+        return entry.fetched_at + self._cache_ttl < time.time()
+
+    def _adopt(self, entry: JwksCacheEntry, fresh: bool) -> Dict[str, RSAPublicKey]:
+        self._cache_value = self._parse_jwks(entry.jwks)
+        self._cache_date = entry.fetched_at
+        self._cache_is_fresh = fresh
+        return self._cache_value
+
+    def _download(self) -> JwksCacheEntry:
+        with profile_span(f"GET {self._jwks_url}", "http"):
+            response: requests.Response = requests.get(
+                self._jwks_url, timeout=JWKS_FETCH_TIMEOUT_SECONDS
+            )
+        response.raise_for_status()
+        entry: JwksCacheEntry = JwksCacheEntry(
+            jwks_url=self._jwks_url, fetched_at=time.time(), jwks=response.json()
+        )
+        try:
+            WriteBinaryFileAtomicallyCommand(
+                file_path=self._cache_file,
+                content=entry.model_dump_json().encode("utf-8"),
+            ).execute()
+        except OSError as e:
+            logger.debug(f"Failed to write JWKS cache {self._cache_file}: {e}")
+        return entry
+
+    def _fetch_jwks(self, force: bool = False) -> Dict[str, RSAPublicKey]:
+        with self._thread_lock:
+            if not force:
+                if self._cache_value and not self._cache_expired():
+                    self._cache_is_fresh = False
+                    return self._cache_value
+                entry: Optional[JwksCacheEntry] = self._read_cache_file()
+                if entry and not self._is_expired(entry):
+                    return self._adopt(entry, fresh=False)
+
+            self._lock_file.parent.mkdir(parents=True, exist_ok=True)
+            with FileLock(self._lock_file, timeout=JWKS_LOCK_TIMEOUT_SECONDS):
+                # Another process may have fetched the key set while we waited.
+                entry = self._read_cache_file()
+                if (
+                    entry
+                    and not self._is_expired(entry)
+                    and (not force or entry.fetched_at > self._cache_date)
+                ):
+                    return self._adopt(entry, fresh=force)
+
+                logger.debug(f"Fetching JWKS from {self._jwks_url}")
+                return self._adopt(self._download(), fresh=True)
+
+    def get_key(self, key_id: str) -> RSAPublicKey:
+        keys: Dict[str, RSAPublicKey] = self._fetch_jwks()
+        if key_id in keys:
+            return keys[key_id]
+
+        # An unknown key id means the keys were rotated since we cached them.
+        if not self._cache_is_fresh:
+            keys = self._fetch_jwks(force=True)
+            if key_id in keys:
+                return keys[key_id]
+        raise TokenValidationError(f'RSA Public Key with ID "{key_id}" was not found.')
+
+
+class JwksFetcherSignatureVerifier(SignatureVerifier):
+    """An RSA signature verifier that uses a given (shared) JWKS fetcher."""
+
+    def __init__(self, fetcher: JwksFetcher, algorithm: str = "RS256"):
+        super().__init__(algorithm)
+        self._fetcher: JwksFetcher = fetcher
+
+    def _fetch_key(self, key_id: str) -> RSAPublicKey:
+        return self._fetcher.get_key(key_id)
+
+
+_fetchers: Dict[Tuple[str, Path], PersistentJwksFetcher] = {}
+_fetchers_lock: threading.Lock = threading.Lock()
+
+
+def get_jwks_fetcher(domain: str, cache_dir: Path, cache_ttl: int) -> JwksFetcher:
+    """Return the process-wide JWKS fetcher for an Auth0 domain."""
+    safe_domain: str = re.sub(r"[^A-Za-z0-9_.-]", "_", domain)
+    cache_file: Path = cache_dir / f"{safe_domain}.json"
+    with _fetchers_lock:
+        fetcher: Optional[PersistentJwksFetcher] = _fetchers.get((domain, cache_file))
+        if fetcher is None:
+            fetcher = PersistentJwksFetcher(
+                jwks_url=f"https://{domain}/.well-known/jwks.json",
+                cache_file=cache_file,
+                cache_ttl=cache_ttl,
+            )
+            _fetchers[(domain, cache_file)] = fetcher
+        return fetcher
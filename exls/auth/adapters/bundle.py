@@ -6,12 +6,17 @@ from typing import Optional
 from exls.auth.adapters.auth0.auth0 import Auth0Adapter
 from exls.auth.adapters.auth0.config import Auth0Config
 from exls.auth.adapters.auth0.pkce_adapter import Auth0PkceAdapter
+from exls.auth.adapters.file.config import EncryptedFileTokenStoreConfig
+from exls.auth.adapters.file.file import EncryptedFileTokenAdapter
 from exls.auth.adapters.keyring.keyring import KeyringAdapter
+from exls.auth.adapters.lock.lock import FileTokenRefreshLock
+from exls.auth.adapters.memory.memory import InMemoryTokenCache
 from exls.auth.adapters.ui.display.display import IOAuthFacade
 from exls.auth.core.domain import AuthFlowType
 from exls.auth.core.ports.pkce_operations import PkceOperations
+from exls.auth.core.ports.repository import TokenRepository
 from exls.auth.core.service import AuthService
-from exls.config import AppConfig
+from exls.config import AppConfig, TokenStoreBackend
 from exls.shared.adapters.bundle import BaseBundle
 from exls.shared.adapters.ui.factory import IOFactory
 from exls.state import AppState
@@ -49,6 +54,14 @@ class AuthBundle(BaseBundle):
             logger.debug("No browser found, using device code")
             return AuthFlowType.DEVICE_CODE
 
+    def get_token_repository(self) -> TokenRepository:
+        backend: TokenRepository
+        if self.config.token_store == TokenStoreBackend.ENCRYPTED_FILE:
+            backend = EncryptedFileTokenAdapter(config=EncryptedFileTokenStoreConfig())
+        else:
+            backend = KeyringAdapter()
+        return InMemoryTokenCache(backend=backend)
+
     def get_auth_service(
         self, auth_flow_override: Optional[AuthFlowType] = None
     ) -> AuthService:
@@ -62,9 +75,14 @@ class AuthBundle(BaseBundle):
 
         return AuthService(
             auth_operations=auth0_adapter,
-            token_repository=KeyringAdapter(),
+            token_repository=self.get_token_repository(),
             device_code_operations=auth0_adapter,
             pkce_operations=pkce_ops,
+            refresh_ahead_seconds=auth_config.token_expiry_buffer_minutes * 60,
+            refresh_lock=FileTokenRefreshLock(
+                lock_dir=auth_config.token_refresh_lock_dir,
+                timeout_seconds=auth_config.token_refresh_lock_timeout_seconds,
+            ),
         )
 
     def get_io_facade(self) -> IOAuthFacade:
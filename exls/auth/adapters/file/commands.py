@@ -0,0 +1,107 @@
+from pathlib import Path
+from typing import Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+from filelock import FileLock
+from pydantic import ValidationError
+
+from exls.auth.core.domain import LoadedToken
+from exls.shared.adapters.file.commands import WriteBinaryFileAtomicallyCommand
+from exls.shared.core.ports.command import BaseCommand, CommandError
+
+KEY_FILE_LOCK_TIMEOUT_SECONDS = 10
+
+
+class TokenFileCommandError(CommandError):
+    pass
+
+
+def _write_private_file(path: Path, content: bytes) -> None:
+    """Atomically write a file that is only readable by the current user."""
+    path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    WriteBinaryFileAtomicallyCommand(
+        file_path=path, content=content, mode=0o600
+    ).execute()
+
+
+class LoadOrCreateFernetKeyCommand(BaseCommand[bytes]):
+    def __init__(self, key_file: Path):
+        self.key_file: Path = key_file
+
+    def execute(self) -> bytes:
+        try:
+            if self.key_file.exists():
+                return self.key_file.read_bytes().strip()
+            self.key_file.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            # Concurrent first runs (e.g. a batch and the daemon) must agree on
+            # one key, or the token encrypted with the other becomes unreadable.
+            with FileLock(
+                self.key_file.with_name(f"{self.key_file.name}.lock"),
+                timeout=KEY_FILE_LOCK_TIMEOUT_SECONDS,
+            ):
+                if self.key_file.exists():
+                    return self.key_file.read_bytes().strip()
+                key: bytes = Fernet.generate_key()
+                _write_private_file(self.key_file, key)
+                return key
+        except OSError as e:
+            raise TokenFileCommandError(
+                f"failed to load token encryption key from {self.key_file}: {e}"
+            ) from e
+
+
+class StoreTokenToEncryptedFileCommand(BaseCommand[None]):
+    def __init__(self, token_file: Path, key: bytes, token: LoadedToken):
+        self.token_file: Path = token_file
+        self.key: bytes = key
+        self.token: LoadedToken = token
+
+    def execute(self) -> None:
+        try:
+            encrypted: bytes = Fernet(self.key).encrypt(
+                self.token.model_dump_json().encode("utf-8")
+            )
+            _write_private_file(self.token_file, encrypted)
+        except (OSError, ValueError) as e:
+            raise TokenFileCommandError(
+                f"failed to store token in {self.token_file}: {e}"
+            ) from e
+
+
+class LoadTokenFromEncryptedFileCommand(BaseCommand[Optional[LoadedToken]]):
+    """Loads the token from an encrypted file; None if there is no such file."""
+
+    def __init__(self, token_file: Path, key: bytes):
+        self.token_file: Path = token_file
+        self.key: bytes = key
+
+    def execute(self) -> Optional[LoadedToken]:
+        try:
+            encrypted: bytes = self.token_file.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            raise TokenFileCommandError(
+                f"failed to read token from {self.token_file}: {e}"
+            ) from e
+        try:
+            decrypted: bytes = Fernet(self.key).decrypt(encrypted)
+            return LoadedToken.model_validate_json(decrypted)
+        except (InvalidToken, ValueError, ValidationError) as e:
+            raise TokenFileCommandError(
+                f"failed to decrypt token from {self.token_file}, "
+                "was it encrypted with a different key?"
+            ) from e
+
+
+class DeleteTokenFileCommand(BaseCommand[None]):
+    def __init__(self, token_file: Path):
+        self.token_file: Path = token_file
+
+    def execute(self) -> None:
+        try:
+            self.token_file.unlink(missing_ok=True)
+        except OSError as e:
+            raise TokenFileCommandError(
+                f"failed to delete token file {self.token_file}: {e}"
+            ) from e
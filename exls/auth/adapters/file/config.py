@@ -0,0 +1,23 @@
+from pathlib import Path
+from typing import Optional
+
+from pydantic import Field, SecretStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from exls.defaults import CFG_DIR
+
+
+class EncryptedFileTokenStoreConfig(BaseSettings):
+    token_dir: Path = Field(
+        default=CFG_DIR / "tokens",
+        description="The directory the encrypted token files are stored in",
+    )
+    key: Optional[SecretStr] = Field(
+        default=None,
+        description=(
+            "A Fernet key used to encrypt the token files. If not set, a key is "
+            "generated and stored next to the token files."
+        ),
+    )
+
+    model_config = SettingsConfigDict(env_prefix="EXLS_TOKEN_STORE_")
@@ -0,0 +1,81 @@
+import re
+from pathlib import Path
+from typing import Optional
+
+from exls.auth.adapters.file.commands import (
+    DeleteTokenFileCommand,
+    LoadOrCreateFernetKeyCommand,
+    LoadTokenFromEncryptedFileCommand,
+    StoreTokenToEncryptedFileCommand,
+)
+from exls.auth.adapters.file.config import EncryptedFileTokenStoreConfig
+from exls.auth.core.domain import LoadedToken, Token
+from exls.auth.core.ports.repository import TokenRepository, TokenRepositoryError
+from exls.shared.core.ports.command import CommandError
+
+KEY_FILE_NAME = "token.key"
+
+
+class EncryptedFileTokenAdapter(TokenRepository):
+    """
+    Stores the token in a Fernet-encrypted file, one file per client.
+
+    Meant for headless machines such as CI runners that have no keyring
+    service. Set EXLS_TOKEN_STORE_KEY to a key kept in the runner's secret
+    store; without it a key file is generated next to the token files,
+    which only protects against accidental disclosure of the token files.
+    """
+
+    def __init__(self, config: EncryptedFileTokenStoreConfig):
+        self._config: EncryptedFileTokenStoreConfig = config
+        self._key: Optional[bytes] = None
+
+    def _token_file(self, client_id: str) -> Path:
+        safe_client_id: str = re.sub(r"[^A-Za-z0-9_.-]", "_", client_id)
+        return self._config.token_dir / f"{safe_client_id}.token"
+
+    def _get_key(self) -> bytes:
+        if self._key is None:
+            if self._config.key is not None:
+                self._key = self._config.key.get_secret_value().encode("utf-8")
+            else:
+                self._key = LoadOrCreateFernetKeyCommand(
+                    key_file=self._config.token_dir / KEY_FILE_NAME
+                ).execute()
+        return self._key
+
+    def store(self, token: Token) -> None:
+        try:
+            command: StoreTokenToEncryptedFileCommand = (
+                StoreTokenToEncryptedFileCommand(
+                    token_file=self._token_file(token.client_id),
+                    key=self._get_key(),
+                    token=LoadedToken.from_token(token),
+                )
+            )
+            command.execute()
+        except CommandError as e:
+            raise TokenRepositoryError(f"Failed to store token: {str(e)}") from e
+
+    def load(self, client_id: str) -> LoadedToken:
+        try:
+            command: LoadTokenFromEncryptedFileCommand = (
+                LoadTokenFromEncryptedFileCommand(
+                    token_file=self._token_file(client_id), key=self._get_key()
+                )
+            )
+            token: Optional[LoadedToken] = command.execute()
+        except CommandError as e:
+            raise TokenRepositoryError(f"Failed to load token: {str(e)}") from e
+        if token is None:
+            raise TokenRepositoryError("Failed to load token: no token stored.")
+        return token
+
+    def delete(self, client_id: str) -> None:
+        command: DeleteTokenFileCommand = DeleteTokenFileCommand(
+            token_file=self._token_file(client_id)
+        )
+        try:
+            command.execute()
+        except CommandError as e:
+            raise TokenRepositoryError(f"Failed to clear token: {str(e)}") from e
@@ -4,6 +4,8 @@ from enum import StrEnum
 from typing import Optional
 
 import keyring
+from keyring.errors import PasswordDeleteError
+from pydantic import ValidationError
 
 from exls.auth.core.domain import (
     LoadedToken,
@@ -22,6 +24,69 @@ class KeyringKeys(StrEnum):
     EXPIRY_KEY = "expiry"
     REFRESH_TOKEN_KEY = "refresh_token"
     ID_TOKEN_KEY = "id_token"
+    TOKEN_RECORD_KEY = "token"
+
+
+class StoreTokenRecordOnKeyringCommand(BaseCommand[None]):
+    """Stores the whole token as a single serialized keyring entry."""
+
+    def __init__(self, token: LoadedToken):
+        self.token: LoadedToken = token
+
+    def execute(self) -> None:
+        try:
+            keyring.set_password(
+                KeyringKeys.SERVICE_KEY,
+                f"{self.token.client_id}_{KeyringKeys.TOKEN_RECORD_KEY}",
+                self.token.model_dump_json(),
+            )
+        except Exception as e:
+            raise KeyringCommandError(f"failed to store token on keyring: {e}") from e
+
+
+class LoadTokenRecordFromKeyringCommand(BaseCommand[Optional[LoadedToken]]):
+    """Loads the token stored as a single keyring entry; None if there is none."""
+
+    def __init__(self, client_id: str):
+        self.client_id: str = client_id
+
+    def execute(self) -> Optional[LoadedToken]:
+        try:
+            record: Optional[str] = keyring.get_password(
+                KeyringKeys.SERVICE_KEY,
+                f"{self.client_id}_{KeyringKeys.TOKEN_RECORD_KEY}",
+            )
+        except Exception as e:
+            raise KeyringCommandError(
+                message=f"failed to load token from keyring: {e}"
+            ) from e
+        if record is None:
+            return None
+        try:
+            return LoadedToken.model_validate_json(record)
+        except ValidationError as e:
+            raise KeyringCommandError(
+                message=f"failed to load token from keyring: malformed token record: {e}"
+            ) from e
+
+
+class ClearTokenRecordFromKeyringCommand(BaseCommand[bool]):
+    def __init__(self, client_id: str):
+        self.client_id: str = client_id
+
+    def execute(self) -> bool:
+        try:
+            keyring.delete_password(
+                KeyringKeys.SERVICE_KEY,
+                f"{self.client_id}_{KeyringKeys.TOKEN_RECORD_KEY}",
+            )
+            return True
+        except PasswordDeleteError:
+            # There is no token record, e.g. because it was never migrated.
+            return True
+        except Exception as e:
+            logging.warning(f"failed to delete token record from keyring: {e}")
+            return False
 
 
 class StoreTokenOnKeyringCommand(BaseCommand[None]):
@@ -108,6 +173,9 @@ class ClearTokenFromKeyringCommand(BaseCommand[bool]):
                 f"{self.client_id}_{token_type}",
             )
 
+            return True
+        except PasswordDeleteError:
+            # The entry does not exist, e.g. because the token was migrated.
             return True
         except Exception as e:
             logging.warning(f"failed to delete token {token_type} from keyring: {e}")
@@ -118,4 +186,5 @@ class ClearTokenFromKeyringCommand(BaseCommand[bool]):
         success &= self._delete_token(KeyringKeys.ACCESS_TOKEN_KEY)
         success &= self._delete_token(KeyringKeys.EXPIRY_KEY)
         success &= self._delete_token(KeyringKeys.REFRESH_TOKEN_KEY)
+        success &= self._delete_token(KeyringKeys.ID_TOKEN_KEY)
         return success
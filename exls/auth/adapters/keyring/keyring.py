@@ -1,35 +1,75 @@
+import logging
+from typing import Optional
+
 from exls.auth.adapters.keyring.commands import (
     ClearTokenFromKeyringCommand,
+    ClearTokenRecordFromKeyringCommand,
     LoadTokenFromKeyringCommand,
-    StoreTokenOnKeyringCommand,
+    LoadTokenRecordFromKeyringCommand,
+    StoreTokenRecordOnKeyringCommand,
 )
 from exls.auth.core.domain import LoadedToken, Token
 from exls.auth.core.ports.repository import TokenRepository, TokenRepositoryError
 from exls.shared.core.ports.command import CommandError
 
+logger = logging.getLogger(__name__)
+
 
 class KeyringAdapter(TokenRepository):
+    """
+    Stores the token as a single serialized keyring entry.
+
+    Older versions stored every token field in its own entry, which costs four
+    keyring round trips per load. Tokens in that layout are migrated to the
+    single entry the first time they are loaded.
+    """
+
     def store(self, token: Token) -> None:
-        command: StoreTokenOnKeyringCommand = StoreTokenOnKeyringCommand(token=token)
+        command: StoreTokenRecordOnKeyringCommand = StoreTokenRecordOnKeyringCommand(
+            token=LoadedToken.from_token(token)
+        )
         try:
             command.execute()
         except CommandError as e:
             raise TokenRepositoryError(f"Failed to store token: {str(e)}") from e
 
     def load(self, client_id: str) -> LoadedToken:
-        command: LoadTokenFromKeyringCommand = LoadTokenFromKeyringCommand(
+        command: LoadTokenRecordFromKeyringCommand = LoadTokenRecordFromKeyringCommand(
             client_id=client_id
         )
         try:
-            return command.execute()
+            token: Optional[LoadedToken] = command.execute()
+            if token is not None:
+                return token
+            legacy_command: LoadTokenFromKeyringCommand = LoadTokenFromKeyringCommand(
+                client_id=client_id
+            )
+            legacy_token: LoadedToken = legacy_command.execute()
         except CommandError as e:
             raise TokenRepositoryError(f"Failed to load token: {str(e)}") from e
 
+        self._migrate(legacy_token)
+        return legacy_token
+
+    def _migrate(self, token: LoadedToken) -> None:
+        try:
+            StoreTokenRecordOnKeyringCommand(token=token).execute()
+        except CommandError as e:
+            # The token is still usable from the old layout; we retry next time.
+            logger.warning(f"Failed to migrate token to a single keyring entry: {e}")
+            return
+        ClearTokenFromKeyringCommand(client_id=token.client_id).execute()
+        logger.debug("Migrated token to a single keyring entry")
+
     def delete(self, client_id: str) -> None:
-        command: ClearTokenFromKeyringCommand = ClearTokenFromKeyringCommand(
+        record_command: ClearTokenRecordFromKeyringCommand = (
+            ClearTokenRecordFromKeyringCommand(client_id=client_id)
+        )
+        legacy_command: ClearTokenFromKeyringCommand = ClearTokenFromKeyringCommand(
             client_id=client_id
         )
         try:
-            command.execute()
+            record_command.execute()
+            legacy_command.execute()
         except CommandError as e:
             raise TokenRepositoryError(f"Failed to clear token: {str(e)}") from e
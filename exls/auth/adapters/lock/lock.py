@@ -0,0 +1,32 @@
+import contextlib
+import re
+from pathlib import Path
+from typing import Generator
+
+from filelock import FileLock, Timeout
+
+from exls.auth.core.ports.lock import TokenRefreshLock, TokenRefreshLockTimeoutError
+
+
+class FileTokenRefreshLock(TokenRefreshLock):
+    """A token refresh lock backed by a lock file per client."""
+
+    def __init__(self, lock_dir: Path, timeout_seconds: float):
+        self._lock_dir: Path = lock_dir
+        self._timeout_seconds: float = timeout_seconds
+
+    def _lock_file(self, client_id: str) -> Path:
+        safe_client_id: str = re.sub(r"[^A-Za-z0-9_.-]", "_", client_id)
+        return self._lock_dir / f"token-refresh-{safe_client_id}.lock"
+
+    @contextlib.contextmanager
+    def hold(self, client_id: str) -> Generator[None, None, None]:
+        lock_file: Path = self._lock_file(client_id)
+        lock_file.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with FileLock(lock_file, timeout=self._timeout_seconds):
+                yield
+        except Timeout as e:
+            raise TokenRefreshLockTimeoutError(
+                f"Timed out after {self._timeout_seconds}s waiting for the token refresh lock {lock_file}"
+            ) from e
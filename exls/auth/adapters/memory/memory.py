@@ -0,0 +1,56 @@
+import threading
+from typing import ClassVar, Dict, Tuple
+
+from exls.auth.core.domain import LoadedToken, Token
+from exls.auth.core.ports.repository import TokenRepository
+
+
+class InMemoryTokenCache(TokenRepository):
+    """
+    Keeps loaded tokens in process memory in front of a persistent token store.
+
+    The cache is shared by all instances in the process, so long-running
+    processes (e.g. batch runs) only hit the persistent store once per client.
+    Writes go through to the persistent store.
+    """
+
+    _tokens: ClassVar[Dict[Tuple[str, str], LoadedToken]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, backend: TokenRepository):
+        self._backend: TokenRepository = backend
+
+    def _key(self, client_id: str) -> Tuple[str, str]:
+        return (type(self._backend).__name__, client_id)
+
+    def store(self, token: Token) -> None:
+        self._backend.store(token)
+        with self._lock:
+            self._tokens[self._key(token.client_id)] = LoadedToken.from_token(token)
+
+    def load(self, client_id: str) -> LoadedToken:
+        with self._lock:
+            cached: LoadedToken | None = self._tokens.get(self._key(client_id))
+        if cached is not None:
+            return cached.model_copy()
+
+        token: LoadedToken = self._backend.load(client_id)
+        with self._lock:
+            self._tokens[self._key(client_id)] = token
+        return token.model_copy()
+
+    def reload(self, client_id: str) -> LoadedToken:
+        token: LoadedToken = self._backend.reload(client_id)
+        with self._lock:
+            self._tokens[self._key(client_id)] = token
+        return token.model_copy()
+
+    def delete(self, client_id: str) -> None:
+        with self._lock:
+            self._tokens.pop(self._key(client_id), None)
+        self._backend.delete(client_id)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._tokens.clear()
@@ -26,6 +26,16 @@ class LoadedToken(BaseModel):
     )
     expiry: datetime = Field(..., description="The expiry datetime")
 
+    @classmethod
+    def from_token(cls, token: Token) -> LoadedToken:
+        return cls(
+            client_id=token.client_id,
+            access_token=token.access_token,
+            id_token=token.id_token,
+            refresh_token=token.refresh_token,
+            expiry=token.expiry.astimezone(timezone.utc),
+        )
+
     @property
     def expires_in(self) -> int:
         return int((self.expiry - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+
+from exls.shared.core.exceptions import ExalsiusError
+
+
+class TokenRefreshLockTimeoutError(ExalsiusError):
+    pass
+
+
+class TokenRefreshLock(ABC):
+    """Serializes token refreshes of the same client across processes."""
+
+    @abstractmethod
+    def hold(self, client_id: str) -> AbstractContextManager[None]:
+        """
+        Hold the refresh lock of a client for the duration of the context.
+
+        Raises TokenRefreshLockTimeoutError if the lock could not be acquired in time.
+        """
+        ...
@@ -20,3 +20,7 @@ class TokenRepository(ABC):
 
     @abstractmethod
     def delete(self, client_id: str) -> None: ...
+
+    def reload(self, client_id: str) -> LoadedToken:
+        """Load the token bypassing any cache, e.g. after another process stored it."""
+        return self.load(client_id)
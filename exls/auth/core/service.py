@@ -12,6 +12,7 @@ from exls.auth.core.domain import (
     User,
 )
 from exls.auth.core.ports.device_code_operations import DeviceCodeOperations
+from exls.auth.core.ports.lock import TokenRefreshLock, TokenRefreshLockTimeoutError
 from exls.auth.core.ports.operations import AuthError, AuthOperations
 from exls.auth.core.ports.pkce_operations import PkceOperations
 from exls.auth.core.ports.repository import TokenRepository, TokenRepositoryError
@@ -40,11 +41,17 @@ class AuthService:
         token_repository: TokenRepository,
         device_code_operations: DeviceCodeOperations,
         pkce_operations: Optional[PkceOperations] = None,
+        refresh_ahead_seconds: int = 0,
+        refresh_lock: Optional[TokenRefreshLock] = None,
     ):
         self._auth_operations: AuthOperations = auth_operations
         self._token_repository: TokenRepository = token_repository
         self._device_code_operations: DeviceCodeOperations = device_code_operations
         self._pkce_operations: Optional[PkceOperations] = pkce_operations
+        # Tokens that expire within this window are refreshed before they are used,
+        # so that a command does not start with a token that expires mid-flight.
+        self._refresh_ahead_seconds: int = refresh_ahead_seconds
+        self._refresh_lock: Optional[TokenRefreshLock] = refresh_lock
 
     # --- Unified login flow ---
 
@@ -149,6 +156,48 @@ class AuthService:
         )
         return AuthSession(user=user, token=new_loaded_token)
 
+    def _needs_refresh(self, token: LoadedToken) -> bool:
+        return token.expires_in <= self._refresh_ahead_seconds
+
+    def _refresh_single_flight(self, loaded_token: LoadedToken) -> AuthSession:
+        """
+        Refresh the token while holding the refresh lock of its client.
+
+        Concurrent invocations that also need a refresh wait for the lock and then
+        reuse the token the first one stored instead of refreshing again.
+        """
+        if self._refresh_lock is None:
+            assert loaded_token.refresh_token is not None
+            return self._refresh_access_token(refresh_token=loaded_token.refresh_token)
+
+        try:
+            with self._refresh_lock.hold(loaded_token.client_id):
+                current_token: LoadedToken = self._token_repository.reload(
+                    client_id=loaded_token.client_id
+                )
+                if not self._needs_refresh(current_token):
+                    logger.debug("Reusing the token refreshed by another process")
+                    return self._session_from_loaded_token(current_token)
+                if not current_token.refresh_token:
+                    current_token = loaded_token
+                assert current_token.refresh_token is not None
+                return self._refresh_access_token(
+                    refresh_token=current_token.refresh_token
+                )
+        except TokenRefreshLockTimeoutError as e:
+            if not loaded_token.is_expired:
+                logger.warning(f"{e}; using the current access token")
+                return self._session_from_loaded_token(loaded_token)
+            logger.warning(f"{e}; refreshing the access token without the lock")
+            assert loaded_token.refresh_token is not None
+            return self._refresh_access_token(refresh_token=loaded_token.refresh_token)
+
+    def _session_from_loaded_token(self, loaded_token: LoadedToken) -> AuthSession:
+        user: User = self._auth_operations.decode_user_from_token(
+            id_token=loaded_token.id_token
+        )
+        return AuthSession(user=user, token=loaded_token)
+
     @handle_service_layer_errors("acquiring access token")
     def acquire_access_token(self) -> AuthSession:
         try:
@@ -157,23 +206,26 @@ class AuthService:
         except TokenRepositoryError as e:
             raise NotLoggedInWarning(f"You are not logged in: {str(e)}") from e
 
-        if loaded_token.is_expired:
-            if not loaded_token.refresh_token:
+        if not self._needs_refresh(loaded_token):
+            return self._session_from_loaded_token(loaded_token)
+
+        if not loaded_token.refresh_token:
+            if loaded_token.is_expired:
                 raise ServiceError("Session is expired. Please log in again.")
+            return self._session_from_loaded_token(loaded_token)
 
-            try:
-                return self._refresh_access_token(
-                    refresh_token=loaded_token.refresh_token
+        try:
+            return self._refresh_single_flight(loaded_token)
+        except AuthError as e:
+            if not loaded_token.is_expired:
+                # The token is still valid, so a failed early refresh is not fatal.
+                logger.warning(
+                    f"Failed to refresh access token ahead of expiry: {str(e)}"
                 )
-            except AuthError as e:
-                raise ServiceError(
-                    f"failed to refresh access token. Please log in again. Error: {str(e)}"
-                ) from e
-        else:
-            user: User = self._auth_operations.decode_user_from_token(
-                id_token=loaded_token.id_token
-            )
-            return AuthSession(user=user, token=loaded_token)
+                return self._session_from_loaded_token(loaded_token)
+            raise ServiceError(
+                f"failed to refresh access token. Please log in again. Error: {str(e)}"
+            ) from e
 
     @handle_service_layer_errors("logging out")
     def logout(self) -> None:
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Iterator, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from exls.clusters.adapters.gateway.gateway import (
     ClusterData,
@@ -27,6 +27,12 @@ from exls.clusters.core.ports.repository import (
 )
 from exls.clusters.core.results import ClusterScaleIssue, ClusterScaleResult
 from exls.shared.core.exceptions import ExalsiusError
+from exls.shared.core.parallel import (
+    AdaptiveLimiter,
+    ParallelExecutionResult,
+    call_concurrently,
+    execute_concurrently,
+)
 from exls.shared.core.ports.command import CommandError
 
 logger = logging.getLogger(__name__)
@@ -88,9 +94,17 @@ def _map_cluster_node(
 
 
 class ClusterAdapter(ClusterRepository, ClusterOperations):
-    def __init__(self, cluster_gateway: ClustersGateway, nodes_provider: NodesProvider):
+    def __init__(
+        self,
+        cluster_gateway: ClustersGateway,
+        nodes_provider: NodesProvider,
+        max_concurrency: int = 10,
+        concurrency_limiter: Optional[AdaptiveLimiter] = None,
+    ):
         self._cluster_gateway: ClustersGateway = cluster_gateway
         self._nodes_provider: NodesProvider = nodes_provider
+        self._max_concurrency: int = max_concurrency
+        self._concurrency_limiter: Optional[AdaptiveLimiter] = concurrency_limiter
 
     def _load_cluster_nodes(
         self,
@@ -107,13 +121,44 @@ class ClusterAdapter(ClusterRepository, ClusterOperations):
         else:
             return []
 
-        cluster_node_refs: List[ClusterNodeRefData] = (
-            self._cluster_gateway.get_cluster_nodes(cluster_id=cluster_data.id)
+        # The node refs, the nodes and the resources of the cluster don't
+        # depend on each other, so they are fetched at the same time. The
+        # nodes are looked up by the node IDs of the cluster; nodes that only
+        # the refs list are looked up afterwards.
+        # Only fetch cluster resources when cluster is READY, as resources
+        # are not available during DEPLOYING or PENDING states
+        known_node_ids: List[str] = list(
+            dict.fromkeys(
+                cluster_data.control_plane_node_ids + cluster_data.worker_node_ids
+            )
         )
+        calls: List[Callable[[], Any]] = [
+            lambda: self._cluster_gateway.get_cluster_nodes(cluster_id=cluster_data.id),
+            lambda: self._nodes_provider.get_nodes_by_ids(known_node_ids),
+        ]
+        if cluster_data.status == ClusterStatus.READY:
+            calls.append(
+                lambda: self._cluster_gateway.get_cluster_resources(
+                    cluster_id=cluster_data.id
+                )
+            )
+        results: List[Any] = call_concurrently(*calls)
+
+        cluster_node_refs: List[ClusterNodeRefData] = results[0]
         cluster_node_ref_map: Dict[str, ClusterNodeRefData] = {
             node.id: node for node in cluster_node_refs
         }
-        nodes_data: List[ClusterNodeData] = self._nodes_provider.list_nodes()
+        nodes_data: List[ClusterNodeData] = results[1]
+        requested_node_ids: Set[str] = set(known_node_ids)
+        unknown_node_ids: List[str] = [
+            node_id
+            for node_id in cluster_node_ref_map
+            if node_id not in requested_node_ids
+        ]
+        if unknown_node_ids:
+            nodes_data = nodes_data + self._nodes_provider.get_nodes_by_ids(
+                unknown_node_ids
+            )
         nodes_data_map: Dict[str, ClusterNodeData] = {
             node.id: node for node in nodes_data
         }
@@ -135,13 +180,9 @@ class ClusterAdapter(ClusterRepository, ClusterOperations):
                     )
                     invalid_node_ids.append(node_id)
 
-        # Only fetch cluster resources when cluster is READY, as resources
-        # are not available during DEPLOYING or PENDING states
         cluster_node_resource_map: Dict[str, ClusterNodeRefResourcesData] = {}
         if cluster_data.status == ClusterStatus.READY:
-            cluster_node_resources: List[ClusterNodeRefResourcesData] = (
-                self._cluster_gateway.get_cluster_resources(cluster_id=cluster_data.id)
-            )
+            cluster_node_resources: List[ClusterNodeRefResourcesData] = results[2]
             cluster_node_resource_map = {
                 resource.node_id: resource for resource in cluster_node_resources
             }
@@ -174,30 +215,36 @@ class ClusterAdapter(ClusterRepository, ClusterOperations):
                     nodes.append(cluster_node)
         return nodes
 
+    def _summaries(self, cluster_data_list: List[ClusterData]) -> List[ClusterSummary]:
+        return [
+            ClusterSummary(
+                id=cluster_data.id,
+                name=cluster_data.name,
+                status=cluster_data.status,
+                type=cluster_data.type,
+                created_at=cluster_data.created_at,
+                updated_at=cluster_data.updated_at,
+                owner_username=cluster_data.owner_username,
+                owner_org_id=cluster_data.owner_org_id,
+                owner_org_name=cluster_data.owner_org_name,
+                owner_teams=cluster_data.owner_teams,
+                worker_node_ids=cluster_data.worker_node_ids or [],
+                control_plane_node_ids=cluster_data.control_plane_node_ids or [],
+            )
+            for cluster_data in cluster_data_list
+        ]
+
     def list(self, status: Optional[ClusterStatus]) -> List[ClusterSummary]:
         cluster_data_list: List[ClusterData] = self._cluster_gateway.list(status=status)
-        summaries: List[ClusterSummary] = []
-        for cluster_data in cluster_data_list:
-            summaries.append(
-                ClusterSummary(
-                    id=cluster_data.id,
-                    name=cluster_data.name,
-                    status=cluster_data.status,
-                    type=cluster_data.type,
-                    created_at=cluster_data.created_at,
-                    updated_at=cluster_data.updated_at,
-                    owner_username=cluster_data.owner_username,
-                    owner_org_id=cluster_data.owner_org_id,
-                    owner_org_name=cluster_data.owner_org_name,
-                    owner_teams=cluster_data.owner_teams,
-                    worker_node_ids=cluster_data.worker_node_ids or [],
-                    control_plane_node_ids=cluster_data.control_plane_node_ids or [],
-                )
-            )
-        if status:
-            return [summary for summary in summaries if summary.status == status]
-        else:
-            return summaries
+        return self._summaries(cluster_data_list)
+
+    def iter_pages(
+        self, status: Optional[ClusterStatus], page_size: int
+    ) -> Iterator[List[ClusterSummary]]:
+        for page in self._cluster_gateway.iter_pages(
+            status=status, page_size=page_size
+        ):
+            yield self._summaries(page)
 
     def get(self, cluster_id: str) -> Cluster:
         cluster_data: ClusterData = self._cluster_gateway.get(cluster_id=cluster_id)
@@ -253,32 +300,52 @@ class ClusterAdapter(ClusterRepository, ClusterOperations):
             for node in nodes_to_remove
         ]
 
+        # Returns the requested and the removed node ID.
+        async def _remove_node(node_ref_data: ClusterNodeRefData) -> Tuple[str, str]:
+            removed_node_id: str = (
+                await self._cluster_gateway.remove_node_from_cluster_async(
+                    cluster_id=cluster_id, node_id=node_ref_data.id
+                )
+            )
+            return node_ref_data.id, removed_node_id
+
+        results: ParallelExecutionResult[ClusterNodeRefData, Tuple[str, str]] = (
+            execute_concurrently(
+                items=nodes_to_remove_ref_data,
+                func=_remove_node,
+                max_concurrency=self._max_concurrency,
+                limiter=self._concurrency_limiter,
+            )
+        )
+
         removed_nodes: List[ClusterNode] = []
         issues: List[ClusterScaleIssue] = []
-        for node_to_remove_ref_data in nodes_to_remove_ref_data:
-            try:
-                removed_node_id: str = self._cluster_gateway.remove_node_from_cluster(
-                    cluster_id=cluster_id, node_id=node_to_remove_ref_data.id
-                )
-                if removed_node_id in node_map:
-                    removed_nodes.append(node_map[removed_node_id])
-                else:
-                    issues.append(
-                        ClusterScaleIssue(
-                            node=node_map[node_to_remove_ref_data.id],
-                            error_message=f"Node {removed_node_id} not found",
-                        )
-                    )
-            except CommandError as e:
+        for requested_node_id, removed_node_id in results.successes:
+            if removed_node_id in node_map:
+                removed_nodes.append(node_map[removed_node_id])
+            else:
                 issues.append(
                     ClusterScaleIssue(
-                        node=node_map[node_to_remove_ref_data.id], error_message=str(e)
+                        node=node_map[requested_node_id],
+                        error_message=f"Node {removed_node_id} not found",
                     )
                 )
+        for failure in results.failures:
+            if not isinstance(failure.error, CommandError):
+                raise failure.error
+            issues.append(
+                ClusterScaleIssue(
+                    node=node_map[failure.item.id], error_message=failure.message
+                )
+            )
         return ClusterScaleResult(nodes=removed_nodes, issues=issues)
 
     def load_kubeconfig(self, cluster_id: str) -> str:
         return self._cluster_gateway.load_kubeconfig(cluster_id=cluster_id)
 
-    def stream_logs(self, cluster_id: str) -> Iterator[ClusterEvent]:
-        return self._cluster_gateway.stream_logs(cluster_id=cluster_id)
+    def stream_logs(
+        self, cluster_id: str, idle_timeout_seconds: Optional[float] = None
+    ) -> Iterator[ClusterEvent]:
+        return self._cluster_gateway.stream_logs(
+            cluster_id=cluster_id, idle_timeout_seconds=idle_timeout_seconds
+        )
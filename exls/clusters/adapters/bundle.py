@@ -29,12 +29,16 @@ class ClustersBundle(BaseBundle):
             management_api=management_api,
             base_url=self.config.backend_host,
             access_token=self.access_token,
+            response_cache=self.get_response_cache(),
         )
         nodes_provider: NodesProvider = NodesDomainProvider(
             nodes_service=self._nodes_bundle.get_nodes_service()
         )
         cluster_adapter: ClusterAdapter = ClusterAdapter(
-            cluster_gateway=clusters_gateway, nodes_provider=nodes_provider
+            cluster_gateway=clusters_gateway,
+            nodes_provider=nodes_provider,
+            max_concurrency=self.config.http.max_concurrency,
+            concurrency_limiter=self.get_concurrency_limiter(),
         )
         file_write_adapter: FileWritePort[str] = YamlFileWriteAdapter()
         return ClustersService(
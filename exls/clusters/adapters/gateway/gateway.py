@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 from abc import ABC, abstractmethod
 from enum import StrEnum
@@ -14,6 +15,7 @@ from exls.clusters.core.domain import (
 # It's a leaky abstraction between the domain and the gateway layer.
 # Strong abstraction is not needed here for now.
 from exls.clusters.core.ports.repository import ClusterCreateParameters
+from exls.shared.core.pagination import paginate
 
 
 class ClusterData(BaseModel):
@@ -93,6 +95,11 @@ class ClustersGateway(ABC):
     def list(self, status: Optional[ClusterStatus]) -> List[ClusterData]:
         raise NotImplementedError
 
+    def iter_pages(
+        self, status: Optional[ClusterStatus], page_size: int
+    ) -> Iterator[List[ClusterData]]:
+        yield from paginate(self.list(status=status), page_size)
+
     @abstractmethod
     def get(self, cluster_id: str) -> ClusterData:
         raise NotImplementedError
@@ -129,10 +136,19 @@ class ClustersGateway(ABC):
     def remove_node_from_cluster(self, cluster_id: str, node_id: str) -> str:
         raise NotImplementedError
 
+    async def remove_node_from_cluster_async(
+        self, cluster_id: str, node_id: str
+    ) -> str:
+        return await asyncio.to_thread(
+            self.remove_node_from_cluster, cluster_id, node_id
+        )
+
     @abstractmethod
     def load_kubeconfig(self, cluster_id: str) -> str:
         raise NotImplementedError
 
     @abstractmethod
-    def stream_logs(self, cluster_id: str) -> Iterator[ClusterEvent]:
+    def stream_logs(
+        self, cluster_id: str, idle_timeout_seconds: Optional[float] = None
+    ) -> Iterator[ClusterEvent]:
         raise NotImplementedError
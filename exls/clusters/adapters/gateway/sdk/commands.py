@@ -21,6 +21,7 @@ from exalsius_api_client.models.clusters_list_response import ClustersListRespon
 
 from exls.clusters.core.domain import ClusterEvent
 from exls.shared.adapters.http.commands import StreamingGetRequestCommand
+from exls.shared.adapters.sdk.cache import SdkResponseCache, api_client_of
 from exls.shared.adapters.sdk.command import (
     ExalsiusSdkCommand,
     UnexpectedSdkCommandResponseError,
@@ -42,15 +43,25 @@ class ListClustersSdkCommand(BaseClustersSdkCommand[ClustersListResponse]):
         status: Optional[
             Literal["PENDING", "DEPLOYING", "READY", "DELETING", "FAILED"]
         ],
+        response_cache: Optional[SdkResponseCache] = None,
     ):
         super().__init__(api_client)
         self._status: Optional[
             Literal["PENDING", "DEPLOYING", "READY", "DELETING", "FAILED"]
         ] = status
+        self._response_cache: Optional[SdkResponseCache] = response_cache
 
     def _execute_api_call(self) -> ClustersListResponse:
-        response: ClustersListResponse = self.api_client.list_clusters(
-            cluster_status=self._status
+        if self._response_cache is None:
+            return self.api_client.list_clusters(cluster_status=self._status)
+        response: ClustersListResponse = self._response_cache.get(
+            api_client=api_client_of(self.api_client),
+            resource="clusters",
+            key=f"list_clusters {self._status}",
+            request=lambda headers: self.api_client.list_clusters_without_preload_content(
+                cluster_status=self._status, _headers=headers
+            ),
+            response_type="ClustersListResponse",
         )
         return response
 
@@ -80,6 +91,8 @@ class DeleteClusterSdkCommand(BaseClustersSdkCommand[ClusterDeleteResponse]):
 
 
 class CreateClusterSdkCommand(BaseClustersSdkCommand[ClusterCreateResponse]):
+    idempotent = False
+
     def __init__(self, api_client: ClustersApi, request: ClusterCreateRequest):
         super().__init__(api_client)
         self._request: ClusterCreateRequest = request
@@ -92,6 +105,8 @@ class CreateClusterSdkCommand(BaseClustersSdkCommand[ClusterCreateResponse]):
 
 
 class DeployClusterSdkCommand(BaseClustersSdkCommand[ClusterDeployResponse]):
+    idempotent = False
+
     def __init__(self, api_client: ClustersApi, cluster_id: str):
         super().__init__(api_client)
         self._cluster_id: str = cluster_id
@@ -116,6 +131,8 @@ class GetClusterNodesSdkCommand(BaseClustersSdkCommand[ClusterNodesResponse]):
 
 
 class AddNodesSdkCommand(BaseClustersSdkCommand[ClusterNodesResponse]):
+    idempotent = False
+
     def __init__(
         self, api_client: ClustersApi, cluster_id: str, request: ClusterAddNodeRequest
     ):
@@ -177,8 +194,14 @@ class GetKubeconfigSdkCommand(BaseClustersSdkCommand[ClusterKubeconfigResponse])
 
 
 class StreamClusterLogsSdkCommand(StreamingGetRequestCommand[ClusterEvent]):
-    def __init__(self, base_url: str, cluster_id: str, access_token: str):
-        super().__init__(model=ClusterEvent)
+    def __init__(
+        self,
+        base_url: str,
+        cluster_id: str,
+        access_token: str,
+        read_timeout_seconds: Optional[float] = None,
+    ):
+        super().__init__(model=ClusterEvent, read_timeout_seconds=read_timeout_seconds)
         self._base_url: str = base_url
         self._cluster_id: str = cluster_id
         self._access_token: str = access_token
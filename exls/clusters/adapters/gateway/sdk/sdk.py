@@ -57,6 +57,10 @@ from exls.clusters.core.domain import (
     ClusterStatus,
     ClusterType,
 )
+from exls.shared.adapters.memo import invalidates, memoized_read
+from exls.shared.adapters.sdk.cache import SdkResponseCache
+from exls.shared.core.filtering import LocalFilter
+from exls.shared.core.pagination import paginate
 
 logger = logging.getLogger(__name__)
 
@@ -137,24 +141,56 @@ class SdkClustersGateway(ClustersGateway):
         management_api: ManagementApi,
         base_url: str = "",
         access_token: str = "",
+        response_cache: Optional[SdkResponseCache] = None,
     ):
         self._clusters_api = clusters_api
         self._management_api = management_api
         self._base_url: str = base_url
         self._access_token: str = access_token
+        self._response_cache: Optional[SdkResponseCache] = response_cache
 
-    def list(self, status: Optional[ClusterStatus]) -> List[ClusterData]:
+    def _invalidate_cached_lists(self, *resources: str) -> None:
+        if self._response_cache is not None:
+            self._response_cache.invalidate(*resources)
+
+    def _iter_clusters(self, status: Optional[ClusterStatus]) -> Iterator[ClusterData]:
+        # The API only knows the statuses it reports; clusters in a status the
+        # CLI does not know are mapped to UNKNOWN, which is filtered here.
+        pushed_status: Optional[str] = (
+            status.value if status and status != ClusterStatus.UNKNOWN else None
+        )
         command: ListClustersSdkCommand = ListClustersSdkCommand(
             self._clusters_api,
-            status=status.value if status and status != ClusterStatus.UNKNOWN else None,
+            status=pushed_status,
+            response_cache=self._response_cache,
         )
         response: ClustersListResponse = command.execute()
-        clusters: List[ClusterData] = [
+        local_filter: LocalFilter[ClusterData] = LocalFilter(
+            [
+                (
+                    (lambda cluster: cluster.status == ClusterStatus.UNKNOWN)
+                    if status == ClusterStatus.UNKNOWN
+                    else None
+                )
+            ]
+        )
+        yield from local_filter.apply(
             _cluster_data_from_sdk_model(sdk_model=cluster)
             for cluster in response.clusters
-        ]
-        return clusters
+        )
+
+    @memoized_read("clusters")
+    def list(self, status: Optional[ClusterStatus]) -> List[ClusterData]:
+        return list(self._iter_clusters(status))
 
+    def iter_pages(
+        self, status: Optional[ClusterStatus], page_size: int
+    ) -> Iterator[List[ClusterData]]:
+        # The API returns all clusters in one response; they are mapped one
+        # page at a time, as the pages are consumed.
+        yield from paginate(self._iter_clusters(status), page_size)
+
+    @memoized_read("clusters")
     def get(self, cluster_id: str) -> ClusterData:
         command: GetClusterSdkCommand = GetClusterSdkCommand(
             self._clusters_api, cluster_id=cluster_id
@@ -162,13 +198,16 @@ class SdkClustersGateway(ClustersGateway):
         response: ClusterResponse = command.execute()
         return _cluster_data_from_sdk_model(sdk_model=response.cluster)
 
+    @invalidates("clusters", "nodes")
     def delete(self, cluster_id: str) -> str:
         command: DeleteClusterSdkCommand = DeleteClusterSdkCommand(
             self._clusters_api, cluster_id=cluster_id
         )
         response: ClusterDeleteResponse = command.execute()
+        self._invalidate_cached_lists("clusters", "nodes")
         return response.cluster_id
 
+    @invalidates("clusters", "nodes")
     def create(self, parameters: ClusterCreateParameters) -> str:
         sdk_request: SdkClusterCreateRequest = SdkClusterCreateRequest(
             name=parameters.name,
@@ -186,15 +225,19 @@ class SdkClustersGateway(ClustersGateway):
             request=sdk_request,
         )
         response: ClusterCreateResponse = command.execute()
+        self._invalidate_cached_lists("clusters", "nodes")
         return response.cluster_id
 
+    @invalidates("clusters", "nodes")
     def deploy(self, cluster_id: str) -> str:
         command: DeployClusterSdkCommand = DeployClusterSdkCommand(
             self._clusters_api, cluster_id=cluster_id
         )
         response: ClusterDeployResponse = command.execute()
+        self._invalidate_cached_lists("clusters", "nodes")
         return response.cluster_id
 
+    @memoized_read("clusters")
     def get_cluster_nodes(self, cluster_id: str) -> List[ClusterNodeRefData]:
         command: GetClusterNodesSdkCommand = GetClusterNodesSdkCommand(
             self._clusters_api, cluster_id=cluster_id
@@ -205,6 +248,7 @@ class SdkClustersGateway(ClustersGateway):
             worker_node_ids=response.worker_node_ids,
         )
 
+    @invalidates("clusters", "nodes")
     def add_nodes_to_cluster(
         self, cluster_id: str, nodes_to_add: List[ClusterNodeRefData]
     ) -> List[ClusterNodeRefData]:
@@ -222,19 +266,34 @@ class SdkClustersGateway(ClustersGateway):
             request=sdk_request,
         )
         response: ClusterNodesResponse = command.execute()
+        self._invalidate_cached_lists("clusters", "nodes")
 
         return _cluster_node_ref_from_node_ids(
             control_plane_node_ids=response.control_plane_node_ids,
             worker_node_ids=response.worker_node_ids,
         )
 
+    @invalidates("clusters", "nodes")
     def remove_node_from_cluster(self, cluster_id: str, node_id: str) -> str:
         command: RemoveNodeSdkCommand = RemoveNodeSdkCommand(
             self._clusters_api, cluster_id=cluster_id, node_id=node_id
         )
         response: ClusterNodeRemoveResponse = command.execute()
+        self._invalidate_cached_lists("clusters", "nodes")
+        return response.node_id
+
+    @invalidates("clusters", "nodes")
+    async def remove_node_from_cluster_async(
+        self, cluster_id: str, node_id: str
+    ) -> str:
+        command: RemoveNodeSdkCommand = RemoveNodeSdkCommand(
+            self._clusters_api, cluster_id=cluster_id, node_id=node_id
+        )
+        response: ClusterNodeRemoveResponse = await command.execute_async()
+        self._invalidate_cached_lists("clusters", "nodes")
         return response.node_id
 
+    @memoized_read("clusters")
     def get_cluster_resources(
         self, cluster_id: str
     ) -> List[ClusterNodeRefResourcesData]:
@@ -252,6 +311,7 @@ class SdkClustersGateway(ClustersGateway):
                 cluster_node_resources.append(resource_model)
         return cluster_node_resources
 
+    @memoized_read("clusters")
     def load_kubeconfig(self, cluster_id: str) -> str:
         command: GetKubeconfigSdkCommand = GetKubeconfigSdkCommand(
             self._clusters_api, cluster_id
@@ -259,11 +319,14 @@ class SdkClustersGateway(ClustersGateway):
         response: ClusterKubeconfigResponse = command.execute()
         return response.kubeconfig
 
-    def stream_logs(self, cluster_id: str) -> Iterator[ClusterEvent]:
+    def stream_logs(
+        self, cluster_id: str, idle_timeout_seconds: Optional[float] = None
+    ) -> Iterator[ClusterEvent]:
         command: StreamClusterLogsSdkCommand = StreamClusterLogsSdkCommand(
             base_url=self._base_url,
             cluster_id=cluster_id,
             access_token=self._access_token,
+            read_timeout_seconds=idle_timeout_seconds,
         )
         try:
             yield from command.execute()
@@ -33,27 +33,31 @@ def _map_resources(resources: NodeResources) -> ClusterNodeResources:
     )
 
 
+def _map_cluster_node_data(domain_nodes: List[BaseNode]) -> List[ClusterNodeData]:
+    return [
+        ClusterNodeData(
+            id=node.id,
+            hostname=node.hostname,
+            username=node.username,
+            ssh_key_id=node.ssh_key_id,
+            status=ClusterNodeStatus.from_str(node.status.value),
+            endpoint=node.endpoint,
+            resources=_map_resources(node.resources),
+        )
+        for node in domain_nodes
+        if isinstance(node, SelfManagedNode)
+    ]
+
+
 class NodesDomainProvider(NodesProvider):
     def __init__(self, nodes_service: NodesService):
         self.nodes_service: NodesService = nodes_service
 
     def list_nodes(self) -> List[ClusterNodeData]:
-        domain_nodes: List[BaseNode] = self.nodes_service.list_nodes()
-        nodes: List[ClusterNodeData] = []
-        for node in domain_nodes:
-            if isinstance(node, SelfManagedNode):
-                nodes.append(
-                    ClusterNodeData(
-                        id=node.id,
-                        hostname=node.hostname,
-                        username=node.username,
-                        ssh_key_id=node.ssh_key_id,
-                        status=ClusterNodeStatus.from_str(node.status.value),
-                        endpoint=node.endpoint,
-                        resources=_map_resources(node.resources),
-                    )
-                )
-        return nodes
+        return _map_cluster_node_data(self.nodes_service.list_nodes())
+
+    def get_nodes_by_ids(self, node_ids: List[str]) -> List[ClusterNodeData]:
+        return _map_cluster_node_data(self.nodes_service.get_nodes_by_ids(node_ids))
 
     def list_available_nodes(self) -> List[ClusterNode]:
         node_data_list: List[ClusterNodeData] = self.list_nodes()
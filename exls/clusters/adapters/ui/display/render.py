@@ -6,6 +6,7 @@ from exls.shared.adapters.ui.output.render.json import JsonRenderContext
 from exls.shared.adapters.ui.output.render.service import (
     format_datetime,
     format_datetime_humanized,
+    format_duration_ms,
     format_short_id,
     format_status,
 )
@@ -157,6 +158,28 @@ _CLUSTER_NODE_ISSUE_COLUMNS: Dict[str, Column] = {
 CLUSTER_NODE_ISSUE_VIEW = ViewContext.from_table_columns(_CLUSTER_NODE_ISSUE_COLUMNS)
 
 
+# -----------------------------------------------------------------------------
+# TIMING VIEWS
+# -----------------------------------------------------------------------------
+
+_CLUSTER_DEPLOY_TIMELINE_COLUMNS: Dict[str, Column] = {
+    "name": TableRenderContext.get_column("Phase", no_wrap=True),
+    "started_at": TableRenderContext.get_column(
+        "Started At", value_formatter=format_datetime
+    ),
+    "duration_ms": TableRenderContext.get_column(
+        "Duration", value_formatter=format_duration_ms
+    ),
+    "items": TableRenderContext.get_column("Items"),
+    "api_calls": TableRenderContext.get_column("API Calls"),
+    "error": TableRenderContext.get_column("Error"),
+}
+
+CLUSTER_DEPLOY_TIMELINE_VIEW = ViewContext.from_table_columns(
+    _CLUSTER_DEPLOY_TIMELINE_COLUMNS
+)
+
+
 # -----------------------------------------------------------------------------
 # DTO VIEWS (Input/Flows)
 # -----------------------------------------------------------------------------
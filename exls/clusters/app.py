@@ -1,10 +1,13 @@
+import itertools
+import json
 from pathlib import Path
-from typing import Iterator, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import typer
 
 from exls.clusters.adapters.bundle import ClustersBundle
 from exls.clusters.adapters.ui.display.render import (
+    CLUSTER_DEPLOY_TIMELINE_VIEW,
     CLUSTER_DETAIL_VIEW,
     CLUSTER_LIST_VIEW,
     CLUSTER_LOG_TEXT_VIEW,
@@ -46,6 +49,8 @@ from exls.shared.adapters.ui.utils import (
     get_config_from_ctx,
     help_if_no_subcommand,
 )
+from exls.shared.core.pagination import DEFAULT_PAGE_SIZE
+from exls.shared.core.polling import watch_snapshots
 from exls.shared.core.resolver import (
     AmbiguousResourceError,
     ResourceNotFoundError,
@@ -97,6 +102,24 @@ def list_clusters(
         "--status",
         help="Filter clusters by status",
     ),
+    limit: Optional[int] = typer.Option(
+        None, "--limit", min=1, help="Show at most this many clusters"
+    ),
+    page_size: int = typer.Option(
+        DEFAULT_PAGE_SIZE,
+        "--page-size",
+        min=1,
+        help="The number of clusters fetched and shown at a time",
+    ),
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        "-w",
+        help="Keep the list open and update it as clusters change, until Ctrl+C",
+    ),
+    interval: float = typer.Option(
+        2, "--interval", min=0.5, help="The seconds between updates with --watch"
+    ),
 ):
     """
     List all clusters.
@@ -105,16 +128,37 @@ def list_clusters(
     io_facade: IOBaseModelFacade = bundle.get_io_facade()
     service: ClustersService = bundle.get_clusters_service()
 
-    clusters_domain: List[ClusterSummary] = service.list_clusters(status=status)
+    if watch:
+        io_facade.display_watch(
+            watch_snapshots(
+                lambda: list(
+                    itertools.chain.from_iterable(
+                        service.iter_clusters(
+                            status=status, page_size=page_size, limit=limit
+                        )
+                    )
+                ),
+                key=lambda cluster: cluster.id,
+                interval_seconds=interval,
+            ),
+            bundle.object_output_format,
+            view_context=CLUSTER_LIST_VIEW,
+        )
+        return
+
+    pages: Iterator[List[ClusterSummary]] = service.iter_clusters(
+        status=status, page_size=page_size, limit=limit
+    )
+    first_page: Optional[List[ClusterSummary]] = next(pages, None)
 
-    if len(clusters_domain) == 0:
+    if first_page is None:
         io_facade.display_info_message(
             "No clusters found. Run 'exls clusters deploy' to deploy a cluster.",
             bundle.message_output_format,
         )
     else:
-        io_facade.display_data(
-            clusters_domain,
+        io_facade.display_pages(
+            itertools.chain([first_page], pages),
             bundle.object_output_format,
             view_context=CLUSTER_LIST_VIEW,
         )
@@ -201,6 +245,17 @@ def _validate_worker_node_ids(value: Optional[List[str]]) -> Optional[List[str]]
     return value
 
 
+def _write_deploy_timings(result: DeployClusterResult, path: Path) -> None:
+    cluster: Optional[Cluster] = result.deployed_cluster
+    timings: Dict[str, Any] = {
+        "cluster_id": cluster.id if cluster else None,
+        "cluster_name": cluster.name if cluster else None,
+        "total_ms": round(sum(p.duration_ms or 0 for p in result.timeline), 3),
+        "phases": [p.model_dump(mode="json") for p in result.timeline],
+    }
+    path.write_text(json.dumps(timings, indent=2))
+
+
 @clusters_app.command("deploy", help="Deploy a cluster")
 @handle_application_layer_errors(ClustersBundle)
 def deploy_cluster(
@@ -246,6 +301,18 @@ def deploy_cluster(
         "-f",
         help="Stream cluster logs after deployment starts",
     ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="Show how long each phase of the deployment took.",
+    ),
+    timings_output: Optional[Path] = typer.Option(
+        None,
+        "--timings-output",
+        help="Write the phase timings as JSON to this file instead of showing them.",
+        dir_okay=False,
+        writable=True,
+    ),
 ):
     """
     Create a cluster.
@@ -335,6 +402,15 @@ def deploy_cluster(
             view_context=CLUSTER_NODE_ISSUE_VIEW,
         )
 
+    if timings_output:
+        _write_deploy_timings(result, timings_output)
+    elif timings:
+        io_facade.display_data(
+            data=result.timeline,
+            output_format=bundle.object_output_format,
+            view_context=CLUSTER_DEPLOY_TIMELINE_VIEW,
+        )
+
     if follow and result.is_success:
         assert result.deployed_cluster is not None
         events: Iterator[ClusterEvent] = service.stream_cluster_logs(
@@ -358,6 +434,15 @@ def list_nodes(
         metavar="CLUSTER_NAME_OR_ID",
         callback=_resolve_cluster_id_callback,
     ),
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        "-w",
+        help="Keep the list open and update it as the nodes change, until Ctrl+C",
+    ),
+    interval: float = typer.Option(
+        2, "--interval", min=0.5, help="The seconds between updates with --watch"
+    ),
 ):
     """
     List all nodes of a cluster.
@@ -366,6 +451,18 @@ def list_nodes(
     io_facade: IOBaseModelFacade = bundle.get_io_facade()
     service: ClustersService = bundle.get_clusters_service()
 
+    if watch:
+        io_facade.display_watch(
+            watch_snapshots(
+                lambda: service.get_cluster(cluster_id).nodes,
+                key=lambda node: node.id,
+                interval_seconds=interval,
+            ),
+            bundle.object_output_format,
+            view_context=CLUSTER_NODE_LIST_VIEW,
+        )
+        return
+
     cluster: Cluster = service.get_cluster(cluster_id)
 
     io_facade.display_info_message(
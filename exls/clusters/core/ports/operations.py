@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Iterator, List
+from typing import Iterator, List, Optional
 
 from exls.clusters.core.domain import ClusterEvent, ClusterNode
 from exls.clusters.core.results import ClusterScaleResult
@@ -23,4 +23,6 @@ class ClusterOperations(ABC):
     def load_kubeconfig(self, cluster_id: str) -> str: ...
 
     @abstractmethod
-    def stream_logs(self, cluster_id: str) -> Iterator[ClusterEvent]: ...
+    def stream_logs(
+        self, cluster_id: str, idle_timeout_seconds: Optional[float] = None
+    ) -> Iterator[ClusterEvent]: ...
@@ -45,6 +45,11 @@ class NodesProvider(ABC):
     @abstractmethod
     def list_nodes(self) -> List[ClusterNodeData]: ...
 
+    @abstractmethod
+    def get_nodes_by_ids(self, node_ids: List[str]) -> List[ClusterNodeData]:
+        """The nodes with the given IDs; IDs of nodes that don't exist are skipped."""
+        ...
+
     @abstractmethod
     def list_available_nodes(self) -> List[ClusterNode]: ...
 
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from pydantic import BaseModel, Field, StrictStr
 
@@ -10,6 +10,7 @@ from exls.clusters.core.domain import (
     ClusterSummary,
     ClusterType,
 )
+from exls.shared.core.pagination import paginate
 
 
 class ClusterCreateParameters(BaseModel):
@@ -43,6 +44,11 @@ class ClusterRepository(ABC):
     @abstractmethod
     def list(self, status: Optional[ClusterStatus]) -> List[ClusterSummary]: ...
 
+    def iter_pages(
+        self, status: Optional[ClusterStatus], page_size: int
+    ) -> Iterator[List[ClusterSummary]]:
+        yield from paginate(self.list(status=status), page_size)
+
     @abstractmethod
     def get(self, cluster_id: str) -> Cluster: ...
 
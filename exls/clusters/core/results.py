@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field, StrictStr
 
 from exls.clusters.core.domain import Cluster, ClusterNode
 from exls.clusters.core.requests import ClusterDeployRequest
+from exls.shared.core.timeline import TimelinePhase
 
 
 class ClusterNodeIssue(BaseModel):
@@ -42,6 +43,10 @@ class DeployClusterResult(BaseModel):
         default_factory=lambda: cast(List[ClusterNodeIssue], []),
         description="List of issues encountered",
     )
+    timeline: List[TimelinePhase] = Field(
+        default_factory=lambda: cast(List[TimelinePhase], []),
+        description="The phases of the deployment, in the order they started",
+    )
 
     @property
     def is_success(self) -> bool:
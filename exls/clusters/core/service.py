@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import Future, wait
 from pathlib import Path
 from typing import Dict, Iterator, List, Optional, Tuple
 
@@ -34,11 +35,20 @@ from exls.clusters.core.results import (
 )
 from exls.shared.core.decorators import handle_service_layer_errors
 from exls.shared.core.exceptions import ServiceError
-from exls.shared.core.polling import PollingTimeoutError, poll_until
+from exls.shared.core.pagination import DEFAULT_PAGE_SIZE, limit_pages
+from exls.shared.core.polling import (
+    BatchWatcher,
+    PollingTimeoutError,
+    WatchedResourceNotFoundError,
+)
 from exls.shared.core.ports.file import FileWritePort
+from exls.shared.core.timeline import PhaseTimeline
 
 logger = logging.getLogger(__name__)
 
+NODE_WAIT_TIMEOUT_SECONDS: float = 60
+NODE_WAIT_INTERVAL_SECONDS: float = 3
+
 
 class ClustersService:
     def __init__(
@@ -52,6 +62,13 @@ class ClustersService:
         self._clusters_repository: ClusterRepository = clusters_repository
         self._nodes_provider: NodesProvider = nodes_provider
         self._file_write_adapter: FileWritePort[str] = file_write_adapter
+        self._node_watcher: BatchWatcher[ClusterNode] = BatchWatcher(
+            fetch=lambda: {
+                node.id: node for node in self._nodes_provider.list_available_nodes()
+            },
+            interval_seconds=NODE_WAIT_INTERVAL_SECONDS,
+            missing_is_final=True,
+        )
 
     @handle_service_layer_errors("listing clusters")
     def list_clusters(
@@ -59,6 +76,19 @@ class ClustersService:
     ) -> List[ClusterSummary]:
         return self._clusters_repository.list(status=status)
 
+    @handle_service_layer_errors("listing clusters")
+    def iter_clusters(
+        self,
+        status: Optional[ClusterStatus] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        limit: Optional[int] = None,
+    ) -> Iterator[List[ClusterSummary]]:
+        """List the clusters page by page, stopping after `limit` clusters."""
+        yield from limit_pages(
+            self._clusters_repository.iter_pages(status=status, page_size=page_size),
+            limit,
+        )
+
     @handle_service_layer_errors("getting cluster")
     def get_cluster(self, cluster_id: str) -> Cluster:
         cluster: Cluster = self._clusters_repository.get(cluster_id=cluster_id)
@@ -146,42 +176,33 @@ class ClustersService:
         if not node_ids:
             return [], []
 
-        def fetch() -> List[ClusterNode]:
-            return self._nodes_provider.list_available_nodes()
-
-        def predicate(nodes: List[ClusterNode]) -> bool:
-            node_map = {n.id: n for n in nodes}
-            for nid in node_ids:
-                if nid not in node_map:
-                    # We will detect and handle this case in the
-                    # final check below
-                    continue
-                node = node_map[nid]
-                if node.status == ClusterNodeStatus.DISCOVERING:
-                    return False
-            return True
-
-        # We poll the nodes until they are available or we timeout
-        # If we timeout, we fetch the nodes again to get the final state
-        # and iterate over them to build the final result
-        final_nodes: List[ClusterNode] = []
-        try:
-            final_nodes = poll_until(
-                fetcher=fetch,
-                predicate=predicate,
-                timeout_seconds=60,
-                interval_seconds=3,
-                error_message="Timed out waiting for nodes to become available",
+        # Each node is watched on its own, but all of them share one list
+        # call per tick. Missing nodes are reported by the final check below.
+        futures: List[Future[ClusterNode]] = [
+            self._node_watcher.watch(
+                nid,
+                predicate=lambda node: node.status != ClusterNodeStatus.DISCOVERING,
+                timeout_seconds=NODE_WAIT_TIMEOUT_SECONDS,
+                error_message=f"Timed out waiting for node {nid} to become available",
             )
-        except PollingTimeoutError as e:
-            logger.warning(f"Timed out waiting for nodes to become available: {e}")
-        except Exception as e:
-            raise ServiceError(
-                f"Unexpected error waiting for nodes to become available: {e}"
-            )
-        finally:
-            final_nodes = fetch()
+            for nid in node_ids
+        ]
+        wait(futures)
+
+        for future in futures:
+            error: Optional[BaseException] = future.exception()
+            if isinstance(error, PollingTimeoutError):
+                logger.warning(str(error))
+            elif error is not None and not isinstance(
+                error, WatchedResourceNotFoundError
+            ):
+                raise ServiceError(
+                    f"Unexpected error waiting for nodes to become available: {error}"
+                )
 
+        # Fetch the nodes again to get the final state of the ones that
+        # timed out or went missing, and build the result from it.
+        final_nodes: List[ClusterNode] = self._nodes_provider.list_available_nodes()
         node_map = {n.id: n for n in final_nodes}
         ready_ids: List[str] = []
         issues: List[ClusterNodeIssue] = []
@@ -218,9 +239,23 @@ class ClustersService:
     @handle_service_layer_errors("deploying cluster")
     def deploy_cluster(
         self, create_params: ClusterDeployRequest
+    ) -> DeployClusterResult:
+        timeline: PhaseTimeline = PhaseTimeline()
+        try:
+            return self._deploy_cluster(create_params, timeline)
+        except Exception:
+            logger.debug(f"Cluster deployment failed, timeline: {timeline.phases}")
+            raise
+
+    def _deploy_cluster(
+        self, create_params: ClusterDeployRequest, timeline: PhaseTimeline
     ) -> DeployClusterResult:
         # List the available nodes that can be deployed to
-        available_nodes: List[ClusterNode] = self._nodes_provider.list_available_nodes()
+        with timeline.phase("list_available_nodes") as phase:
+            available_nodes: List[ClusterNode] = (
+                self._nodes_provider.list_available_nodes()
+            )
+            phase.items = len(available_nodes)
         available_nodes_map: Dict[str, ClusterNode] = {
             node.id: node for node in available_nodes
         }
@@ -249,20 +284,27 @@ class ClustersService:
             ]
 
         # Validate Existing IDs and Check Status
-        valid_worker_ids, worker_poll_ids, worker_id_issues = self._validate_node_ids(
-            worker_ids_to_check, available_nodes_map
-        )
-        valid_cp_ids, cp_poll_ids, cp_id_issues = self._validate_node_ids(
-            cp_ids_to_check, available_nodes_map
-        )
+        with timeline.phase(
+            "validate_node_ids", items=len(worker_ids_to_check) + len(cp_ids_to_check)
+        ):
+            valid_worker_ids, worker_poll_ids, worker_id_issues = (
+                self._validate_node_ids(worker_ids_to_check, available_nodes_map)
+            )
+            valid_cp_ids, cp_poll_ids, cp_id_issues = self._validate_node_ids(
+                cp_ids_to_check, available_nodes_map
+            )
 
         # Import New Nodes (Bulk)
-        imported_worker_nodes, worker_import_issues = self._import_nodes_bulk(
-            worker_specs_to_import
-        )
-        imported_cp_nodes, cp_import_issues = self._import_nodes_bulk(
-            cp_specs_to_import
-        )
+        with timeline.phase("import_worker_nodes", items=len(worker_specs_to_import)):
+            imported_worker_nodes, worker_import_issues = self._import_nodes_bulk(
+                worker_specs_to_import
+            )
+        with timeline.phase(
+            "import_control_plane_nodes", items=len(cp_specs_to_import)
+        ):
+            imported_cp_nodes, cp_import_issues = self._import_nodes_bulk(
+                cp_specs_to_import
+            )
 
         # Combine all issues so far
         all_issues: List[ClusterNodeIssue] = (
@@ -272,13 +314,15 @@ class ClustersService:
         # Combine nodes that need polling from existing validation
         polled_ready_worker_ids: List[str] = []
         if worker_poll_ids:
-            ready_ids, polling_issues = self._wait_for_nodes(worker_poll_ids)
+            with timeline.phase("wait_for_worker_nodes", items=len(worker_poll_ids)):
+                ready_ids, polling_issues = self._wait_for_nodes(worker_poll_ids)
             polled_ready_worker_ids = ready_ids
             all_issues.extend(polling_issues)
 
         polled_ready_cp_ids: List[str] = []
         if cp_poll_ids:
-            ready_ids, polling_issues = self._wait_for_nodes(cp_poll_ids)
+            with timeline.phase("wait_for_control_plane_nodes", items=len(cp_poll_ids)):
+                ready_ids, polling_issues = self._wait_for_nodes(cp_poll_ids)
             polled_ready_cp_ids = ready_ids
             all_issues.extend(polling_issues)
 
@@ -299,6 +343,7 @@ class ClustersService:
             return DeployClusterResult(
                 deployed_cluster=None,
                 issues=all_issues,
+                timeline=timeline.phases,
             )
 
         # Build the create parameters with only valid nodes
@@ -315,13 +360,19 @@ class ClustersService:
             control_plane_node_ids=final_cp_ids,
         )
 
+        node_count: int = len(final_worker_ids) + len(final_cp_ids)
+
         # Create the cluster
-        cluster_id: str = self._clusters_repository.create(parameters=create_parameters)
+        with timeline.phase("create_cluster", items=node_count):
+            cluster_id: str = self._clusters_repository.create(
+                parameters=create_parameters
+            )
 
         # Deploy the cluster
-        deployed_cluster_id: str = self._clusters_operations.deploy(
-            cluster_id=cluster_id
-        )
+        with timeline.phase("deploy_cluster", items=node_count):
+            deployed_cluster_id: str = self._clusters_operations.deploy(
+                cluster_id=cluster_id
+            )
 
         final_worker_nodes: List[ClusterNode] = []
         for node_id in valid_worker_ids + polled_ready_worker_ids:
@@ -335,7 +386,10 @@ class ClustersService:
             cp_node.role = ClusterNodeRole.CONTROL_PLANE
             final_cp_nodes.append(cp_node)
 
-        cluster: Cluster = self._clusters_repository.get(cluster_id=deployed_cluster_id)
+        with timeline.phase("get_cluster"):
+            cluster: Cluster = self._clusters_repository.get(
+                cluster_id=deployed_cluster_id
+            )
         cluster_with_nodes: Cluster = Cluster(
             id=cluster.id,
             name=cluster.name,
@@ -353,7 +407,9 @@ class ClustersService:
 
         # Return result with any issues encountered during the process
         return DeployClusterResult(
-            deployed_cluster=cluster_with_nodes, issues=all_issues
+            deployed_cluster=cluster_with_nodes,
+            issues=all_issues,
+            timeline=timeline.phases,
         )
 
     def _validate_cluster_status(self, cluster: ClusterSummary) -> None:
@@ -456,8 +512,13 @@ class ClustersService:
         )
 
     @handle_service_layer_errors("streaming cluster logs")
-    def stream_cluster_logs(self, cluster_id: str) -> Iterator[ClusterEvent]:
-        return self._clusters_operations.stream_logs(cluster_id=cluster_id)
+    def stream_cluster_logs(
+        self, cluster_id: str, idle_timeout_seconds: Optional[float] = None
+    ) -> Iterator[ClusterEvent]:
+        """With `idle_timeout_seconds`, the stream ends after that long without events."""
+        return self._clusters_operations.stream_logs(
+            cluster_id=cluster_id, idle_timeout_seconds=idle_timeout_seconds
+        )
 
     def list_available_nodes(self) -> List[ClusterNode]:
         return self._nodes_provider.list_available_nodes()
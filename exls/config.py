@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import logging
+import os
+from enum import StrEnum
 from typing import Any, Optional
 
 import yaml
 from filelock import FileLock
-from pydantic import Field
+from pydantic import BaseModel, Field, ValidationError
 from pydantic.fields import FieldInfo
 from pydantic_settings import (
     BaseSettings,
@@ -19,7 +21,9 @@ from exls.defaults import (
     CONFIG_ENV_NESTED_DELIMITER,
     CONFIG_ENV_PREFIX,
     CONFIG_LOCK_FILE,
+    CONFIG_SNAPSHOT_FILE,
 )
+from exls.shared.adapters.file.commands import WriteBinaryFileAtomicallyCommand
 from exls.shared.adapters.ui.output.values import OutputFormat
 
 logger = logging.getLogger("cli.config")
@@ -34,6 +38,66 @@ class ConfigWorkspaceCreationPolling(BaseSettings):
         default=5,
         description="The interval in seconds to poll for workspace creation",
     )
+    event_wakeups: bool = Field(
+        default=True,
+        description="Check the workspace again as soon as the cluster's event "
+        "stream reports a relevant change, instead of only on the interval",
+    )
+
+
+class ConfigHttp(BaseSettings):
+    max_concurrency: int = Field(
+        default=10,
+        ge=1,
+        description="The maximum number of concurrent requests to the backend, "
+        "which is also the size of the HTTP connection pool",
+    )
+    adaptive_concurrency: bool = Field(
+        default=True,
+        description="Adapt the concurrency of bulk operations to the backend's "
+        "responses, between min_concurrency and max_concurrency",
+    )
+    min_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="The concurrency bulk operations start at and never drop below",
+    )
+    item_timeout_seconds: float = Field(
+        default=120,
+        gt=0,
+        description="The time limit of each item of a bulk operation, e.g. "
+        "deleting one node",
+    )
+    max_retries: int = Field(
+        default=3,
+        ge=0,
+        description="How often a request is retried after a transient failure",
+    )
+    retry_budget: int = Field(
+        default=20,
+        ge=0,
+        description="The maximum number of retries of all requests of one command",
+    )
+    cache_enabled: bool = Field(
+        default=False,
+        description="Cache list responses on disk and revalidate them with ETags "
+        "(opt-in)",
+    )
+    cache_max_age_seconds: int = Field(
+        default=0,
+        ge=0,
+        description="Use cached list responses younger than this without a request",
+    )
+    cache_max_bytes: int = Field(
+        default=20 * 1024 * 1024,
+        ge=0,
+        description="The size limit of the response cache",
+    )
+
+
+class TokenStoreBackend(StrEnum):
+    KEYRING = "keyring"
+    ENCRYPTED_FILE = "encrypted_file"
 
 
 class AppConfig(BaseSettings):
@@ -53,6 +117,14 @@ class AppConfig(BaseSettings):
         default=OutputFormat.TABLE,
         description="The default output format for objects",
     )
+    http: ConfigHttp = Field(
+        default=ConfigHttp(),
+        description="The HTTP client configuration",
+    )
+    token_store: TokenStoreBackend = Field(
+        default=TokenStoreBackend.KEYRING,
+        description="Where the authentication tokens are stored",
+    )
 
     model_config = SettingsConfigDict(
         env_prefix=CONFIG_ENV_PREFIX,
@@ -78,6 +150,22 @@ class AppConfig(BaseSettings):
         )
 
 
+class ConfigSnapshot(BaseModel):
+    """The parsed content of the config file, keyed by the file's identity."""
+
+    inode: int = Field(..., description="The inode of the parsed config file")
+    mtime_ns: int = Field(..., description="The modification time of the file")
+    size: int = Field(..., description="The size of the file in bytes")
+    data: dict[str, Any] = Field(..., description="The parsed YAML content")
+
+    def matches(self, stat: os.stat_result) -> bool:
+        return (self.inode, self.mtime_ns, self.size) == (
+            stat.st_ino,
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+
+
 class ExalsiusYamlConfig(PydanticBaseSettingsSource):
     def __call__(self) -> dict[str, Any]:
         """
@@ -92,22 +180,62 @@ class ExalsiusYamlConfig(PydanticBaseSettingsSource):
 
     def _load_config(self) -> dict[str, Any]:
         """
-        Loads and merges YAML files from the AWS plugin's config directory.
+        Loads the YAML config file.
 
-        Supports both .yml and .yaml file extensions. YAML files are merged with
-        a simple update, meaning keys in later-loaded files will overwrite those
-        from earlier ones. Files are processed in alphabetical order by filename.
-        The entire merged configuration is placed under an 'aws' key.
+        The config file is only ever replaced atomically (see `save_config`), so
+        reading it does not need the config lock. The parsed content is kept in a
+        JSON snapshot next to the YAML file; as long as the file's inode, mtime and
+        size match the snapshot, the snapshot is used and YAML parsing is skipped.
 
         Returns:
-            A dictionary containing the merged configuration under the 'aws' key.
+            The dictionary of configuration data.
         """
-        if not CFG_FILE.exists():
+        try:
+            stat: os.stat_result = os.stat(CFG_FILE)
+        except FileNotFoundError:
             return {}
 
-        with FileLock(CONFIG_LOCK_FILE):
-            with CFG_FILE.open() as f:
-                return yaml.safe_load(f) or {}
+        snapshot: Optional[ConfigSnapshot] = self._read_snapshot()
+        if snapshot and snapshot.matches(stat):
+            return snapshot.data
+
+        try:
+            with CFG_FILE.open("rb") as f:
+                # Key the snapshot by the file we actually read, which may have been
+                # replaced since the stat above.
+                stat = os.fstat(f.fileno())
+                data: dict[str, Any] = yaml.safe_load(f) or {}
+        except FileNotFoundError:
+            return {}
+
+        self._write_snapshot(
+            ConfigSnapshot(
+                inode=stat.st_ino,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                data=data,
+            )
+        )
+        return data
+
+    def _read_snapshot(self) -> Optional[ConfigSnapshot]:
+        try:
+            return ConfigSnapshot.model_validate_json(CONFIG_SNAPSHOT_FILE.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as e:
+            logger.debug(f"Ignoring unreadable config snapshot: {e}")
+            return None
+
+    def _write_snapshot(self, snapshot: ConfigSnapshot) -> None:
+        try:
+            WriteBinaryFileAtomicallyCommand(
+                file_path=CONFIG_SNAPSHOT_FILE,
+                content=snapshot.model_dump_json().encode("utf-8"),
+            ).execute()
+        except (OSError, ValueError) as e:
+            # The snapshot is only an optimization, e.g. the directory may be read-only.
+            logger.debug(f"Failed to write config snapshot: {e}")
 
     def get_field_value(
         self, field: FieldInfo, field_name: str
@@ -127,6 +255,14 @@ def load_config(force_reload: bool = False) -> AppConfig:
 
 
 def save_config(cfg: AppConfig) -> None:
+    """
+    Saves the configuration by atomically replacing the config file.
+
+    The lock only serializes concurrent writers; readers never take it.
+    """
+    CFG_DIR.mkdir(parents=True, exist_ok=True)
     with FileLock(CONFIG_LOCK_FILE):
-        CFG_DIR.mkdir(parents=True, exist_ok=True)
-        CFG_FILE.write_text(yaml.dump(cfg.model_dump(mode="json")))
+        WriteBinaryFileAtomicallyCommand(
+            file_path=CFG_FILE,
+            content=yaml.dump(cfg.model_dump(mode="json")).encode("utf-8"),
+        ).execute()
@@ -4,6 +4,10 @@ from pathlib import Path
 CFG_DIR = Path(os.getenv("XDG_CONFIG_HOME", "~/.config")).expanduser() / "exalsius"
 CFG_FILE = CFG_DIR / "config.yaml"
 CONFIG_LOCK_FILE = CFG_DIR / "config.lock"
+CONFIG_SNAPSHOT_FILE = CFG_DIR / "config.snapshot.json"
+DAEMON_SOCKET_FILE = CFG_DIR / "daemon.sock"
+DAEMON_LOG_FILE = CFG_DIR / "daemon.log"
+HTTP_CACHE_DIR = CFG_DIR / "cache" / "http"
 
 CONFIG_ENV_PREFIX = "EXLS_"
 CONFIG_ENV_NESTED_DELIMITER = "__"
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from termcolor import colored
 
@@ -38,6 +38,9 @@ class ColorFormatter(logging.Formatter):
         return formatter.format(record)
 
 
+_installed_handlers: List[logging.Handler] = []
+
+
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> None:
     log_level = log_level.upper()
     level = getattr(logging, log_level, logging.INFO)
@@ -45,11 +48,19 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> No
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
+    # Replace the handlers of a previous call, e.g. of an earlier invocation
+    # served by the same daemon process.
+    for handler in _installed_handlers:
+        root_logger.removeHandler(handler)
+        handler.close()
+    _installed_handlers.clear()
+
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
     console_handler.setFormatter(ColorFormatter())
     root_logger.addHandler(console_handler)
+    _installed_handlers.append(console_handler)
 
     # File handler
     if log_file:
@@ -61,3 +72,4 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> No
         )
         file_handler.setFormatter(formatter)
         root_logger.addHandler(file_handler)
+        _installed_handlers.append(file_handler)
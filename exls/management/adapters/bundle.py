@@ -20,7 +20,8 @@ class ManagementBundle(BaseBundle):
             api_client=self.create_api_client()
         )
         management_gateway: ManagementGateway = ManagementGatewaySdk(
-            management_api=management_api
+            management_api=management_api,
+            response_cache=self.get_response_cache(),
         )
         file_read_adapter: FileReadPort[str] = StringBase64FileReadAdapter()
         return ManagementService(
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from exalsius_api_client.api.management_api import ManagementApi
 from exalsius_api_client.models.dashboard_url_response import (
     DashboardUrlResponse,
@@ -9,6 +11,7 @@ from exalsius_api_client.models.workspace_template_list_response import (
     WorkspaceTemplateListResponse,
 )
 
+from exls.shared.adapters.sdk.cache import SdkResponseCache, api_client_of
 from exls.shared.adapters.sdk.command import ExalsiusSdkCommand
 
 
@@ -24,20 +27,56 @@ class BaseManagementSdkCommand[T_Cmd_Return](
 class ListWorkspaceTemplatesSdkCommand(
     BaseManagementSdkCommand[WorkspaceTemplateListResponse]
 ):
+    def __init__(
+        self,
+        api_client: ManagementApi,
+        response_cache: Optional[SdkResponseCache] = None,
+    ):
+        super().__init__(api_client)
+        self._response_cache: Optional[SdkResponseCache] = response_cache
+
     def _execute_api_call(self) -> WorkspaceTemplateListResponse:
-        response: WorkspaceTemplateListResponse = (
-            self.api_client.list_workspace_templates()
+        if self._response_cache is None:
+            return self.api_client.list_workspace_templates()
+        response: WorkspaceTemplateListResponse = self._response_cache.get(
+            api_client=api_client_of(self.api_client),
+            resource="workspace_templates",
+            key="list_workspace_templates",
+            request=lambda headers: self.api_client.list_workspace_templates_without_preload_content(
+                _headers=headers
+            ),
+            response_type="WorkspaceTemplateListResponse",
         )
         return response
 
 
 class ListSshKeysSdkCommand(BaseManagementSdkCommand[SshKeysListResponse]):
+    def __init__(
+        self,
+        api_client: ManagementApi,
+        response_cache: Optional[SdkResponseCache] = None,
+    ):
+        super().__init__(api_client)
+        self._response_cache: Optional[SdkResponseCache] = response_cache
+
     def _execute_api_call(self) -> SshKeysListResponse:
-        response: SshKeysListResponse = self.api_client.list_ssh_keys()
+        if self._response_cache is None:
+            return self.api_client.list_ssh_keys()
+        response: SshKeysListResponse = self._response_cache.get(
+            api_client=api_client_of(self.api_client),
+            resource="ssh_keys",
+            key="list_ssh_keys",
+            request=lambda headers: self.api_client.list_ssh_keys_without_preload_content(
+                _headers=headers
+            ),
+            response_type="SshKeysListResponse",
+        )
         return response
 
 
 class AddSshKeySdkCommand(BaseManagementSdkCommand[SshKeyCreateResponse]):
+    idempotent = False
+
     def __init__(self, api_client: ManagementApi, request: SshKeyCreateRequest):
         super().__init__(api_client)
 
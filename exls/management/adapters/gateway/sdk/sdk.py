@@ -28,6 +28,8 @@ from exls.management.core.domain import (
     SshKeyScope,
     WorkspaceTemplate,
 )
+from exls.shared.adapters.memo import invalidates, memoized_read
+from exls.shared.adapters.sdk.cache import SdkResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -53,11 +55,23 @@ def _workspace_template_from_sdk_model(
 
 
 class ManagementGatewaySdk(ManagementGateway):
-    def __init__(self, management_api: ManagementApi):
+    def __init__(
+        self,
+        management_api: ManagementApi,
+        response_cache: Optional[SdkResponseCache] = None,
+    ):
         self._management_api = management_api
+        self._response_cache: Optional[SdkResponseCache] = response_cache
 
+    def _invalidate_cached_lists(self, *resources: str) -> None:
+        if self._response_cache is not None:
+            self._response_cache.invalidate(*resources)
+
+    @memoized_read("ssh_keys")
     def list_ssh_keys(self) -> List[SshKey]:
-        command: ListSshKeysSdkCommand = ListSshKeysSdkCommand(self._management_api)
+        command: ListSshKeysSdkCommand = ListSshKeysSdkCommand(
+            self._management_api, response_cache=self._response_cache
+        )
         response: SshKeysListResponse = command.execute()
         ssh_keys: List[SshKey] = []
         if response.ssh_keys:
@@ -69,13 +83,16 @@ class ManagementGatewaySdk(ManagementGateway):
                     ssh_keys.append(ssh_key_domain)
         return ssh_keys
 
+    @invalidates("ssh_keys")
     def delete_ssh_key(self, ssh_key_id: str) -> str:
         command: DeleteSshKeySdkCommand = DeleteSshKeySdkCommand(
             self._management_api, ssh_key_id
         )
         command.execute()
+        self._invalidate_cached_lists("ssh_keys")
         return ssh_key_id
 
+    @invalidates("ssh_keys")
     def create_ssh_key(
         self, name: str, base64_key_content: str, scope: str = "private"
     ) -> str:
@@ -91,11 +108,13 @@ class ManagementGatewaySdk(ManagementGateway):
             self._management_api, request=create_request
         )
         response: SshKeyCreateResponse = command.execute()
+        self._invalidate_cached_lists("ssh_keys")
         return response.ssh_key_id
 
+    @memoized_read("workspace_templates")
     def list_workspace_templates(self) -> List[WorkspaceTemplate]:
         command: ListWorkspaceTemplatesSdkCommand = ListWorkspaceTemplatesSdkCommand(
-            self._management_api
+            self._management_api, response_cache=self._response_cache
         )
         response: WorkspaceTemplateListResponse = command.execute()
         return [
@@ -103,6 +122,7 @@ class ManagementGatewaySdk(ManagementGateway):
             for wt in response.workspace_templates
         ]
 
+    @memoized_read("dashboard")
     def get_dashboard_url(self) -> str:
         command: GetDashboardUrlSdkCommand = GetDashboardUrlSdkCommand(
             api_client=self._management_api
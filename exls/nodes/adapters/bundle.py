@@ -26,7 +26,9 @@ class NodesBundle(BaseBundle):
 
     def get_nodes_service(self) -> NodesService:
         nodes_api: NodesApi = NodesApi(api_client=self.create_api_client())
-        nodes_gateway: NodesGateway = SdkNodesGateway(nodes_api=nodes_api)
+        nodes_gateway: NodesGateway = SdkNodesGateway(
+            nodes_api=nodes_api, response_cache=self.get_response_cache()
+        )
         ssh_key_provider: SshKeyProvider = ManagementDomainSshProvider(
             management_service=self._management_bundle.get_management_service()
         )
@@ -34,6 +36,9 @@ class NodesBundle(BaseBundle):
             nodes_repository=nodes_gateway,
             nodes_operations=nodes_gateway,
             ssh_key_provider=ssh_key_provider,
+            max_concurrency=self.config.http.max_concurrency,
+            concurrency_limiter=self.get_concurrency_limiter(),
+            item_timeout_seconds=self.config.http.item_timeout_seconds,
         )
 
     def get_import_selfmanaged_node_flow(self) -> ImportSelfmanagedNodeFlow:
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from exalsius_api_client.api.nodes_api import NodesApi
 from exalsius_api_client.models.node_delete_response import NodeDeleteResponse
@@ -11,6 +11,7 @@ from exls.nodes.core.requests import (
     ImportCloudNodeRequest,
     NodesFilterCriteria,
 )
+from exls.shared.adapters.sdk.cache import SdkResponseCache, api_client_of
 from exls.shared.adapters.sdk.command import (
     ExalsiusSdkCommand,
     UnexpectedSdkCommandResponseError,
@@ -26,17 +27,34 @@ class BaseNodesSdkCommand[T_Cmd_Return](ExalsiusSdkCommand[NodesApi, T_Cmd_Retur
 class ListNodesSdkCommand(BaseNodesSdkCommand[NodesListResponse]):
     """Command to list nodes."""
 
-    def __init__(self, api_client: NodesApi, request: Optional[NodesFilterCriteria]):
+    def __init__(
+        self,
+        api_client: NodesApi,
+        request: Optional[NodesFilterCriteria],
+        response_cache: Optional[SdkResponseCache] = None,
+    ):
         super().__init__(api_client)
 
         self._request: Optional[NodesFilterCriteria] = request
+        self._response_cache: Optional[SdkResponseCache] = response_cache
 
     def _execute_api_call(self) -> NodesListResponse:
-        response: NodesListResponse = self.api_client.list_nodes(
-            node_type=self._request.node_type if self._request else None,
-            provider=self._request.provider if self._request else None,
-            sort_field=self._request.sort_field if self._request else None,
-            order_by=self._request.order_by if self._request else None,
+        params: Dict[str, Any] = {
+            "node_type": self._request.node_type if self._request else None,
+            "provider": self._request.provider if self._request else None,
+            "sort_field": self._request.sort_field if self._request else None,
+            "order_by": self._request.order_by if self._request else None,
+        }
+        if self._response_cache is None:
+            return self.api_client.list_nodes(**params)
+        response: NodesListResponse = self._response_cache.get(
+            api_client=api_client_of(self.api_client),
+            resource="nodes",
+            key=f"list_nodes {sorted(params.items())}",
+            request=lambda headers: self.api_client.list_nodes_without_preload_content(
+                **params, _headers=headers
+            ),
+            response_type="NodesListResponse",
         )
         return response
 
@@ -73,6 +91,8 @@ class DeleteNodeSdkCommand(BaseNodesSdkCommand[NodeDeleteResponse]):
 
 
 class ImportSSHNodeSdkCommand(BaseNodesSdkCommand[str]):
+    idempotent = False
+
     def __init__(self, api_client: NodesApi, request: NodeImportSshRequest):
         super().__init__(api_client)
 
@@ -100,6 +120,8 @@ class ImportSSHNodeSdkCommand(BaseNodesSdkCommand[str]):
 
 
 class ImportCloudNodeSdkCommand(BaseNodesSdkCommand[NodeImportResponse]):
+    idempotent = False
+
     def __init__(self, api_client: NodesApi, request: ImportCloudNodeRequest):
         super().__init__(api_client)
 
@@ -1,5 +1,5 @@
 from functools import singledispatch
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Union
 
 from exalsius_api_client.api.nodes_api import NodesApi
 from exalsius_api_client.models.cloud_node import CloudNode as SdkCloudNode
@@ -36,7 +36,14 @@ from exls.nodes.core.requests import (
     ImportCloudNodeRequest,
     NodesFilterCriteria,
 )
-from exls.shared.adapters.sdk.command import UnexpectedSdkCommandResponseError
+from exls.shared.adapters.memo import invalidates, memoized_read
+from exls.shared.adapters.sdk.cache import SdkResponseCache
+from exls.shared.adapters.sdk.command import (
+    ExalsiusSdkCommandError,
+    UnexpectedSdkCommandResponseError,
+)
+from exls.shared.core.filtering import LocalFilter
+from exls.shared.core.pagination import paginate
 
 
 def _map_node_resources_from_sdk_model(
@@ -108,28 +115,79 @@ def _(sdk_model: SdkSelfManagedNode) -> SelfManagedNode:
     )
 
 
+def _local_node_filter(filter: Optional[NodesFilterCriteria]) -> LocalFilter[BaseNode]:
+    """
+    The criteria the list endpoint has no query parameters for.
+
+    Node type, provider and sorting are passed to the API by ListNodesSdkCommand.
+    """
+    if filter is None:
+        return LocalFilter([])
+    status: Optional[str] = filter.status.lower() if filter.status else None
+    hostname_prefix: Optional[str] = filter.hostname_prefix
+    gpu_vendor: Optional[str] = filter.gpu_vendor.lower() if filter.gpu_vendor else None
+    min_gpu_count: Optional[int] = filter.min_gpu_count
+    return LocalFilter(
+        [
+            (lambda node: node.status.lower() == status) if status else None,
+            (
+                (lambda node: node.hostname.startswith(hostname_prefix))
+                if hostname_prefix
+                else None
+            ),
+            (
+                (lambda node: node.resources.gpu_vendor.lower() == gpu_vendor)
+                if gpu_vendor
+                else None
+            ),
+            (
+                (lambda node: node.resources.gpu_count >= min_gpu_count)
+                if min_gpu_count is not None
+                else None
+            ),
+        ]
+    )
+
+
 class SdkNodesGateway(NodesGateway):
-    def __init__(self, nodes_api: NodesApi):
+    def __init__(
+        self,
+        nodes_api: NodesApi,
+        response_cache: Optional[SdkResponseCache] = None,
+    ):
         self._nodes_api = nodes_api
+        self._response_cache: Optional[SdkResponseCache] = response_cache
 
-    def list(self, filter: Optional[NodesFilterCriteria]) -> List[BaseNode]:
+    def _invalidate_cached_lists(self, *resources: str) -> None:
+        if self._response_cache is not None:
+            self._response_cache.invalidate(*resources)
+
+    def _iter_nodes(self, filter: Optional[NodesFilterCriteria]) -> Iterator[BaseNode]:
         command = ListNodesSdkCommand(
             self._nodes_api,
             request=filter,
+            response_cache=self._response_cache,
         )
         response: NodesListResponse = command.execute()
-        nodes: List[BaseNode] = [
-            _node_domain_from_sdk_model(node.actual_instance)
-            for node in response.nodes
-            if node.actual_instance is not None
-        ]
-        if filter and filter.status is not None:
-            nodes = [
-                node for node in nodes if node.status.lower() == filter.status.lower()
-            ]
+        local_filter: LocalFilter[BaseNode] = _local_node_filter(filter)
+        yield from local_filter.apply(
+            _node_domain_from_sdk_model(sdk_node.actual_instance)
+            for sdk_node in response.nodes
+            if sdk_node.actual_instance is not None
+        )
+
+    @memoized_read("nodes")
+    def list(self, filter: Optional[NodesFilterCriteria]) -> List[BaseNode]:
+        return list(self._iter_nodes(filter))
 
-        return nodes
+    def iter_pages(
+        self, filter: Optional[NodesFilterCriteria], page_size: int
+    ) -> Iterator[List[BaseNode]]:
+        # The API returns all nodes in one response; the nodes are mapped to
+        # the domain one page at a time, as the pages are consumed.
+        yield from paginate(self._iter_nodes(filter), page_size)
 
+    @memoized_read("nodes")
     def get(self, node_id: str) -> BaseNode:
         command = GetNodeSdkCommand(self._nodes_api, node_id)
         response: NodeResponse = command.execute()
@@ -140,14 +198,31 @@ class SdkNodesGateway(NodesGateway):
             )
         return _node_domain_from_sdk_model(response.actual_instance)
 
+    def find(self, node_id: str) -> Optional[BaseNode]:
+        try:
+            return self.get(node_id)
+        except ExalsiusSdkCommandError as e:
+            if e.status == 404:
+                return None
+            raise
+
+    @invalidates("nodes", "clusters")
     def delete(self, node_id: str) -> str:
         command = DeleteNodeSdkCommand(self._nodes_api, node_id)
         response: NodeDeleteResponse = command.execute()
+        self._invalidate_cached_lists("nodes", "clusters")
         return response.node_id
 
-    def import_selfmanaged_node(
+    @invalidates("nodes", "clusters")
+    async def delete_async(self, node_id: str) -> str:
+        command = DeleteNodeSdkCommand(self._nodes_api, node_id)
+        response: NodeDeleteResponse = await command.execute_async()
+        self._invalidate_cached_lists("nodes", "clusters")
+        return response.node_id
+
+    def _import_ssh_node_command(
         self, parameters: ImportSelfmanagedNodeParameters
-    ) -> str:
+    ) -> ImportSSHNodeSdkCommand:
         sdk_request: SdkNodeImportSshRequest = SdkNodeImportSshRequest(
             hostname=parameters.hostname,
             endpoint=parameters.endpoint,
@@ -155,13 +230,25 @@ class SdkNodesGateway(NodesGateway):
             ssh_key_id=parameters.ssh_key_id,
             price_per_hour=parameters.price_per_hour,
         )
-        cmd_node_import_ssh: ImportSSHNodeSdkCommand = ImportSSHNodeSdkCommand(
-            self._nodes_api,
-            request=sdk_request,
-        )
-        node_id: str = cmd_node_import_ssh.execute()
+        return ImportSSHNodeSdkCommand(self._nodes_api, request=sdk_request)
+
+    @invalidates("nodes")
+    def import_selfmanaged_node(
+        self, parameters: ImportSelfmanagedNodeParameters
+    ) -> str:
+        node_id: str = self._import_ssh_node_command(parameters).execute()
+        self._invalidate_cached_lists("nodes", "clusters")
+        return node_id
+
+    @invalidates("nodes")
+    async def import_selfmanaged_node_async(
+        self, parameters: ImportSelfmanagedNodeParameters
+    ) -> str:
+        node_id: str = await self._import_ssh_node_command(parameters).execute_async()
+        self._invalidate_cached_lists("nodes", "clusters")
         return node_id
 
+    @invalidates("nodes")
     def import_cloud_nodes(self, parameters: ImportCloudNodeRequest) -> List[str]:
         cmd_cloud_node_import: ImportCloudNodeSdkCommand = ImportCloudNodeSdkCommand(
             self._nodes_api,
@@ -172,5 +259,6 @@ class SdkNodesGateway(NodesGateway):
             ),
         )
         response: NodeImportResponse = cmd_cloud_node_import.execute()
+        self._invalidate_cached_lists("nodes", "clusters")
         node_ids: List[str] = [node_id for node_id in response.node_ids]
         return node_ids
@@ -1,6 +1,8 @@
+import itertools
+from collections import Counter
 from enum import StrEnum
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Callable, Iterator, List, Optional, Sequence, Union
 
 import typer
 
@@ -32,6 +34,9 @@ from exls.shared.adapters.ui.utils import (
     get_config_from_ctx,
     help_if_no_subcommand,
 )
+from exls.shared.core.pagination import DEFAULT_PAGE_SIZE
+from exls.shared.core.parallel import ExecutionProgress, ExecutionStatus
+from exls.shared.core.polling import watch_snapshots
 from exls.shared.core.resolver import (
     AmbiguousResourceError,
     ResourceNotFoundError,
@@ -104,12 +109,42 @@ def list_nodes(
     status: Optional[AllowedNodeStatuses] = typer.Option(
         None, "--status", "-S", help="Filter nodes by status"
     ),
+    provider: Optional[str] = typer.Option(
+        None, "--provider", help="Filter cloud nodes by provider (e.g. aws)"
+    ),
+    hostname_prefix: Optional[str] = typer.Option(
+        None, "--hostname-prefix", help="Filter nodes by the start of their hostname"
+    ),
+    gpu_vendor: Optional[str] = typer.Option(
+        None, "--gpu-vendor", help="Filter nodes by GPU vendor (e.g. nvidia)"
+    ),
+    min_gpus: Optional[int] = typer.Option(
+        None, "--min-gpus", min=0, help="Filter nodes by minimum number of GPUs"
+    ),
     sort_by: Optional[AllowedSortFields] = typer.Option(
         None, "--sort-by", "-s", help="Sort nodes by field"
     ),
     order: Optional[AllowedSortOrders] = typer.Option(
         None, "--order", "-o", help="Sort order"
     ),
+    limit: Optional[int] = typer.Option(
+        None, "--limit", min=1, help="Show at most this many nodes"
+    ),
+    page_size: int = typer.Option(
+        DEFAULT_PAGE_SIZE,
+        "--page-size",
+        min=1,
+        help="The number of nodes fetched and shown at a time",
+    ),
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        "-w",
+        help="Keep the list open and update it as nodes change, until Ctrl+C",
+    ),
+    interval: float = typer.Option(
+        2, "--interval", min=0.5, help="The seconds between updates with --watch"
+    ),
 ):
     """List all nodes in the node pool"""
 
@@ -117,23 +152,45 @@ def list_nodes(
     service: NodesService = bundle.get_nodes_service()
     io_facade: IOBaseModelFacade = bundle.get_io_facade()
 
-    domain_nodes: List[BaseNode] = service.list_nodes(
-        NodesFilterCriteria(
-            node_type=node_type.value.upper() if node_type else None,
-            status=NodeStatus.from_str(status.value) if status else None,
-            sort_field=sort_by.value.upper() if sort_by else None,
-            order_by=order.value.upper() if order else None,
+    criteria: NodesFilterCriteria = NodesFilterCriteria(
+        node_type=node_type.value.upper() if node_type else None,
+        provider=provider,
+        status=NodeStatus.from_str(status.value) if status else None,
+        hostname_prefix=hostname_prefix,
+        gpu_vendor=gpu_vendor,
+        min_gpu_count=min_gpus,
+        sort_field=sort_by.value.upper() if sort_by else None,
+        order_by=order.value.upper() if order else None,
+    )
+    if watch:
+        io_facade.display_watch(
+            watch_snapshots(
+                lambda: list(
+                    itertools.chain.from_iterable(
+                        service.iter_nodes(criteria, page_size=page_size, limit=limit)
+                    )
+                ),
+                key=lambda node: node.id,
+                interval_seconds=interval,
+            ),
+            bundle.object_output_format,
+            view_context=NODE_LIST_VIEW,
         )
+        return
+
+    pages: Iterator[List[BaseNode]] = service.iter_nodes(
+        criteria, page_size=page_size, limit=limit
     )
+    first_page: Optional[List[BaseNode]] = next(pages, None)
 
-    if len(domain_nodes) == 0:
+    if first_page is None:
         io_facade.display_info_message(
             "No nodes found. Run 'exls nodes import' to import a node.",
             bundle.message_output_format,
         )
     else:
-        io_facade.display_data(
-            data=domain_nodes,
+        io_facade.display_pages(
+            pages=itertools.chain([first_page], pages),
             output_format=bundle.object_output_format,
             view_context=NODE_LIST_VIEW,
         )
@@ -179,6 +236,18 @@ def delete_nodes(
         "-y",
         help="Confirm the deletion of the nodes. If not provided, you will be asked for confirmation.",
     ),
+    max_failures: Optional[int] = typer.Option(
+        None,
+        "--max-failures",
+        min=1,
+        help="Stop deleting after this many nodes failed to delete",
+    ),
+    timeout: Optional[float] = typer.Option(
+        None,
+        "--timeout",
+        min=0,
+        help="Stop deleting after this many seconds; nodes not deleted by then are reported",
+    ),
 ):
     """Delete a node in the node pool."""
     bundle: NodesBundle = _get_bundle(ctx)
@@ -207,7 +276,17 @@ def delete_nodes(
         if not user_confirmation:
             raise typer.Exit()
 
-    deleted_node_ids_result = service.delete_nodes(resolved_node_ids)
+    with io_facade.display_progress(
+        "Deleting nodes",
+        total=len(resolved_node_ids),
+        output_format=bundle.object_output_format,
+    ) as update:
+        deleted_node_ids_result = service.delete_nodes(
+            resolved_node_ids,
+            on_progress=_progress_callback(update),
+            max_failures=max_failures,
+            timeout_seconds=timeout,
+        )
 
     io_facade.display_success_message(
         f"Nodes {', '.join(deleted_node_ids_result.deleted_node_ids)} deleted successfully",
@@ -215,10 +294,13 @@ def delete_nodes(
     )
     if deleted_node_ids_result.issues:
         io_facade.display_error_message(
-            f"Failed to delete {len(deleted_node_ids_result.issues)} nodes",
+            f"Failed to delete {len(deleted_node_ids_result.issues)} nodes "
+            f"({_describe_statuses([i.status for i in deleted_node_ids_result.issues])})",
             output_format=bundle.message_output_format,
         )
         # We could add a view for delete issues if needed
+    if deleted_node_ids_result.interrupted:
+        raise typer.Exit(130)
 
 
 @nodes_app.command("import-ssh", help="Import a self-managed node via SSH")
@@ -273,17 +355,21 @@ def import_selfmanaged_node(
             "No SSH key provided. Please provide an SSH key ID or a name and path to a new SSH key."
         )
 
-    result: ImportSelfmanagedNodesResult = service.import_selfmanaged_nodes(
-        [
-            ImportSelfmanagedNodeRequest(
-                hostname=hostname,
-                endpoint=endpoint,
-                username=username,
-                price_per_hour=price_per_hour,
-                ssh_key=final_ssh_key,
-            )
-        ]
-    )
+    with io_facade.display_progress(
+        "Importing nodes", total=1, output_format=bundle.object_output_format
+    ) as update:
+        result: ImportSelfmanagedNodesResult = service.import_selfmanaged_nodes(
+            [
+                ImportSelfmanagedNodeRequest(
+                    hostname=hostname,
+                    endpoint=endpoint,
+                    username=username,
+                    price_per_hour=price_per_hour,
+                    ssh_key=final_ssh_key,
+                )
+            ],
+            on_progress=_progress_callback(update),
+        )
 
     _display_import_result(1, result, bundle, io_facade)
 
@@ -306,13 +392,37 @@ def import_nodes(ctx: typer.Context):
     # Convert Flow DTO to Domain Request
     import_request: ImportSelfmanagedNodeRequest = flow_request.to_domain()
 
-    result: ImportSelfmanagedNodesResult = node_service.import_selfmanaged_nodes(
-        [import_request]
-    )
+    with io_facade.display_progress(
+        "Importing nodes", total=1, output_format=bundle.object_output_format
+    ) as update:
+        result: ImportSelfmanagedNodesResult = node_service.import_selfmanaged_nodes(
+            [import_request], on_progress=_progress_callback(update)
+        )
 
     _display_import_result(1, result, bundle, io_facade)
 
 
+def _progress_callback(
+    update: Callable[[int], None],
+) -> Callable[[ExecutionProgress[object]], None]:
+    """Forward the progress of a bulk operation to a progress display."""
+
+    def _on_progress(progress: ExecutionProgress[object]) -> None:
+        update(progress.completed)
+
+    return _on_progress
+
+
+def _describe_statuses(statuses: Sequence[ExecutionStatus]) -> str:
+    """E.g. '2 failed, 1 timed out, 3 not started'."""
+    counts: Counter[ExecutionStatus] = Counter(statuses)
+    return ", ".join(
+        f"{counts[status]} {status.value}"
+        for status in ExecutionStatus
+        if counts[status]
+    )
+
+
 def _display_import_result(
     num_imports: int,
     result: ImportSelfmanagedNodesResult,
@@ -334,7 +444,8 @@ def _display_import_result(
 
     else:
         io_facade.display_error_message(
-            f"Failed to import {len(result.issues)} / {num_imports} nodes",
+            f"Failed to import {len(result.issues)} / {num_imports} nodes "
+            f"({_describe_statuses([issue.status for issue in result.issues])})",
             output_format=bundle.message_output_format,
         )
         io_facade.display_info_message(
@@ -356,3 +467,5 @@ def _display_import_result(
                 output_format=bundle.object_output_format,
                 view_context=NODE_LIST_VIEW,
             )
+    if result.interrupted:
+        raise typer.Exit(130)
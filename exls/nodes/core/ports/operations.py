@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List
 
@@ -54,6 +55,11 @@ class NodesOperations(ABC):
         self, parameters: ImportSelfmanagedNodeParameters
     ) -> str: ...
 
+    async def import_selfmanaged_node_async(
+        self, parameters: ImportSelfmanagedNodeParameters
+    ) -> str:
+        return await asyncio.to_thread(self.import_selfmanaged_node, parameters)
+
     # We leake the domain's request here, which is fine since they
     # are identical
     @abstractmethod
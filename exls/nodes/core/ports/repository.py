@@ -1,18 +1,36 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from exls.nodes.core.domain import BaseNode
 from exls.nodes.core.requests import NodesFilterCriteria
+from exls.shared.core.pagination import paginate
 
 
 class NodesRepository(ABC):
     @abstractmethod
     def list(self, filter: Optional[NodesFilterCriteria]) -> List[BaseNode]: ...
 
+    def iter_pages(
+        self, filter: Optional[NodesFilterCriteria], page_size: int
+    ) -> Iterator[List[BaseNode]]:
+        yield from paginate(self.list(filter=filter), page_size)
+
     @abstractmethod
     def get(self, node_id: str) -> BaseNode: ...
 
+    @abstractmethod
+    def find(self, node_id: str) -> Optional[BaseNode]:
+        """Like `get`, but returns None if the node does not exist."""
+        ...
+
+    async def find_async(self, node_id: str) -> Optional[BaseNode]:
+        return await asyncio.to_thread(self.find, node_id)
+
     @abstractmethod
     def delete(self, node_id: str) -> str: ...
+
+    async def delete_async(self, node_id: str) -> str:
+        return await asyncio.to_thread(self.delete, node_id)
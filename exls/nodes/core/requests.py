@@ -1,7 +1,14 @@
 from pathlib import Path
 from typing import Optional, Union
 
-from pydantic import BaseModel, Field, NonNegativeFloat, PositiveInt, StrictStr
+from pydantic import (
+    BaseModel,
+    Field,
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveInt,
+    StrictStr,
+)
 
 from exls.nodes.core.domain import NodeStatus
 
@@ -18,6 +25,15 @@ class NodesFilterCriteria(BaseModel):
     status: Optional[NodeStatus] = Field(
         default=None, description="The status of the node"
     )
+    hostname_prefix: Optional[StrictStr] = Field(
+        default=None, description="The prefix of the hostname of the node"
+    )
+    gpu_vendor: Optional[StrictStr] = Field(
+        default=None, description="The vendor of the GPUs of the node"
+    )
+    min_gpu_count: Optional[NonNegativeInt] = Field(
+        default=None, description="The minimum number of GPUs of the node"
+    )
     sort_field: Optional[StrictStr] = Field(
         default=None, description="The field to sort by (e.g. CREATED_AT, HOSTNAME)"
     )
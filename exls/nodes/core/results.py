@@ -4,11 +4,16 @@ from pydantic import BaseModel, Field, StrictStr
 
 from exls.nodes.core.domain import SelfManagedNode
 from exls.nodes.core.requests import ImportSelfmanagedNodeRequest
+from exls.shared.core.parallel import ExecutionStatus
 
 
 class DeleteNodeIssue(BaseModel):
     node_id: StrictStr = Field(..., description="The node ID")
     error_message: StrictStr = Field(..., description="The error message that occurred")
+    status: ExecutionStatus = Field(
+        default=ExecutionStatus.FAILED,
+        description="Whether the deletion failed, timed out or never started",
+    )
 
 
 class DeleteNodesResult(BaseModel):
@@ -16,6 +21,9 @@ class DeleteNodesResult(BaseModel):
     issues: Optional[List[DeleteNodeIssue]] = Field(
         default=None, description="List of deletion issues encountered"
     )
+    interrupted: bool = Field(
+        default=False, description="Whether the deletion was interrupted"
+    )
 
     @property
     def is_success(self) -> bool:
@@ -29,6 +37,10 @@ class ImportSelfmanagedNodeIssue(BaseModel):
         ..., description="The node import request that was imported"
     )
     error_message: StrictStr = Field(..., description="The error message that occurred")
+    status: ExecutionStatus = Field(
+        default=ExecutionStatus.FAILED,
+        description="Whether the import failed, timed out or never started",
+    )
 
 
 class ImportSelfmanagedNodesResult(BaseModel):
@@ -40,6 +52,9 @@ class ImportSelfmanagedNodesResult(BaseModel):
     issues: List[ImportSelfmanagedNodeIssue] = Field(
         ..., description="The issues that occurred"
     )
+    interrupted: bool = Field(
+        default=False, description="Whether the import was interrupted"
+    )
 
     @property
     def is_success(self) -> bool:
@@ -1,5 +1,7 @@
+import asyncio
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Dict, List, Optional, cast
+from typing import Dict, Iterator, List, Optional, cast
 
 from exls.nodes.core.domain import (
     BaseNode,
@@ -27,8 +29,21 @@ from exls.nodes.core.results import (
 )
 from exls.shared.core.decorators import handle_service_layer_errors
 from exls.shared.core.exceptions import ServiceError
-from exls.shared.core.parallel import ParallelExecutionResult, execute_in_parallel
-from exls.shared.core.polling import poll_until
+from exls.shared.core.pagination import DEFAULT_PAGE_SIZE, limit_pages
+from exls.shared.core.parallel import (
+    AdaptiveLimiter,
+    CancellationToken,
+    ParallelExecutionResult,
+    ProgressCallback,
+    execute_concurrently,
+    execute_in_parallel,
+)
+from exls.shared.core.polling import BatchWatcher
+
+NODE_WAIT_TIMEOUT_SECONDS = 120
+# Up to this many nodes are looked up one by one; for more, listing all
+# nodes once is cheaper, as the backend cannot filter the nodes by ID.
+NODE_LOOKUP_MAX_GETS = 50
 
 
 class NodesService:
@@ -37,10 +52,22 @@ class NodesService:
         nodes_repository: NodesRepository,
         nodes_operations: NodesOperations,
         ssh_key_provider: SshKeyProvider,
+        max_concurrency: int = 10,
+        concurrency_limiter: Optional[AdaptiveLimiter] = None,
+        item_timeout_seconds: Optional[float] = None,
+        node_watch_interval_seconds: float = 5,
     ):
+        self._max_concurrency: int = max_concurrency
+        self._concurrency_limiter: Optional[AdaptiveLimiter] = concurrency_limiter
+        self._item_timeout_seconds: Optional[float] = item_timeout_seconds
         self._nodes_repository: NodesRepository = nodes_repository
         self._nodes_operations: NodesOperations = nodes_operations
         self._ssh_key_provider: SshKeyProvider = ssh_key_provider
+        # Nodes that are waited for concurrently share one list call per tick.
+        self._node_watcher: BatchWatcher[BaseNode] = BatchWatcher(
+            fetch=self._list_nodes_by_id,
+            interval_seconds=node_watch_interval_seconds,
+        )
 
     # This should be rather done by an adapter layer but since it's
     # rather simple logic, we keep it here for now.
@@ -65,41 +92,107 @@ class NodesService:
         nodes: List[BaseNode] = self._nodes_repository.list(filter=filter)
         return self._resolve_ssh_key_name(nodes)
 
+    @handle_service_layer_errors("listing nodes")
+    def iter_nodes(
+        self,
+        filter: Optional[NodesFilterCriteria] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        limit: Optional[int] = None,
+    ) -> Iterator[List[BaseNode]]:
+        """List the nodes page by page, stopping after `limit` nodes."""
+        pages: Iterator[List[BaseNode]] = self._nodes_repository.iter_pages(
+            filter=filter, page_size=page_size
+        )
+        for page in limit_pages(pages, limit):
+            yield self._resolve_ssh_key_name(page)
+
     @handle_service_layer_errors("getting node")
     def get_node(self, node_id: str) -> BaseNode:
         node: BaseNode = self._nodes_repository.get(node_id)
         return self._resolve_ssh_key_name([node])[0]
 
+    @handle_service_layer_errors("getting nodes")
+    def get_nodes_by_ids(self, node_ids: List[str]) -> List[BaseNode]:
+        """
+        Get the nodes with the given IDs, in that order; missing nodes are skipped.
+
+        The names of the SSH keys are not resolved.
+        """
+        unique_ids: List[str] = list(dict.fromkeys(node_ids))
+        nodes_by_id: Dict[str, BaseNode]
+        if len(unique_ids) > NODE_LOOKUP_MAX_GETS:
+            nodes_by_id = {
+                node.id: node for node in self._nodes_repository.list(filter=None)
+            }
+        else:
+            results: ParallelExecutionResult[str, Optional[BaseNode]] = (
+                execute_concurrently(
+                    items=unique_ids,
+                    func=self._nodes_repository.find_async,
+                    max_concurrency=self._max_concurrency,
+                    limiter=self._concurrency_limiter,
+                    item_timeout_seconds=self._item_timeout_seconds,
+                )
+            )
+            if results.has_failures:
+                failure = results.failures[0]
+                raise ServiceError(
+                    message=f"Failed to get node {failure.item}: {failure.message}"
+                )
+            nodes_by_id = {node.id: node for node in results.successes if node}
+        return [nodes_by_id[nid] for nid in unique_ids if nid in nodes_by_id]
+
     @handle_service_layer_errors("deleting node")
-    def delete_nodes(self, node_ids: List[str]) -> DeleteNodesResult:
-        results: ParallelExecutionResult[str, str] = execute_in_parallel(
+    def delete_nodes(
+        self,
+        node_ids: List[str],
+        on_progress: Optional[ProgressCallback] = None,
+        max_failures: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        cancellation: Optional[CancellationToken] = None,
+    ) -> DeleteNodesResult:
+        results: ParallelExecutionResult[str, str] = execute_concurrently(
             items=node_ids,
-            func=lambda node_id: self._nodes_repository.delete(node_id),
-            max_workers=max(10, len(node_ids)),
+            func=self._nodes_repository.delete_async,
+            max_concurrency=self._max_concurrency,
+            limiter=self._concurrency_limiter,
+            on_progress=on_progress,
+            max_failures=max_failures,
+            timeout_seconds=timeout_seconds,
+            item_timeout_seconds=self._item_timeout_seconds,
+            cancellation=cancellation,
         )
 
         all_failures = [
             DeleteNodeIssue(
                 node_id=failure.item,
                 error_message=failure.message,
+                status=failure.status,
             )
             for failure in results.failures
         ]
         return DeleteNodesResult(
             deleted_node_ids=results.successes,
             issues=all_failures,
+            interrupted=results.interrupted,
         )
 
-    def _wait_for_node_status(
-        self, node_id: str, target_status: NodeStatus, timeout_seconds: int = 120
-    ) -> BaseNode:
+    def _list_nodes_by_id(self) -> Dict[str, BaseNode]:
+        # Only the status is watched; the SSH key names are resolved once the
+        # watch is over.
+        nodes: List[BaseNode] = self._nodes_repository.list(filter=None)
+        return {node.id: node for node in nodes}
+
+    def _watch_node_status(
+        self,
+        node_id: str,
+        target_status: NodeStatus,
+        timeout_seconds: int = NODE_WAIT_TIMEOUT_SECONDS,
+    ) -> Future[BaseNode]:
         """
         Waits for a node to reach a specific status.
         """
 
-        def _fetch_node() -> BaseNode:
-            return self.get_node(node_id)
-
         def _is_status_reached(node: BaseNode) -> bool:
             # You might want to handle failure states here too
             if node.status == NodeStatus.FAILED:
@@ -108,11 +201,10 @@ class NodesService:
                 )
             return node.status == target_status
 
-        return poll_until(
-            fetcher=_fetch_node,
+        return self._node_watcher.watch(
+            node_id,
             predicate=_is_status_reached,
             timeout_seconds=timeout_seconds,
-            interval_seconds=5,
             error_message=f"Node {node_id} did not reach status {target_status} within {timeout_seconds}s",
         )
 
@@ -121,6 +213,10 @@ class NodesService:
         self,
         node_import_requests: List[ImportSelfmanagedNodeRequest],
         wait_for_available: bool = False,
+        on_progress: Optional[ProgressCallback] = None,
+        max_failures: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        cancellation: Optional[CancellationToken] = None,
     ) -> ImportSelfmanagedNodesResult:
         # Check that the import requests are valid
         if len(node_import_requests) == 0:
@@ -136,10 +232,21 @@ class NodesService:
         # 2. Execute Node Imports in Parallel
         results: ParallelExecutionResult[
             ImportSelfmanagedNodeParameters, SelfManagedNode
-        ] = execute_in_parallel(
+        ] = execute_concurrently(
             items=import_parameters,
             func=lambda p: self._import_single_node(p, wait_for_available),
-            max_workers=10,
+            max_concurrency=self._max_concurrency,
+            limiter=self._concurrency_limiter,
+            on_progress=on_progress,
+            max_failures=max_failures,
+            timeout_seconds=timeout_seconds,
+            # Waiting for the node is bounded by its own timeout.
+            item_timeout_seconds=(
+                self._item_timeout_seconds + NODE_WAIT_TIMEOUT_SECONDS
+                if self._item_timeout_seconds is not None and wait_for_available
+                else self._item_timeout_seconds
+            ),
+            cancellation=cancellation,
         )
 
         # 3. Combine Results
@@ -149,6 +256,7 @@ class NodesService:
                     failure.item
                 ),
                 error_message=failure.message,
+                status=failure.status,
             )
             for failure in results.failures
         ]
@@ -156,6 +264,7 @@ class NodesService:
         return ImportSelfmanagedNodesResult(
             imported_nodes=results.successes,
             issues=all_failures,
+            interrupted=results.interrupted,
         )
 
     def _prepare_import_parameters(
@@ -188,7 +297,7 @@ class NodesService:
         ] = execute_in_parallel(
             items=list(keys_to_import_map.values()),
             func=_import_single_ssh_key,
-            max_workers=10,
+            max_workers=self._max_concurrency,
         )
 
         # Process SSH key import results
@@ -255,19 +364,27 @@ class NodesService:
 
         return import_parameters, pre_flight_failures
 
-    def _import_single_node(
+    async def _import_single_node(
         self, params: ImportSelfmanagedNodeParameters, wait: bool
     ) -> SelfManagedNode:
         """Imports a single node and optionally waits for it."""
-        node_id: str = self._nodes_operations.import_selfmanaged_node(parameters=params)
-        # wait_for_node_status returns the updated node
+        node_id: str = await self._nodes_operations.import_selfmanaged_node_async(
+            parameters=params
+        )
+        # Fetching the node blocks, so it runs in a worker thread. Waiting for
+        # it doesn't; the watcher resolves the future with the updated node.
         result_node: BaseNode
         if wait:
-            result_node = self._wait_for_node_status(
-                node_id=node_id, target_status=NodeStatus.DEPLOYED
+            watched_node: BaseNode = await asyncio.wrap_future(
+                self._watch_node_status(
+                    node_id=node_id, target_status=NodeStatus.DEPLOYED
+                )
             )
+            result_node = (
+                await asyncio.to_thread(self._resolve_ssh_key_name, [watched_node])
+            )[0]
         else:
-            result_node = self.get_node(node_id)
+            result_node = await asyncio.to_thread(self.get_node, node_id)
 
         # Runtime check to satisfy strict typing
         if not isinstance(result_node, SelfManagedNode):
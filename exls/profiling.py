@@ -0,0 +1,172 @@
+import contextlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional
+
+from pydantic import BaseModel, Field
+
+WATERFALL_BAR_WIDTH = 40
+
+
+def _process_start() -> float:
+    """
+    Return the process start on the perf_counter clock.
+
+    On Linux this includes interpreter startup and all imports up to here;
+    elsewhere it falls back to the time this module was imported.
+    """
+    now: float = time.perf_counter()
+    try:
+        stat: str = Path("/proc/self/stat").read_text()
+        # The process name may contain spaces, so we split after its closing paren.
+        fields: List[str] = stat[stat.rindex(")") + 2 :].split()
+        start_ticks: int = int(fields[19])
+        uptime_at_start: float = start_ticks / os.sysconf("SC_CLK_TCK")
+        elapsed: float = time.clock_gettime(time.CLOCK_BOOTTIME) - uptime_at_start
+    except (OSError, ValueError, IndexError, AttributeError):
+        return now
+    # Guard against clock mismatches, e.g. on kernels with a different time base.
+    if not 0 <= elapsed < 60:
+        return now
+    return now - elapsed
+
+
+_PROCESS_START: float = _process_start()
+
+
+class ProfileSpan(BaseModel):
+    name: str = Field(..., description="The name of the profiled phase or call")
+    category: str = Field(..., description="The category of the span")
+    start_ms: float = Field(..., description="Start offset since process start")
+    duration_ms: float = Field(..., description="The duration of the span")
+    thread: str = Field(..., description="The thread that recorded the span")
+
+
+class Profiler:
+    """Collects timed spans for a single CLI invocation."""
+
+    def __init__(self, origin: float = _PROCESS_START):
+        self._origin: float = origin
+        self._spans: List[ProfileSpan] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def spans(self) -> List[ProfileSpan]:
+        with self._lock:
+            return sorted(self._spans, key=lambda s: s.start_ms)
+
+    def _offset_ms(self, timestamp: float) -> float:
+        return (timestamp - self._origin) * 1000
+
+    def record(self, name: str, category: str, start: float, end: float) -> None:
+        span: ProfileSpan = ProfileSpan(
+            name=name,
+            category=category,
+            start_ms=self._offset_ms(start),
+            duration_ms=(end - start) * 1000,
+            thread=threading.current_thread().name,
+        )
+        with self._lock:
+            self._spans.append(span)
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str) -> Generator[None, None, None]:
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, time.perf_counter())
+
+    def total_ms(self) -> float:
+        return self._offset_ms(time.perf_counter())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_ms": round(self.total_ms(), 3),
+            "spans": [span.model_dump() for span in self.spans],
+        }
+
+    def render_waterfall(self, width: int = WATERFALL_BAR_WIDTH) -> str:
+        total_ms: float = self.total_ms()
+        spans: List[ProfileSpan] = self.spans
+        name_width: int = max(
+            [len(f"{s.category}:{s.name}") for s in spans] + [len("phase")]
+        )
+        scale: float = width / total_ms if total_ms > 0 else 0
+
+        lines: List[str] = [
+            f"exls profile - total {total_ms:.1f} ms",
+            f"{'offset':>10} {'duration':>10}  {'phase':<{name_width}}",
+        ]
+        for span in spans:
+            bar_start: int = min(int(span.start_ms * scale), width - 1)
+            bar_length: int = max(
+                1, min(int(span.duration_ms * scale), width - bar_start)
+            )
+            bar: str = " " * bar_start + "█" * bar_length
+            lines.append(
+                f"{span.start_ms:>8.1f}ms {span.duration_ms:>8.1f}ms  "
+                f"{f'{span.category}:{span.name}':<{name_width}} |{bar:<{width}}|"
+            )
+        return "\n".join(lines)
+
+    def write_json(self, path: Path) -> None:
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+
+
+_active_profiler: Optional[Profiler] = None
+_invocation_start: float = _PROCESS_START
+
+
+def enable_profiling() -> Profiler:
+    """
+    Start profiling the current invocation.
+
+    Everything before this call (interpreter startup, imports and argument
+    parsing) is recorded as a single startup span.
+    """
+    global _active_profiler
+    if _active_profiler is None:
+        _active_profiler = Profiler(origin=_invocation_start)
+        _active_profiler.record(
+            "interpreter and imports",
+            "startup",
+            _invocation_start,
+            time.perf_counter(),
+        )
+    return _active_profiler
+
+
+def disable_profiling() -> None:
+    global _active_profiler
+    _active_profiler = None
+
+
+def begin_invocation(start: float) -> None:
+    """
+    Reset profiling for a new invocation of a long-running process.
+
+    Used by the daemon, which serves many invocations from one process; their
+    profiles start at the time the request was received.
+    """
+    global _active_profiler, _invocation_start
+    _active_profiler = None
+    _invocation_start = start
+
+
+def get_profiler() -> Optional[Profiler]:
+    return _active_profiler
+
+
+@contextlib.contextmanager
+def profile_span(name: str, category: str = "phase") -> Generator[None, None, None]:
+    """Time the enclosed block if profiling is enabled; a no-op otherwise."""
+    profiler: Optional[Profiler] = _active_profiler
+    if profiler is None:
+        yield
+        return
+    with profiler.span(name, category):
+        yield
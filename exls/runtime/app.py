@@ -0,0 +1,239 @@
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import typer
+
+from exls.auth.adapters.bundle import AuthBundle
+from exls.auth.core.domain import AuthSession
+from exls.auth.core.service import AuthService
+from exls.defaults import DAEMON_LOG_FILE, DAEMON_SOCKET_FILE
+from exls.runtime.batch import (
+    BatchCommand,
+    BatchCommandResult,
+    BatchParseError,
+    parse_batch,
+    run_batch,
+)
+from exls.runtime.client import DaemonUnavailableError, send_control
+from exls.runtime.daemon import DEFAULT_IDLE_TIMEOUT_SECONDS, DaemonServer
+from exls.shared.adapters.bundle import BaseBundle
+from exls.shared.adapters.decorators import handle_application_layer_errors
+from exls.shared.adapters.ui.facade.facade import IOBaseModelFacade
+from exls.shared.adapters.ui.utils import (
+    get_app_state_from_ctx,
+    get_config_from_ctx,
+    help_if_no_subcommand,
+)
+from exls.shared.core.exceptions import ServiceError
+from exls.state import AppState
+
+DAEMON_START_TIMEOUT_SECONDS = 10.0
+
+daemon_app = typer.Typer()
+
+
+def _get_bundle(ctx: typer.Context) -> BaseBundle:
+    return BaseBundle(get_config_from_ctx(ctx), get_app_state_from_ctx(ctx))
+
+
+def _describe(status: Dict[str, Any]) -> str:
+    return (
+        f"exls daemon is running (pid {status['pid']}, up "
+        f"{status['uptime_seconds']:.0f}s, {status['requests_served']} "
+        f"invocations served) on {DAEMON_SOCKET_FILE}"
+    )
+
+
+@daemon_app.callback(invoke_without_command=True)
+def _root(  # pyright: ignore[reportUnusedFunction]
+    ctx: typer.Context,
+):
+    """
+    Manage the exls daemon.
+
+    While the daemon is running, `exls` forwards invocations to it over a Unix
+    socket, which avoids the startup cost of a new process. Commands that prompt,
+    e.g. a delete without --yes, watches (--watch) and `login`/`logout` always
+    run in-process, and so do invocations while the daemon is busy with another
+    one. Set
+    EXLS_NO_DAEMON=1 to bypass the daemon for a single invocation.
+    """
+    help_if_no_subcommand(ctx)
+
+
+@daemon_app.command("start", help="Start the exls daemon")
+@handle_application_layer_errors(BaseBundle)
+def start(
+    ctx: typer.Context,
+    foreground: bool = typer.Option(
+        False,
+        "--foreground",
+        help="Run the daemon in this process instead of in the background",
+    ),
+    idle_timeout: int = typer.Option(
+        DEFAULT_IDLE_TIMEOUT_SECONDS,
+        "--idle-timeout",
+        help="Stop the daemon after this many seconds without invocations (0 to never stop)",
+    ),
+):
+    bundle: BaseBundle = _get_bundle(ctx)
+    io_facade: IOBaseModelFacade = bundle.get_io_facade()
+
+    try:
+        status: Dict[str, Any] = send_control("ping")
+        io_facade.display_info_message(_describe(status), bundle.message_output_format)
+        return
+    except DaemonUnavailableError:
+        pass
+
+    if foreground:
+        DaemonServer(
+            socket_file=DAEMON_SOCKET_FILE, idle_timeout_seconds=idle_timeout
+        ).serve_forever()
+        return
+
+    command: List[str] = [
+        sys.executable,
+        "-m",
+        "exls",
+        "daemon",
+        "start",
+        "--foreground",
+        "--idle-timeout",
+        str(idle_timeout),
+    ]
+    DAEMON_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with DAEMON_LOG_FILE.open("ab") as log_file:
+        subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=log_file,
+            start_new_session=True,
+        )
+
+    deadline: float = time.monotonic() + DAEMON_START_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            status = send_control("ping")
+        except DaemonUnavailableError:
+            time.sleep(0.05)
+            continue
+        io_facade.display_success_message(
+            _describe(status), bundle.message_output_format
+        )
+        return
+    raise ServiceError(
+        f"The exls daemon did not start within {DAEMON_START_TIMEOUT_SECONDS:.0f}s. "
+        f"See {DAEMON_LOG_FILE} for details."
+    )
+
+
+@daemon_app.command("stop", help="Stop the exls daemon")
+@handle_application_layer_errors(BaseBundle)
+def stop(ctx: typer.Context):
+    bundle: BaseBundle = _get_bundle(ctx)
+    io_facade: IOBaseModelFacade = bundle.get_io_facade()
+    try:
+        status: Dict[str, Any] = send_control("shutdown")
+    except DaemonUnavailableError:
+        io_facade.display_info_message(
+            "No exls daemon is running.", bundle.message_output_format
+        )
+        return
+    io_facade.display_success_message(
+        f"Stopped the exls daemon (pid {status['pid']}).",
+        bundle.message_output_format,
+    )
+
+
+@daemon_app.command("status", help="Show whether the exls daemon is running")
+@handle_application_layer_errors(BaseBundle)
+def status(ctx: typer.Context):
+    bundle: BaseBundle = _get_bundle(ctx)
+    io_facade: IOBaseModelFacade = bundle.get_io_facade()
+    try:
+        daemon_status: Dict[str, Any] = send_control("ping")
+    except DaemonUnavailableError:
+        io_facade.display_info_message(
+            "No exls daemon is running.", bundle.message_output_format
+        )
+        raise typer.Exit(1)
+    io_facade.display_info_message(
+        _describe(daemon_status), bundle.message_output_format
+    )
+
+
+def _batch_state_provider(ctx: typer.Context) -> Callable[[], AppState]:
+    """
+    Provide the state for the commands of a batch.
+
+    The access token is re-acquired for every command, which is served from the
+    in-memory token cache and refreshes the token ahead of its expiry during
+    long batches.
+    """
+    state: AppState = get_app_state_from_ctx(ctx)
+    auth_service: AuthService = AuthBundle(
+        get_config_from_ctx(ctx), state
+    ).get_auth_service()
+    lock: threading.Lock = threading.Lock()
+
+    def _get_state() -> AppState:
+        nonlocal state
+        with lock:
+            session: AuthSession = auth_service.acquire_access_token()
+            if session.token.access_token != state.access_token:
+                state = state.model_copy(
+                    update={"access_token": session.token.access_token}
+                )
+            return state
+
+    return _get_state
+
+
+@handle_application_layer_errors(BaseBundle)
+def batch(
+    ctx: typer.Context,
+    file: str = typer.Option(
+        "-",
+        "--file",
+        "-f",
+        help="A file with one exls command per line, or '-' to read from stdin",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Run up to this many commands concurrently",
+    ),
+):
+    """
+    Run many exls commands in one process.
+
+    Each line holds one command (a leading `exls` is optional). The commands
+    share the config, the access token and the API connection pools. One JSON
+    object per command with its exit code and output is written to stdout as
+    soon as it finishes.
+    """
+    try:
+        content: str = sys.stdin.read() if file == "-" else Path(file).read_text()
+    except OSError as e:
+        raise ServiceError(f"Failed to read batch file {file}: {e}") from e
+    try:
+        commands: List[BatchCommand] = parse_batch(content.splitlines())
+    except BatchParseError as e:
+        raise ServiceError(f"Invalid batch input: {e}") from e
+
+    def _emit(result: BatchCommandResult) -> None:
+        typer.echo(result.model_dump_json())
+
+    results: List[BatchCommandResult] = run_batch(
+        commands, _batch_state_provider(ctx), _emit, jobs=jobs
+    )
+    if any(result.exit_code != 0 for result in results):
+        raise typer.Exit(1)
@@ -0,0 +1,128 @@
+import io
+import shlex
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, List
+
+from pydantic import BaseModel, Field
+
+from exls.runtime.capture import capture_output, install_routed_streams
+from exls.runtime.invoke import invoke_app
+from exls.state import AppState
+
+# Commands that make no sense inside a batch: they are interactive or would
+# nest process-level machinery.
+UNSUPPORTED_BATCH_COMMANDS = frozenset({"batch", "daemon", "login", "logout"})
+
+
+class BatchParseError(Exception):
+    pass
+
+
+class BatchCommand(BaseModel):
+    line: int = Field(..., description="The 1-based line number in the batch input")
+    command: str = Field(..., description="The command as written in the input")
+    argv: List[str] = Field(..., description="The arguments passed to exls")
+
+
+class BatchCommandResult(BaseModel):
+    line: int = Field(..., description="The 1-based line number in the batch input")
+    command: str = Field(..., description="The command as written in the input")
+    exit_code: int = Field(..., description="The exit code of the command")
+    stdout: str = Field(..., description="What the command printed to stdout")
+    stderr: str = Field(..., description="What the command printed to stderr")
+    duration_ms: float = Field(..., description="The wall time of the command")
+
+
+def parse_batch(lines: Iterable[str]) -> List[BatchCommand]:
+    """
+    Parse batch input with one `exls` command per line.
+
+    Blank lines and lines starting with `#` are skipped; a leading `exls` is
+    optional. Raises BatchParseError for malformed or unsupported lines.
+    """
+    commands: List[BatchCommand] = []
+    for number, line in enumerate(lines, start=1):
+        stripped: str = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        try:
+            argv: List[str] = shlex.split(stripped)
+        except ValueError as e:
+            raise BatchParseError(f"Line {number}: {e}") from e
+        if argv and argv[0] == "exls":
+            argv = argv[1:]
+        if not argv:
+            continue
+        if argv[0] in UNSUPPORTED_BATCH_COMMANDS:
+            raise BatchParseError(
+                f"Line {number}: '{argv[0]}' cannot be run in a batch"
+            )
+        commands.append(BatchCommand(line=number, command=stripped, argv=argv))
+    return commands
+
+
+def _run_command(
+    command: BatchCommand, state: AppState, capture_unrouted_threads: bool
+) -> BatchCommandResult:
+    stdout: io.StringIO = io.StringIO()
+    stderr: io.StringIO = io.StringIO()
+    start: float = time.perf_counter()
+    with capture_output(stdout, stderr, capture_unrouted_threads):
+        try:
+            exit_code: int = invoke_app(command.argv, obj=state)
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+    return BatchCommandResult(
+        line=command.line,
+        command=command.command,
+        exit_code=exit_code,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+        duration_ms=round((time.perf_counter() - start) * 1000, 3),
+    )
+
+
+def run_batch(
+    commands: List[BatchCommand],
+    get_state: Callable[[], AppState],
+    on_result: Callable[[BatchCommandResult], None],
+    jobs: int = 1,
+) -> List[BatchCommandResult]:
+    """
+    Run the commands of a batch in this process.
+
+    Each command gets the state returned by `get_state` as its context object,
+    so config, the access token and the shared API clients are reused. With
+    `jobs` > 1 independent commands run concurrently and `on_result` is called
+    in completion order; otherwise in input order.
+    """
+    install_routed_streams()
+    results: List[BatchCommandResult] = []
+    results_lock: threading.Lock = threading.Lock()
+
+    def _complete(result: BatchCommandResult) -> None:
+        with results_lock:
+            results.append(result)
+            on_result(result)
+
+    if jobs <= 1:
+        for command in commands:
+            _complete(_run_command(command, get_state(), True))
+        return results
+
+    def _run_concurrently(command: BatchCommand) -> BatchCommandResult:
+        # Several commands capture their output at the same time, so only the
+        # worker threads that inherit a command's context are routed to it.
+        return _run_command(command, get_state(), False)
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures: List[Future[BatchCommandResult]] = [
+            executor.submit(_run_concurrently, command) for command in commands
+        ]
+        for future in as_completed(futures):
+            _complete(future.result())
+    return sorted(results, key=lambda r: r.line)
@@ -0,0 +1,128 @@
+import contextlib
+import contextvars
+import io
+import sys
+import threading
+from typing import Callable, Dict, Generator, Optional, TextIO
+
+
+class CallbackStream(io.StringIO):
+    """A text stream that hands every write to a callback instead of keeping it."""
+
+    def __init__(self, write: Callable[[str], None], isatty: bool = False):
+        super().__init__()
+        self._write: Callable[[str], None] = write
+        self._isatty: bool = isatty
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        # Libraries like click probe for binary streams by writing b"".
+        if not isinstance(s, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError(f"write() argument must be str, not {type(s).__name__}")
+        if s:
+            self._write(s)
+        return len(s)
+
+    def isatty(self) -> bool:
+        return self._isatty
+
+
+class ThreadRoutedStream(io.TextIOBase):
+    """
+    A stand-in for `sys.stdout`/`sys.stderr` that routes writes per thread.
+
+    Threads that were routed with `route` write to their own target stream, and
+    so do the threads that run in a copy of their context, e.g. the workers of
+    `asyncio.to_thread` and `call_concurrently`. All other threads write to the
+    default target, which falls back to the original stream.
+    """
+
+    # The base class reports no encoding; ours is the one of the original stream.
+    encoding: str = "utf-8"
+
+    def __init__(self, fallback: TextIO):
+        self.encoding = getattr(fallback, "encoding", None) or "utf-8"
+        self._fallback: TextIO = fallback
+        self._default: Optional[TextIO] = None
+        self._targets: Dict[int, TextIO] = {}
+        self._context_target: contextvars.ContextVar[Optional[TextIO]] = (
+            contextvars.ContextVar(f"routed_target_{id(self)}", default=None)
+        )
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def fallback(self) -> TextIO:
+        return self._fallback
+
+    def _target(self) -> TextIO:
+        target: Optional[TextIO] = self._targets.get(threading.get_ident())
+        return target or self._context_target.get() or self._default or self._fallback
+
+    @contextlib.contextmanager
+    def route(
+        self, target: TextIO, as_default: bool = False
+    ) -> Generator[None, None, None]:
+        """Route the writes of the current thread (and optionally all unrouted ones)."""
+        ident: int = threading.get_ident()
+        with self._lock:
+            self._targets[ident] = target
+            if as_default:
+                self._default = target
+        token: contextvars.Token[Optional[TextIO]] = self._context_target.set(target)
+        try:
+            yield
+        finally:
+            self._context_target.reset(token)
+            with self._lock:
+                self._targets.pop(ident, None)
+                if as_default and self._default is target:
+                    self._default = None
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        return self._target().write(s)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return self._target().isatty()
+
+    def fileno(self) -> int:
+        return self._target().fileno()
+
+
+_stdout: Optional[ThreadRoutedStream] = None
+_stderr: Optional[ThreadRoutedStream] = None
+
+
+def install_routed_streams() -> None:
+    """Replace `sys.stdout` and `sys.stderr` with thread-routed streams."""
+    global _stdout, _stderr
+    if _stdout is None or _stderr is None:
+        _stdout = ThreadRoutedStream(sys.stdout)
+        _stderr = ThreadRoutedStream(sys.stderr)
+        sys.stdout = _stdout
+        sys.stderr = _stderr
+
+
+@contextlib.contextmanager
+def capture_output(
+    stdout: TextIO, stderr: TextIO, include_unrouted_threads: bool = True
+) -> Generator[None, None, None]:
+    """
+    Send everything the current invocation prints to the given streams.
+
+    Requires `install_routed_streams` to have been called. The output of the
+    threads that inherit the invocation's context is captured too. With
+    `include_unrouted_threads`, so is the output of all other threads that are
+    not routed themselves; only one invocation may capture like that at a time.
+    """
+    assert _stdout is not None and _stderr is not None
+    with _stdout.route(stdout, as_default=include_unrouted_threads):
+        with _stderr.route(stderr, as_default=include_unrouted_threads):
+            yield
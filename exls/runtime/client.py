@@ -0,0 +1,213 @@
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, TextIO, Tuple
+
+from exls.defaults import DAEMON_SOCKET_FILE
+from exls.runtime.protocol import (
+    FORWARDED_ENV_NAMES,
+    FORWARDED_ENV_PREFIXES,
+    ControlRequest,
+    RunRequest,
+    iter_frames,
+    send_frame,
+)
+
+# Set to any non-empty value to always run in-process, even if a daemon is running.
+NO_DAEMON_ENV = "EXLS_NO_DAEMON"
+
+# Commands that must not be forwarded: they manage the daemon itself, need an
+# interactive terminal or stdin, which the daemon does not have, or, like
+# `batch`, already amortize the startup over many commands.
+IN_PROCESS_COMMANDS = frozenset({"batch", "daemon", "login", "logout"})
+
+# Commands that prompt the user, by their command path. They are kept
+# in-process, because the daemon has no terminal to prompt on.
+PROMPTING_COMMANDS: FrozenSet[Tuple[str, ...]] = frozenset(
+    {
+        ("nodes", "import"),
+        ("clusters", "add-nodes"),
+        ("clusters", "remove-nodes"),
+        ("workspaces", "deploy"),
+    }
+)
+# Commands that ask for a confirmation unless it is given with `--yes`.
+CONFIRMING_COMMANDS: FrozenSet[Tuple[str, ...]] = frozenset(
+    {("nodes", "delete"), ("clusters", "delete"), ("workspaces", "delete")}
+)
+# Commands that run an interactive flow with `--interactive` or if they are
+# called without any options or arguments.
+FLOW_COMMANDS: FrozenSet[Tuple[str, ...]] = frozenset(
+    {("clusters", "deploy"), ("management", "ssh-keys", "import")}
+)
+# Options that keep a command running until it is stopped, e.g. to watch a
+# list. They run in-process, so they don't occupy the daemon indefinitely.
+LONG_RUNNING_OPTIONS = frozenset({"--watch", "-w"})
+# The options of the root command that take a value.
+ROOT_OPTIONS_WITH_VALUE = frozenset(
+    {
+        "--log-level",
+        "--log-file",
+        "--format",
+        "--profile-output",
+        "--trace-http",
+        "--max-age",
+    }
+)
+
+
+class DaemonUnavailableError(Exception):
+    pass
+
+
+class DaemonBusyError(DaemonUnavailableError):
+    pass
+
+
+def _connect(socket_file: Path) -> socket.socket:
+    sock: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_file))
+    except OSError as e:
+        sock.close()
+        raise DaemonUnavailableError(f"No exls daemon on {socket_file}: {e}") from e
+    return sock
+
+
+def _forwarded_env() -> Dict[str, str]:
+    env: Dict[str, str] = {
+        name: value
+        for name, value in os.environ.items()
+        if name.startswith(FORWARDED_ENV_PREFIXES) or name in FORWARDED_ENV_NAMES
+    }
+    # The daemon has no terminal; tell it the size of ours.
+    if sys.stdout.isatty():
+        size: os.terminal_size = os.get_terminal_size(sys.stdout.fileno())
+        env.setdefault("COLUMNS", str(size.columns))
+        env.setdefault("LINES", str(size.lines))
+    return env
+
+
+def _command_path(argv: List[str]) -> Tuple[List[str], List[str]]:
+    """Split the arguments into the leading positional ones and the rest."""
+    index: int = 0
+    while index < len(argv) and argv[index].startswith("-"):
+        # Skip the root options and their values; `--format=json` is one token.
+        index += 2 if argv[index] in ROOT_OPTIONS_WITH_VALUE else 1
+    start: int = index
+    while index < len(argv) and not argv[index].startswith("-"):
+        index += 1
+    return argv[start:index], argv[index:]
+
+
+def prompts_user(argv: List[str]) -> bool:
+    """
+    Whether an invocation may prompt the user.
+
+    To keep the client cheap, this only looks at the command path and the flags
+    that skip or request prompts instead of parsing the arguments.
+    """
+    if "--help" in argv:
+        return False
+    positionals, options = _command_path(argv)
+    for length in range(1, len(positionals) + 1):
+        path: Tuple[str, ...] = tuple(positionals[:length])
+        if path in PROMPTING_COMMANDS:
+            return True
+        if path in CONFIRMING_COMMANDS:
+            return "--yes" not in options and "-y" not in options
+        if path in FLOW_COMMANDS:
+            called_bare: bool = len(positionals) == length and not options
+            return called_bare or "--interactive" in options
+    return False
+
+
+def should_forward(argv: List[str]) -> bool:
+    if os.environ.get(NO_DAEMON_ENV) or not DAEMON_SOCKET_FILE.exists():
+        return False
+    # An argument value that equals one of these commands also keeps us in-process.
+    if IN_PROCESS_COMMANDS.intersection(argv):
+        return False
+    if LONG_RUNNING_OPTIONS.intersection(argv):
+        return False
+    return not prompts_user(argv)
+
+
+def forward(
+    argv: List[str],
+    socket_file: Path = DAEMON_SOCKET_FILE,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> int:
+    """
+    Run an invocation on the daemon, stream its output and return its exit code.
+
+    Raises DaemonUnavailableError if no daemon accepts the connection and
+    DaemonBusyError if the daemon is still serving another invocation.
+    """
+    out: TextIO = stdout or sys.stdout
+    err: TextIO = stderr or sys.stderr
+    sock: socket.socket = _connect(socket_file)
+    try:
+        request: RunRequest = {
+            "type": "run",
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "env": _forwarded_env(),
+            "stdout_isatty": out.isatty(),
+            "stderr_isatty": err.isatty(),
+        }
+        send_frame(sock, request)
+        for frame in iter_frames(sock):
+            if frame["type"] == "stdout":
+                out.write(frame["data"])
+                out.flush()
+            elif frame["type"] == "stderr":
+                err.write(frame["data"])
+                err.flush()
+            elif frame["type"] == "exit":
+                return int(frame["code"])
+            elif frame["type"] == "busy":
+                raise DaemonBusyError("The exls daemon is serving another invocation")
+    finally:
+        sock.close()
+    err.write("The exls daemon closed the connection unexpectedly.\n")
+    return 1
+
+
+def send_control(
+    request_type: str, socket_file: Path = DAEMON_SOCKET_FILE
+) -> Dict[str, Any]:
+    """Send a ping or shutdown request to the daemon and return its status."""
+    sock: socket.socket = _connect(socket_file)
+    try:
+        request: ControlRequest = {"type": "ping"}
+        if request_type == "shutdown":
+            request = {"type": "shutdown"}
+        send_frame(sock, request)
+        status: Optional[Dict[str, Any]] = next(iter_frames(sock), None)
+    finally:
+        sock.close()
+    if status is None:
+        raise DaemonUnavailableError("The exls daemon did not answer")
+    return status
+
+
+def main() -> None:
+    """
+    The `exls` entry point.
+
+    Forwards the invocation to a running `exls daemon` and falls back to running
+    it in this process if there is none or if it is busy.
+    """
+    argv: List[str] = sys.argv[1:]
+    if should_forward(argv):
+        try:
+            sys.exit(forward(argv))
+        except DaemonUnavailableError:
+            pass
+
+    from exls.app import app
+
+    app(prog_name="exls")
@@ -0,0 +1,333 @@
+import contextlib
+import ctypes
+import logging
+import os
+import select
+import socket
+import struct
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional
+
+from exls.runtime.capture import CallbackStream, capture_output, install_routed_streams
+from exls.runtime.invoke import invoke_app
+from exls.runtime.protocol import (
+    FORWARDED_ENV_NAMES,
+    FORWARDED_ENV_PREFIXES,
+    BusyFrame,
+    ExitFrame,
+    Frame,
+    OutputFrame,
+    StatusFrame,
+    iter_frames,
+    send_frame,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT_SECONDS = 30 * 60
+ACCEPT_POLL_INTERVAL_SECONDS = 1.0
+DISCONNECT_POLL_INTERVAL_SECONDS = 0.2
+
+
+class ClientDisconnectedError(Exception):
+    pass
+
+
+class _Connection:
+    """The daemon side of a client connection; writes frames back to the client."""
+
+    def __init__(self, sock: socket.socket):
+        self._sock: socket.socket = sock
+        self._lock: threading.Lock = threading.Lock()
+        self.disconnected: bool = False
+
+    def send(self, frame: Frame) -> None:
+        if self.disconnected:
+            raise ClientDisconnectedError("The client disconnected")
+        with self._lock:
+            try:
+                send_frame(self._sock, frame)
+            except OSError as e:
+                self.disconnected = True
+                raise ClientDisconnectedError("The client disconnected") from e
+
+    def closed_by_peer(self, timeout: float) -> bool:
+        """Wait up to `timeout` seconds for the client to close its end."""
+        try:
+            readable, _, _ = select.select([self._sock], [], [], timeout)
+            if not readable:
+                return False
+            # The client sends nothing after its request, so anything readable
+            # is the end of the stream.
+            return self._sock.recv(4096) == b""
+        except (OSError, ValueError):
+            # Either side closed the socket meanwhile.
+            return True
+
+    def send_stdout(self, data: str) -> None:
+        frame: OutputFrame = {"type": "stdout", "data": data}
+        self.send(frame)
+
+    def send_stderr(self, data: str) -> None:
+        frame: OutputFrame = {"type": "stderr", "data": data}
+        self.send(frame)
+
+
+def _peer_uid(sock: socket.socket) -> Optional[int]:
+    """The uid of the connected process, where the platform tells us."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds: bytes = sock.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid
+
+
+def _is_forwarded_env(name: str) -> bool:
+    return name.startswith(FORWARDED_ENV_PREFIXES) or name in FORWARDED_ENV_NAMES
+
+
+@contextlib.contextmanager
+def _invocation_environment(
+    cwd: str, env: Dict[str, str]
+) -> Generator[None, None, None]:
+    """Apply the client's working directory and environment for one invocation."""
+    previous_cwd: str = os.getcwd()
+    previous_env: Dict[str, str] = {
+        name: value for name, value in os.environ.items() if _is_forwarded_env(name)
+    }
+    for name in previous_env:
+        del os.environ[name]
+    os.environ.update({k: v for k, v in env.items() if _is_forwarded_env(k)})
+    os.chdir(cwd)
+    try:
+        yield
+    finally:
+        os.chdir(previous_cwd)
+        for name in [n for n in os.environ if _is_forwarded_env(n)]:
+            del os.environ[name]
+        os.environ.update(previous_env)
+
+
+def _raise_in_thread(thread_id: int, exception: Optional[type]) -> None:
+    """Raise `exception` in another thread, or cancel a pending one with None."""
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(thread_id),
+        ctypes.py_object(exception) if exception is not None else None,
+    )
+
+
+@contextlib.contextmanager
+def _interrupt_on_disconnect(connection: _Connection) -> Generator[None, None, None]:
+    """
+    Interrupt the invocation of the calling thread when its client disconnects.
+
+    A client stopped with Ctrl+C closes its socket, which the invocation would
+    only notice on its next write; a quiet one, e.g. waiting for a deployment,
+    would keep the daemon busy meanwhile. It gets a KeyboardInterrupt instead,
+    like it would in-process.
+    """
+    thread_id: int = threading.get_ident()
+    lock: threading.Lock = threading.Lock()
+    done: threading.Event = threading.Event()
+    interrupted: threading.Event = threading.Event()
+
+    def _watch() -> None:
+        while not done.is_set():
+            if not connection.closed_by_peer(DISCONNECT_POLL_INTERVAL_SECONDS):
+                continue
+            with lock:
+                if not done.is_set():
+                    connection.disconnected = True
+                    interrupted.set()
+                    _raise_in_thread(thread_id, KeyboardInterrupt)
+            return
+
+    threading.Thread(target=_watch, daemon=True).start()
+    try:
+        yield
+    finally:
+        with lock:
+            done.set()
+            if interrupted.is_set():
+                # The invocation may have returned before the interrupt hit it.
+                _raise_in_thread(thread_id, None)
+
+
+def run_invocation(argv: List[str]) -> int:
+    """Run a CLI invocation of a client in this process and return its exit code."""
+    from exls import config as cli_config
+    from exls.auth.adapters.memory.memory import InMemoryTokenCache
+    from exls.profiling import begin_invocation
+
+    begin_invocation(time.perf_counter())
+    # `login`, `logout` and token refreshes of other processes change the token
+    # store behind our back, so every invocation loads the token from it again.
+    InMemoryTokenCache.clear()
+    # The environment of the invocation may override config values.
+    cli_config.load_config(force_reload=True)
+    return invoke_app(argv)
+
+
+class DaemonServer:
+    """
+    Serves `exls` invocations from a warm process over a Unix socket.
+
+    Imports, the JWKS and the API client connection pools survive between
+    invocations. Invocations are executed one at a time, because each of them
+    changes the process' working directory and environment to the ones of its
+    client. Instead of queueing behind a long-running invocation, e.g. a
+    `logs --follow`, the others are answered as busy and run by their clients.
+    """
+
+    def __init__(
+        self,
+        socket_file: Path,
+        idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ):
+        self._socket_file: Path = socket_file
+        self._idle_timeout_seconds: float = idle_timeout_seconds
+        self._invocation_lock: threading.Lock = threading.Lock()
+        self._shutdown: threading.Event = threading.Event()
+        self._started_at: float = time.monotonic()
+        self._last_activity: float = time.monotonic()
+        self._requests_served: int = 0
+        self._server: Optional[socket.socket] = None
+
+    def _bind(self) -> socket.socket:
+        self._socket_file.parent.mkdir(parents=True, exist_ok=True)
+        if self._socket_file.exists():
+            # A socket file is only left behind by a daemon that did not shut
+            # down cleanly; a running one would have accepted the probe.
+            probe: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self._socket_file))
+                raise RuntimeError(
+                    f"An exls daemon is already listening on {self._socket_file}"
+                )
+            except (ConnectionRefusedError, FileNotFoundError):
+                self._socket_file.unlink(missing_ok=True)
+            finally:
+                probe.close()
+
+        server: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        previous_umask: int = os.umask(0o177)
+        try:
+            server.bind(str(self._socket_file))
+        finally:
+            os.umask(previous_umask)
+        os.chmod(self._socket_file, 0o600)
+        server.listen()
+        server.settimeout(ACCEPT_POLL_INTERVAL_SECONDS)
+        return server
+
+    def serve_forever(self) -> None:
+        install_routed_streams()
+        self._server = self._bind()
+        logger.info(f"exls daemon {os.getpid()} listening on {self._socket_file}")
+        try:
+            while not self._shutdown.is_set():
+                if (
+                    self._idle_timeout_seconds > 0
+                    and not self._invocation_lock.locked()
+                    and time.monotonic() - self._last_activity
+                    > self._idle_timeout_seconds
+                ):
+                    logger.info("Shutting down the idle exls daemon")
+                    break
+                try:
+                    client, _ = self._server.accept()
+                except socket.timeout:
+                    continue
+                if self._shutdown.is_set():
+                    client.close()
+                    break
+                threading.Thread(
+                    target=self._handle, args=(client,), daemon=True
+                ).start()
+        finally:
+            self._server.close()
+            self._socket_file.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        self._shutdown.set()
+        # Wake up the accept loop instead of waiting for its next poll.
+        wakeup: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            wakeup.connect(str(self._socket_file))
+        except OSError:
+            pass
+        finally:
+            wakeup.close()
+
+    def _handle(self, client: socket.socket) -> None:
+        self._last_activity = time.monotonic()
+        connection: _Connection = _Connection(client)
+        try:
+            peer_uid: Optional[int] = _peer_uid(client)
+            if peer_uid is not None and peer_uid != os.getuid():
+                logger.warning(f"Rejected a connection from uid {peer_uid}")
+                return
+            request: Optional[Dict[str, Any]] = next(iter_frames(client), None)
+            if request is None:
+                return
+            if request["type"] == "ping":
+                connection.send(self._status())
+            elif request["type"] == "shutdown":
+                connection.send(self._status())
+                self.shutdown()
+            elif request["type"] == "run":
+                self._run(connection, request)
+        except ClientDisconnectedError:
+            logger.debug("The client disconnected during its invocation")
+        except Exception:
+            logger.exception("Failed to serve an exls invocation")
+        finally:
+            client.close()
+            self._last_activity = time.monotonic()
+
+    def _status(self) -> StatusFrame:
+        return {
+            "type": "status",
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.monotonic() - self._started_at, 3),
+            "requests_served": self._requests_served,
+        }
+
+    def _run(self, connection: _Connection, request: Dict[str, Any]) -> None:
+        stdout: CallbackStream = CallbackStream(
+            connection.send_stdout,
+            isatty=bool(request.get("stdout_isatty")),
+        )
+        stderr: CallbackStream = CallbackStream(
+            connection.send_stderr,
+            isatty=bool(request.get("stderr_isatty")),
+        )
+        if not self._invocation_lock.acquire(blocking=False):
+            busy_frame: BusyFrame = {"type": "busy"}
+            connection.send(busy_frame)
+            return
+        try:
+            with _invocation_environment(request["cwd"], request["env"]):
+                with capture_output(stdout, stderr):
+                    try:
+                        with _interrupt_on_disconnect(connection):
+                            code: int = run_invocation(list(request["argv"]))
+                    except ClientDisconnectedError:
+                        raise
+                    except BaseException as e:
+                        if connection.disconnected:
+                            raise ClientDisconnectedError(
+                                "The client disconnected"
+                            ) from e
+                        traceback.print_exc()
+                        code = 1
+            self._requests_served += 1
+        finally:
+            self._invocation_lock.release()
+        exit_frame: ExitFrame = {"type": "exit", "code": code}
+        connection.send(exit_frame)
@@ -0,0 +1,23 @@
+import sys
+from typing import Any, List, Optional
+
+
+def invoke_app(argv: List[str], obj: Optional[Any] = None) -> int:
+    """
+    Run the `exls` app with the given arguments in this process.
+
+    Returns the exit code instead of exiting. `obj` becomes the initial context
+    object, which lets nested invocations inherit the state of their parent.
+    """
+    from exls.app import app
+
+    try:
+        app(args=argv, prog_name="exls", obj=obj)
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,81 @@
+"""
+The wire protocol between the `exls` client and the `exls daemon`.
+
+Both sides exchange newline-delimited JSON frames over a Unix socket. The client
+sends a single request frame and the daemon answers with any number of output
+frames followed by exactly one exit frame, or with a single busy frame if it is
+still serving another invocation. This module is imported on the client's hot
+path, so it deliberately only depends on the standard library.
+"""
+
+import json
+import socket
+from typing import Any, Dict, Iterator, List, Literal, TypedDict, Union
+
+
+class RunRequest(TypedDict):
+    type: Literal["run"]
+    argv: List[str]
+    cwd: str
+    env: Dict[str, str]
+    stdout_isatty: bool
+    stderr_isatty: bool
+
+
+class ControlRequest(TypedDict):
+    type: Literal["ping", "shutdown"]
+
+
+Request = Union[RunRequest, ControlRequest]
+
+
+class OutputFrame(TypedDict):
+    type: Literal["stdout", "stderr"]
+    data: str
+
+
+class ExitFrame(TypedDict):
+    type: Literal["exit"]
+    code: int
+
+
+class BusyFrame(TypedDict):
+    type: Literal["busy"]
+
+
+class StatusFrame(TypedDict):
+    type: Literal["status"]
+    pid: int
+    uptime_seconds: float
+    requests_served: int
+
+
+Frame = Union[OutputFrame, ExitFrame, BusyFrame, StatusFrame]
+
+# Environment variables of the client that affect how a command behaves and
+# renders. They are applied for the duration of a forwarded invocation.
+FORWARDED_ENV_PREFIXES = ("EXLS_",)
+FORWARDED_ENV_NAMES = ("COLUMNS", "LINES", "TERM", "NO_COLOR", "FORCE_COLOR")
+
+
+def encode_frame(frame: Union[Request, Frame]) -> bytes:
+    return json.dumps(frame).encode("utf-8") + b"\n"
+
+
+def send_frame(sock: socket.socket, frame: Union[Request, Frame]) -> None:
+    sock.sendall(encode_frame(frame))
+
+
+def iter_frames(sock: socket.socket) -> Iterator[Dict[str, Any]]:
+    """Yield the frames received on a socket until the peer closes it."""
+    buffer: bytes = b""
+    while True:
+        chunk: bytes = sock.recv(65536)
+        if not chunk:
+            return
+        # The last line is incomplete until it is terminated by a newline.
+        lines: List[bytes] = (buffer + chunk).split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            if line:
+                yield json.loads(line)
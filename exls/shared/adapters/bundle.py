@@ -1,17 +1,38 @@
+import threading
 from abc import ABC
+from typing import Dict, Optional, Tuple
 
 from exalsius_api_client.api_client import ApiClient
 from exalsius_api_client.configuration import Configuration
 
 from exls.config import AppConfig
+from exls.defaults import HTTP_CACHE_DIR
 from exls.shared.adapters.file.adapters import StringFileIOAdapter
+from exls.shared.adapters.retry import disable_transport_retries
+from exls.shared.adapters.sdk.cache import SdkResponseCache, cache_namespace
 from exls.shared.adapters.ui.facade.facade import IOBaseModelFacade
 from exls.shared.adapters.ui.factory import IOFactory
 from exls.shared.adapters.ui.output.values import OutputFormat
 from exls.shared.core.crypto import CryptoService
 from exls.shared.core.exceptions import ServiceError
+from exls.shared.core.parallel import AdaptiveLimiter
 from exls.state import AppState
 
+# API clients are shared process-wide, so their connection pools (and open TLS
+# connections) are reused by all bundles and, in the daemon, across invocations.
+# They are keyed by backend host, access token and connection pool size.
+_api_clients: Dict[Tuple[str, str, int], ApiClient] = {}
+_api_clients_lock: threading.Lock = threading.Lock()
+
+# The bulk operations of all bundles share one concurrency limiter per backend,
+# so that they learn its capacity together.
+_limiters: Dict[Tuple[str, int, int], AdaptiveLimiter] = {}
+
+
+def _close_api_client(api_client: ApiClient) -> None:
+    """Closes the pooled connections of a client; the SDK has no close()."""
+    api_client.rest_client.pool_manager.clear()  # pyright: ignore
+
 
 class BaseBundle(ABC):
     def __init__(self, app_config: AppConfig, app_state: AppState):
@@ -58,9 +79,56 @@ class BaseBundle(ABC):
     # Thats a bit of a leaky abstraction since we couple with the SDK's API
     # client implementation but it's convenient for now.
     def create_api_client(self) -> ApiClient:
-        client_config: Configuration = Configuration(host=self.config.backend_host)
-        api_client: ApiClient = ApiClient(configuration=client_config)
-        api_client.set_default_header(  # type: ignore[reportUnknownMemberType]
-            "Authorization", f"Bearer {self.access_token}"
+        key: Tuple[str, str, int] = (
+            self.config.backend_host,
+            self.access_token,
+            self.config.http.max_concurrency,
+        )
+        with _api_clients_lock:
+            api_client: ApiClient | None = _api_clients.get(key)
+            if api_client is None:
+                # A new token (e.g. after a refresh) supersedes the old client.
+                for stale_key in [k for k in _api_clients if k[0] == key[0]]:
+                    _close_api_client(_api_clients.pop(stale_key))
+                client_config: Configuration = Configuration(
+                    host=self.config.backend_host
+                )
+                # One connection per concurrent request, so parallel operations
+                # neither wait for nor discard pooled connections.
+                client_config.connection_pool_maxsize = key[2]
+                # Requests are retried by the SDK commands instead.
+                disable_transport_retries(client_config)
+                api_client = ApiClient(configuration=client_config)
+                api_client.set_default_header(  # type: ignore[reportUnknownMemberType]
+                    "Authorization", f"Bearer {self.access_token}"
+                )
+                _api_clients[key] = api_client
+            return api_client
+
+    def get_concurrency_limiter(self) -> Optional[AdaptiveLimiter]:
+        if not self.config.http.adaptive_concurrency:
+            return None
+        key: Tuple[str, int, int] = (
+            self.config.backend_host,
+            self.config.http.min_concurrency,
+            self.config.http.max_concurrency,
+        )
+        with _api_clients_lock:
+            if key not in _limiters:
+                _limiters[key] = AdaptiveLimiter(min_limit=key[1], max_limit=key[2])
+            return _limiters[key]
+
+    def get_response_cache(self) -> Optional[SdkResponseCache]:
+        if self._app_state.no_cache or not self.config.http.cache_enabled:
+            return None
+        max_age_seconds: int = (
+            self._app_state.cache_max_age_seconds
+            if self._app_state.cache_max_age_seconds is not None
+            else self.config.http.cache_max_age_seconds
+        )
+        return SdkResponseCache(
+            cache_dir=HTTP_CACHE_DIR,
+            namespace=cache_namespace(self.config.backend_host, self.access_token),
+            max_age_seconds=max_age_seconds,
+            max_bytes=self.config.http.cache_max_bytes,
         )
-        return api_client
@@ -57,6 +57,10 @@ def handle_application_layer_errors(
             try:
                 return func(*args, **kwargs)
 
+            except (typer.Exit, typer.Abort):
+                # Deliberate exits of the command; not errors to display.
+                raise
+
             except UserCancellationException as e:
                 ctx: typer.Context | None = _get_ctx(args, kwargs)
                 if ctx:
@@ -1,5 +1,7 @@
+import os
+import tempfile
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import yaml
 
@@ -55,6 +57,35 @@ class WriteBinaryFileCommand(BaseCommand[None]):
             f.write(self._content)
 
 
+class WriteBinaryFileAtomicallyCommand(BaseCommand[None]):
+    """
+    Writes a file via a temporary file in the same directory and a rename.
+
+    Readers either see the previous or the new content, never a partial write,
+    so they do not need to take a lock.
+    """
+
+    def __init__(self, file_path: Path, content: bytes, mode: Optional[int] = None):
+        self._file_path = file_path
+        self._content = content
+        self._mode = mode
+
+    def execute(self) -> None:
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self._file_path.parent, prefix=f".{self._file_path.name}."
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._content)
+            if self._mode is not None:
+                os.chmod(tmp_path, self._mode)
+            os.replace(tmp_path, self._file_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
 class ReadYamlFileCommand(BaseCommand[Dict[str, Any]]):
     def __init__(self, file_path: Path):
         self._file_path = file_path
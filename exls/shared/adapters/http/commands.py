@@ -1,12 +1,32 @@
+import contextlib
 import json
 import logging
 from abc import abstractmethod
-from typing import Any, Dict, Iterator, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    ClassVar,
+    ContextManager,
+    Dict,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import requests
 from pydantic import BaseModel, ValidationError
+from urllib3.exceptions import NewConnectionError
 
+from exls.profiling import profile_span
 from exls.shared.adapters.deserializer import PydanticDeserializer
+from exls.shared.adapters.http_trace import HttpCallTrace, redact_url, trace_http_call
+from exls.shared.adapters.retry import (
+    NO_RETRIES,
+    TransientFailure,
+    call_with_retries,
+    parse_retry_after,
+)
 from exls.shared.core.exceptions import ExalsiusWarning
 from exls.shared.core.ports.command import BaseCommand, CommandError
 
@@ -35,14 +55,50 @@ class UnexpectedHttpResponseWarning(ExalsiusWarning):
         super().__init__(message)
 
 
+def _transient_http_failure(e: Exception) -> Optional[TransientFailure]:
+    if isinstance(e, requests.exceptions.HTTPError) and e.response is not None:
+        return TransientFailure(
+            description=f"status {e.response.status_code}",
+            status=e.response.status_code,
+            retry_after_seconds=parse_retry_after(
+                e.response.headers.get("Retry-After")
+            ),
+        )
+    if isinstance(e, requests.exceptions.ConnectTimeout):
+        return TransientFailure(description=str(e), request_sent=False)
+    if isinstance(e, requests.exceptions.ConnectionError):
+        # requests wraps urllib3's MaxRetryError, whose reason tells whether
+        # a connection was established at all.
+        reason: Any = getattr(e.args[0], "reason", None) if e.args else None
+        return TransientFailure(
+            description=str(e),
+            request_sent=not isinstance(reason, NewConnectionError),
+        )
+    if isinstance(e, requests.exceptions.Timeout):
+        return TransientFailure(description=str(e))
+    return None
+
+
 class BasePostRequestCommand(BaseCommand[T_SerOutput_Nullable]):
     """Base class for POST request commands with shared request logic."""
 
+    idempotent: ClassVar[bool] = False
+    # Off for requests whose failures the caller handles, e.g. by polling.
+    retried: ClassVar[bool] = True
+
+    # The traced call of the last request, if --trace-http is recording.
+    _http_trace: Optional[HttpCallTrace] = None
+
     @abstractmethod
     def _get_url(self) -> str:
         """Return the URL for the POST request."""
         pass
 
+    def _deserializing(self) -> ContextManager[None]:
+        if self._http_trace is None:
+            return contextlib.nullcontext()
+        return self._http_trace.deserializing()
+
     @abstractmethod
     def _get_payload(self) -> Dict[str, Any]:
         """Return the payload for the POST request."""
@@ -53,9 +109,22 @@ class BasePostRequestCommand(BaseCommand[T_SerOutput_Nullable]):
         url: str = self._get_url()
         try:
             payload: Dict[str, Any] = self._get_payload()
-            response: requests.Response = requests.post(url, data=payload)
-            response.raise_for_status()
-            return response
+
+            def _post() -> requests.Response:
+                with profile_span(f"POST {url}", "http"):
+                    response: requests.Response = requests.post(url, data=payload)
+                response.raise_for_status()
+                return response
+
+            with trace_http_call(f"POST {redact_url(url)}") as http_trace:
+                self._http_trace = http_trace
+                return call_with_retries(
+                    _post,
+                    name=f"POST {url}",
+                    idempotent=self.idempotent,
+                    classify=_transient_http_failure,
+                    policy=None if self.retried else NO_RETRIES,
+                )
         except requests.exceptions.HTTPError as e:
             error_body: Optional[Dict[str, Any]] = None
             try:
@@ -92,9 +161,10 @@ class PostRequestWithResponseCommand(BasePostRequestCommand[T_SerOutput]):
                 f"unexpected response from post request to {self._get_url()}: "
                 f"expected json response of model {self._model.__name__} but response content is empty."
             )
-        deserialized_response: T_SerOutput = self._deserializer.deserialize(
-            response.json(), self._model
-        )
+        with self._deserializing():
+            deserialized_response: T_SerOutput = self._deserializer.deserialize(
+                response.json(), self._model
+            )
         return deserialized_response
 
 
@@ -114,9 +184,17 @@ class PostRequestWithoutResponseCommand(BasePostRequestCommand[None]):
 class StreamingGetRequestCommand(BaseCommand[Iterator[T_SerOutput]]):
     """Base class for streaming GET requests that yield NDJSON lines as Pydantic models."""
 
-    def __init__(self, model: Type[T_SerOutput]):
+    def __init__(
+        self, model: Type[T_SerOutput], read_timeout_seconds: Optional[float] = None
+    ):
+        """
+        :param read_timeout_seconds: End the stream after this long without
+            data, instead of waiting for the next line indefinitely.
+        """
         self._model: Type[T_SerOutput] = model
+        self._read_timeout_seconds: Optional[float] = read_timeout_seconds
         self._response: Optional[requests.Response] = None
+        self._http_trace: Optional[HttpCallTrace] = None
 
     @abstractmethod
     def _get_url(self) -> str:
@@ -130,14 +208,31 @@ class StreamingGetRequestCommand(BaseCommand[Iterator[T_SerOutput]]):
 
     def execute(self) -> Iterator[T_SerOutput]:
         url: str = self._get_url()
+
+        def _open() -> requests.Response:
+            with profile_span(f"GET {url} (stream opened)", "http"):
+                response: requests.Response = requests.get(
+                    url,
+                    headers=self._get_headers(),
+                    stream=True,
+                    timeout=(10, self._read_timeout_seconds),
+                )
+            if not response.ok:
+                # Read the error body, which also releases the connection.
+                _: bytes = response.content
+            response.raise_for_status()
+            return response
+
         try:
-            self._response = requests.get(
-                url,
-                headers=self._get_headers(),
-                stream=True,
-                timeout=(10, None),
-            )
-            self._response.raise_for_status()
+            # The traced call lasts until the stream is closed.
+            with trace_http_call(f"GET {redact_url(url)}", finish=False) as http_trace:
+                self._http_trace = http_trace
+                self._response = call_with_retries(
+                    _open,
+                    name=f"GET {url}",
+                    idempotent=True,
+                    classify=_transient_http_failure,
+                )
         except requests.exceptions.HTTPError as e:
             error_body: Optional[Dict[str, Any]] = None
             try:
@@ -163,9 +258,17 @@ class StreamingGetRequestCommand(BaseCommand[Iterator[T_SerOutput]]):
             for line in self._response.iter_lines(decode_unicode=True):
                 if not line:
                     continue
+                if self._http_trace is not None:
+                    # Lines are only decoded if the response declares a charset.
+                    raw: Union[str, bytes] = line
+                    self._http_trace.add_response_bytes(
+                        len(raw.encode("utf-8") if isinstance(raw, str) else raw)
+                    )
                 try:
-                    data: Dict[str, Any] = json.loads(line)
-                    yield self._model.model_validate(data)
+                    with self._deserializing():
+                        data: Dict[str, Any] = json.loads(line)
+                        event: T_SerOutput = self._model.model_validate(data)
+                    yield event
                 except (json.JSONDecodeError, ValidationError) as e:
                     logger.warning(f"skipping malformed NDJSON line: {e}")
                     continue
@@ -178,7 +281,14 @@ class StreamingGetRequestCommand(BaseCommand[Iterator[T_SerOutput]]):
         finally:
             self.close()
 
+    def _deserializing(self) -> ContextManager[None]:
+        if self._http_trace is None:
+            return contextlib.nullcontext()
+        return self._http_trace.deserializing()
+
     def close(self) -> None:
         if self._response is not None:
             self._response.close()
             self._response = None
+        if self._http_trace is not None:
+            self._http_trace.finish()
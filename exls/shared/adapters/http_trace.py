@@ -0,0 +1,437 @@
+"""
+Records the HTTP calls of an invocation as a Chrome trace (`--trace-http`).
+
+A traced call is opened by the command that talks to the backend. The
+connections of urllib3, which both the SDK and `requests` use, and the SDK's
+deserialization are hooked while a recording is active; they add the timings
+of each attempt to the call that is open in the current context.
+
+The trace can be opened in Perfetto (ui.perfetto.dev) or chrome://tracing.
+Headers and bodies are never recorded, and credentials in URLs are redacted.
+"""
+
+import contextlib
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, cast
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from exalsius_api_client.api_client import ApiClient
+from pydantic import BaseModel, Field, PrivateAttr
+from urllib3.connection import HTTPConnection, HTTPSConnection
+
+logger = logging.getLogger(__name__)
+
+REDACTED = "REDACTED"
+
+# Query parameters whose names contain one of these are redacted.
+_SECRET_PARAMETER_HINTS: Tuple[str, ...] = (
+    "token",
+    "secret",
+    "password",
+    "code",
+    "key",
+    "signature",
+    "auth",
+)
+
+
+def redact_url(url: str) -> str:
+    """Remove credentials and secret query parameters from a URL."""
+    parts = urlsplit(url)
+    netloc: str = parts.netloc.rpartition("@")[2]
+    query: List[Tuple[str, str]] = [
+        (
+            name,
+            (
+                REDACTED
+                if any(hint in name.lower() for hint in _SECRET_PARAMETER_HINTS)
+                else value
+            ),
+        )
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+    ]
+    return urlunsplit(
+        (parts.scheme, netloc, parts.path, urlencode(query, safe=REDACTED), "")
+    )
+
+
+class HttpAttempt(BaseModel):
+    """One request sent on a connection; retried calls have several."""
+
+    method: str = Field(..., description="The HTTP method")
+    url: str = Field(..., description="The redacted URL")
+    start: float = Field(..., description="perf_counter when the request started")
+    connect_start: Optional[float] = Field(
+        default=None, description="perf_counter when a new connection was opened"
+    )
+    connect_end: Optional[float] = Field(
+        default=None, description="perf_counter when the connection was ready"
+    )
+    first_byte: Optional[float] = Field(
+        default=None, description="perf_counter when the response headers arrived"
+    )
+    status: Optional[int] = Field(default=None, description="The HTTP status")
+    request_bytes: int = Field(default=0, description="The size of the body sent")
+    response_bytes: Optional[int] = Field(
+        default=None, description="The size of the body received, if known"
+    )
+
+
+class HttpCallTrace(BaseModel):
+    """The attempts and timings of one call made by a command."""
+
+    name: str = Field(..., description="The command or request that was traced")
+    thread_id: int = Field(..., description="The thread that made the call")
+    thread_name: str = Field(..., description="The name of that thread")
+    start: float = Field(..., description="perf_counter when the call started")
+    end: Optional[float] = Field(
+        default=None, description="perf_counter when the call finished"
+    )
+    error: Optional[str] = Field(
+        default=None, description="The type of the error the call failed with"
+    )
+    attempts: List[HttpAttempt] = Field(
+        default_factory=lambda: cast(List[HttpAttempt], []),
+        description="The requests sent for the call, including retries",
+    )
+    deserializations: List[Tuple[float, float]] = Field(
+        default_factory=lambda: cast(List[Tuple[float, float]], []),
+        description="The periods spent deserializing",
+    )
+    # A connection opened before its request was sent, as urllib3 does for
+    # HTTPS to validate it.
+    _connect_start: Optional[float] = PrivateAttr(default=None)
+    _pending_connect: Optional[Tuple[float, float]] = PrivateAttr(default=None)
+
+    def finish(self) -> None:
+        if self.end is None:
+            self.end = time.perf_counter()
+
+    def add_attempt(self, attempt: HttpAttempt) -> None:
+        """Add a request; a connection opened ahead of it counts towards it."""
+        if self._pending_connect is not None:
+            attempt.connect_start, attempt.connect_end = self._pending_connect
+            attempt.start = attempt.connect_start
+            self._pending_connect = None
+        self.attempts.append(attempt)
+
+    def start_connect(self) -> None:
+        self._connect_start = time.perf_counter()
+
+    def finish_connect(self) -> None:
+        if self._connect_start is None:
+            return
+        connect: Tuple[float, float] = (self._connect_start, time.perf_counter())
+        self._connect_start = None
+        in_flight: Optional[HttpAttempt] = (
+            self.attempts[-1]
+            if self.attempts and self.attempts[-1].first_byte is None
+            else None
+        )
+        # Plain HTTP connects lazily while the request is sent.
+        if in_flight is not None and in_flight.connect_start is None:
+            in_flight.connect_start, in_flight.connect_end = connect
+        else:
+            self._pending_connect = connect
+
+    def add_response_bytes(self, size: int) -> None:
+        if self.attempts:
+            attempt: HttpAttempt = self.attempts[-1]
+            attempt.response_bytes = (attempt.response_bytes or 0) + size
+
+    @contextlib.contextmanager
+    def deserializing(self) -> Generator[None, None, None]:
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.deserializations.append((start, time.perf_counter()))
+
+    def summary(self) -> Dict[str, Any]:
+        end: float = self.end if self.end is not None else time.perf_counter()
+        last: Optional[HttpAttempt] = self.attempts[-1] if self.attempts else None
+        return {
+            "method": last.method if last else None,
+            "url": last.url if last else None,
+            "status": last.status if last else None,
+            "error": self.error,
+            "retries": max(0, len(self.attempts) - 1),
+            "connect_ms": _ms(
+                sum(
+                    a.connect_end - a.connect_start
+                    for a in self.attempts
+                    if a.connect_start is not None and a.connect_end is not None
+                )
+            ),
+            "first_byte_ms": (
+                _ms(last.first_byte - last.start)
+                if last and last.first_byte is not None
+                else None
+            ),
+            "total_ms": _ms(end - self.start),
+            "deserialize_ms": _ms(sum(e - s for s, e in self.deserializations)),
+            "request_bytes": sum(a.request_bytes for a in self.attempts),
+            "response_bytes": sum(a.response_bytes or 0 for a in self.attempts),
+        }
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+class HttpTraceRecorder:
+    """Collects the traced calls of one invocation."""
+
+    def __init__(self):
+        self._origin: float = time.perf_counter()
+        self._calls: List[HttpCallTrace] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def calls(self) -> List[HttpCallTrace]:
+        with self._lock:
+            return list(self._calls)
+
+    def add(self, call: HttpCallTrace) -> None:
+        with self._lock:
+            self._calls.append(call)
+
+    def _us(self, timestamp: float) -> float:
+        return round((timestamp - self._origin) * 1_000_000, 3)
+
+    def _event(
+        self,
+        call: HttpCallTrace,
+        name: str,
+        start: float,
+        end: float,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        event: Dict[str, Any] = {
+            "name": name,
+            "cat": "http",
+            "ph": "X",
+            "ts": self._us(start),
+            "dur": self._us(end) - self._us(start),
+            "pid": os.getpid(),
+            "tid": call.thread_id,
+        }
+        if args is not None:
+            event["args"] = args
+        return event
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        events: List[Dict[str, Any]] = []
+        threads: Dict[int, str] = {}
+        for call in self.calls:
+            threads[call.thread_id] = call.thread_name
+            end: float = call.end if call.end is not None else time.perf_counter()
+            events.append(self._event(call, call.name, call.start, end, call.summary()))
+            for attempt in call.attempts:
+                attempt_end: float = attempt.first_byte or end
+                events.append(
+                    self._event(
+                        call,
+                        f"{attempt.method} {attempt.url}",
+                        attempt.start,
+                        attempt_end,
+                        {"status": attempt.status},
+                    )
+                )
+                if attempt.connect_start is not None and attempt.connect_end:
+                    events.append(
+                        self._event(
+                            call, "connect", attempt.connect_start, attempt.connect_end
+                        )
+                    )
+            for start, stop in call.deserializations:
+                events.append(self._event(call, "deserialize", start, stop))
+        for thread_id, thread_name in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "tid": thread_id,
+                    "args": {"name": thread_name},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path) -> None:
+        path.write_text(json.dumps(self.to_chrome_trace(), indent=2))
+
+
+_recorder: Optional[HttpTraceRecorder] = None
+_current_call: contextvars.ContextVar[Optional[HttpCallTrace]] = contextvars.ContextVar(
+    "exls_http_trace_call", default=None
+)
+
+
+def start_recording() -> HttpTraceRecorder:
+    """Record the HTTP calls of the current invocation."""
+    global _recorder
+    _install_hooks()
+    _recorder = HttpTraceRecorder()
+    return _recorder
+
+
+def finish_recording(path: Path) -> None:
+    """Stop recording and write the trace to `path`."""
+    global _recorder
+    recorder: Optional[HttpTraceRecorder] = _recorder
+    _recorder = None
+    if recorder is None:
+        return
+    try:
+        recorder.write(path)
+    except OSError as e:
+        logger.warning(f"Failed to write the HTTP trace to {path}: {e}")
+
+
+@contextlib.contextmanager
+def trace_http_call(
+    name: str, finish: bool = True
+) -> Generator[Optional[HttpCallTrace], None, None]:
+    """
+    Trace the calls to the backend made in the enclosed block as one call.
+
+    Yields None if no recording is active. With `finish=False` the call stays
+    open after the block, e.g. for a stream, until its `finish` is called.
+    """
+    recorder: Optional[HttpTraceRecorder] = _recorder
+    if recorder is None:
+        yield None
+        return
+    thread: threading.Thread = threading.current_thread()
+    call: HttpCallTrace = HttpCallTrace(
+        name=name,
+        thread_id=thread.ident or 0,
+        thread_name=thread.name,
+        start=time.perf_counter(),
+    )
+    recorder.add(call)
+    token: contextvars.Token[Optional[HttpCallTrace]] = _current_call.set(call)
+    try:
+        yield call
+    except BaseException as e:
+        call.error = type(e).__name__
+        call.finish()
+        raise
+    finally:
+        _current_call.reset(token)
+    if finish:
+        call.finish()
+
+
+_hooks_installed: bool = False
+_hooks_lock: threading.Lock = threading.Lock()
+
+
+def _traced(
+    original: Callable[..., Any],
+    before: Optional[Callable[..., None]] = None,
+    after: Optional[Callable[..., None]] = None,
+) -> Callable[..., Any]:
+    @functools.wraps(original)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        call: Optional[HttpCallTrace] = _current_call.get()
+        if call is None:
+            return original(self, *args, **kwargs)
+        if before is not None:
+            before(call, self, *args, **kwargs)
+        result: Any = original(self, *args, **kwargs)
+        if after is not None:
+            after(call, result)
+        return result
+
+    return wrapper
+
+
+def _body_size(body: Any) -> int:
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    return 0
+
+
+def _on_request(
+    call: HttpCallTrace,
+    connection: HTTPConnection,
+    method: str,
+    url: str,
+    body: Any = None,
+    *args: Any,
+    **kwargs: Any,
+) -> None:
+    scheme: str = "https" if isinstance(connection, HTTPSConnection) else "http"
+    attempt: HttpAttempt = HttpAttempt(
+        method=method,
+        url=redact_url(f"{scheme}://{connection.host}:{connection.port}{url}"),
+        start=time.perf_counter(),
+        request_bytes=_body_size(kwargs.get("body", body)),
+    )
+    call.add_attempt(attempt)
+
+
+def _on_connect(call: HttpCallTrace, *args: Any, **kwargs: Any) -> None:
+    call.start_connect()
+
+
+def _on_connected(call: HttpCallTrace, result: Any) -> None:
+    call.finish_connect()
+
+
+def _on_response(call: HttpCallTrace, response: Any) -> None:
+    if not call.attempts:
+        return
+    attempt: HttpAttempt = call.attempts[-1]
+    attempt.first_byte = time.perf_counter()
+    attempt.status = response.status
+    content_length: Optional[str] = response.headers.get("Content-Length")
+    if content_length and content_length.isdigit():
+        attempt.response_bytes = int(content_length)
+
+
+def _traced_response_deserialize(original: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(original)
+    def wrapper(self: Any, response_data: Any, *args: Any, **kwargs: Any) -> Any:
+        call: Optional[HttpCallTrace] = _current_call.get()
+        if call is None:
+            return original(self, response_data, *args, **kwargs)
+        if call.attempts and response_data.data is not None:
+            call.attempts[-1].response_bytes = len(response_data.data)
+        with call.deserializing():
+            return original(self, response_data, *args, **kwargs)
+
+    return wrapper
+
+
+def _install_hooks() -> None:
+    global _hooks_installed
+    with _hooks_lock:
+        if _hooks_installed:
+            return
+        HTTPConnection.request = _traced(  # type: ignore[method-assign]
+            HTTPConnection.request, before=_on_request
+        )
+        HTTPConnection.getresponse = _traced(  # type: ignore[method-assign]
+            HTTPConnection.getresponse, after=_on_response
+        )
+        # The TLS handshake is part of the HTTPS connection's connect.
+        for connection_class in (HTTPConnection, HTTPSConnection):
+            connection_class.connect = _traced(  # type: ignore[method-assign]
+                connection_class.connect, before=_on_connect, after=_on_connected
+            )
+        ApiClient.response_deserialize = (  # type: ignore[method-assign]
+            _traced_response_deserialize(ApiClient.response_deserialize)
+        )
+        _hooks_installed = True
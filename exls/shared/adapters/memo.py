@@ -0,0 +1,164 @@
+import copy
+import functools
+import inspect
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from exls.shared.core.polling import is_polling
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+MemoKey = Tuple[str, str, str]
+
+
+class ReadMemo:
+    """
+    Remembers the results of read calls to the backend for one CLI invocation.
+
+    Identical reads that run at the same time share one request (single
+    flight); repeated reads are answered from memory. Entries belong to a
+    resource (e.g. "clusters") and a mutating call on that resource drops all
+    of them. Failed reads are not remembered.
+    """
+
+    def __init__(self):
+        self._lock: threading.Lock = threading.Lock()
+        self._results: Dict[MemoKey, Any] = {}
+        self._in_flight: Dict[MemoKey, Future[Any]] = {}
+        self._generations: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {
+            "hits": 0,
+            "shared": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "invalidations": 0,
+        }
+
+    def read(self, key: MemoKey, call: Callable[[], T]) -> T:
+        resource: str = key[0]
+        own: Future[Any] = Future()
+        with self._lock:
+            bypass: bool = is_polling()
+            if bypass:
+                self.counters["bypassed"] += 1
+            elif key in self._results:
+                self.counters["hits"] += 1
+                return copy.deepcopy(self._results[key])
+            in_flight: Optional[Future[Any]] = (
+                None if bypass else self._in_flight.get(key)
+            )
+            if in_flight is None:
+                if not bypass:
+                    self.counters["misses"] += 1
+                self._in_flight.setdefault(key, own)
+            else:
+                self.counters["shared"] += 1
+            generation: int = self._generations.get(resource, 0)
+
+        if in_flight is not None:
+            return copy.deepcopy(in_flight.result())
+
+        try:
+            result: T = call()
+        except BaseException as e:
+            with self._lock:
+                if self._in_flight.get(key) is own:
+                    del self._in_flight[key]
+            own.set_exception(e)
+            raise
+        with self._lock:
+            if self._in_flight.get(key) is own:
+                del self._in_flight[key]
+            # A mutation while the read was in flight may have outdated it.
+            if self._generations.get(resource, 0) == generation:
+                self._results[key] = copy.deepcopy(result)
+        own.set_result(result)
+        return result
+
+    def invalidate(self, *resources: str) -> None:
+        with self._lock:
+            self.counters["invalidations"] += 1
+            for resource in resources:
+                self._generations[resource] = self._generations.get(resource, 0) + 1
+            for key in [k for k in self._results if k[0] in resources]:
+                del self._results[key]
+
+
+_memo: Optional[ReadMemo] = None
+
+
+def start_invocation() -> ReadMemo:
+    """Start memoizing reads for a new invocation."""
+    global _memo
+    _memo = ReadMemo()
+    return _memo
+
+
+def finish_invocation() -> None:
+    """Stop memoizing reads and log the counters of the finished invocation."""
+    global _memo
+    if _memo is not None:
+        logger.debug(f"Read memo counters: {_memo.counters}")
+    _memo = None
+
+
+def memoized_read(resource: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Memoize a gateway read of `resource` for the current invocation.
+
+    Outside of an invocation, e.g. when the gateways are used as a library,
+    every call goes to the backend.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+            memo: Optional[ReadMemo] = _memo
+            if memo is None:
+                return func(self, *args, **kwargs)
+            key: MemoKey = (
+                resource,
+                func.__qualname__,
+                repr((args, sorted(kwargs.items()))),
+            )
+            return memo.read(key, lambda: func(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(*resources: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Drop the memoized reads of `resources` when the decorated call mutates them."""
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                memo: Optional[ReadMemo] = _memo
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    if memo is not None:
+                        memo.invalidate(*resources)
+
+            return async_wrapper  # pyright: ignore[reportReturnType]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            memo: Optional[ReadMemo] = _memo
+            try:
+                return func(*args, **kwargs)
+            finally:
+                # Also after failures, which may have changed the resource.
+                if memo is not None:
+                    memo.invalidate(*resources)
+
+        return wrapper
+
+    return decorator
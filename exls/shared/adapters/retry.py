@@ -0,0 +1,227 @@
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+from urllib3.util.retry import Retry
+
+from exls.shared.core.parallel import report_response
+from exls.shared.core.timeline import record_api_call
+
+if TYPE_CHECKING:
+    from exalsius_api_client.configuration import Configuration
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BUDGET = 20
+
+# urllib3 would otherwise retry connection errors and, for idempotent methods,
+# 413/429/503 responses on its own, below and unaccounted by our policy. It
+# still follows redirects.
+NO_TRANSPORT_RETRIES: Retry = Retry(
+    connect=0, read=0, status=0, other=0, respect_retry_after_header=False
+)
+
+
+def disable_transport_retries(configuration: "Configuration") -> None:
+    """Leave the retries of the requests of an SDK client to the SDK commands."""
+    # The generated SDK declares `retries` as an int, but it passes the value on
+    # to urllib3, which takes a Retry as well.
+    configuration.retries = (  # pyright: ignore[reportAttributeAccessIssue]
+        NO_TRANSPORT_RETRIES
+    )
+
+
+class TransientFailure(BaseModel):
+    """A failed attempt of a request that may succeed when it is repeated."""
+
+    description: str = Field(..., description="What went wrong, for the debug log")
+    status: Optional[int] = Field(
+        default=None, description="The HTTP status, if a response was received"
+    )
+    retry_after_seconds: Optional[float] = Field(
+        default=None, description="The delay requested by the server's Retry-After"
+    )
+    request_sent: bool = Field(
+        default=True,
+        description="Whether the request may have reached the server",
+    )
+
+
+class RetryPolicy(BaseModel):
+    max_retries: int = Field(
+        default=DEFAULT_MAX_RETRIES, description="Retries after the first attempt"
+    )
+    base_delay_seconds: float = Field(
+        default=0.5, description="The backoff before the first retry"
+    )
+    max_delay_seconds: float = Field(
+        default=30.0, description="The longest backoff we are willing to wait"
+    )
+    idempotent_statuses: FrozenSet[int] = Field(
+        default=frozenset({408, 425, 429, 500, 502, 503, 504}),
+        description="Statuses after which idempotent requests are retried",
+    )
+    # The server did not process a request it answered with one of these.
+    non_idempotent_statuses: FrozenSet[int] = Field(
+        default=frozenset({429, 503}),
+        description="Statuses after which non-idempotent requests are retried",
+    )
+
+    def should_retry(self, failure: TransientFailure, idempotent: bool) -> bool:
+        if failure.status is not None:
+            statuses: FrozenSet[int] = (
+                self.idempotent_statuses if idempotent else self.non_idempotent_statuses
+            )
+            return failure.status in statuses
+        # Without a response we don't know whether a non-idempotent request
+        # was processed, unless it never left this process.
+        return idempotent or not failure.request_sent
+
+    def is_overload(self, failure: TransientFailure) -> bool:
+        """Whether the failure suggests the backend is at capacity."""
+        return failure.status is None or failure.status in self.idempotent_statuses
+
+    def backoff_seconds(self, retry: int, failure: TransientFailure) -> float:
+        """Exponential backoff with full jitter, or the server's Retry-After."""
+        if failure.retry_after_seconds is not None:
+            return max(0.0, failure.retry_after_seconds)
+        ceiling: float = min(
+            self.max_delay_seconds, self.base_delay_seconds * 2 ** (retry - 1)
+        )
+        return random.uniform(0, ceiling)
+
+
+class RetryBudget:
+    """
+    Limits the retries of one CLI invocation.
+
+    Without a budget, a backend outage during a bulk operation multiplies the
+    load by the number of retries per request; with it, the invocation fails
+    fast once the budget is used up.
+    """
+
+    def __init__(self, retries: int = DEFAULT_RETRY_BUDGET):
+        self._lock: threading.Lock = threading.Lock()
+        self.retries: int = retries
+        self.counters: Dict[str, int] = {
+            "attempts": 0,
+            "retries": 0,
+            "recovered": 0,
+            "gave_up": 0,
+            "budget_exhausted": 0,
+        }
+
+    def count(self, counter: str) -> None:
+        with self._lock:
+            self.counters[counter] += 1
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.counters["retries"] >= self.retries:
+                self.counters["budget_exhausted"] += 1
+                return False
+            self.counters["retries"] += 1
+            return True
+
+
+_policy: RetryPolicy = RetryPolicy()
+# For requests whose callers react to the failures themselves, e.g. to an
+# OAuth "slow_down", which a retry would only make worse.
+NO_RETRIES: RetryPolicy = RetryPolicy(max_retries=0)
+_budget: RetryBudget = RetryBudget()
+
+
+def start_invocation(max_retries: int, budget: int) -> RetryBudget:
+    """Apply the retry settings and start a new retry budget for an invocation."""
+    global _policy, _budget
+    _policy = RetryPolicy(max_retries=max_retries)
+    _budget = RetryBudget(budget)
+    return _budget
+
+
+def log_retry_counters() -> None:
+    if _budget.counters["retries"] or _budget.counters["budget_exhausted"]:
+        logger.debug(f"HTTP retry counters: {_budget.counters}")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header, given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        retry_at: datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+
+def call_with_retries(
+    call: Callable[[], T],
+    name: str,
+    idempotent: bool,
+    classify: Callable[[Exception], Optional[TransientFailure]],
+    policy: Optional[RetryPolicy] = None,
+    budget: Optional[RetryBudget] = None,
+) -> T:
+    """
+    Call `call` and repeat it after transient failures.
+
+    `classify` returns a TransientFailure for exceptions that may be worth
+    retrying and None for all others, which are raised immediately. The
+    exception of the last attempt is raised when the policy or the budget of
+    the invocation does not allow another retry.
+    """
+    retry_policy: RetryPolicy = policy or _policy
+    retry_budget: RetryBudget = budget or _budget
+    retry: int = 0
+    while True:
+        retry_budget.count("attempts")
+        record_api_call()
+        started: float = time.perf_counter()
+        try:
+            result: T = call()
+        except Exception as e:
+            failure: Optional[TransientFailure] = classify(e)
+            # Let an adaptive concurrency limit of a bulk operation back off.
+            report_response(
+                time.perf_counter() - started,
+                overloaded=failure is not None and retry_policy.is_overload(failure),
+            )
+            if failure is None or not retry_policy.should_retry(failure, idempotent):
+                raise
+            delay: float = retry_policy.backoff_seconds(retry + 1, failure)
+            if (
+                retry >= retry_policy.max_retries
+                or delay > retry_policy.max_delay_seconds
+            ):
+                retry_budget.count("gave_up")
+                raise
+            if not retry_budget.try_spend():
+                logger.debug(f"Not retrying {name}: the retry budget is used up")
+                raise
+            retry += 1
+            logger.debug(
+                f"Retrying {name} in {delay:.2f}s after {failure.description} "
+                f"(retry {retry}/{retry_policy.max_retries}, "
+                f"counters: {retry_budget.counters})"
+            )
+            time.sleep(delay)
+            continue
+        report_response(time.perf_counter() - started, overloaded=False)
+        if retry:
+            retry_budget.count("recovered")
+        return result
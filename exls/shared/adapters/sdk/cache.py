@@ -0,0 +1,192 @@
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+from exalsius_api_client.api_client import ApiClient
+from exalsius_api_client.rest import RESTResponse
+from pydantic import BaseModel, Field, ValidationError
+from urllib3 import BaseHTTPResponse
+
+from exls.shared.adapters.file.commands import WriteBinaryFileAtomicallyCommand
+from exls.shared.adapters.jwt.commands import (
+    DecodeTokenMetadataCommand,
+    JWTCommandError,
+)
+from exls.shared.core.polling import is_polling
+
+logger = logging.getLogger(__name__)
+
+# Sends the request with the given extra headers and returns the raw response.
+ConditionalRequest = Callable[[Dict[str, str]], BaseHTTPResponse]
+
+
+class CachedSdkResponse(BaseModel):
+    key: str = Field(..., description="The request the response belongs to")
+    etag: Optional[str] = Field(default=None, description="The ETag of the response")
+    stored_at: float = Field(..., description="Unix time the response was validated")
+    body: str = Field(..., description="The response body")
+
+
+class _TokenIdentity(BaseModel):
+    sub: Optional[str] = None
+    org_id: Optional[str] = None
+
+
+def api_client_of(api: Any) -> ApiClient:
+    """The ApiClient of a generated API class, which declares it untyped."""
+    return cast(ApiClient, api.api_client)
+
+
+def cache_namespace(backend_host: str, access_token: str) -> str:
+    """
+    The cache namespace of a user and organization on a backend.
+
+    Falls back to the token itself for tokens that are not JWTs, which only
+    shares the cache between invocations with the same token.
+    """
+    identity: str
+    try:
+        claims: _TokenIdentity = DecodeTokenMetadataCommand(
+            token=access_token, model=_TokenIdentity
+        ).execute()
+        identity = f"{claims.sub}|{claims.org_id}"
+    except JWTCommandError:
+        identity = access_token
+    return hashlib.sha256(f"{backend_host}|{identity}".encode()).hexdigest()[:32]
+
+
+class SdkResponseCache:
+    """
+    An on-disk cache for responses of idempotent SDK GET requests.
+
+    Entries younger than `max_age_seconds` are used without a request. Older
+    ones, and all entries while polling, are revalidated with `If-None-Match`
+    if the backend sent an ETag and fetched again otherwise. The cache directory is shared by all namespaces
+    and kept below `max_bytes` by evicting the least recently used entries.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        namespace: str,
+        max_age_seconds: int,
+        max_bytes: int,
+    ):
+        self._cache_dir: Path = cache_dir
+        self._namespace_dir: Path = cache_dir / namespace
+        self._max_age_seconds: int = max_age_seconds
+        self._max_bytes: int = max_bytes
+
+    def _entry_file(self, resource: str, key: str) -> Path:
+        digest: str = hashlib.sha256(key.encode()).hexdigest()
+        return self._namespace_dir / f"{resource}-{digest}.json"
+
+    def _load(self, resource: str, key: str) -> Optional[CachedSdkResponse]:
+        try:
+            entry: CachedSdkResponse = CachedSdkResponse.model_validate_json(
+                self._entry_file(resource, key).read_bytes()
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as e:
+            logger.debug(f"Ignoring unreadable cache entry for {key}: {e}")
+            return None
+        return entry if entry.key == key else None
+
+    def _touch(self, resource: str, key: str) -> None:
+        try:
+            os.utime(self._entry_file(resource, key))
+        except OSError:
+            pass
+
+    def _store(self, resource: str, entry: CachedSdkResponse) -> None:
+        entry_file: Path = self._entry_file(resource, entry.key)
+        try:
+            WriteBinaryFileAtomicallyCommand(
+                file_path=entry_file,
+                content=entry.model_dump_json().encode("utf-8"),
+                mode=0o600,
+            ).execute()
+            self._evict(keep=entry_file)
+        except OSError as e:
+            logger.debug(f"Failed to write cache entry for {entry.key}: {e}")
+
+    def _evict(self, keep: Path) -> None:
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self._cache_dir.glob("*/*.json"):
+            try:
+                stat: os.stat_result = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total: int = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def invalidate(self, *resources: str) -> None:
+        """Drop the cached responses of resources that were changed."""
+        for resource in resources:
+            for path in self._namespace_dir.glob(f"{resource}-*.json"):
+                path.unlink(missing_ok=True)
+
+    def get(
+        self,
+        api_client: ApiClient,
+        resource: str,
+        key: str,
+        request: ConditionalRequest,
+        response_type: str,
+    ) -> Any:
+        """Return the deserialized response of `request`, from the cache if valid."""
+        entry: Optional[CachedSdkResponse] = self._load(resource, key)
+        if (
+            entry is not None
+            and not is_polling()
+            and time.time() - entry.stored_at <= self._max_age_seconds
+        ):
+            logger.debug(f"Response cache hit for {key}")
+            self._touch(resource, key)
+            return cast(
+                Any,
+                api_client.deserialize(entry.body, response_type, "application/json"),
+            )
+
+        headers: Dict[str, str] = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        raw_response: BaseHTTPResponse = request(headers)
+        response: RESTResponse = RESTResponse(raw_response)
+        response.read()
+
+        if raw_response.status == 304 and entry is not None:
+            logger.debug(f"Response cache revalidated {key}")
+            entry.stored_at = time.time()
+            self._store(resource, entry)
+            return cast(
+                Any,
+                api_client.deserialize(entry.body, response_type, "application/json"),
+            )
+
+        logger.debug(f"Response cache miss for {key}")
+        # Raises the SDK's ApiException for error responses.
+        result: Any = api_client.response_deserialize(
+            response_data=response, response_types_map={"2XX": response_type}
+        ).data
+        self._store(
+            resource,
+            CachedSdkResponse(
+                key=key,
+                etag=raw_response.headers.get("ETag"),
+                stored_at=time.time(),
+                body=raw_response.data.decode("utf-8"),
+            ),
+        )
+        return result
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, TypeVar
+from typing import ClassVar, Generic, Mapping, Optional, TypeVar, cast
 
 from exalsius_api_client.exceptions import ApiException
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    HTTPError,
+    MaxRetryError,
+    NewConnectionError,
+)
 
+from exls.profiling import profile_span
+from exls.shared.adapters.http_trace import trace_http_call
+from exls.shared.adapters.retry import (
+    TransientFailure,
+    call_with_retries,
+    parse_retry_after,
+)
 from exls.shared.core.ports.command import BaseCommand, CommandError
 
 T_API = TypeVar("T_API")
@@ -49,11 +62,36 @@ class UnexpectedSdkCommandResponseError(ExalsiusSdkCommandError):
         super().__init__(message, sdk_command, status, reason, details, retryable)
 
 
+def _transient_sdk_failure(e: Exception) -> Optional[TransientFailure]:
+    if isinstance(e, UnexpectedSdkCommandResponseError):
+        return TransientFailure(description=e.message) if e.retryable else None
+    if isinstance(e, ApiException):
+        headers: Mapping[str, str] = cast(
+            Mapping[str, str],
+            e.headers or {},  # pyright: ignore[reportUnknownMemberType]
+        )
+        return TransientFailure(
+            description=f"status {e.status}",  # pyright: ignore[reportUnknownMemberType]
+            status=e.status,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+            retry_after_seconds=parse_retry_after(headers.get("Retry-After")),
+        )
+    reason: Exception = e.reason if isinstance(e, MaxRetryError) and e.reason else e
+    if isinstance(reason, (NewConnectionError, ConnectTimeoutError)):
+        return TransientFailure(description=str(reason), request_sent=False)
+    if isinstance(reason, HTTPError):
+        return TransientFailure(description=str(reason))
+    return None
+
+
 class ExalsiusSdkCommand(
     BaseCommand[T_Cmd_Return],
     Generic[T_API, T_Cmd_Return],
     ABC,
 ):
+    # Whether repeating the call has the same effect as making it once. Calls
+    # that are not are only retried when the backend did not process them.
+    idempotent: ClassVar[bool] = True
+
     def __init__(self, api_client: T_API):
         self._api_client: T_API = api_client
 
@@ -63,7 +101,16 @@ class ExalsiusSdkCommand(
 
     def execute(self) -> T_Cmd_Return:
         try:
-            return self._execute_api_call()
+            with (
+                profile_span(self.__class__.__name__, "api"),
+                trace_http_call(self.__class__.__name__),
+            ):
+                return call_with_retries(
+                    self._execute_api_call,
+                    name=self.__class__.__name__,
+                    idempotent=self.idempotent,
+                    classify=_transient_sdk_failure,
+                )
         except UnexpectedSdkCommandResponseError as e:
             raise ExalsiusSdkCommandError(
                 message=f"The API returned an unexpected response: {e.message}",
@@ -2,12 +2,14 @@ from pathlib import Path
 from typing import (
     Any,
     Callable,
+    ContextManager,
     Dict,
     Iterator,
     Optional,
     Sequence,
     TypeVar,
     Union,
+    cast,
 )
 
 from pydantic import BaseModel
@@ -25,8 +27,10 @@ from exls.shared.adapters.ui.shared.render.render import (
     DictToYamlStringRenderer,
     YamlRenderContext,
 )
+from exls.shared.core.polling import SnapshotChanges
 
 T = TypeVar("T")
+T_Model = TypeVar("T_Model", bound=BaseModel)
 
 
 class IOBaseModelFacade(IOFacade[BaseModel]):
@@ -76,6 +80,38 @@ class IOBaseModelFacade(IOFacade[BaseModel]):
             header=header,
         )
 
+    def display_pages(
+        self,
+        pages: Iterator[Sequence[BaseModel]],
+        output_format: OutputFormat,
+        view_context: Optional[ViewContext] = None,
+    ):
+        self.output_manager.display_pages(
+            pages,
+            output_format=output_format,
+            render_context=(
+                view_context.get_context_for_format(output_format)
+                if view_context
+                else None
+            ),
+        )
+
+    def display_watch(
+        self,
+        changes: Iterator[SnapshotChanges[T_Model]],
+        output_format: OutputFormat,
+        view_context: Optional[ViewContext] = None,
+    ):
+        self.output_manager.display_watch(
+            cast(Iterator[SnapshotChanges[BaseModel]], changes),
+            output_format=output_format,
+            render_context=(
+                view_context.get_context_for_format(output_format)
+                if view_context
+                else None
+            ),
+        )
+
     def display_info_message(self, message: str, output_format: OutputFormat):
         self.output_manager.display_info_message(message, output_format)
 
@@ -85,6 +121,11 @@ class IOBaseModelFacade(IOFacade[BaseModel]):
     def display_error_message(self, message: str, output_format: OutputFormat):
         self.output_manager.display_error_message(message, output_format)
 
+    def display_progress(
+        self, description: str, total: int, output_format: OutputFormat
+    ) -> ContextManager[Callable[[int], None]]:
+        return self.output_manager.display_progress(description, total, output_format)
+
     def ask_confirm(self, message: str, default: bool = False) -> bool:
         return self.input_manager.ask_confirm(message=message, default=False)
 
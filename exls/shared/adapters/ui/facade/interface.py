@@ -7,8 +7,11 @@ from exls.shared.adapters.ui.input.interfaces import IInputManager
 from exls.shared.adapters.ui.output.interfaces import IMessageOutputManager
 from exls.shared.adapters.ui.output.values import OutputFormat
 from exls.shared.adapters.ui.output.view import ViewContext
+from exls.shared.core.polling import SnapshotChanges
 
 T = TypeVar("T", bound=BaseModel)
+# The resources of a watch, which need not be those of the facade.
+T_Model = TypeVar("T_Model", bound=BaseModel)
 
 
 class IOFacade(
@@ -33,3 +36,19 @@ class IOFacade(
         view_context: Optional[ViewContext] = None,
         header: Optional[str] = None,
     ) -> None: ...
+
+    @abstractmethod
+    def display_pages(
+        self,
+        pages: Iterator[Sequence[T]],
+        output_format: OutputFormat,
+        view_context: Optional[ViewContext] = None,
+    ) -> None: ...
+
+    @abstractmethod
+    def display_watch(
+        self,
+        changes: Iterator[SnapshotChanges[T_Model]],
+        output_format: OutputFormat,
+        view_context: Optional[ViewContext] = None,
+    ) -> None: ...
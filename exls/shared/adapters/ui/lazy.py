@@ -0,0 +1,57 @@
+import importlib
+from typing import Any, ClassVar, Dict, List, Optional
+
+import typer
+import typer.main
+from pydantic import BaseModel, Field
+from typer.core import TyperGroup
+
+
+class LazySubcommand(BaseModel):
+    """A subcommand whose implementation is only imported when it is invoked."""
+
+    import_path: str = Field(
+        ...,
+        description="Location of the typer app or command function as 'module:attribute'",
+    )
+    help: Optional[str] = Field(
+        default=None, description="The help text shown for the subcommand"
+    )
+
+
+def _load_subcommand(name: str, subcommand: LazySubcommand) -> Any:
+    module_name, attribute = subcommand.import_path.split(":", 1)
+    target: Any = getattr(importlib.import_module(module_name), attribute)
+
+    # Register the target on a throwaway app exactly like it would be registered
+    # on the root app, so the generated command (name, help, params) is identical.
+    holder: typer.Typer = typer.Typer()
+    if isinstance(target, typer.Typer):
+        holder.add_typer(target, name=name, help=subcommand.help)
+    else:
+        holder.command(name=name, help=subcommand.help)(target)
+    return typer.main.get_group(holder).commands[name]
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    A typer group that imports its subcommands on first use.
+
+    Subclasses declare their subcommands in `lazy_subcommands`. Only the module of
+    the subcommand that is actually resolved gets imported, which keeps the import
+    graph of a single invocation small. Listing all commands (e.g. for `--help` or
+    shell completion) loads every subcommand.
+    """
+
+    lazy_subcommands: ClassVar[Dict[str, LazySubcommand]] = {}
+
+    def list_commands(self, ctx: Any) -> List[str]:
+        names: List[str] = super().list_commands(ctx)
+        return names + [name for name in self.lazy_subcommands if name not in names]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        command: Any = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_subcommands:
+            command = _load_subcommand(cmd_name, self.lazy_subcommands[cmd_name])
+            self.commands[cmd_name] = command
+        return command
@@ -3,6 +3,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import (
     TYPE_CHECKING,
+    Callable,
+    ContextManager,
     Generic,
     Iterator,
     Literal,
@@ -20,6 +22,7 @@ if TYPE_CHECKING:
     from exls.shared.adapters.ui.output.render.text import TextRenderContext
     from exls.shared.adapters.ui.output.values import OutputFormat
     from exls.shared.adapters.ui.shared.render.entities import BaseRenderContext
+    from exls.shared.core.polling import SnapshotChanges
 
 T_Input_Cov = TypeVar("T_Input_Cov", contravariant=True)
 T_Output_Cov = TypeVar("T_Output_Cov", covariant=True)
@@ -35,6 +38,15 @@ class IListRenderer(Generic[T_Input_Cov, T_Output_Cov], ABC):
         render_context: Optional[BaseRenderContext] = None,
     ) -> T_Output_Cov: ...
 
+    def render_pages(
+        self,
+        pages: Iterator[Sequence[T_Input_Cov]],
+        render_context: Optional[BaseRenderContext] = None,
+    ) -> Iterator[T_Output_Cov]:
+        """Render pages of a list as they arrive, one output per page."""
+        for page in pages:
+            yield self.render(page, render_context)
+
 
 class ISingleItemRenderer(Generic[T_Input_Cov, T_Output_Cov], ABC):
     """Base single item renderer."""
@@ -100,6 +112,24 @@ class IObjectOutputManager(
         header: Optional[str] = None,
     ) -> None: ...
 
+    @abstractmethod
+    def display_pages(
+        self,
+        pages: Iterator[Sequence[T_Input_Cov]],
+        output_format: OutputFormat,
+        render_context: Optional[BaseRenderContext] = None,
+    ) -> None: ...
+
+    @abstractmethod
+    def display_watch(
+        self,
+        changes: Iterator[SnapshotChanges[T_Input_Cov]],
+        output_format: OutputFormat,
+        render_context: Optional[BaseRenderContext] = None,
+    ) -> None:
+        """Keeps showing a list as it changes, until interrupted."""
+        ...
+
 
 class IMessageOutputManager(ABC):
     """Protocol for output display of messages."""
@@ -119,6 +149,14 @@ class IMessageOutputManager(ABC):
         self, message: str, output_format: OutputFormat
     ) -> None: ...
 
+    @abstractmethod
+    def display_progress(
+        self, description: str, total: int, output_format: OutputFormat
+    ) -> ContextManager[Callable[[int], None]]:
+        """Shows the progress of `total` steps; call the yielded function with
+        the number of completed steps."""
+        ...
+
 
 class IOutputManager(
     IMessageOutputManager,
@@ -1,7 +1,12 @@
 import contextlib
+import time
 from typing import (
+    Callable,
+    Dict,
+    Generator,
     Generic,
     Iterator,
+    List,
     Literal,
     Optional,
     Sequence,
@@ -11,10 +16,23 @@ from typing import (
 )
 
 from pydantic import BaseModel
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
+from rich.live import Live
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TaskID,
+    TextColumn,
+    TimeElapsedColumn,
+)
+from rich.style import StyleType
 from rich.table import Table
+from rich.text import Text
 from rich.theme import Theme
 
+from exls.profiling import profile_span
 from exls.shared.adapters.ui.output.interfaces import (
     IListRenderer,
     IMessageOutputManager,
@@ -28,14 +46,21 @@ from exls.shared.adapters.ui.output.render.factory import (
     DefaultRendererProvider,
     RendererProvider,
 )
-from exls.shared.adapters.ui.output.render.json import JsonRenderContext
-from exls.shared.adapters.ui.output.render.table import TableRenderContext
+from exls.shared.adapters.ui.output.render.json import (
+    JsonRenderContext,
+    NdjsonListStringRenderer,
+)
+from exls.shared.adapters.ui.output.render.table import (
+    TableListRenderer,
+    TableRenderContext,
+)
 from exls.shared.adapters.ui.output.render.text import TextRenderContext
 from exls.shared.adapters.ui.output.values import (
     OutputFormat,
 )
 from exls.shared.adapters.ui.shared.render.entities import BaseRenderContext
 from exls.shared.adapters.ui.shared.render.render import YamlRenderContext
+from exls.shared.core.polling import SnapshotChanges
 
 DEFAULT_THEME = Theme(
     {
@@ -97,6 +122,15 @@ class TyperConsoleOutputManager(
     ) -> ISingleItemRenderer[TextMessageItem, Union[Table, str]]:
         return self.message_renderer_provider.get_error_renderer(output_format)
 
+    def _print(self, renderable: Union[Table, str], output_format: OutputFormat):
+        if output_format == OutputFormat.NDJSON:
+            # Each line must stay one JSON document, whatever the terminal width.
+            self.console.print(
+                renderable, soft_wrap=True, markup=False, highlight=False
+            )
+        else:
+            self.console.print(renderable)
+
     @overload
     def display(
         self,
@@ -135,16 +169,19 @@ class TyperConsoleOutputManager(
         output_format: OutputFormat,
         render_context: Optional[BaseRenderContext] = None,
     ) -> None:
-        if isinstance(data, Sequence):
-            list_renderer: IListRenderer[T, Union[Table, str]] = (
-                self._get_list_renderer(output_format)
-            )
-            self.console.print(list_renderer.render(data, render_context))
-        else:
-            single_item_renderer: ISingleItemRenderer[T, Union[Table, str]] = (
-                self._get_item_renderer(output_format)
-            )
-            self.console.print(single_item_renderer.render(data, render_context))
+        with profile_span(f"display {output_format.value}", "render"):
+            if isinstance(data, Sequence):
+                list_renderer: IListRenderer[T, Union[Table, str]] = (
+                    self._get_list_renderer(output_format)
+                )
+                self._print(list_renderer.render(data, render_context), output_format)
+            else:
+                single_item_renderer: ISingleItemRenderer[T, Union[Table, str]] = (
+                    self._get_item_renderer(output_format)
+                )
+                self._print(
+                    single_item_renderer.render(data, render_context), output_format
+                )
 
     def display_stream(
         self,
@@ -153,7 +190,7 @@ class TyperConsoleOutputManager(
         render_context: Optional[BaseRenderContext] = None,
         header: Optional[str] = None,
     ) -> None:
-        if header and output_format != OutputFormat.JSON:
+        if header and output_format not in (OutputFormat.JSON, OutputFormat.NDJSON):
             self.console.print(header)
             self.console.print("[dim]Press Ctrl+C to stop[/dim]\n")
 
@@ -165,23 +202,195 @@ class TyperConsoleOutputManager(
         except KeyboardInterrupt:
             pass
 
+    def display_pages(
+        self,
+        pages: Iterator[Sequence[T]],
+        output_format: OutputFormat,
+        render_context: Optional[BaseRenderContext] = None,
+    ) -> None:
+        with profile_span(f"display {output_format.value} pages", "render"):
+            list_renderer: IListRenderer[T, Union[Table, str]] = (
+                self._get_list_renderer(output_format)
+            )
+            if output_format == OutputFormat.TABLE:
+                self._display_table_pages(list_renderer, pages, render_context)
+                return
+            for chunk in list_renderer.render_pages(pages, render_context):
+                self._print(chunk, output_format)
+
+    def _display_table_pages(
+        self,
+        list_renderer: IListRenderer[T, Union[Table, str]],
+        pages: Iterator[Sequence[T]],
+        render_context: Optional[BaseRenderContext],
+    ) -> None:
+        # A table needs all of its rows to size the columns, so it is rendered
+        # again as pages arrive. On a terminal the first rows show right away;
+        # otherwise the complete table is printed once at the end.
+        rows: List[T] = []
+        if not self.console.is_terminal:
+            for page in pages:
+                rows.extend(page)
+            self.console.print(list_renderer.render(rows, render_context))
+            return
+        with Live(console=self.console, refresh_per_second=4) as live:
+            for page in pages:
+                rows.extend(page)
+                live.update(
+                    list_renderer.render(rows, render_context),
+                    refresh=len(rows) == len(page),
+                )
+
+    def display_watch(
+        self,
+        changes: Iterator[SnapshotChanges[T]],
+        output_format: OutputFormat,
+        render_context: Optional[BaseRenderContext] = None,
+    ) -> None:
+        try:
+            with contextlib.closing(changes):  # type: ignore[arg-type]
+                if output_format == OutputFormat.NDJSON:
+                    self._display_watch_events(changes)
+                elif output_format == OutputFormat.TABLE and self.console.is_terminal:
+                    self._display_live_table(changes, render_context)
+                else:
+                    # Without a live view, each new state is printed in full.
+                    list_renderer: IListRenderer[T, Union[Table, str]] = (
+                        self._get_list_renderer(output_format)
+                    )
+                    for change in changes:
+                        if change.error is not None:
+                            self._display_watch_error(change.error, output_format)
+                            continue
+                        self._print(
+                            list_renderer.render(
+                                list(change.snapshot.values()), render_context
+                            ),
+                            output_format,
+                        )
+        except KeyboardInterrupt:
+            pass
+
+    def _display_watch_error(self, error: str, output_format: OutputFormat) -> None:
+        # A table of the error's fields reads poorly between listings.
+        if output_format == OutputFormat.TABLE:
+            output_format = OutputFormat.TEXT
+        self.display_error_message(
+            f"Failed to refresh, trying again: {error}", output_format
+        )
+
+    def _display_watch_events(self, changes: Iterator[SnapshotChanges[T]]) -> None:
+        renderer: NdjsonListStringRenderer[T] = NdjsonListStringRenderer[T]()
+        for change in changes:
+            if change.error is not None:
+                self._display_watch_error(change.error, OutputFormat.NDJSON)
+                continue
+            for key in change.added:
+                self._print(
+                    renderer.render_event("added", key, change.snapshot[key]),
+                    OutputFormat.NDJSON,
+                )
+            for key in change.changed:
+                self._print(
+                    renderer.render_event("changed", key, change.snapshot[key]),
+                    OutputFormat.NDJSON,
+                )
+            for key, item in change.removed.items():
+                self._print(
+                    renderer.render_event("removed", key, item), OutputFormat.NDJSON
+                )
+
+    def _display_live_table(
+        self,
+        changes: Iterator[SnapshotChanges[T]],
+        render_context: Optional[BaseRenderContext],
+    ) -> None:
+        # The cells of a row are only formatted again when its item changed;
+        # rows that were added or changed are highlighted until the next update.
+        table_renderer: TableListRenderer[T] = TableListRenderer[T]()
+        rows: Dict[str, List[object]] = {}
+        first: bool = True
+        with Live(console=self.console, auto_refresh=False) as live:
+            for change in changes:
+                items: List[T] = list(change.snapshot.values())
+                for key in change.removed:
+                    rows.pop(key, None)
+                view: RenderableType = Text("Nothing to show.", style="dim")
+                if items:
+                    table_context: TableRenderContext = (
+                        table_renderer.resolve_list_context(items, render_context)
+                    )
+                    for key in change.added + change.changed:
+                        rows[key] = table_renderer.render_row(
+                            change.snapshot[key], table_context
+                        )
+                    styles: Dict[str, StyleType] = (
+                        {}
+                        if first
+                        else {
+                            **{key: "green" for key in change.added},
+                            **{key: "bold" for key in change.changed},
+                        }
+                    )
+                    view = table_renderer.render_rows(
+                        [rows[key] for key in change.snapshot],
+                        table_context,
+                        row_styles=[styles.get(key) for key in change.snapshot],
+                    )
+                summary: Text = Text(
+                    f"Updated {time.strftime('%H:%M:%S')}: "
+                    f"{len(change.added)} added, {len(change.changed)} changed, "
+                    f"{len(change.removed)} removed. Press Ctrl+C to stop.",
+                    style="dim",
+                )
+                if change.error is not None:
+                    # The rows keep the last known state until a refresh works.
+                    summary = Text(
+                        f"Failed to refresh at {time.strftime('%H:%M:%S')}, "
+                        f"trying again: {change.error}. Press Ctrl+C to stop.",
+                        style="red",
+                    )
+                live.update(Group(view, summary), refresh=True)
+                first = False
+
+    @contextlib.contextmanager
+    def display_progress(
+        self, description: str, total: int, output_format: OutputFormat
+    ) -> Generator[Callable[[int], None], None, None]:
+        # The bar is drawn on the terminal only and removed when done, so it
+        # never ends up in piped or machine-readable output.
+        if output_format != OutputFormat.TABLE or not self.console.is_terminal:
+            yield lambda completed: None
+            return
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=self.console,
+            transient=True,
+        ) as progress:
+            task: TaskID = progress.add_task(description, total=total)
+            yield lambda completed: progress.update(task, completed=completed)
+
     def display_info_message(self, message: str, output_format: OutputFormat):
         item = TextMessageItem(message=message)
         renderer: ISingleItemRenderer[TextMessageItem, Union[Table, str]] = (
             self._get_info_message_renderer(output_format)
         )
-        self.console.print(renderer.render(item))
+        self._print(renderer.render(item), output_format)
 
     def display_success_message(self, message: str, output_format: OutputFormat):
         item = TextMessageItem(message=message)
         renderer: ISingleItemRenderer[TextMessageItem, Union[Table, str]] = (
             self._get_success_message_renderer(output_format)
         )
-        self.console.print(renderer.render(item))
+        self._print(renderer.render(item), output_format)
 
     def display_error_message(self, message: str, output_format: OutputFormat):
         item = TextMessageItem(message=message)
         renderer: ISingleItemRenderer[TextMessageItem, Union[Table, str]] = (
             self._get_error_message_renderer(output_format)
         )
-        self.console.print(renderer.render(item))
+        self._print(renderer.render(item), output_format)
@@ -13,6 +13,8 @@ from exls.shared.adapters.ui.output.render.entities import (
 from exls.shared.adapters.ui.output.render.json import (
     JsonListStringRenderer,
     JsonSingleItemStringRenderer,
+    NdjsonListStringRenderer,
+    NdjsonSingleItemStringRenderer,
 )
 from exls.shared.adapters.ui.output.render.table import (
     TableListRenderer,
@@ -92,6 +94,8 @@ class DefaultRendererProvider(RendererProvider[T], Generic[T]):
             return TableListRenderer[T]()
         elif output_format == OutputFormat.TEXT:
             return RichTextListRenderer[T]()
+        elif output_format == OutputFormat.NDJSON:
+            return NdjsonListStringRenderer[T]()
 
     def get_item_renderer(
         self,
@@ -105,6 +109,8 @@ class DefaultRendererProvider(RendererProvider[T], Generic[T]):
             return TableSingleItemRenderer[T]()
         elif output_format == OutputFormat.TEXT:
             return RichTextItemRenderer[T]()
+        elif output_format == OutputFormat.NDJSON:
+            return NdjsonSingleItemStringRenderer[T]()
 
     def get_message_renderer(
         self, output_format: OutputFormat
@@ -117,6 +123,8 @@ class DefaultRendererProvider(RendererProvider[T], Generic[T]):
             return YamlSingleItemStringRenderer[TextMessageItem]()
         elif output_format == OutputFormat.TABLE:
             return TableSingleItemRenderer[TextMessageItem]()
+        elif output_format == OutputFormat.NDJSON:
+            return NdjsonSingleItemStringRenderer[TextMessageItem]()
 
     def get_success_message_renderer(
         self, output_format: OutputFormat
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import json
+import textwrap
 from typing import (
     Any,
     Dict,
     Generic,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -114,3 +116,67 @@ class JsonListStringRenderer(_BaseJsonStringRenderer[T], IListRenderer[T, str]):
         ]
         json_string = self._format_json(processed_payload, validated_render_context)
         return json_string
+
+    def render_pages(
+        self,
+        pages: Iterator[Sequence[T]],
+        render_context: Optional[BaseRenderContext] = None,
+    ) -> Iterator[str]:
+        """
+        Render pages of items as the lines of one JSON array.
+
+        Joined with newlines, the chunks equal the output of `render` for all
+        items. The last item of a page is held back until it is known whether
+        another item follows it.
+        """
+        validated_render_context = self.resolve_context(render_context)
+        prefix: str = " " * validated_render_context.indent
+        pending: Optional[str] = None
+        for page in pages:
+            items: List[str] = [
+                textwrap.indent(
+                    self._format_json(
+                        self._process_item(item), validated_render_context
+                    ),
+                    prefix,
+                )
+                for item in page
+            ]
+            if not items:
+                continue
+            if pending is None:
+                yield "["
+            ready: List[str] = ([pending] if pending is not None else []) + items[:-1]
+            if ready:
+                yield ",\n".join(ready) + ","
+            pending = items[-1]
+        yield "[]" if pending is None else f"{pending}\n]"
+
+
+class NdjsonSingleItemStringRenderer(
+    _BaseJsonStringRenderer[T], ISingleItemRenderer[T, str]
+):
+    """Renders a single item as one line of JSON."""
+
+    def render(
+        self, data: T, render_context: Optional[BaseRenderContext] = None
+    ) -> str:
+        return json.dumps(self._process_item(data), default=str)
+
+
+class NdjsonListStringRenderer(_BaseJsonStringRenderer[T], IListRenderer[T, str]):
+    """Renders a list of items as newline-delimited JSON, one item per line."""
+
+    def render(
+        self, data: Sequence[T], render_context: Optional[BaseRenderContext] = None
+    ) -> str:
+        return "\n".join(
+            json.dumps(self._process_item(item), default=str) for item in data
+        )
+
+    def render_event(self, event: str, key: str, data: T) -> str:
+        """Render a change of an item (e.g. added, changed, removed) as one line."""
+        return json.dumps(
+            {"event": event, "id": key, "object": self._process_item(data)},
+            default=str,
+        )
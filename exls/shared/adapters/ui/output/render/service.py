@@ -23,6 +23,17 @@ def format_float(value: float | int, precision: int = 2) -> str:
     return f"{float(value):.{precision}f}"
 
 
+def format_duration_ms(value: float | int) -> str:
+    """Format a duration in milliseconds (e.g., '350 ms', '4.2 s', '9m 12s')."""
+    if value < 1000:
+        return f"{value:.0f} ms"
+    seconds: float = value / 1000
+    if seconds < 60:
+        return f"{seconds:.1f} s"
+    minutes, rest = divmod(round(seconds), 60)
+    return f"{minutes}m {rest:02d}s"
+
+
 def format_short_id(value: str) -> str:
     return f"{value[:8]}…" if len(value) > 8 else value
 
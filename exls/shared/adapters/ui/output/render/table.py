@@ -283,25 +283,42 @@ class TableListRenderer(IListRenderer[T, Table], Generic[T], _BaseTableRenderer)
         if not data:
             return Table()
 
+        validated_render_context: TableRenderContext = self.resolve_list_context(
+            data, render_context
+        )
+        return self.render_rows(
+            [self.render_row(item, validated_render_context) for item in data],
+            validated_render_context,
+        )
+
+    def resolve_list_context(
+        self, data: Sequence[T], render_context: Optional[BaseRenderContext] = None
+    ) -> TableRenderContext:
+        """Resolve the render context, with the columns of the first item as fallback."""
         columns = None
         if not render_context:
-            # We fallback to the first item in the list to get the columns
             model_dump: Dict[str, Any] = data[0].model_dump()
             columns = TableRenderContext.columns_from_model_dump(model_dump)
+        return self.resolve_context(render_context, columns)
 
-        validated_render_context: TableRenderContext = self.resolve_context(
-            render_context, columns
-        )
-        table: Table = self._create_table(validated_render_context)
-
-        for item_data in data:
-            row_values: List[Any] = []
-            for key, column in validated_render_context.columns.items():
-                value: Any = _get_nested_attribute(item_data, key)
-                value = column.value_formatter(value)
-                row_values.append(value)
-            table.add_row(*row_values)
+    def render_row(self, item: T, render_context: TableRenderContext) -> List[Any]:
+        """Render the cells of one item, to be reused while the item is unchanged."""
+        row_values: List[Any] = []
+        for key, column in render_context.columns.items():
+            value: Any = _get_nested_attribute(item, key)
+            row_values.append(column.value_formatter(value))
+        return row_values
 
+    def render_rows(
+        self,
+        rows: Sequence[Sequence[Any]],
+        render_context: TableRenderContext,
+        row_styles: Optional[Sequence[Optional[StyleType]]] = None,
+    ) -> Table:
+        """Render a table from rendered rows, each with an optional style."""
+        table: Table = self._create_table(render_context)
+        for index, row_values in enumerate(rows):
+            table.add_row(*row_values, style=row_styles[index] if row_styles else None)
         return table
 
 
@@ -12,6 +12,7 @@ class OutputFormat(StrEnum):
     JSON = "json"
     YAML = "yaml"
     TEXT = "text"
+    NDJSON = "ndjson"
 
 
 # Type-safe format-context pairs
@@ -19,6 +20,7 @@ T_TableFormat = Literal[OutputFormat.TABLE]
 T_JsonFormat = Literal[OutputFormat.JSON]
 T_YamlFormat = Literal[OutputFormat.YAML]
 T_TextFormat = Literal[OutputFormat.TEXT]
+T_NdjsonFormat = Literal[OutputFormat.NDJSON]
 
 # Type-safe format-context union
 FormatContextPair = Union[
@@ -26,4 +28,5 @@ FormatContextPair = Union[
     tuple[T_JsonFormat, Optional[JsonRenderContext]],
     tuple[T_YamlFormat, Optional[YamlRenderContext]],
     tuple[T_TextFormat, Optional[TextRenderContext]],
+    tuple[T_NdjsonFormat, None],
 ]
@@ -1,5 +1,7 @@
+import contextlib
+import inspect
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Generator
 
 from exls.shared.core.exceptions import (
     ServiceError,
@@ -8,33 +10,49 @@ from exls.shared.core.exceptions import (
 from exls.shared.core.ports.command import CommandError
 
 
+@contextlib.contextmanager
+def _service_layer_errors(operation_name: str) -> Generator[None, None, None]:
+    try:
+        yield
+    except ServiceWarning as e:
+        raise e
+    except ServiceError as e:
+        raise e
+    except CommandError as e:
+        raise ServiceError(
+            message=f"error {operation_name}: {str(e)}",
+        ) from e
+    except Exception as e:
+        # We catch the generic exception to ensure we always
+        # return a ServiceError from the service layer.
+        raise ServiceError(
+            message=f"unexpected error while {operation_name}: {str(e)}",
+        ) from e
+
+
 def handle_service_layer_errors(operation_name: str) -> Callable[..., Any]:
     """
     A decorator to handle common service layer errors.
 
     It catches CommandError, ServiceError and generic Exceptions and re-raises them
-    as a consistent ServiceError.
+    as a consistent ServiceError. For generator functions, this also applies to
+    the errors raised while the generator is consumed.
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.isgeneratorfunction(func):
+
+            @wraps(func)
+            def generator_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with _service_layer_errors(operation_name):
+                    yield from func(*args, **kwargs)
+
+            return generator_wrapper
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            try:
+            with _service_layer_errors(operation_name):
                 return func(*args, **kwargs)
-            except ServiceWarning as e:
-                raise e
-            except ServiceError as e:
-                raise e
-            except CommandError as e:
-                raise ServiceError(
-                    message=f"error {operation_name}: {str(e)}",
-                ) from e
-            except Exception as e:
-                # We catch the generic exception to ensure we always
-                # return a ServiceError from the service layer.
-                raise ServiceError(
-                    message=f"unexpected error while {operation_name}: {str(e)}",
-                ) from e
 
         return wrapper
 
@@ -0,0 +1,31 @@
+from typing import Callable, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+Predicate = Callable[[T], bool]
+
+
+class LocalFilter(Generic[T]):
+    """
+    The predicates of a query that the backend cannot evaluate.
+
+    Built once per query from the predicates that apply, and then applied to
+    the items one at a time while they stream by.
+    """
+
+    def __init__(self, predicates: Iterable[Optional[Predicate[T]]]):
+        self._predicates: List[Predicate[T]] = [p for p in predicates if p is not None]
+
+    def __bool__(self) -> bool:
+        return bool(self._predicates)
+
+    def matches(self, item: T) -> bool:
+        return all(predicate(item) for predicate in self._predicates)
+
+    def apply(self, items: Iterable[T]) -> Iterator[T]:
+        if not self._predicates:
+            yield from items
+            return
+        for item in items:
+            if self.matches(item):
+                yield item
@@ -0,0 +1,26 @@
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def paginate(items: Iterable[T], page_size: int) -> Iterator[List[T]]:
+    """Split items into pages of at most `page_size` items."""
+    iterator: Iterator[T] = iter(items)
+    while page := list(islice(iterator, page_size)):
+        yield page
+
+
+def limit_pages(pages: Iterable[List[T]], limit: Optional[int]) -> Iterator[List[T]]:
+    """Stop the pages after `limit` items; the remaining pages are never pulled."""
+    if limit is None:
+        yield from pages
+        return
+    remaining: int = limit
+    for page in pages:
+        yield page[:remaining]
+        remaining -= len(page)
+        if remaining <= 0:
+            return
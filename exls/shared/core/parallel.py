@@ -1,14 +1,73 @@
-from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Generic, List, TypeVar
+import asyncio
+import collections
+import contextvars
+import functools
+import logging
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import StrEnum
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Generic,
+    List,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 from pydantic import BaseModel, Field
 from typing_extensions import Optional
 
+logger = logging.getLogger(__name__)
+
 T_Input = TypeVar("T_Input")
 T_Output = TypeVar("T_Output")
 
 
-class _ExecutionResult(BaseModel, Generic[T_Input, T_Output]):
+class ExecutionStatus(StrEnum):
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    TIMED_OUT = "timed out"
+    CANCELLED = "cancelled"
+    NOT_STARTED = "not started"
+
+
+class ExecutionAbortedError(Exception):
+    """The error of items that were not processed because the batch was aborted."""
+
+
+class ExecutionTimeoutError(Exception):
+    """The error of items that did not complete within their time limit."""
+
+
+class ExecutionCancelledError(Exception):
+    """The error of items that were cancelled while they were processed."""
+
+
+def _execution_status(error: Optional[Exception]) -> ExecutionStatus:
+    if error is None:
+        return ExecutionStatus.SUCCEEDED
+    if isinstance(error, ExecutionAbortedError):
+        return ExecutionStatus.NOT_STARTED
+    if isinstance(error, ExecutionTimeoutError):
+        return ExecutionStatus.TIMED_OUT
+    if isinstance(error, ExecutionCancelledError):
+        return ExecutionStatus.CANCELLED
+    return ExecutionStatus.FAILED
+
+
+class ExecutionOutcome(BaseModel, Generic[T_Input, T_Output]):
+    """The outcome of processing one item."""
+
+    index: int = Field(default=0, description="The position of the item in the input")
     item: T_Input = Field(..., description="The item that was processed")
     result: Optional[T_Output] = Field(
         default=None, description="The result of the processing"
@@ -21,9 +80,248 @@ class _ExecutionResult(BaseModel, Generic[T_Input, T_Output]):
     def is_success(self) -> bool:
         return self.error is None
 
+    @property
+    def is_skipped(self) -> bool:
+        return isinstance(self.error, ExecutionAbortedError)
+
+    @property
+    def status(self) -> ExecutionStatus:
+        return _execution_status(self.error)
+
     model_config = {"arbitrary_types_allowed": True}
 
 
+class ExecutionProgress(BaseModel, Generic[T_Input]):
+    """The progress of a batch, reported each time an item completes."""
+
+    total: int = Field(..., description="The number of items in the batch")
+    completed: int = Field(..., description="The items processed or skipped so far")
+    failed: int = Field(..., description="The items that failed or were skipped")
+    item: T_Input = Field(..., description="The item that just completed")
+    error: Optional[Exception] = Field(
+        default=None, description="The error of the item that just completed"
+    )
+
+    model_config = {"arbitrary_types_allowed": True}
+
+
+ProgressCallback = Callable[[ExecutionProgress[Any]], None]
+
+
+class AdaptiveLimiter:
+    """
+    An AIMD limit for the number of requests a bulk operation has in flight.
+
+    The limit starts at `min_limit` and grows by one per healthy response,
+    doubling every round, until the first sign of overload (slow start);
+    after that it grows by one per round of `limit` healthy responses. A
+    throttled or failed response (429, 5xx, no response) or one slower than
+    `latency_tolerance` times the moving average of the latency cuts it by
+    `decrease_factor`. The responses to requests sent before a cut are not
+    held against the new limit. The limit stays within `min_limit` and
+    `max_limit`.
+
+    Responses are reported with `report_response` from the requests made on
+    behalf of the items of an `iter_bounded` batch that uses this limiter.
+    One limiter may be shared by several batches, so that they learn the
+    capacity of the backend together.
+    """
+
+    def __init__(
+        self,
+        min_limit: int = 1,
+        max_limit: int = 10,
+        latency_tolerance: float = 3.0,
+        decrease_factor: float = 0.5,
+    ):
+        self._lock: threading.Lock = threading.Lock()
+        self.min_limit: int = max(1, min(min_limit, max_limit))
+        self.max_limit: int = max_limit
+        self.latency_tolerance: float = latency_tolerance
+        self.decrease_factor: float = decrease_factor
+        self._limit: int = self.min_limit
+        self._slow_start: bool = True
+        self._baseline_latency_seconds: Optional[float] = None
+        self._healthy_in_round: int = 0
+        # The responses still expected for requests sent before the last cut.
+        self._stale_responses: int = 0
+        self.counters: Dict[str, int] = {"increases": 0, "decreases": 0}
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def on_response(self, latency_seconds: float, overloaded: bool) -> None:
+        with self._lock:
+            baseline: float = (
+                self._baseline_latency_seconds
+                if self._baseline_latency_seconds is not None
+                else latency_seconds
+            )
+            slow: bool = latency_seconds > self.latency_tolerance * baseline
+            # Follows lasting changes of the latency over a few dozen responses.
+            self._baseline_latency_seconds = 0.9 * baseline + 0.1 * latency_seconds
+            if self._stale_responses > 0:
+                self._stale_responses -= 1
+                return
+            if overloaded or slow:
+                self._decrease()
+                return
+            self._healthy_in_round += 1
+            if self._slow_start or self._healthy_in_round >= self._limit:
+                self._increase()
+
+    def _increase(self) -> None:
+        self._healthy_in_round = 0
+        if self._limit < self.max_limit:
+            self._limit += 1
+            self.counters["increases"] += 1
+
+    def _decrease(self) -> None:
+        self._slow_start = False
+        self._healthy_in_round = 0
+        self._stale_responses = self._limit - 1
+        self._limit = max(self.min_limit, int(self._limit * self.decrease_factor))
+        self.counters["decreases"] += 1
+        logger.debug(f"Decreased the concurrency limit to {self._limit}")
+
+
+_active_limiter: contextvars.ContextVar[Optional[AdaptiveLimiter]] = (
+    contextvars.ContextVar("active_limiter", default=None)
+)
+
+
+def report_response(latency_seconds: float, overloaded: bool) -> None:
+    """
+    Report a response to the limiter of the batch item that made the request,
+    if any. The item's context is passed on to `asyncio.to_thread`, so this
+    also works from blocking calls handed off to a thread.
+    """
+    limiter: Optional[AdaptiveLimiter] = _active_limiter.get()
+    if limiter is not None:
+        limiter.on_response(latency_seconds, overloaded)
+
+
+class CancellationToken:
+    """
+    Cancels a batch cooperatively: items that have not started are not
+    started, and items in flight are cancelled at their next `await`.
+
+    `cancel` may be called from any thread or a signal handler.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._cancelled: bool = False
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks: List[Callable[[], None]] = list(self._callbacks)
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Calls `callback` on cancellation; returns a function to unregister it."""
+
+        def _unregister() -> None:
+            with self._lock:
+                if callback in self._callbacks:
+                    self._callbacks.remove(callback)
+
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return _unregister
+        callback()
+        return _unregister
+
+
+class _DaemonThreadPool(ThreadPoolExecutor):
+    """
+    A thread pool whose workers do not keep the process alive.
+
+    ThreadPoolExecutor joins its workers at exit, so a blocking call that
+    outlived its item's timeout or an interrupted batch would keep the CLI
+    from exiting. The workers of this pool are daemon threads, and `shutdown`
+    does not wait for them. (It subclasses ThreadPoolExecutor only because
+    asyncio accepts nothing else as the default executor.)
+    """
+
+    def __init__(self, max_workers: int):
+        super().__init__(max_workers=max_workers)
+        self._work: queue.SimpleQueue[
+            Optional[Tuple[Future[Any], Callable[[], Any]]]
+        ] = queue.SimpleQueue()
+        self._lock: threading.Lock = threading.Lock()
+        self._workers: int = 0
+        self._idle: int = 0
+        self._queued: int = 0
+        self._closed: bool = False
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        future: Future[Any] = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._work.put((future, functools.partial(fn, *args, **kwargs)))
+            self._queued += 1
+            if self._queued > self._idle and self._workers < self._max_workers:
+                self._workers += 1
+                threading.Thread(
+                    target=self._work_loop,
+                    name=f"exls-worker-{self._workers}",
+                    daemon=True,
+                ).start()
+        return future
+
+    def _work_loop(self) -> None:
+        while True:
+            with self._lock:
+                self._idle += 1
+            work: Optional[Tuple[Future[Any], Callable[[], Any]]] = self._work.get()
+            with self._lock:
+                self._idle -= 1
+                self._queued -= 1
+            if work is None:
+                return
+            future, call = work
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(call())
+            except BaseException as e:
+                future.set_exception(e)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._closed = True
+            workers: int = self._workers
+        if cancel_futures:
+            while True:
+                try:
+                    work = self._work.get_nowait()
+                except queue.Empty:
+                    break
+                with self._lock:
+                    self._queued -= 1
+                if work is not None:
+                    work[0].cancel()
+        for _ in range(workers):
+            with self._lock:
+                self._queued += 1
+            self._work.put(None)
+
+
 class ExecutionFailure(BaseModel, Generic[T_Input]):
     """Represents a failed execution for a specific item."""
 
@@ -31,6 +329,10 @@ class ExecutionFailure(BaseModel, Generic[T_Input]):
     error: Exception
     message: str
 
+    @property
+    def status(self) -> ExecutionStatus:
+        return _execution_status(self.error)
+
     model_config = {"arbitrary_types_allowed": True}
 
 
@@ -39,14 +341,48 @@ class ParallelExecutionResult(BaseModel, Generic[T_Input, T_Output]):
 
     successes: List[T_Output]
     failures: List[ExecutionFailure[T_Input]]
+    interrupted: bool = False
 
     @property
     def has_failures(self) -> bool:
         return len(self.failures) > 0
 
+    def status_counts(self) -> Dict[ExecutionStatus, int]:
+        """How many items succeeded, failed, timed out, ... ."""
+        counts: Dict[ExecutionStatus, int] = {status: 0 for status in ExecutionStatus}
+        counts[ExecutionStatus.SUCCEEDED] = len(self.successes)
+        for failure in self.failures:
+            counts[failure.status] += 1
+        return counts
+
     model_config = {"arbitrary_types_allowed": True}
 
 
+def _collect_results(
+    results: List[ExecutionOutcome[T_Input, T_Output]],
+    interrupted: bool = False,
+) -> ParallelExecutionResult[T_Input, T_Output]:
+    # Sort results into successes and failures
+    successes: List[T_Output] = []
+    failures: List[ExecutionFailure[T_Input]] = []
+
+    for result in results:
+        if result.is_success:
+            # The result may be None, e.g. for Optional outputs.
+            successes.append(cast(T_Output, result.result))
+        else:
+            assert result.error is not None
+            failures.append(
+                ExecutionFailure[T_Input](
+                    item=result.item, error=result.error, message=str(result.error)
+                )
+            )
+
+    return ParallelExecutionResult[T_Input, T_Output](
+        successes=successes, failures=failures, interrupted=interrupted
+    )
+
+
 def execute_in_parallel(
     items: List[T_Input],
     func: Callable[[T_Input], T_Output],
@@ -63,36 +399,351 @@ def execute_in_parallel(
     """
 
     # Internal wrapper to catch exceptions and return a success/failure tuple
-    def _safe_execute(item: T_Input) -> _ExecutionResult[T_Input, T_Output]:
+    def _safe_execute(item: T_Input) -> ExecutionOutcome[T_Input, T_Output]:
         try:
             result: T_Output = func(item)
-            return _ExecutionResult(item=item, result=result)
+            return ExecutionOutcome(item=item, result=result)
         except Exception as e:
-            return _ExecutionResult(item=item, error=e)
+            return ExecutionOutcome(item=item, error=e)
+
+    def _run_in_context(
+        work: Tuple[contextvars.Context, T_Input],
+    ) -> ExecutionOutcome[T_Input, T_Output]:
+        context, item = work
+        return context.run(_safe_execute, item)
 
     # Execute in parallel
-    # map guarantees that results are returned in the same order as items
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        results: List[_ExecutionResult[T_Input, T_Output]] = list[
-            _ExecutionResult[T_Input, T_Output]
-        ](executor.map(_safe_execute, items))
+    # map guarantees that results are returned in the same order as items.
+    # Each item runs in a copy of the caller's context, as it would in a task.
+    contexts: List[contextvars.Context] = [contextvars.copy_context() for _ in items]
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        results: List[ExecutionOutcome[T_Input, T_Output]] = list[
+            ExecutionOutcome[T_Input, T_Output]
+        ](executor.map(_run_in_context, zip(contexts, items)))
+    except BaseException:
+        # On Ctrl-C, don't start the queued items or wait for the running ones.
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
 
-    # Sort results into successes and failures
-    successes: List[T_Output] = []
-    failures: List[ExecutionFailure[T_Input]] = []
+    return _collect_results(results)
 
-    for result in results:
-        if result.is_success:
-            assert result.result is not None
-            successes.append(result.result)
-        else:
-            assert result.error is not None
-            failures.append(
-                ExecutionFailure[T_Input](
-                    item=result.item, error=result.error, message=str(result.error)
-                )
+
+def call_concurrently(*calls: Callable[[], Any]) -> List[Any]:
+    """
+    Makes independent blocking calls at the same time, e.g. the requests that
+    make up one view, and returns their results in the order of the calls.
+
+    Each call runs in a worker thread, in a copy of the caller's context.
+    Errors are raised as if the calls had been made one after another: the
+    error of the first call that failed, once the calls before it completed.
+    """
+    if len(calls) <= 1:
+        return [call() for call in calls]
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=len(calls))
+    try:
+        futures: List[Future[Any]] = [
+            executor.submit(contextvars.copy_context().run, call) for call in calls
+        ]
+        return [future.result() for future in futures]
+    finally:
+        # Don't wait for the other calls when one of them failed or on Ctrl-C.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def iter_bounded(
+    items: List[T_Input],
+    func: Callable[[T_Input], Awaitable[T_Output]],
+    max_concurrency: int = 10,
+    max_failures: Optional[int] = None,
+    limiter: Optional[AdaptiveLimiter] = None,
+    timeout_seconds: Optional[float] = None,
+    item_timeout_seconds: Optional[float] = None,
+    cancellation: Optional[CancellationToken] = None,
+) -> AsyncIterator[ExecutionOutcome[T_Input, T_Output]]:
+    """
+    Awaits a coroutine for each item on the running event loop, with at most
+    `max_concurrency` of them in flight at a time, and yields the outcomes in
+    the order they complete.
+    Captures exceptions for individual items so the entire batch doesn't fail.
+
+    Items that are not started because the batch was aborted (after
+    `max_failures` failures, after the deadline `timeout_seconds` from now,
+    or after `cancellation`) are yielded as failures with an
+    ExecutionAbortedError. Items in flight still complete after
+    `max_failures`; at the deadline or their own `item_timeout_seconds` they
+    fail with an ExecutionTimeoutError, and on cancellation with an
+    ExecutionCancelledError. If the iteration is stopped early, the remaining
+    coroutines are cancelled. A blocking call an item handed off to a thread
+    cannot be interrupted; it is abandoned instead.
+
+    With a `limiter`, the number of coroutines in flight follows its limit,
+    capped at `max_concurrency`, and the requests made for the items report
+    their responses to it.
+
+    :param items: List of items to process.
+    :param func: The coroutine function to apply to each item.
+    :param max_concurrency: Maximum number of coroutines in flight.
+    :param max_failures: Abort the batch after this many failures.
+    :param limiter: Adapt the concurrency to the responses of the backend.
+    :param timeout_seconds: The time limit of the whole batch.
+    :param item_timeout_seconds: The time limit of each item.
+    :param cancellation: Cancels the batch when it is cancelled.
+    :return: The outcome of each item, as soon as it is known.
+    """
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    deadline: Optional[float] = (
+        loop.time() + timeout_seconds if timeout_seconds is not None else None
+    )
+    cancelled: asyncio.Event = asyncio.Event()
+
+    def _on_cancel() -> None:
+        # The token may be cancelled from any thread.
+        loop.call_soon_threadsafe(cancelled.set)
+
+    unregister: Callable[[], None] = (
+        cancellation.on_cancel(_on_cancel) if cancellation is not None else lambda: None
+    )
+    failures: int = 0
+
+    def _limit() -> int:
+        if limiter is None:
+            return max_concurrency
+        return min(max_concurrency, limiter.limit)
+
+    def _abort_reason() -> Optional[str]:
+        if cancelled.is_set():
+            return "the batch was cancelled before it started"
+        if deadline is not None and loop.time() >= deadline:
+            return f"the batch ran out of time ({timeout_seconds}s) before it started"
+        if max_failures is not None and failures >= max_failures:
+            return f"skipped after {failures} failed item(s)"
+        return None
+
+    async def _run_with_limits(item: T_Input) -> T_Output:
+        timeout: Optional[float] = item_timeout_seconds
+        if deadline is not None:
+            timeout = min(timeout or float("inf"), deadline - loop.time())
+        work: asyncio.Future[T_Output] = asyncio.ensure_future(func(item))
+        cancel_waiter: asyncio.Task[Any] = asyncio.ensure_future(cancelled.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {work, cancel_waiter},
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
             )
+        finally:
+            cancel_waiter.cancel()
+            if not work.done():
+                work.cancel()
+        if work in done:
+            return work.result()
+        if cancelled.is_set():
+            raise ExecutionCancelledError("cancelled while it was running")
+        raise ExecutionTimeoutError(f"did not complete within {timeout:.1f}s")
 
-    return ParallelExecutionResult[T_Input, T_Output](
-        successes=successes, failures=failures
+    async def _safe_execute(
+        index: int, item: T_Input
+    ) -> ExecutionOutcome[T_Input, T_Output]:
+        nonlocal failures
+        # Each task runs in a copy of the context, so this is per item.
+        _active_limiter.set(limiter)
+        try:
+            result: T_Output = await _run_with_limits(item)
+            return ExecutionOutcome(index=index, item=item, result=result)
+        except Exception as e:
+            # Counted before the slot is released, so that the next item
+            # already sees it.
+            failures += 1
+            return ExecutionOutcome(index=index, item=item, error=e)
+
+    # Only the items in flight are tasks; the next ones are started as slots
+    # free up, with the limit read again each time.
+    waiting: Deque[Tuple[int, T_Input]] = collections.deque(enumerate(items))
+    running: Set[asyncio.Task[ExecutionOutcome[T_Input, T_Output]]] = set()
+    try:
+        while waiting or running:
+            while waiting and len(running) < _limit():
+                index, item = waiting.popleft()
+                abort_reason: Optional[str] = _abort_reason()
+                if abort_reason is not None:
+                    yield ExecutionOutcome(
+                        index=index,
+                        item=item,
+                        error=ExecutionAbortedError(abort_reason),
+                    )
+                    continue
+                running.add(asyncio.ensure_future(_safe_execute(index, item)))
+            if not running:
+                continue
+            done, running = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        unregister()
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+
+async def gather_bounded(
+    items: List[T_Input],
+    func: Callable[[T_Input], Awaitable[T_Output]],
+    max_concurrency: int = 10,
+) -> ParallelExecutionResult[T_Input, T_Output]:
+    """
+    Awaits a coroutine for each item on the running event loop, with at most
+    `max_concurrency` of them in flight at a time.
+    Captures exceptions for individual items so the entire batch doesn't fail.
+
+    :param items: List of items to process.
+    :param func: The coroutine function to apply to each item.
+    :param max_concurrency: Maximum number of coroutines in flight.
+    :return: A structured result containing lists of successes and failures.
+    """
+    outcomes: List[ExecutionOutcome[T_Input, T_Output]] = [
+        outcome async for outcome in iter_bounded(items, func, max_concurrency)
+    ]
+    # Report the results in the same order as items
+    return _collect_results(sorted(outcomes, key=lambda outcome: outcome.index))
+
+
+async def _next_outcome(
+    outcomes: AsyncIterator[ExecutionOutcome[T_Input, T_Output]],
+) -> ExecutionOutcome[T_Input, T_Output]:
+    return await anext(outcomes)
+
+
+def iter_concurrently(
+    items: List[T_Input],
+    func: Callable[[T_Input], Awaitable[T_Output]],
+    max_concurrency: int = 10,
+    max_failures: Optional[int] = None,
+    limiter: Optional[AdaptiveLimiter] = None,
+    timeout_seconds: Optional[float] = None,
+    item_timeout_seconds: Optional[float] = None,
+    cancellation: Optional[CancellationToken] = None,
+) -> Generator[ExecutionOutcome[T_Input, T_Output], None, None]:
+    """
+    Runs `iter_bounded` on a new event loop and yields the outcomes as they
+    complete; the loop only runs while the next outcome is awaited. Closing
+    the generator cancels the remaining items.
+
+    Blocking calls that the coroutines hand off to the loop's default executor
+    (e.g. with `asyncio.to_thread`) share one pool of `max_concurrency`
+    threads, which is not waited for when the iteration ends.
+
+    The first Ctrl-C cancels the batch: the outcomes of the remaining items
+    are yielded right away, and then KeyboardInterrupt is raised. A second
+    Ctrl-C raises it immediately. Must not be called from a running event
+    loop.
+    """
+    token: CancellationToken = cancellation or CancellationToken()
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    executor: _DaemonThreadPool = _DaemonThreadPool(max_workers=max_concurrency)
+    loop.set_default_executor(executor)
+    outcomes: AsyncIterator[ExecutionOutcome[T_Input, T_Output]] = iter_bounded(
+        items,
+        func,
+        max_concurrency=max_concurrency,
+        max_failures=max_failures,
+        limiter=limiter,
+        timeout_seconds=timeout_seconds,
+        item_timeout_seconds=item_timeout_seconds,
+        cancellation=token,
+    )
+    interrupted: bool = False
+    next_outcome: Optional[asyncio.Task[ExecutionOutcome[T_Input, T_Output]]] = None
+    try:
+        while True:
+            next_outcome = loop.create_task(_next_outcome(outcomes))
+            while True:
+                try:
+                    outcome: ExecutionOutcome[T_Input, T_Output] = (
+                        loop.run_until_complete(next_outcome)
+                    )
+                    break
+                except StopAsyncIteration:
+                    if interrupted:
+                        raise KeyboardInterrupt
+                    return
+                except KeyboardInterrupt:
+                    # Only an interrupt between the steps of the loop leaves
+                    # it able to wind the batch down.
+                    if interrupted or next_outcome.done():
+                        raise
+                    interrupted = True
+                    logger.debug("Interrupted, cancelling the batch")
+                    token.cancel()
+            yield outcome
+    finally:
+        if next_outcome is not None and not next_outcome.done():
+            next_outcome.cancel()
+            loop.run_until_complete(
+                asyncio.gather(next_outcome, return_exceptions=True)
+            )
+        loop.run_until_complete(outcomes.aclose())  # type: ignore[attr-defined]
+        executor.shutdown(wait=False, cancel_futures=True)
+        loop.close()
+
+
+def execute_concurrently(
+    items: List[T_Input],
+    func: Callable[[T_Input], Awaitable[T_Output]],
+    max_concurrency: int = 10,
+    on_progress: Optional[ProgressCallback] = None,
+    max_failures: Optional[int] = None,
+    limiter: Optional[AdaptiveLimiter] = None,
+    timeout_seconds: Optional[float] = None,
+    item_timeout_seconds: Optional[float] = None,
+    cancellation: Optional[CancellationToken] = None,
+) -> ParallelExecutionResult[T_Input, T_Output]:
+    """
+    Runs `iter_concurrently` to the end and returns its results in the order
+    of the items.
+
+    `on_progress` is called each time an item completes. The items that are
+    not started (after `max_failures` failures, the `timeout_seconds`
+    deadline or cancellation), time out or are cancelled are failures, see
+    `iter_bounded`; `status_counts` of the result tells them apart. With a
+    `limiter`, the concurrency adapts to the responses of the backend.
+
+    When the batch is interrupted with Ctrl-C, the result so far is returned
+    with `interrupted` set, so that callers can report what was done.
+    """
+    outcomes: Dict[int, ExecutionOutcome[T_Input, T_Output]] = {}
+    failed: int = 0
+    interrupted: bool = False
+    try:
+        for outcome in iter_concurrently(
+            items,
+            func,
+            max_concurrency=max_concurrency,
+            max_failures=max_failures,
+            limiter=limiter,
+            timeout_seconds=timeout_seconds,
+            item_timeout_seconds=item_timeout_seconds,
+            cancellation=cancellation,
+        ):
+            outcomes[outcome.index] = outcome
+            failed += 0 if outcome.is_success else 1
+            if on_progress is not None:
+                on_progress(
+                    ExecutionProgress(
+                        total=len(items),
+                        completed=len(outcomes),
+                        failed=failed,
+                        item=outcome.item,
+                        error=outcome.error,
+                    )
+                )
+    except KeyboardInterrupt:
+        if len(outcomes) < len(items):
+            raise
+        interrupted = True
+    return _collect_results(
+        [outcomes[index] for index in sorted(outcomes)], interrupted=interrupted
     )
@@ -1,15 +1,49 @@
+import logging
+import random
+import threading
 import time
-from typing import Callable, TypeVar
+from concurrent.futures import Future
+from contextvars import ContextVar, Token, copy_context
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from pydantic import BaseModel, Field
 
 from exls.shared.core.exceptions import ServiceError
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 
 
+# Set while `poll_until` fetches the state it waits for. That state is expected
+# to change between fetches, so caches of reads must not answer them.
+_polling: ContextVar[bool] = ContextVar("polling", default=False)
+
+
 class PollingTimeoutError(ServiceError):
     pass
 
 
+class WatchedResourceNotFoundError(ServiceError):
+    pass
+
+
+def is_polling() -> bool:
+    return _polling.get()
+
+
 def poll_until(
     fetcher: Callable[[], T],
     predicate: Callable[[T], bool],
@@ -30,7 +64,11 @@ def poll_until(
     start_time = time.time()
 
     while True:
-        result = fetcher()
+        token: Token[bool] = _polling.set(True)
+        try:
+            result = fetcher()
+        finally:
+            _polling.reset(token)
         if predicate(result):
             return result
 
@@ -40,3 +78,376 @@ def poll_until(
         time.sleep(interval_seconds)
 
     raise PollingTimeoutError(message=error_message)
+
+
+class _Waiter(Generic[T]):
+    def __init__(
+        self,
+        resource_id: str,
+        predicate: Callable[[T], bool],
+        deadline: float,
+        error_message: str,
+    ):
+        self.resource_id: str = resource_id
+        self.predicate: Callable[[T], bool] = predicate
+        self.deadline: float = deadline
+        self.error_message: str = error_message
+        self.future: Future[T] = Future()
+
+
+class BatchWatcher(Generic[T]):
+    """
+    Waits for many resources at once, with one list call per tick.
+
+    `fetch` returns the current state of all watched resources, keyed by ID.
+    Each call of `watch` registers a waiter and returns a future that is
+    resolved with the resource once its predicate holds. It fails with a
+    PollingTimeoutError after the waiter's timeout, with the exception of
+    the predicate, or with the exception of `fetch`, which fails all waiters
+    of that tick. A waiter whose future is cancelled is dropped.
+
+    A background thread ticks while there are waiters. The interval between
+    ticks grows by `backoff_factor` up to `max_interval_seconds`, with
+    `jitter` (a fraction of the interval) to spread out the requests of
+    concurrent watchers; it starts over when a waiter is resolved or added.
+
+    With `wakeups`, a second thread listens on the stream it opens (e.g. the
+    events of a cluster) and every item triggers a tick right away, at most
+    one per `wakeup_interval_seconds`, so the waiters don't sleep through a
+    change. Polling stays the fallback: if the stream fails, the watcher
+    keeps ticking on its interval. A stream that ends is opened again while
+    there are waiters, at most once per interval. The stream is closed when
+    the last waiter is resolved; as a read blocked in the stream can't be
+    interrupted, the stream should end by itself after a while without items
+    (e.g. with a read timeout), so that its listener doesn't outlive it.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Mapping[str, T]],
+        interval_seconds: float = 3,
+        max_interval_seconds: float = 30,
+        backoff_factor: float = 1.5,
+        jitter: float = 0.1,
+        missing_is_final: bool = False,
+        wakeups: Optional[Callable[[], Generator[Any, None, None]]] = None,
+        wakeup_interval_seconds: float = 0.5,
+    ):
+        """
+        :param missing_is_final: Fail waiters whose resource is not listed,
+            instead of waiting for it to appear.
+        :param wakeups: Opens a stream whose items trigger a tick.
+        :param wakeup_interval_seconds: The minimum time between the start
+            of a tick and a tick triggered by the stream.
+        """
+        self._fetch: Callable[[], Mapping[str, T]] = fetch
+        self._interval_seconds: float = interval_seconds
+        self._max_interval_seconds: float = max(interval_seconds, max_interval_seconds)
+        self._backoff_factor: float = backoff_factor
+        self._jitter: float = jitter
+        self._missing_is_final: bool = missing_is_final
+        self._condition: threading.Condition = threading.Condition()
+        self._waiters: List[_Waiter[T]] = []
+        self._ticker: Optional[threading.Thread] = None
+        self._restart_backoff: bool = False
+        self._wakeups: Optional[Callable[[], Generator[Any, None, None]]] = wakeups
+        self._wakeup_interval_seconds: float = wakeup_interval_seconds
+        self._listener: Optional[threading.Thread] = None
+        self._wakeup_stream: Optional[Generator[Any, None, None]] = None
+        self._woken: bool = False
+
+    def watch(
+        self,
+        resource_id: str,
+        predicate: Callable[[T], bool],
+        timeout_seconds: float = 60,
+        error_message: Optional[str] = None,
+    ) -> "Future[T]":
+        waiter: _Waiter[T] = _Waiter(
+            resource_id=resource_id,
+            predicate=predicate,
+            deadline=time.monotonic() + timeout_seconds,
+            error_message=error_message
+            or f"Timed out waiting for {resource_id} after {timeout_seconds}s.",
+        )
+        with self._condition:
+            self._waiters.append(waiter)
+            self._restart_backoff = True
+            if self._ticker is None:
+                # The ticks run in the context of the first waiter, e.g. to
+                # count their calls on the phase of an operation.
+                self._ticker = threading.Thread(
+                    target=copy_context().run,
+                    args=(self._run,),
+                    name="batch-watcher",
+                    daemon=True,
+                )
+                self._ticker.start()
+            if self._wakeups is not None and self._listener is None:
+                self._listener = threading.Thread(
+                    target=self._listen, name="batch-watcher-wakeups", daemon=True
+                )
+                self._listener.start()
+            self._condition.notify_all()
+        return waiter.future
+
+    def wake(self) -> None:
+        """Triggers a tick, e.g. when an event hints that a resource changed."""
+        with self._condition:
+            self._woken = True
+            self._condition.notify_all()
+
+    def wait(
+        self,
+        resource_id: str,
+        predicate: Callable[[T], bool],
+        timeout_seconds: float = 60,
+        error_message: Optional[str] = None,
+    ) -> T:
+        """Blocks until `watch` resolves; for callers outside an event loop."""
+        return self.watch(
+            resource_id, predicate, timeout_seconds, error_message
+        ).result()
+
+    def _run(self) -> None:
+        interval: float = self._interval_seconds
+        while True:
+            with self._condition:
+                self._waiters = [w for w in self._waiters if not w.future.done()]
+                if not self._waiters:
+                    self._ticker = None
+                    stream: Optional[Generator[Any, None, None]] = self._wakeup_stream
+                    self._wakeup_stream = None
+                    # Let a listener that waits to reopen its stream go.
+                    self._condition.notify_all()
+                    break
+                waiters: List[_Waiter[T]] = list(self._waiters)
+                self._restart_backoff = False
+                # Events that arrive during the tick may not be reflected in
+                # its fetch, so they trigger the next one.
+                self._woken = False
+                tick_started: float = time.monotonic()
+
+            resolved: bool = self._tick(waiters)
+
+            with self._condition:
+                if resolved or self._restart_backoff:
+                    interval = self._interval_seconds
+                else:
+                    interval = min(
+                        self._max_interval_seconds, interval * self._backoff_factor
+                    )
+                pending: List[_Waiter[T]] = [
+                    w for w in self._waiters if not w.future.done()
+                ]
+                if not pending:
+                    continue
+                delay: float = interval * random.uniform(
+                    1 - self._jitter, 1 + self._jitter
+                )
+                # Tick once more at the first deadline rather than after it.
+                next_tick: float = min(
+                    time.monotonic() + delay, min(w.deadline for w in pending)
+                )
+                while not self._restart_backoff:
+                    if self._woken:
+                        next_tick = min(
+                            next_tick, tick_started + self._wakeup_interval_seconds
+                        )
+                    remaining: float = next_tick - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(timeout=remaining)
+        if stream is not None:
+            self._close_wakeup_stream(stream)
+
+    def _listen(self) -> None:
+        """Wakes the ticker for each item of the stream, while there are waiters."""
+        while True:
+            ended: bool = self._listen_once()
+            with self._condition:
+                if ended and self._waiters:
+                    # Don't reopen a stream that ends right away over and over.
+                    self._condition.wait_for(
+                        lambda: not self._waiters, timeout=self._interval_seconds
+                    )
+                if not ended or not self._waiters:
+                    self._listener = None
+                    return
+
+    def _listen_once(self) -> bool:
+        """Listens on one stream; returns whether it ended rather than failed."""
+        assert self._wakeups is not None
+        events: Optional[Generator[Any, None, None]] = None
+        try:
+            events = self._wakeups()
+            with self._condition:
+                if not self._waiters:
+                    return True
+                self._wakeup_stream = events
+            for _ in events:
+                with self._condition:
+                    if not self._waiters:
+                        break
+                    self._woken = True
+                    self._condition.notify_all()
+            else:
+                logger.debug("Wakeup stream ended")
+            return True
+        except Exception as e:
+            logger.debug(f"Wakeup stream failed, falling back to polling: {e}")
+            return False
+        finally:
+            with self._condition:
+                if self._wakeup_stream is events:
+                    self._wakeup_stream = None
+            if events is not None:
+                self._close_wakeup_stream(events)
+
+    @staticmethod
+    def _close_wakeup_stream(stream: Generator[Any, None, None]) -> None:
+        try:
+            stream.close()
+        except ValueError:
+            # The listener is inside the stream, waiting for its next item; it
+            # closes the stream itself once that arrives or the stream ends.
+            logger.debug("Wakeup stream is busy, leaving it to the listener")
+
+    def _tick(self, waiters: List[_Waiter[T]]) -> bool:
+        """Fetches all resources once and resolves the waiters that are done."""
+        token: Token[bool] = _polling.set(True)
+        try:
+            resources: Mapping[str, T] = self._fetch()
+        except Exception as e:
+            logger.debug(f"Failed to refresh {len(waiters)} watched resources: {e}")
+            for waiter in waiters:
+                self._settle(waiter, error=e)
+            return True
+        finally:
+            _polling.reset(token)
+
+        now: float = time.monotonic()
+        resolved: bool = False
+        for waiter in waiters:
+            resource: Optional[T] = resources.get(waiter.resource_id)
+            try:
+                if resource is None:
+                    if self._missing_is_final:
+                        raise WatchedResourceNotFoundError(
+                            message=f"Resource {waiter.resource_id} not found"
+                        )
+                elif waiter.predicate(resource):
+                    resolved |= self._settle(waiter, result=resource)
+                    continue
+            except Exception as e:
+                resolved |= self._settle(waiter, error=e)
+                continue
+            if now >= waiter.deadline:
+                resolved |= self._settle(
+                    waiter, error=PollingTimeoutError(message=waiter.error_message)
+                )
+        return resolved
+
+    @staticmethod
+    def _settle(
+        waiter: _Waiter[T],
+        result: Optional[T] = None,
+        error: Optional[BaseException] = None,
+    ) -> bool:
+        # The future may have been cancelled by its caller in the meantime.
+        if not waiter.future.set_running_or_notify_cancel():
+            return False
+        if error is not None:
+            waiter.future.set_exception(error)
+        else:
+            waiter.future.set_result(result)  # type: ignore[arg-type]
+        return True
+
+
+class SnapshotChanges(BaseModel, Generic[T]):
+    """The difference between two snapshots of a list of resources."""
+
+    snapshot: Dict[str, T] = Field(
+        ..., description="The current resources by key, in the order they were listed"
+    )
+    added: List[str] = Field(
+        default_factory=list, description="The keys of the new resources"
+    )
+    changed: List[str] = Field(
+        default_factory=list, description="The keys of the changed resources"
+    )
+    removed: Dict[str, T] = Field(
+        default_factory=dict,
+        description="The last known state of the removed resources by key",
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description="Why the last listing failed; the snapshot is then the last "
+        "known state",
+    )
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+
+def diff_snapshots(
+    previous: Mapping[str, T], current: Dict[str, T]
+) -> SnapshotChanges[T]:
+    return SnapshotChanges(
+        snapshot=current,
+        added=[key for key in current if key not in previous],
+        changed=[
+            key
+            for key, resource in current.items()
+            if key in previous and previous[key] != resource
+        ],
+        removed={
+            key: resource for key, resource in previous.items() if key not in current
+        },
+    )
+
+
+def watch_snapshots(
+    fetch: Callable[[], Sequence[T]],
+    key: Callable[[T], str],
+    interval_seconds: float = 2,
+) -> Iterator[SnapshotChanges[T]]:
+    """
+    Lists the resources every `interval_seconds` and yields what changed.
+
+    The first snapshot is yielded with all resources as added; after that,
+    only snapshots that differ from the previous one are yielded. The fetches
+    count as polling, so caches revalidate their responses instead of
+    answering them. A failed fetch is yielded as the last known state with its
+    error, and the next tick tries again. Runs until the iteration is stopped.
+    """
+    previous: Dict[str, T] = {}
+    first: bool = True
+    failed: bool = False
+    while True:
+        resources: Sequence[T] = []
+        error: Optional[Exception] = None
+        token: Token[bool] = _polling.set(True)
+        try:
+            resources = fetch()
+        except Exception as e:
+            error = e
+        finally:
+            _polling.reset(token)
+        if error is not None:
+            logger.debug(f"Failed to list the watched resources: {error}")
+            yield SnapshotChanges(snapshot=dict(previous), error=str(error))
+            failed = True
+            time.sleep(interval_seconds)
+            continue
+        changes: SnapshotChanges[T] = diff_snapshots(
+            previous, {key(resource): resource for resource in resources}
+        )
+        # After a failure, the state is shown again even if it did not change.
+        if first or failed or not changes.is_empty:
+            yield changes
+        first = False
+        failed = False
+        previous = changes.snapshot
+        time.sleep(interval_seconds)
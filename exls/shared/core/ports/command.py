@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
@@ -15,3 +16,7 @@ class CommandError(ExalsiusError):
 class BaseCommand(Generic[T], ABC):
     @abstractmethod
     def execute(self) -> T: ...
+
+    async def execute_async(self) -> T:
+        """Execute the command in a worker thread without blocking the event loop."""
+        return await asyncio.to_thread(self.execute)
@@ -0,0 +1,81 @@
+import contextlib
+import threading
+import time
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from typing import Generator, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class TimelinePhase(BaseModel):
+    """One phase of a long-running service operation."""
+
+    name: str = Field(..., description="The name of the phase")
+    started_at: datetime = Field(..., description="When the phase started (UTC)")
+    duration_ms: Optional[float] = Field(
+        default=None, description="The duration of the phase, once it ended"
+    )
+    items: Optional[int] = Field(
+        default=None, description="The number of items the phase worked on"
+    )
+    api_calls: int = Field(
+        default=0, description="The calls to the backend, including retries"
+    )
+    error: Optional[str] = Field(
+        default=None, description="The type of the error the phase failed with"
+    )
+
+
+class PhaseTimeline:
+    """
+    Records the phases of an operation, e.g. of a cluster deployment.
+
+    The calls to the backend made while a phase is open are counted on it,
+    including those made by the tasks, worker threads and watchers that were
+    started from its context.
+    """
+
+    def __init__(self):
+        self._phases: List[TimelinePhase] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def phases(self) -> List[TimelinePhase]:
+        with self._lock:
+            return list(self._phases)
+
+    @contextlib.contextmanager
+    def phase(
+        self, name: str, items: Optional[int] = None
+    ) -> Generator[TimelinePhase, None, None]:
+        phase: TimelinePhase = TimelinePhase(
+            name=name, started_at=datetime.now(timezone.utc), items=items
+        )
+        with self._lock:
+            self._phases.append(phase)
+        started: float = time.perf_counter()
+        token: Token[Optional[TimelinePhase]] = _current_phase.set(phase)
+        try:
+            yield phase
+        except BaseException as e:
+            phase.error = type(e).__name__
+            raise
+        finally:
+            _current_phase.reset(token)
+            phase.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+
+
+_current_phase: ContextVar[Optional[TimelinePhase]] = ContextVar(
+    "timeline_phase", default=None
+)
+_api_calls_lock: threading.Lock = threading.Lock()
+
+
+def record_api_call() -> None:
+    """Count a call to the backend on the phase that is open, if any."""
+    phase: Optional[TimelinePhase] = _current_phase.get()
+    if phase is None:
+        return
+    with _api_calls_lock:
+        phase.api_calls += 1
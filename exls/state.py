@@ -32,3 +32,11 @@ class AppState(BaseModel):
         default=None,
         description=f"The output format to use for the CLI ({', '.join([f.value for f in OutputFormat])}).",
     )
+    no_cache: bool = Field(
+        default=False,
+        description="Whether to bypass the response cache",
+    )
+    cache_max_age_seconds: Optional[int] = Field(
+        default=None,
+        description="Overrides the maximum age of cached responses",
+    )
@@ -74,6 +74,8 @@ class WorkspacesBundle(BaseBundle):
             workspace_creation_polling_config=self.config.workspace_creation_polling,
             clusters_provider=clusters_provider,
             workspace_templates_provider=workspace_templates_provider,
+            max_concurrency=self.config.http.max_concurrency,
+            concurrency_limiter=self.get_concurrency_limiter(),
         )
 
     def get_configure_workspace_access_flow(self) -> ConfigureWorkspaceAccessFlow:
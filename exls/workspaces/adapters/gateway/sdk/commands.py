@@ -43,6 +43,8 @@ class GetWorkspaceSdkCommand(BaseWorkspacesSdkCommand[WorkspaceResponse]):
 
 
 class DeployWorkspaceSdkCommand(BaseWorkspacesSdkCommand[WorkspaceCreateResponse]):
+    idempotent = False
+
     def __init__(self, api_client: WorkspacesApi, request: WorkspaceCreateRequest):
         super().__init__(api_client)
         self._request: WorkspaceCreateRequest = request
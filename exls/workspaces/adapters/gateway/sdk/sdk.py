@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from exalsius_api_client.api.workspaces_api import WorkspacesApi
 from exalsius_api_client.models.node_hardware import NodeHardware
@@ -10,6 +10,8 @@ from exalsius_api_client.models.workspace_response import WorkspaceResponse
 from exalsius_api_client.models.workspace_template import WorkspaceTemplate
 from exalsius_api_client.models.workspaces_list_response import WorkspacesListResponse
 
+from exls.shared.adapters.memo import invalidates, memoized_read
+from exls.shared.core.pagination import paginate
 from exls.workspaces.adapters.gateway.gateway import WorkspacesGateway
 from exls.workspaces.adapters.gateway.sdk.commands import (
     DeleteWorkspaceSdkCommand,
@@ -89,16 +91,26 @@ class SdkWorkspacesGateway(WorkspacesGateway):
     def __init__(self, workspaces_api: WorkspacesApi):
         self._workspaces_api = workspaces_api
 
-    def list(self, cluster_id: Optional[str] = None) -> List[Workspace]:
+    def _iter_workspaces(self, cluster_id: Optional[str]) -> Iterator[Workspace]:
         command: ListWorkspacesSdkCommand = ListWorkspacesSdkCommand(
             self._workspaces_api, cluster_id=cluster_id
         )
         response: WorkspacesListResponse = command.execute()
-        return [
-            _workspace_from_sdk(sdk_model=workspace)
-            for workspace in response.workspaces
-        ]
+        for workspace in response.workspaces:
+            yield _workspace_from_sdk(sdk_model=workspace)
+
+    @memoized_read("workspaces")
+    def list(self, cluster_id: Optional[str] = None) -> List[Workspace]:
+        return list(self._iter_workspaces(cluster_id))
 
+    def iter_pages(
+        self, cluster_id: Optional[str], page_size: int
+    ) -> Iterator[List[Workspace]]:
+        # The API returns all workspaces in one response; they are mapped one
+        # page at a time, as the pages are consumed.
+        yield from paginate(self._iter_workspaces(cluster_id), page_size)
+
+    @memoized_read("workspaces")
     def get(self, workspace_id: str) -> Workspace:
         command: GetWorkspaceSdkCommand = GetWorkspaceSdkCommand(
             self._workspaces_api, workspace_id=workspace_id
@@ -106,6 +118,7 @@ class SdkWorkspacesGateway(WorkspacesGateway):
         response: WorkspaceResponse = command.execute()
         return _workspace_from_sdk(sdk_model=response.workspace)
 
+    @invalidates("workspaces")
     def deploy(self, parameters: DeployWorkspaceRequest) -> str:
         """Deploy a workspace."""
         sdk_create_request: WorkspaceCreateRequest = (
@@ -117,9 +130,18 @@ class SdkWorkspacesGateway(WorkspacesGateway):
         response: WorkspaceCreateResponse = command.execute()
         return response.workspace_id
 
+    @invalidates("workspaces")
     def delete(self, workspace_id: str) -> str:
         command: DeleteWorkspaceSdkCommand = DeleteWorkspaceSdkCommand(
             self._workspaces_api, workspace_id=workspace_id
         )
         response: WorkspaceDeleteResponse = command.execute()
         return response.workspace_id
+
+    @invalidates("workspaces")
+    async def delete_async(self, workspace_id: str) -> str:
+        command: DeleteWorkspaceSdkCommand = DeleteWorkspaceSdkCommand(
+            self._workspaces_api, workspace_id=workspace_id
+        )
+        response: WorkspaceDeleteResponse = await command.execute_async()
+        return response.workspace_id
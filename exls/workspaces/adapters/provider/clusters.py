@@ -1,10 +1,11 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-from exls.clusters.core.domain import Cluster, ClusterSummary
+from exls.clusters.core.domain import Cluster, ClusterEvent, ClusterSummary
 from exls.clusters.core.service import ClustersService
 from exls.workspaces.core.domain import (
     AvailableClusterNodeResources,
     WorkspaceCluster,
+    WorkspaceClusterEvent,
     WorkspaceClusterStatus,
     WorkspaceGPUVendor,
 )
@@ -62,3 +63,17 @@ class ClustersDomainProvider(ClustersProvider):
             status=WorkspaceClusterStatus.from_str(cluster.status.value),
             available_resources=available_cluster_resources,
         )
+
+    def stream_cluster_events(
+        self, cluster_id: str, idle_timeout_seconds: Optional[float] = None
+    ) -> Iterator[WorkspaceClusterEvent]:
+        events: Iterator[ClusterEvent] = self.clusters_service.stream_cluster_logs(
+            cluster_id=cluster_id, idle_timeout_seconds=idle_timeout_seconds
+        )
+        for event in events:
+            yield WorkspaceClusterEvent(
+                kind=event.involved_object.kind,
+                name=event.involved_object.name,
+                namespace=event.involved_object.namespace,
+                reason=event.reason,
+            )
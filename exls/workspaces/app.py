@@ -1,6 +1,7 @@
+import itertools
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import typer
 from pydantic import BaseModel, Field
@@ -20,6 +21,8 @@ from exls.shared.adapters.ui.utils import (
     help_if_no_subcommand,
 )
 from exls.shared.core.crypto import CryptoService
+from exls.shared.core.pagination import DEFAULT_PAGE_SIZE
+from exls.shared.core.polling import watch_snapshots
 from exls.shared.core.resolver import (
     AmbiguousResourceError,
     ResourceNotFoundError,
@@ -124,21 +127,60 @@ def list_workspaces(
         show_default=False,
         callback=_resolve_cluster_id_callback,
     ),
+    limit: Optional[int] = typer.Option(
+        None, "--limit", min=1, help="Show at most this many workspaces"
+    ),
+    page_size: int = typer.Option(
+        DEFAULT_PAGE_SIZE,
+        "--page-size",
+        min=1,
+        help="The number of workspaces fetched and shown at a time",
+    ),
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        "-w",
+        help="Keep the list open and update it as workspaces change, until Ctrl+C",
+    ),
+    interval: float = typer.Option(
+        2, "--interval", min=0.5, help="The seconds between updates with --watch"
+    ),
 ):
     bundle: WorkspacesBundle = _get_bundle(ctx)
     io_facade: IOBaseModelFacade = bundle.get_io_facade()
     service = bundle.get_workspaces_service()
 
-    workspaces: List[Workspace] = service.list_workspaces(cluster_id=cluster_id)
+    if watch:
+        io_facade.display_watch(
+            watch_snapshots(
+                lambda: list(
+                    itertools.chain.from_iterable(
+                        service.iter_workspaces(
+                            cluster_id=cluster_id, page_size=page_size, limit=limit
+                        )
+                    )
+                ),
+                key=lambda workspace: workspace.id,
+                interval_seconds=interval,
+            ),
+            bundle.object_output_format,
+            view_context=WORKSPACE_LIST_VIEW,
+        )
+        return
 
-    if len(workspaces) == 0:
+    pages: Iterator[List[Workspace]] = service.iter_workspaces(
+        cluster_id=cluster_id, page_size=page_size, limit=limit
+    )
+    first_page: Optional[List[Workspace]] = next(pages, None)
+
+    if first_page is None:
         io_facade.display_info_message(
             "No workspaces found. Run 'exls workspaces deploy <workspace-type>' to deploy a workspace.",
             bundle.message_output_format,
         )
     else:
-        io_facade.display_data(
-            data=workspaces,
+        io_facade.display_pages(
+            pages=itertools.chain([first_page], pages),
             output_format=bundle.object_output_format,
             view_context=WORKSPACE_LIST_VIEW,
         )
@@ -457,3 +457,23 @@ class WorkspaceCluster(BaseModel):
                 )
 
             return result
+
+
+class WorkspaceClusterEvent(BaseModel):
+    kind: StrictStr = Field(..., description="The kind of the involved object")
+    name: StrictStr = Field(..., description="The name of the involved object")
+    namespace: StrictStr = Field(
+        ..., description="The namespace of the involved object"
+    )
+    reason: Optional[StrictStr] = Field(
+        default=None, description="The reason for the event"
+    )
+
+    def involves_workspace(self, workspace_name: str) -> bool:
+        """Whether the event is about a node or an object of the workspace."""
+        return (
+            self.kind == "Node"
+            or self.namespace == workspace_name
+            or self.name == workspace_name
+            or self.name.startswith(f"{workspace_name}-")
+        )
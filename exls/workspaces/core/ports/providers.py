@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List, Optional
 
 from exls.workspaces.core.domain import (
     WorkspaceCluster,
+    WorkspaceClusterEvent,
     WorkspaceTemplate,
 )
 
@@ -14,6 +15,11 @@ class ClustersProvider(ABC):
     @abstractmethod
     def get_cluster(self, cluster_id: str) -> WorkspaceCluster: ...
 
+    @abstractmethod
+    def stream_cluster_events(
+        self, cluster_id: str, idle_timeout_seconds: Optional[float] = None
+    ) -> Iterator[WorkspaceClusterEvent]: ...
+
 
 class WorkspaceTemplatesProvider(ABC):
     @abstractmethod
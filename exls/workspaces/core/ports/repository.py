@@ -1,6 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
+from exls.shared.core.pagination import paginate
 from exls.workspaces.core.domain import Workspace
 
 
@@ -9,6 +11,11 @@ class WorkspaceRepository(ABC):
     def list(self, cluster_id: Optional[str] = None) -> List[Workspace]:
         raise NotImplementedError
 
+    def iter_pages(
+        self, cluster_id: Optional[str], page_size: int
+    ) -> Iterator[List[Workspace]]:
+        yield from paginate(self.list(cluster_id=cluster_id), page_size)
+
     @abstractmethod
     def get(self, workspace_id: str) -> Workspace:
         raise NotImplementedError
@@ -16,3 +23,6 @@ class WorkspaceRepository(ABC):
     @abstractmethod
     def delete(self, workspace_id: str) -> str:
         raise NotImplementedError
+
+    async def delete_async(self, workspace_id: str) -> str:
+        return await asyncio.to_thread(self.delete, workspace_id)
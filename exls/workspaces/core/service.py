@@ -1,13 +1,22 @@
-from typing import Dict, List, Optional
+import functools
+import threading
+from typing import Callable, Dict, Generator, Iterator, List, Optional, Set
 
 from exls.config import ConfigWorkspaceCreationPolling
 from exls.shared.core.decorators import handle_service_layer_errors
 from exls.shared.core.exceptions import ServiceError
-from exls.shared.core.polling import poll_until
+from exls.shared.core.pagination import DEFAULT_PAGE_SIZE, limit_pages
+from exls.shared.core.parallel import (
+    AdaptiveLimiter,
+    ParallelExecutionResult,
+    execute_concurrently,
+)
+from exls.shared.core.polling import BatchWatcher
 from exls.workspaces.core.domain import (
     WorkerGroupResources,
     Workspace,
     WorkspaceCluster,
+    WorkspaceClusterEvent,
     WorkspaceClusterStatus,
     WorkspaceStatus,
     WorkspaceTemplate,
@@ -26,6 +35,23 @@ from exls.workspaces.core.requests import (
     WorkerResources,
 )
 
+# Reasons of cluster events after which the status of a workspace is likely
+# to have changed: its pods started or failed, or a node joined or left.
+WAKEUP_EVENT_REASONS: Set[str] = {
+    "Started",
+    "Killing",
+    "Failed",
+    "BackOff",
+    "Unhealthy",
+    "RegisteredNode",
+    "NodeReady",
+    "NodeNotReady",
+}
+# The event stream of a wait ends after this long without events and is opened
+# again while the wait goes on. A read can't be interrupted otherwise, so this
+# bounds how long the stream and its listener outlive the wait.
+WAKEUP_STREAM_IDLE_TIMEOUT_SECONDS = 15
+
 
 class WorkspacesService:
     def __init__(
@@ -35,7 +61,11 @@ class WorkspacesService:
         workspaces_repository: WorkspaceRepository,
         clusters_provider: ClustersProvider,
         workspace_templates_provider: WorkspaceTemplatesProvider,
+        max_concurrency: int = 10,
+        concurrency_limiter: Optional[AdaptiveLimiter] = None,
     ):
+        self._max_concurrency: int = max_concurrency
+        self._concurrency_limiter: Optional[AdaptiveLimiter] = concurrency_limiter
         self._workspace_creation_polling_config: ConfigWorkspaceCreationPolling = (
             workspace_creation_polling_config
         )
@@ -47,6 +77,13 @@ class WorkspacesService:
         )
 
         self._cached_clusters: Dict[str, WorkspaceCluster] = {}
+        # Workspaces that are waited for concurrently share one list call of
+        # their cluster per tick.
+        self._workspace_watchers: Dict[str, BatchWatcher[Workspace]] = {}
+        # The names of the workspaces that are waited for, by cluster ID; only
+        # the events about them wake the watcher of their cluster.
+        self._watched_workspace_names: Dict[str, Set[str]] = {}
+        self._watched_workspace_names_lock: threading.Lock = threading.Lock()
 
     def _get_workspace_cluster(self, cluster_id: str) -> WorkspaceCluster:
         if cluster_id not in self._cached_clusters:
@@ -67,24 +104,107 @@ class WorkspacesService:
     def list_workspaces(self, cluster_id: Optional[str] = None) -> List[Workspace]:
         return self._workspaces_repository.list(cluster_id=cluster_id)
 
+    @handle_service_layer_errors("listing workspaces")
+    def iter_workspaces(
+        self,
+        cluster_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        limit: Optional[int] = None,
+    ) -> Iterator[List[Workspace]]:
+        """List the workspaces page by page, stopping after `limit` workspaces."""
+        yield from limit_pages(
+            self._workspaces_repository.iter_pages(
+                cluster_id=cluster_id, page_size=page_size
+            ),
+            limit,
+        )
+
     @handle_service_layer_errors("getting workspace")
     def get_workspace(self, workspace_id: str) -> Workspace:
         return self._workspaces_repository.get(workspace_id=workspace_id)
 
     @handle_service_layer_errors("deleting workspace")
     def delete_workspaces(self, workspace_ids: List[str]) -> None:
-        for workspace_id in workspace_ids:
-            self._workspaces_repository.delete(workspace_id=workspace_id)
+        results: ParallelExecutionResult[str, str] = execute_concurrently(
+            items=workspace_ids,
+            func=lambda workspace_id: self._workspaces_repository.delete_async(
+                workspace_id=workspace_id
+            ),
+            max_concurrency=self._max_concurrency,
+            limiter=self._concurrency_limiter,
+        )
+        if results.has_failures:
+            raise results.failures[0].error
+
+    def _is_wakeup_event(self, cluster_id: str, event: WorkspaceClusterEvent) -> bool:
+        if event.reason not in WAKEUP_EVENT_REASONS:
+            return False
+        with self._watched_workspace_names_lock:
+            workspace_names: List[str] = list(
+                self._watched_workspace_names.get(cluster_id, ())
+            )
+        return any(event.involves_workspace(name) for name in workspace_names)
+
+    def _stream_wakeup_events(
+        self, cluster_id: str
+    ) -> Generator[WorkspaceClusterEvent, None, None]:
+        events: Iterator[WorkspaceClusterEvent] = (
+            self._clusters_provider.stream_cluster_events(
+                cluster_id=cluster_id,
+                idle_timeout_seconds=WAKEUP_STREAM_IDLE_TIMEOUT_SECONDS,
+            )
+        )
+        try:
+            for event in events:
+                if self._is_wakeup_event(cluster_id, event):
+                    yield event
+        finally:
+            close: Optional[Callable[[], None]] = getattr(events, "close", None)
+            if close is not None:
+                close()
+
+    def _get_workspace_watcher(self, cluster_id: str) -> BatchWatcher[Workspace]:
+        if cluster_id not in self._workspace_watchers:
+            wakeups: Optional[
+                Callable[[], Generator[WorkspaceClusterEvent, None, None]]
+            ] = (
+                functools.partial(self._stream_wakeup_events, cluster_id)
+                if self._workspace_creation_polling_config.event_wakeups
+                else None
+            )
+            self._workspace_watchers[cluster_id] = BatchWatcher(
+                fetch=lambda: {
+                    workspace.id: workspace
+                    for workspace in self._workspaces_repository.list(
+                        cluster_id=cluster_id
+                    )
+                },
+                interval_seconds=self._workspace_creation_polling_config.polling_interval_seconds,
+                wakeups=wakeups,
+            )
+        return self._workspace_watchers[cluster_id]
 
     def _wait_for_workspace_status(
-        self, workspace_id: str, target_status: WorkspaceStatus
+        self,
+        cluster_id: str,
+        workspace_id: str,
+        workspace_name: str,
+        target_status: WorkspaceStatus,
     ) -> Workspace:
-        return poll_until(
-            fetcher=lambda: self.get_workspace(workspace_id=workspace_id),
-            predicate=lambda workspace: workspace.status == target_status,
-            timeout_seconds=self._workspace_creation_polling_config.timeout_seconds,
-            interval_seconds=self._workspace_creation_polling_config.polling_interval_seconds,
-        )
+        with self._watched_workspace_names_lock:
+            self._watched_workspace_names.setdefault(cluster_id, set()).add(
+                workspace_name
+            )
+        try:
+            return self._get_workspace_watcher(cluster_id).wait(
+                workspace_id,
+                predicate=lambda workspace: workspace.status == target_status,
+                timeout_seconds=self._workspace_creation_polling_config.timeout_seconds,
+                error_message="Operation timed out waiting for condition.",
+            )
+        finally:
+            with self._watched_workspace_names_lock:
+                self._watched_workspace_names[cluster_id].discard(workspace_name)
 
     @handle_service_layer_errors("deploying workspace")
     def deploy_workspace(
@@ -105,7 +225,10 @@ class WorkspacesService:
         workspace: Workspace
         if wait_for_ready:
             workspace = self._wait_for_workspace_status(
-                workspace_id=workspace_id, target_status=WorkspaceStatus.RUNNING
+                cluster_id=request.cluster_id,
+                workspace_id=workspace_id,
+                workspace_name=request.workspace_name,
+                target_status=WorkspaceStatus.RUNNING,
             )
         else:
             workspace = self.get_workspace(workspace_id=workspace_id)
@@ -0,0 +1,35 @@
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+# Set this to a directory to keep the JSON results of the benchmarks, e.g. to
+# compare them between two revisions.
+BENCHMARK_OUTPUT_DIR_ENV = "EXLS_BENCHMARK_OUTPUT_DIR"
+
+
+@pytest.fixture
+def record_benchmark(
+    request: pytest.FixtureRequest,
+    record_property: Callable[[str, Any], None],
+) -> Callable[[Dict[str, Any]], None]:
+    """Record the results of a benchmark in the test report and, optionally, on disk."""
+
+    def _record(results: Dict[str, Any]) -> None:
+        for key, value in results.items():
+            record_property(key, value)
+
+        output_dir: str | None = os.getenv(BENCHMARK_OUTPUT_DIR_ENV)
+        if output_dir:
+            # The name of the test item includes its parameters, e.g.
+            # "test_x[nodes]", so each parametrization keeps its own file.
+            test_name: str = str(request.node.name)  # pyright: ignore
+            name: str = re.sub(r"[^A-Za-z0-9_.-]+", "_", test_name).strip("_")
+            path: Path = Path(output_dir) / f"{name}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(results, indent=2, sort_keys=True))
+
+    return _record
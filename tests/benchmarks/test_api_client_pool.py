@@ -0,0 +1,132 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Set, Tuple, cast
+
+import pytest
+from exalsius_api_client.api_client import ApiClient
+from exalsius_api_client.configuration import Configuration
+
+from exls.config import AppConfig, ConfigHttp
+from exls.nodes.adapters.bundle import NodesBundle
+from exls.shared.adapters import bundle as shared_bundle
+from exls.state import AppState
+
+NODES = 100
+ROUNDS = 3
+MAX_CONCURRENCY = 10
+RESPONSE_DELAY_SECONDS = 0.005
+
+
+class _FakeBackend(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _NodeDeleteHandler)
+        self.connections: Set[Tuple[str, int]] = set()
+        self.lock: threading.Lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _NodeDeleteHandler(BaseHTTPRequestHandler):
+    # Keep-alive, like the real backend.
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def backend(self) -> _FakeBackend:
+        return cast(_FakeBackend, self.server)
+
+    def setup(self) -> None:
+        super().setup()
+        with self.backend.lock:
+            self.backend.connections.add(self.client_address)
+
+    def do_DELETE(self) -> None:
+        time.sleep(RESPONSE_DELAY_SECONDS)
+        body: bytes = json.dumps({"node_id": self.path.rsplit("/", 1)[-1]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def backend() -> Iterator[_FakeBackend]:
+    server: _FakeBackend = _FakeBackend()
+    thread: threading.Thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _per_bundle_client(self: NodesBundle) -> ApiClient:
+    """The previous behavior: a new client with the SDK's default pool size."""
+    api_client: ApiClient = ApiClient(
+        configuration=Configuration(host=self.config.backend_host)
+    )
+    api_client.set_default_header(  # type: ignore[reportUnknownMemberType]
+        "Authorization", f"Bearer {self.access_token}"
+    )
+    return api_client
+
+
+def _delete_nodes(config: AppConfig) -> None:
+    node_ids: List[str] = [f"node-{i}" for i in range(NODES)]
+    for _ in range(ROUNDS):
+        # Every round builds its services from scratch, like a new command.
+        bundle: NodesBundle = NodesBundle(
+            config, AppState(config=config, access_token="token")
+        )
+        result = bundle.get_nodes_service().delete_nodes(node_ids)
+        assert len(result.deleted_node_ids) == NODES
+
+
+def _measure(backend: _FakeBackend, run: Callable[[], None]) -> Dict[str, Any]:
+    backend.connections.clear()
+    start: float = time.perf_counter()
+    run()
+    return {
+        "connections": len(backend.connections),
+        "ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+
+
+@pytest.mark.benchmark
+def test_shared_api_client_reuses_connections(
+    backend: _FakeBackend,
+    monkeypatch: pytest.MonkeyPatch,
+    record_benchmark: Callable[[Dict[str, Any]], None],
+) -> None:
+    config: AppConfig = AppConfig(
+        backend_host=backend.url, http=ConfigHttp(max_concurrency=MAX_CONCURRENCY)
+    )
+    monkeypatch.setattr(shared_bundle, "_api_clients", {})
+
+    with monkeypatch.context() as m:
+        m.setattr(NodesBundle, "create_api_client", _per_bundle_client)
+        per_bundle: Dict[str, Any] = _measure(backend, lambda: _delete_nodes(config))
+    shared: Dict[str, Any] = _measure(backend, lambda: _delete_nodes(config))
+
+    record_benchmark(
+        {
+            "requests": NODES * ROUNDS,
+            "per_bundle_connections": per_bundle["connections"],
+            "per_bundle_ms": per_bundle["ms"],
+            "shared_connections": shared["connections"],
+            "shared_ms": shared["ms"],
+        }
+    )
+    print(f"\nper bundle: {per_bundle}, shared: {shared}")
+    # Each worker keeps using its pooled connection across all rounds.
+    assert shared["connections"] <= MAX_CONCURRENCY
+    assert shared["connections"] < per_bundle["connections"]
@@ -0,0 +1,44 @@
+import asyncio
+import time
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+from exls.shared.core.parallel import ParallelExecutionResult, execute_concurrently
+
+BATCH_SIZES: List[int] = [1000, 4000]
+MAX_CONCURRENCY = 10
+ITEM_SECONDS = 0.001
+
+
+async def _item(_: int) -> None:
+    await asyncio.sleep(ITEM_SECONDS)
+
+
+def _seconds(size: int) -> float:
+    start: float = time.perf_counter()
+    result: ParallelExecutionResult[int, None] = execute_concurrently(
+        items=list(range(size)), func=_item, max_concurrency=MAX_CONCURRENCY
+    )
+    elapsed: float = time.perf_counter() - start
+    assert len(result.successes) == size
+    return elapsed
+
+
+@pytest.mark.benchmark
+def test_batch_overhead_grows_linearly_with_the_items(
+    record_benchmark: Callable[[Dict[str, Any]], None],
+) -> None:
+    results: Dict[str, Any] = {
+        f"batch_{size}_ms": round(_seconds(size) * 1000, 1) for size in BATCH_SIZES
+    }
+    per_item_ms: List[float] = [
+        results[f"batch_{size}_ms"] / size for size in BATCH_SIZES
+    ]
+    results["ideal_ms_per_item"] = ITEM_SECONDS * 1000 / MAX_CONCURRENCY
+
+    record_benchmark(results)
+    print(f"\n{results}")
+    # Waking all waiting items on each completion makes the time per item grow
+    # with the size of the batch; starting them as slots free up does not.
+    assert per_item_ms[-1] < 1.5 * per_item_ms[0]
@@ -0,0 +1,88 @@
+import time
+from typing import Any, Callable, Dict, Iterator, List
+
+import pytest
+
+from exls.clusters.adapters import adapter as cluster_adapter
+from exls.clusters.adapters.bundle import ClustersBundle
+from exls.clusters.core.domain import Cluster
+from exls.clusters.core.service import ClustersService
+from exls.config import AppConfig, ConfigHttp
+from exls.shared.adapters import bundle as shared_bundle
+from exls.state import AppState
+from tests.support.backend import FakeExalsiusBackend, FaultProfile, Fleet, FleetSpec
+
+CLUSTER_NODES = 4
+LATENCY: FaultProfile = FaultProfile(latency_seconds=0.05)
+
+
+@pytest.fixture
+def backend(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeExalsiusBackend]:
+    monkeypatch.setattr(shared_bundle, "_api_clients", {})
+    backend: FakeExalsiusBackend = FakeExalsiusBackend(
+        fleet=Fleet(
+            FleetSpec(
+                clusters=1,
+                nodes=CLUSTER_NODES,
+                nodes_per_cluster=CLUSTER_NODES,
+                workspaces=0,
+            )
+        ),
+        faults=LATENCY,
+    )
+    backend.start()
+    yield backend
+    backend.stop()
+
+
+def _clusters_service(backend: FakeExalsiusBackend) -> ClustersService:
+    config: AppConfig = AppConfig(
+        backend_host=backend.url, http=ConfigHttp(cache_enabled=False)
+    )
+    return ClustersBundle(
+        config, AppState(config=config, access_token="token")
+    ).get_clusters_service()
+
+
+def _best_ms(run: Callable[[], Any], repeat: int = 3) -> float:
+    best: float = float("inf")
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 1)
+
+
+def _call_sequentially(*calls: Callable[[], Any]) -> List[Any]:
+    return [call() for call in calls]
+
+
+@pytest.mark.benchmark
+def test_cluster_get_overlaps_its_sub_fetches(
+    backend: FakeExalsiusBackend,
+    monkeypatch: pytest.MonkeyPatch,
+    record_benchmark: Callable[[Dict[str, Any]], None],
+) -> None:
+    service: ClustersService = _clusters_service(backend)
+    cluster_id: str = next(iter(backend.fleet.clusters))
+    clusters: List[Cluster] = []
+
+    concurrent_ms: float = _best_ms(
+        lambda: clusters.append(service.get_cluster(cluster_id))
+    )
+    with monkeypatch.context() as patched:
+        patched.setattr(cluster_adapter, "call_concurrently", _call_sequentially)
+        sequential_ms: float = _best_ms(lambda: service.get_cluster(cluster_id))
+
+    results: Dict[str, Any] = {
+        "latency_ms": LATENCY.latency_seconds * 1000,
+        "cluster_nodes": CLUSTER_NODES,
+        "sequential_ms": sequential_ms,
+        "concurrent_ms": concurrent_ms,
+    }
+    record_benchmark(results)
+    print(f"\n{results}")
+    assert len(clusters[0].nodes) == CLUSTER_NODES
+    # describe, then the refs, nodes and resources side by side, instead of
+    # describe, refs, nodes and resources one after another.
+    assert concurrent_ms < sequential_ms - LATENCY.latency_seconds * 1000
@@ -0,0 +1,85 @@
+import json
+import subprocess
+import sys
+from typing import Any, Callable, Dict, List, Set
+
+import pytest
+
+# Resolves a single top-level command the same way `exls <command> ...` does and
+# reports the wall time and the modules that got imported on the way.
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import typer.main
+from exls.app import app
+group = typer.main.get_command(app)
+name = sys.argv[1]
+if name:
+    ctx = group.make_context("exls", [name], resilient_parsing=True)
+    group.get_command(ctx, name)
+print(json.dumps({
+    "wall_ms": (time.perf_counter() - start) * 1000,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+# Packages that must not be imported to dispatch the given top-level command.
+# An empty command name stands for invocations that are handled by the root
+# app itself, e.g. `exls --version`.
+_FORBIDDEN_IMPORTS: Dict[str, Set[str]] = {
+    "": {
+        "exalsius_api_client",
+        "auth0",
+        "keyring",
+        "exls.auth",
+        "exls.nodes",
+        "exls.clusters",
+        "exls.workspaces",
+        "exls.management",
+    },
+    "login": {"exls.nodes", "exls.clusters", "exls.workspaces", "exls.management"},
+    "logout": {"exls.nodes", "exls.clusters", "exls.workspaces", "exls.management"},
+    "management": {"exls.nodes", "exls.clusters", "exls.workspaces"},
+    "nodes": {"exls.clusters", "exls.workspaces"},
+    "clusters": {"exls.workspaces"},
+    "workspaces": set(),
+}
+
+
+def _probe(command: str) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE, command],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _is_imported(package: str, modules: List[str]) -> bool:
+    return any(m == package or m.startswith(f"{package}.") for m in modules)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("command", list(_FORBIDDEN_IMPORTS.keys()))
+def test_cold_start_import_graph(
+    command: str, record_benchmark: Callable[[Dict[str, Any]], None]
+) -> None:
+    result: Dict[str, Any] = _probe(command)
+    modules: List[str] = result["modules"]
+
+    record_benchmark(
+        {
+            "command": command or "<root>",
+            "wall_ms": round(result["wall_ms"], 1),
+            "imported_modules": len(modules),
+            "imported_exls_modules": len([m for m in modules if m.startswith("exls")]),
+        }
+    )
+
+    unexpected: List[str] = [
+        package
+        for package in sorted(_FORBIDDEN_IMPORTS[command])
+        if _is_imported(package, modules)
+    ]
+    assert unexpected == []
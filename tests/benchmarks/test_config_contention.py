@@ -0,0 +1,69 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator
+
+import pytest
+import yaml
+from filelock import FileLock
+
+from exls import config as cli_config
+from exls.config import AppConfig, ExalsiusYamlConfig, save_config
+
+READERS = 32
+READS_PER_READER = 20
+
+
+@pytest.fixture
+def config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.setattr(cli_config, "CFG_DIR", tmp_path)
+    monkeypatch.setattr(cli_config, "CFG_FILE", tmp_path / "config.yaml")
+    monkeypatch.setattr(cli_config, "CONFIG_LOCK_FILE", tmp_path / "config.lock")
+    monkeypatch.setattr(
+        cli_config, "CONFIG_SNAPSHOT_FILE", tmp_path / "config.snapshot.json"
+    )
+    save_config(AppConfig())
+    yield tmp_path
+
+
+def _locked_yaml_read(config_dir: Path) -> Dict[str, Any]:
+    """The previous read path: parse the YAML file under the config lock."""
+    with FileLock(config_dir / "config.lock"):
+        with (config_dir / "config.yaml").open() as f:
+            return yaml.safe_load(f) or {}
+
+
+def _snapshot_read(config_dir: Path) -> Dict[str, Any]:
+    return ExalsiusYamlConfig(AppConfig)()
+
+
+def _measure(read: Callable[[Path], Dict[str, Any]], config_dir: Path) -> float:
+    def _reader(_: int) -> None:
+        for _ in range(READS_PER_READER):
+            read(config_dir)
+
+    start: float = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=READERS) as executor:
+        list(executor.map(_reader, range(READERS)))
+    return (time.perf_counter() - start) * 1000
+
+
+@pytest.mark.benchmark
+def test_concurrent_config_reads(
+    config_dir: Path, record_benchmark: Callable[[Dict[str, Any]], None]
+) -> None:
+    expected: Dict[str, Any] = _locked_yaml_read(config_dir)
+    assert _snapshot_read(config_dir) == expected
+
+    locked_ms: float = _measure(_locked_yaml_read, config_dir)
+    snapshot_ms: float = _measure(_snapshot_read, config_dir)
+
+    record_benchmark(
+        {
+            "readers": READERS,
+            "reads_per_reader": READS_PER_READER,
+            "locked_yaml_ms": round(locked_ms, 1),
+            "snapshot_ms": round(snapshot_ms, 1),
+        }
+    )
+    assert snapshot_ms < locked_ms
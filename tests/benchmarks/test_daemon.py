@@ -0,0 +1,73 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+import pytest
+
+ITERATIONS = 5
+# A full authenticated command path that needs no backend: the token store is
+# empty, so the command stops after loading config, imports and the token.
+COMMAND: List[str] = ["nodes", "list"]
+
+
+@pytest.fixture
+def env(tmp_path: Path) -> Dict[str, str]:
+    environment: Dict[str, str] = dict(os.environ)
+    environment["XDG_CONFIG_HOME"] = str(tmp_path)
+    environment["EXLS_TOKEN_STORE"] = "encrypted_file"
+    environment["EXLS_TOKEN_STORE_TOKEN_DIR"] = str(tmp_path / "tokens")
+    return environment
+
+
+@pytest.fixture
+def daemon(env: Dict[str, str]) -> Iterator[None]:
+    exls: List[str] = [sys.executable, "-m", "exls", "daemon"]
+    subprocess.run(
+        exls + ["start", "--idle-timeout", "60"],
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+    yield
+    subprocess.run(exls + ["stop"], env=env, capture_output=True)
+
+
+def _median_wall_ms(env: Dict[str, str]) -> Dict[str, Any]:
+    samples: List[float] = []
+    output: str = ""
+    for _ in range(ITERATIONS):
+        start: float = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-m", "exls", *COMMAND],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+        output = completed.stdout + completed.stderr
+    return {"wall_ms": round(statistics.median(samples), 1), "output": output}
+
+
+@pytest.mark.benchmark
+def test_daemon_invocation_latency(
+    env: Dict[str, str],
+    daemon: None,
+    record_benchmark: Callable[[Dict[str, Any]], None],
+) -> None:
+    via_daemon: Dict[str, Any] = _median_wall_ms(env)
+    in_process: Dict[str, Any] = _median_wall_ms({**env, "EXLS_NO_DAEMON": "1"})
+
+    record_benchmark(
+        {
+            "command": " ".join(COMMAND),
+            "in_process_wall_ms": in_process["wall_ms"],
+            "daemon_wall_ms": via_daemon["wall_ms"],
+        }
+    )
+    assert via_daemon["output"] == in_process["output"]
+    assert "not logged in" in via_daemon["output"]
+    assert via_daemon["wall_ms"] < in_process["wall_ms"]
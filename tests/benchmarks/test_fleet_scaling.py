@@ -0,0 +1,105 @@
+import time
+from typing import Any, Callable, Dict, Iterator, List
+
+import pytest
+
+from exls.config import AppConfig, ConfigHttp
+from exls.nodes.adapters.bundle import NodesBundle
+from exls.nodes.core.results import DeleteNodesResult
+from exls.nodes.core.service import NodesService
+from exls.shared.adapters import bundle as shared_bundle
+from exls.state import AppState
+from tests.support.backend import FakeExalsiusBackend, FaultProfile, Fleet, FleetSpec
+
+FLEET_SIZES: List[int] = [100, 1000, 5000]
+DELETED_NODES = 100
+MAX_CONCURRENCY = 10
+LATENCY: FaultProfile = FaultProfile(latency_seconds=0.01, jitter_seconds=0.005)
+
+
+@pytest.fixture
+def start_backend(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[Callable[[int], FakeExalsiusBackend]]:
+    monkeypatch.setattr(shared_bundle, "_api_clients", {})
+    backends: List[FakeExalsiusBackend] = []
+
+    def _start(nodes: int) -> FakeExalsiusBackend:
+        backend: FakeExalsiusBackend = FakeExalsiusBackend(
+            fleet=Fleet(FleetSpec(clusters=0, nodes=nodes, workspaces=0)),
+            faults=LATENCY,
+        )
+        backend.start()
+        backends.append(backend)
+        return backend
+
+    yield _start
+    for backend in backends:
+        backend.stop()
+
+
+def _nodes_service(backend: FakeExalsiusBackend) -> NodesService:
+    config: AppConfig = AppConfig(
+        backend_host=backend.url,
+        http=ConfigHttp(max_concurrency=MAX_CONCURRENCY, cache_enabled=False),
+    )
+    return NodesBundle(
+        config, AppState(config=config, access_token="token")
+    ).get_nodes_service()
+
+
+def _ms(run: Callable[[], Any], repeat: int = 1) -> float:
+    """The best time of `repeat` runs, in milliseconds."""
+    best: float = float("inf")
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 1)
+
+
+@pytest.mark.benchmark
+def test_list_and_first_page_by_fleet_size(
+    start_backend: Callable[[int], FakeExalsiusBackend],
+    record_benchmark: Callable[[Dict[str, Any]], None],
+) -> None:
+    results: Dict[str, Any] = {}
+    for size in FLEET_SIZES:
+        service: NodesService = _nodes_service(start_backend(size))
+        results[f"list_{size}_ms"] = _ms(service.list_nodes, repeat=3)
+        results[f"first_page_{size}_ms"] = _ms(
+            lambda: next(service.iter_nodes(page_size=20, limit=20)), repeat=3
+        )
+
+    record_benchmark(results)
+    print(f"\n{results}")
+    largest: int = FLEET_SIZES[-1]
+    # Only the first page is mapped, so it does not pay for the whole fleet.
+    assert results[f"first_page_{largest}_ms"] < results[f"list_{largest}_ms"]
+
+
+@pytest.mark.benchmark
+def test_bulk_delete_is_bounded_by_max_concurrency(
+    start_backend: Callable[[int], FakeExalsiusBackend],
+    record_benchmark: Callable[[Dict[str, Any]], None],
+) -> None:
+    backend: FakeExalsiusBackend = start_backend(DELETED_NODES)
+    node_ids: List[str] = list(backend.fleet.nodes)
+    result: List[DeleteNodesResult] = []
+
+    ms: float = _ms(
+        lambda: result.append(_nodes_service(backend).delete_nodes(node_ids))
+    )
+
+    record_benchmark(
+        {
+            "nodes": DELETED_NODES,
+            "ms": ms,
+            "max_in_flight": backend.max_in_flight,
+        }
+    )
+    print(f"\n{DELETED_NODES} deletes in {ms} ms, {backend.max_in_flight} in flight")
+    assert len(result[0].deleted_node_ids) == DELETED_NODES
+    assert backend.max_in_flight <= MAX_CONCURRENCY
+    # Sequential deletes would take at least DELETED_NODES * latency.
+    assert ms < DELETED_NODES * LATENCY.latency_seconds * 1000
@@ -0,0 +1,101 @@
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator
+
+import pytest
+
+from exls.auth.adapters.file.config import EncryptedFileTokenStoreConfig
+from exls.auth.adapters.file.file import EncryptedFileTokenAdapter
+from exls.auth.adapters.keyring.commands import (
+    LoadTokenFromKeyringCommand,
+    StoreTokenOnKeyringCommand,
+)
+from exls.auth.adapters.keyring.keyring import KeyringAdapter
+from exls.auth.adapters.memory.memory import InMemoryTokenCache
+from exls.auth.core.domain import Token
+from tests.support.keyring import InMemoryKeyring, use_in_memory_keyring
+
+CLIENT_ID = "benchmark-client"
+# Roughly the cost of a D-Bus round trip to SecretService on a desktop.
+KEYRING_LATENCY_SECONDS = 0.002
+ITERATIONS = 20
+
+
+@pytest.fixture
+def slow_keyring() -> Iterator[InMemoryKeyring]:
+    yield from use_in_memory_keyring(latency_seconds=KEYRING_LATENCY_SECONDS)
+
+
+@pytest.fixture
+def token() -> Token:
+    return Token(
+        client_id=CLIENT_ID,
+        access_token="a" * 900,
+        id_token="i" * 1200,
+        scope="openid profile email offline_access",
+        token_type="Bearer",
+        refresh_token="r" * 64,
+        expires_in=3600,
+    )
+
+
+def _measure_load(
+    load: Callable[[], Any], keyring: InMemoryKeyring
+) -> Dict[str, float]:
+    keyring.round_trips = 0
+    start: float = time.perf_counter()
+    for _ in range(ITERATIONS):
+        load()
+    elapsed: float = time.perf_counter() - start
+    return {
+        "load_ms": round(elapsed / ITERATIONS * 1000, 3),
+        "round_trips_per_load": keyring.round_trips / ITERATIONS,
+    }
+
+
+@pytest.mark.benchmark
+def test_token_store_backends(
+    slow_keyring: InMemoryKeyring,
+    token: Token,
+    tmp_path: Path,
+    record_benchmark: Callable[[Dict[str, Any]], None],
+) -> None:
+    StoreTokenOnKeyringCommand(token=token).execute()
+    legacy: Dict[str, float] = _measure_load(
+        lambda: LoadTokenFromKeyringCommand(client_id=CLIENT_ID).execute(),
+        slow_keyring,
+    )
+
+    KeyringAdapter().store(token)
+    single_record: Dict[str, float] = _measure_load(
+        lambda: KeyringAdapter().load(CLIENT_ID), slow_keyring
+    )
+
+    InMemoryTokenCache.clear()
+    in_memory: Dict[str, float] = _measure_load(
+        lambda: InMemoryTokenCache(KeyringAdapter()).load(CLIENT_ID), slow_keyring
+    )
+    InMemoryTokenCache.clear()
+
+    file_adapter = EncryptedFileTokenAdapter(
+        EncryptedFileTokenStoreConfig(token_dir=tmp_path)
+    )
+    file_adapter.store(token)
+    encrypted_file: Dict[str, float] = _measure_load(
+        lambda: file_adapter.load(CLIENT_ID), slow_keyring
+    )
+
+    record_benchmark(
+        {
+            "legacy_keyring": legacy,
+            "single_record_keyring": single_record,
+            "in_memory_first": in_memory,
+            "encrypted_file": encrypted_file,
+        }
+    )
+
+    assert legacy["round_trips_per_load"] == 4
+    assert single_record["round_trips_per_load"] == 1
+    assert in_memory["round_trips_per_load"] <= 1 / ITERATIONS
+    assert encrypted_file["round_trips_per_load"] == 0
+    assert single_record["load_ms"] < legacy["load_ms"]
@@ -0,0 +1,216 @@
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+import requests
+from auth0.authentication.token_verifier import AsymmetricSignatureVerifier
+
+from exls.auth.adapters.auth0.commands import ValidateTokenCommand
+from exls.auth.adapters.auth0.requests import ValidateTokenRequest
+from exls.auth.adapters.auth0.responses import ValidatedAuthUserResponse
+from exls.clusters.adapters.bundle import ClustersBundle
+from exls.clusters.core.domain import Cluster, ClusterEvent, ClusterSummary
+from exls.clusters.core.service import ClustersService
+from exls.config import AppConfig
+from exls.management.adapters.bundle import ManagementBundle
+from exls.nodes.adapters.bundle import NodesBundle
+from exls.nodes.core.domain import BaseNode
+from exls.nodes.core.results import DeleteNodesResult
+from exls.nodes.core.service import NodesService
+from exls.shared.adapters import retry
+from exls.shared.adapters.retry import RetryBudget, RetryPolicy
+from exls.shared.core.exceptions import ServiceError
+from exls.shared.core.parallel import AdaptiveLimiter
+from exls.state import AppState
+from exls.workspaces.adapters.bundle import WorkspacesBundle
+from tests.support.backend import FakeExalsiusBackend, FaultProfile, Fleet, FleetSpec
+
+SPEC: FleetSpec = FleetSpec(clusters=4, nodes=20, workspaces=7, events_per_cluster=5)
+DEVICE_CODE_GRANT = "urn:ietf:params:oauth:grant-type:device_code"
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(retry, "_policy", RetryPolicy(base_delay_seconds=0.001))
+    monkeypatch.setattr(retry, "_budget", RetryBudget(retries=10))
+
+
+@pytest.fixture
+def backend() -> Iterator[FakeExalsiusBackend]:
+    backend: FakeExalsiusBackend = FakeExalsiusBackend(fleet=Fleet(SPEC))
+    backend.start()
+    yield backend
+    backend.stop()
+
+
+@pytest.fixture
+def config(backend: FakeExalsiusBackend) -> AppConfig:
+    return AppConfig(backend_host=backend.url)
+
+
+@pytest.fixture
+def state(config: AppConfig) -> AppState:
+    return AppState(config=config, access_token="token")
+
+
+@pytest.mark.integration
+class TestFakeBackend:
+    def test_serves_the_fleet_through_the_sdk(
+        self, config: AppConfig, state: AppState
+    ) -> None:
+        nodes: List[BaseNode] = (
+            NodesBundle(config, state).get_nodes_service().list_nodes()
+        )
+        clusters_service: ClustersService = ClustersBundle(
+            config, state
+        ).get_clusters_service()
+        clusters: List[ClusterSummary] = clusters_service.list_clusters()
+        cluster: Cluster = clusters_service.get_cluster(clusters[0].id)
+        events: List[ClusterEvent] = list(
+            clusters_service.stream_cluster_logs(clusters[0].id)
+        )
+
+        assert len(nodes) == SPEC.nodes
+        assert len(clusters) == SPEC.clusters
+        assert len(cluster.nodes) == SPEC.nodes_per_cluster
+        assert len(events) == SPEC.events_per_cluster
+        assert (
+            len(
+                WorkspacesBundle(config, state)
+                .get_workspaces_service()
+                .list_workspaces()
+            )
+            == SPEC.workspaces
+        )
+        assert [
+            key.name
+            for key in ManagementBundle(config, state)
+            .get_management_service()
+            .list_ssh_keys()
+        ] == ["default"]
+
+    def test_get_cluster_looks_up_only_its_nodes(
+        self, backend: FakeExalsiusBackend, config: AppConfig, state: AppState
+    ) -> None:
+        service: ClustersService = ClustersBundle(config, state).get_clusters_service()
+        cluster_id: str = next(iter(backend.fleet.clusters))
+
+        cluster: Cluster = service.get_cluster(cluster_id)
+
+        node_requests: List[str] = [
+            path for _, path in backend.requests if path.startswith("/node")
+        ]
+        assert sorted(node.id for node in cluster.nodes) == sorted(
+            backend.fleet.cluster_node_ids(cluster_id)
+        )
+        assert sorted(node_requests) == sorted(
+            f"/node/{node_id}" for node_id in backend.fleet.cluster_node_ids(cluster_id)
+        )
+
+    def test_write_endpoints_change_the_fleet(
+        self, backend: FakeExalsiusBackend, config: AppConfig, state: AppState
+    ) -> None:
+        service: NodesService = NodesBundle(config, state).get_nodes_service()
+        node_ids: List[str] = list(backend.fleet.nodes)[-3:]
+
+        result: DeleteNodesResult = service.delete_nodes(node_ids)
+
+        assert sorted(result.deleted_node_ids) == node_ids
+        assert len(service.list_nodes()) == SPEC.nodes - 3
+
+    def test_generates_the_same_fleet_for_the_same_spec(self) -> None:
+        assert Fleet(SPEC).nodes == Fleet(SPEC).nodes
+        assert Fleet(SPEC).nodes != Fleet(SPEC.model_copy(update={"seed": 1})).nodes
+
+    def test_requires_a_bearer_token(self, backend: FakeExalsiusBackend) -> None:
+        assert requests.get(f"{backend.url}/nodes").status_code == 401
+
+
+@pytest.mark.integration
+class TestFakeBackendFaults:
+    def test_injected_errors_are_retried(
+        self, backend: FakeExalsiusBackend, config: AppConfig, state: AppState
+    ) -> None:
+        backend.set_faults(FaultProfile(error_rate=0.5, seed=3))
+
+        nodes: List[BaseNode] = (
+            NodesBundle(config, state).get_nodes_service().list_nodes()
+        )
+
+        assert len(nodes) == SPEC.nodes
+        assert len(backend.requests) > 1
+
+    def test_persistent_errors_fail_the_command(
+        self, backend: FakeExalsiusBackend, config: AppConfig, state: AppState
+    ) -> None:
+        backend.set_faults(FaultProfile(error_rate=1.0, error_status=500))
+
+        with pytest.raises(ServiceError):
+            NodesBundle(config, state).get_nodes_service().list_nodes()
+
+    def test_overload_lowers_the_concurrency_of_bulk_operations(
+        self, backend: FakeExalsiusBackend, config: AppConfig, state: AppState
+    ) -> None:
+        backend.set_faults(FaultProfile(error_rate=0.3, error_status=503, seed=1))
+        bundle: NodesBundle = NodesBundle(config, state)
+        node_ids: List[str] = list(backend.fleet.nodes)[:10]
+
+        result: DeleteNodesResult = bundle.get_nodes_service().delete_nodes(node_ids)
+
+        limiter: Optional[AdaptiveLimiter] = bundle.get_concurrency_limiter()
+        assert limiter is not None
+        assert sorted(result.deleted_node_ids) == node_ids
+        assert limiter.counters["decreases"] > 0
+
+    def test_rate_limits_with_retry_after(self, backend: FakeExalsiusBackend) -> None:
+        backend.set_faults(FaultProfile(rate_limit_per_second=1, rate_limit_burst=2))
+        headers: Dict[str, str] = {"Authorization": "Bearer token"}
+
+        statuses: List[int] = [
+            requests.get(f"{backend.url}/nodes", headers=headers).status_code
+            for _ in range(3)
+        ]
+        limited: requests.Response = requests.get(
+            f"{backend.url}/nodes", headers=headers
+        )
+
+        assert statuses == [200, 200, 429]
+        assert limited.headers["Retry-After"] == "1"
+
+
+@pytest.mark.integration
+class TestFakeAuthServer:
+    def test_device_code_flow_issues_valid_tokens(
+        self, backend: FakeExalsiusBackend
+    ) -> None:
+        backend.auth.pending_polls = 1
+        device_code: Dict[str, Any] = requests.post(
+            f"{backend.url}/oauth/device/code", json={"client_id": "cli"}
+        ).json()
+
+        def _poll() -> requests.Response:
+            return requests.post(
+                f"{backend.url}/oauth/token",
+                json={
+                    "client_id": "cli",
+                    "device_code": device_code["device_code"],
+                    "grant_type": DEVICE_CODE_GRANT,
+                },
+            )
+
+        pending: requests.Response = _poll()
+        tokens: Dict[str, Any] = _poll().json()
+        user: ValidatedAuthUserResponse = ValidateTokenCommand(
+            ValidateTokenRequest(
+                domain=backend.host,
+                client_id="cli",
+                id_token=tokens["id_token"],
+                leeway=0,
+            ),
+            signature_verifier=AsymmetricSignatureVerifier(
+                f"{backend.url}/.well-known/jwks.json"
+            ),
+        ).execute()
+
+        assert pending.json()["error"] == "authorization_pending"
+        assert user.sub == backend.auth.user
+        assert tokens["refresh_token"]
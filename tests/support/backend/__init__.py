@@ -0,0 +1,27 @@
+"""
+A local fake of the exalsius backend, for benchmarks and load tests.
+
+    backend = FakeExalsiusBackend(
+        fleet=Fleet(FleetSpec(clusters=50, nodes=2000, workspaces=500)),
+        faults=FaultProfile(latency_seconds=0.02, jitter_seconds=0.01),
+    ).start()
+    ...
+    backend.stop()
+
+Point `AppConfig.backend_host` at `backend.url`, and the Auth0 domain at
+`backend.host`.
+"""
+
+from tests.support.backend.auth import FakeAuthServer
+from tests.support.backend.faults import FaultInjector, FaultProfile
+from tests.support.backend.fleet import Fleet, FleetSpec
+from tests.support.backend.server import FakeExalsiusBackend
+
+__all__ = [
+    "FakeAuthServer",
+    "FakeExalsiusBackend",
+    "FaultInjector",
+    "FaultProfile",
+    "Fleet",
+    "FleetSpec",
+]
@@ -0,0 +1,137 @@
+import json
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from jwt.algorithms import RSAAlgorithm
+
+from tests.support.http import ScriptedResponse
+
+KEY_ID = "fake-backend-key"
+ACCESS_TOKEN_LIFETIME_SECONDS = 3600
+
+
+class FakeAuthServer:
+    """
+    The Auth0 endpoints of a fake backend.
+
+    Issues RS256-signed tokens for the device code, refresh token and
+    authorization code grants, and serves the signing key as a JWKS, so that
+    the issued ID tokens pass validation with `https://<issuer_host>/` as the
+    issuer. A device code is pending for `pending_polls` polls before tokens
+    are issued for it.
+    """
+
+    def __init__(
+        self,
+        issuer_host: str,
+        pending_polls: int = 0,
+        org_id: str = "org-fake",
+        user: str = "fake-user",
+    ):
+        self.issuer: str = f"https://{issuer_host}/"
+        self.pending_polls: int = pending_polls
+        self.org_id: str = org_id
+        self.user: str = user
+        self.issued_tokens: int = 0
+        self._polls: Dict[str, int] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._private_key: Optional[RSAPrivateKey] = None
+
+    @property
+    def private_key(self) -> RSAPrivateKey:
+        # Generating the key takes a moment; only do it if tokens are used.
+        with self._lock:
+            if self._private_key is None:
+                self._private_key = rsa.generate_private_key(
+                    public_exponent=65537, key_size=2048
+                )
+            return self._private_key
+
+    def jwks(self) -> ScriptedResponse:
+        jwk: Dict[str, Any] = json.loads(
+            RSAAlgorithm.to_jwk(self.private_key.public_key())
+        )
+        jwk.update({"kid": KEY_ID, "use": "sig", "alg": "RS256"})
+        return ScriptedResponse(body={"keys": [jwk]})
+
+    def device_code(self, form: Dict[str, str]) -> ScriptedResponse:
+        with self._lock:
+            device_code: str = f"device-code-{len(self._polls) + 1}"
+            self._polls[device_code] = 0
+        return ScriptedResponse(
+            body={
+                "device_code": device_code,
+                "user_code": "FAKE-CODE",
+                "verification_uri": f"{self.issuer}activate",
+                "verification_uri_complete": f"{self.issuer}activate?user_code=FAKE-CODE",
+                "expires_in": 900,
+                "interval": 1,
+            }
+        )
+
+    def token(self, form: Dict[str, str]) -> ScriptedResponse:
+        grant_type: str = form.get("grant_type", "")
+        if grant_type.endswith("device_code"):
+            with self._lock:
+                polls: Optional[int] = self._polls.get(form.get("device_code", ""))
+                if polls is None:
+                    return _oauth_error(403, "invalid_grant", "unknown device code")
+                self._polls[form["device_code"]] = polls + 1
+            if polls < self.pending_polls:
+                return _oauth_error(
+                    403, "authorization_pending", "the user has not logged in yet"
+                )
+        elif grant_type not in ("refresh_token", "authorization_code"):
+            return _oauth_error(400, "unsupported_grant_type", grant_type)
+        return ScriptedResponse(body=self._tokens(form.get("client_id", "")))
+
+    def _sign(self, claims: Dict[str, Any]) -> str:
+        return jwt.encode(
+            claims, self.private_key, algorithm="RS256", headers={"kid": KEY_ID}
+        )
+
+    def _tokens(self, client_id: str) -> Dict[str, Any]:
+        now: int = int(time.time())
+        with self._lock:
+            self.issued_tokens += 1
+            serial: int = self.issued_tokens
+        access_token: str = self._sign(
+            {
+                "iss": self.issuer,
+                "sub": self.user,
+                "org_id": self.org_id,
+                "aud": "https://api.exalsius.ai",
+                "iat": now,
+                "exp": now + ACCESS_TOKEN_LIFETIME_SECONDS,
+                "jti": str(serial),
+            }
+        )
+        id_token: str = self._sign(
+            {
+                "iss": self.issuer,
+                "sub": self.user,
+                "aud": client_id,
+                "iat": now,
+                "exp": now + ACCESS_TOKEN_LIFETIME_SECONDS,
+                "email": f"{self.user}@example.com",
+                "nickname": self.user,
+            }
+        )
+        return {
+            "access_token": access_token,
+            "id_token": id_token,
+            "refresh_token": f"refresh-token-{serial}",
+            "scope": "openid profile email offline_access",
+            "token_type": "Bearer",
+            "expires_in": ACCESS_TOKEN_LIFETIME_SECONDS,
+        }
+
+
+def _oauth_error(status: int, error: str, description: str) -> ScriptedResponse:
+    return ScriptedResponse(
+        status=status, body={"error": error, "error_description": description}
+    )
@@ -0,0 +1,70 @@
+import random
+import threading
+import time
+from typing import Optional
+
+from pydantic import BaseModel, Field, NonNegativeFloat, PositiveFloat, PositiveInt
+
+
+class FaultProfile(BaseModel):
+    """The latency, errors and rate limits a fake backend injects."""
+
+    latency_seconds: NonNegativeFloat = Field(
+        default=0.0, description="The time every response is delayed by"
+    )
+    jitter_seconds: NonNegativeFloat = Field(
+        default=0.0, description="Up to this much random delay on top of the latency"
+    )
+    error_rate: float = Field(
+        default=0.0, ge=0, le=1, description="The share of requests that fail"
+    )
+    error_status: int = Field(
+        default=503, description="The status of the failed requests"
+    )
+    rate_limit_per_second: Optional[PositiveFloat] = Field(
+        default=None,
+        description="The sustained request rate; faster requests get a 429",
+    )
+    rate_limit_burst: PositiveInt = Field(
+        default=10, description="The requests allowed at once before rate limiting"
+    )
+    seed: int = Field(default=0, description="The seed of the random faults")
+
+
+class FaultInjector:
+    """Decides, per request, which faults of a profile apply. Thread safe."""
+
+    def __init__(self, profile: FaultProfile):
+        self.profile: FaultProfile = profile
+        self._rng: random.Random = random.Random(profile.seed)
+        self._lock: threading.Lock = threading.Lock()
+        self._tokens: float = float(profile.rate_limit_burst)
+        self._refilled_at: float = time.monotonic()
+
+    def delay(self) -> float:
+        with self._lock:
+            jitter: float = self._rng.uniform(0, self.profile.jitter_seconds)
+        return self.profile.latency_seconds + jitter
+
+    def fails(self) -> bool:
+        if not self.profile.error_rate:
+            return False
+        with self._lock:
+            return self._rng.random() < self.profile.error_rate
+
+    def retry_after(self) -> Optional[float]:
+        """None if the request is within the rate limit, else the wait in seconds."""
+        rate: Optional[float] = self.profile.rate_limit_per_second
+        if rate is None:
+            return None
+        with self._lock:
+            now: float = time.monotonic()
+            self._tokens = min(
+                float(self.profile.rate_limit_burst),
+                self._tokens + (now - self._refilled_at) * rate,
+            )
+            self._refilled_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return None
+            return (1 - self._tokens) / rate
@@ -0,0 +1,240 @@
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from pydantic import BaseModel, Field, NonNegativeInt
+
+FLEET_EPOCH: datetime = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+GPU_MODELS: List[Dict[str, Any]] = [
+    {"gpu_vendor": "NVIDIA", "gpu_type": "H100", "gpu_memory": 80},
+    {"gpu_vendor": "NVIDIA", "gpu_type": "A100", "gpu_memory": 40},
+    {"gpu_vendor": "NVIDIA", "gpu_type": "L4", "gpu_memory": 24},
+    {"gpu_vendor": "AMD", "gpu_type": "MI300X", "gpu_memory": 192},
+]
+CLOUD_PROVIDERS: List[str] = ["aws", "gcp", "azure"]
+WORKSPACE_TEMPLATES: List[str] = [
+    "vscode-devcontainer-template",
+    "jupyter-notebook-template",
+    "marimo-template",
+    "ray-llm-service-template",
+]
+
+
+class FleetSpec(BaseModel):
+    """The size and shape of a synthetic fleet."""
+
+    clusters: NonNegativeInt = Field(default=3, description="The number of clusters")
+    nodes: NonNegativeInt = Field(default=12, description="The number of nodes")
+    workspaces: NonNegativeInt = Field(
+        default=6, description="The number of workspaces, spread over the clusters"
+    )
+    nodes_per_cluster: NonNegativeInt = Field(
+        default=2, description="The nodes deployed to each cluster, if there are enough"
+    )
+    events_per_cluster: NonNegativeInt = Field(
+        default=10, description="The events in the log stream of each cluster"
+    )
+    cloud_node_ratio: float = Field(
+        default=0.25, ge=0, le=1, description="The share of nodes that are cloud nodes"
+    )
+    seed: int = Field(default=0, description="The seed of the generator")
+
+
+def _timestamp(offset_seconds: int) -> str:
+    return (FLEET_EPOCH + timedelta(seconds=offset_seconds)).isoformat()
+
+
+class Fleet:
+    """
+    The resources of a fake backend, as the JSON documents of the API.
+
+    The same spec always generates the same fleet. The resources can be
+    changed through the methods below, which the backend uses for its write
+    endpoints; all access is guarded by a lock.
+    """
+
+    def __init__(self, spec: Optional[FleetSpec] = None):
+        self.spec: FleetSpec = spec or FleetSpec()
+        self.lock: threading.RLock = threading.RLock()
+        self.ssh_keys: Dict[str, Dict[str, Any]] = {}
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.clusters: Dict[str, Dict[str, Any]] = {}
+        self.workspaces: Dict[str, Dict[str, Any]] = {}
+        self._rng: random.Random = random.Random(self.spec.seed)
+        self._next_id: int = 0
+        self._generate()
+
+    def new_id(self, prefix: str) -> str:
+        with self.lock:
+            self._next_id += 1
+            return f"{prefix}-{self._next_id:06d}"
+
+    def _generate(self) -> None:
+        self.add_ssh_key(name="default")
+        for _ in range(self.spec.nodes):
+            self._add_generated_node()
+
+        free_node_ids: List[str] = list(self.nodes)
+        for index in range(self.spec.clusters):
+            node_ids: List[str] = free_node_ids[: self.spec.nodes_per_cluster]
+            del free_node_ids[: self.spec.nodes_per_cluster]
+            self._add_generated_cluster(index, node_ids)
+
+        cluster_ids: List[str] = list(self.clusters)
+        for index in range(self.spec.workspaces if cluster_ids else 0):
+            self.add_workspace(
+                name=f"workspace-{index:05d}",
+                cluster_id=cluster_ids[index % len(cluster_ids)],
+                template_name=WORKSPACE_TEMPLATES[index % len(WORKSPACE_TEMPLATES)],
+                resources={"gpu_count": 1, "cpu_cores": 4, "memory_gb": 16},
+                status="RUNNING",
+            )
+
+    def _hardware(self) -> Dict[str, Any]:
+        gpu: Dict[str, Any] = self._rng.choice(GPU_MODELS)
+        return {
+            **gpu,
+            "gpu_count": self._rng.choice([1, 2, 4, 8]),
+            "cpu_cores": self._rng.choice([16, 32, 64]),
+            "memory_gb": self._rng.choice([64, 128, 256]),
+            "storage_gb": self._rng.choice([500, 1000, 2000]),
+        }
+
+    def _add_generated_node(self) -> None:
+        index: int = len(self.nodes)
+        node_id: str = self.new_id("node")
+        node: Dict[str, Any] = {
+            "id": node_id,
+            "hostname": f"gpu-{index:05d}",
+            "import_time": _timestamp(index),
+            "price_per_hour": round(self._rng.uniform(0.5, 12.0), 2),
+            "node_status": "AVAILABLE",
+            "hardware": self._hardware(),
+        }
+        if self._rng.random() < self.spec.cloud_node_ratio:
+            node.update(
+                node_type="CLOUD",
+                provider=self._rng.choice(CLOUD_PROVIDERS),
+                region="eu-central-1",
+                instance_type=f"{node['hardware']['gpu_type'].lower()}.xlarge",
+            )
+        else:
+            node.update(
+                node_type="SELF_MANAGED",
+                endpoint=f"10.0.{index // 256}.{index % 256}:22",
+                username="ubuntu",
+                ssh_key_id=next(iter(self.ssh_keys)),
+            )
+        self.nodes[node_id] = node
+
+    def _add_generated_cluster(self, index: int, node_ids: List[str]) -> None:
+        cluster_id: str = self.add_cluster(
+            name=f"cluster-{index:05d}",
+            cluster_type="REMOTE",
+            control_plane_node_ids=node_ids[:1],
+            worker_node_ids=node_ids[1:],
+        )
+        self.clusters[cluster_id]["cluster_status"] = "READY"
+        for node_id in node_ids:
+            self.nodes[node_id]["node_status"] = "DEPLOYED"
+
+    def add_ssh_key(self, name: str) -> str:
+        with self.lock:
+            ssh_key_id: str = self.new_id("ssh-key")
+            self.ssh_keys[ssh_key_id] = {
+                "id": ssh_key_id,
+                "name": name,
+                "scope": "private",
+            }
+            return ssh_key_id
+
+    def add_self_managed_node(self, request: Dict[str, Any]) -> str:
+        with self.lock:
+            node_id: str = self.new_id("node")
+            self.nodes[node_id] = {
+                "id": node_id,
+                "node_type": "SELF_MANAGED",
+                "hostname": request["hostname"],
+                "import_time": _timestamp(len(self.nodes)),
+                "price_per_hour": request.get("price_per_hour") or 0.0,
+                "node_status": "AVAILABLE",
+                "endpoint": request["endpoint"],
+                "username": request["username"],
+                "ssh_key_id": request["ssh_key_id"],
+                "hardware": self._hardware(),
+            }
+            return node_id
+
+    def add_cluster(
+        self,
+        name: str,
+        cluster_type: str,
+        control_plane_node_ids: Optional[List[str]] = None,
+        worker_node_ids: Optional[List[str]] = None,
+    ) -> str:
+        with self.lock:
+            cluster_id: str = self.new_id("cluster")
+            self.clusters[cluster_id] = {
+                "id": cluster_id,
+                "name": name,
+                "cluster_type": cluster_type,
+                "cluster_status": "PENDING",
+                "created_at": _timestamp(len(self.clusters)),
+                "owner_username": "fake-user",
+                "control_plane_node_ids": list(control_plane_node_ids or []),
+                "worker_node_ids": list(worker_node_ids or []),
+            }
+            return cluster_id
+
+    def add_workspace(
+        self,
+        name: str,
+        cluster_id: str,
+        template_name: str,
+        resources: Dict[str, Any],
+        status: str = "PENDING",
+    ) -> str:
+        with self.lock:
+            workspace_id: str = self.new_id("workspace")
+            self.workspaces[workspace_id] = {
+                "id": workspace_id,
+                "name": name,
+                "cluster_id": cluster_id,
+                "workspace_status": status,
+                "template": {"name": template_name, "variables": {}},
+                "resources": resources,
+                "created_at": _timestamp(len(self.workspaces)),
+            }
+            return workspace_id
+
+    def remove_node(self, node_id: str) -> None:
+        with self.lock:
+            del self.nodes[node_id]
+            for cluster in self.clusters.values():
+                for key in ("control_plane_node_ids", "worker_node_ids"):
+                    if node_id in cluster[key]:
+                        cluster[key].remove(node_id)
+
+    def cluster_node_ids(self, cluster_id: str) -> List[str]:
+        cluster: Dict[str, Any] = self.clusters[cluster_id]
+        return cluster["control_plane_node_ids"] + cluster["worker_node_ids"]
+
+    def cluster_events(self, cluster_id: str) -> Iterator[Dict[str, Any]]:
+        """The log stream of a cluster, the same for every request."""
+        name: str = self.clusters[cluster_id]["name"]
+        for index in range(self.spec.events_per_cluster):
+            yield {
+                "watch_event_type": "ADDED",
+                "namespace": name,
+                "involved_object": {
+                    "kind": "Pod",
+                    "name": f"{name}-pod-{index}",
+                    "namespace": name,
+                },
+                "type": "Normal",
+                "reason": "Scheduled",
+                "message": f"Event {index} of cluster {name}",
+                "timestamp": _timestamp(index),
+            }
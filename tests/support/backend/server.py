@@ -0,0 +1,384 @@
+import json
+import math
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from tests.support.backend.auth import FakeAuthServer
+from tests.support.backend.faults import FaultInjector, FaultProfile
+from tests.support.backend.fleet import WORKSPACE_TEMPLATES, Fleet, FleetSpec
+from tests.support.http import FaultInjectingServer, ScriptedResponse
+
+
+class _Request:
+    def __init__(
+        self,
+        params: Dict[str, str],
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        body: bytes,
+    ):
+        self.params: Dict[str, str] = params
+        self.query: Dict[str, str] = query
+        self.headers: Dict[str, str] = headers
+        self.body: bytes = body
+
+    def json(self) -> Dict[str, Any]:
+        return json.loads(self.body or b"{}")
+
+    def form(self) -> Dict[str, str]:
+        # The Auth0 commands post JSON; the form encoding is accepted as well.
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            return {key: str(value) for key, value in self.json().items()}
+        return {key: values[0] for key, values in parse_qs(self.body.decode()).items()}
+
+
+_Handler = Callable[[_Request], ScriptedResponse]
+
+
+class _NotFound(Exception):
+    pass
+
+
+def _error(status: int, title: str, detail: str, instance: str) -> ScriptedResponse:
+    return ScriptedResponse(
+        status=status,
+        body={
+            "detail": {
+                "type": "about:blank",
+                "title": title,
+                "status": status,
+                "detail": detail,
+                "instance": instance,
+            }
+        },
+    )
+
+
+class FakeExalsiusBackend(FaultInjectingServer):
+    """
+    A local stand-in for the exalsius API and its Auth0 tenant.
+
+    Serves the endpoints of the SDK's ClustersApi, NodesApi, WorkspacesApi and
+    ManagementApi that the CLI uses, the NDJSON log stream of clusters, and
+    the Auth0 token endpoints, from a synthetic `Fleet`. The API endpoints
+    require a bearer token, which is not checked further. Responses can be
+    delayed, failed and rate limited with a `FaultProfile`; as with the
+    parent class, scripted responses take precedence and are not subject to
+    faults. The backend is thread safe and keeps requests alive, like the
+    real one.
+    """
+
+    def __init__(
+        self,
+        fleet: Optional[Fleet] = None,
+        faults: Optional[FaultProfile] = None,
+    ):
+        super().__init__()
+        self.fleet: Fleet = fleet or Fleet(FleetSpec())
+        self.faults: FaultInjector = FaultInjector(faults or FaultProfile())
+        self.auth: FakeAuthServer = FakeAuthServer(issuer_host=self.host)
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+        self._in_flight_lock: threading.Lock = threading.Lock()
+        self._routes: List[Tuple[str, Pattern[str], _Handler]] = []
+        self._register_routes()
+
+    @property
+    def host(self) -> str:
+        """The host and port, which is the Auth0 domain of the fake tenant."""
+        return f"127.0.0.1:{self.server_address[1]}"
+
+    def set_faults(self, faults: FaultProfile) -> None:
+        self.faults = FaultInjector(faults)
+
+    def _route(self, method: str, pattern: str, handler: _Handler) -> None:
+        regex: str = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", pattern)
+        self._routes.append((method, re.compile(f"^{regex}$"), handler))
+
+    def respond(
+        self, method: str, path: str, headers: Dict[str, str], body: bytes
+    ) -> ScriptedResponse:
+        with self._in_flight_lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return self._respond(method, path, headers, body)
+        finally:
+            with self._in_flight_lock:
+                self.in_flight -= 1
+
+    def _respond(
+        self, method: str, path: str, headers: Dict[str, str], body: bytes
+    ) -> ScriptedResponse:
+        retry_after: Optional[float] = self.faults.retry_after()
+        if retry_after is not None:
+            return ScriptedResponse(
+                status=429,
+                body={"detail": "rate limited"},
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+        delay: float = self.faults.delay()
+        if delay:
+            time.sleep(delay)
+        if self.faults.fails():
+            status: int = self.faults.profile.error_status
+            return _error(status, "Injected fault", "injected fault", path)
+
+        url = urlsplit(path)
+        query: Dict[str, str] = {
+            key: values[0] for key, values in parse_qs(url.query).items()
+        }
+        for route_method, pattern, handler in self._routes:
+            match: Optional[re.Match[str]] = pattern.match(url.path)
+            if route_method != method or match is None:
+                continue
+            is_auth_route: bool = url.path.startswith(("/oauth/", "/.well-known/"))
+            if not is_auth_route and not headers.get("Authorization", "").startswith(
+                "Bearer "
+            ):
+                return _error(401, "Unauthorized", "missing bearer token", url.path)
+            try:
+                with self.fleet.lock:
+                    return handler(_Request(match.groupdict(), query, headers, body))
+            except (_NotFound, KeyError) as e:
+                return _error(404, "Not Found", f"not found: {e}", url.path)
+        return _error(404, "Not Found", f"no route for {method} {url.path}", url.path)
+
+    def _register_routes(self) -> None:
+        route = self._route
+        route("GET", "/clusters", self._list_clusters)
+        route("POST", "/clusters", self._create_cluster)
+        route("GET", "/cluster/{cluster_id}", self._get_cluster)
+        route("DELETE", "/cluster/{cluster_id}", self._delete_cluster)
+        route("POST", "/cluster/{cluster_id}/deploy", self._deploy_cluster)
+        route("GET", "/cluster/{cluster_id}/nodes", self._get_cluster_nodes)
+        route("POST", "/cluster/{cluster_id}/nodes", self._add_cluster_nodes)
+        route(
+            "DELETE",
+            "/cluster/{cluster_id}/nodes/{node_id}",
+            self._remove_cluster_node,
+        )
+        route("GET", "/cluster/{cluster_id}/resources", self._get_cluster_resources)
+        route("GET", "/cluster/{cluster_id}/kubeconfig", self._get_kubeconfig)
+        route("GET", "/cluster/{cluster_id}/logs", self._stream_cluster_logs)
+        route("GET", "/nodes", self._list_nodes)
+        route("GET", "/node/{node_id}", self._get_node)
+        route("DELETE", "/node/{node_id}", self._delete_node)
+        route("POST", "/node/import/ssh", self._import_ssh_node)
+        route("GET", "/workspaces", self._list_workspaces)
+        route("POST", "/workspaces", self._create_workspace)
+        route("GET", "/workspace/{workspace_id}", self._get_workspace)
+        route("DELETE", "/workspace/{workspace_id}", self._delete_workspace)
+        route("GET", "/management/ssh-keys", self._list_ssh_keys)
+        route("POST", "/management/ssh-keys", self._add_ssh_key)
+        route("DELETE", "/management/ssh-key/{ssh_key_id}", self._delete_ssh_key)
+        route("GET", "/management/workspace-templates", self._list_workspace_templates)
+        route("GET", "/management/dashboard-url", self._get_dashboard_url)
+        route("POST", "/oauth/device/code", lambda r: self.auth.device_code(r.form()))
+        route("POST", "/oauth/token", lambda r: self.auth.token(r.form()))
+        route("POST", "/oauth/revoke", lambda r: ScriptedResponse(body={}))
+        route("GET", "/.well-known/jwks.json", lambda r: self.auth.jwks())
+
+    # Clusters
+
+    def _list_clusters(self, request: _Request) -> ScriptedResponse:
+        status: Optional[str] = request.query.get("cluster_status")
+        clusters: List[Dict[str, Any]] = [
+            cluster
+            for cluster in self.fleet.clusters.values()
+            if status is None or cluster["cluster_status"] == status
+        ]
+        return ScriptedResponse(body={"clusters": clusters, "total": len(clusters)})
+
+    def _create_cluster(self, request: _Request) -> ScriptedResponse:
+        payload: Dict[str, Any] = request.json()
+        cluster_id: str = self.fleet.add_cluster(
+            name=payload["name"],
+            cluster_type=payload["cluster_type"],
+            control_plane_node_ids=payload.get("control_plane_node_ids"),
+            worker_node_ids=payload.get("worker_node_ids"),
+        )
+        for node_id in self.fleet.cluster_node_ids(cluster_id):
+            self.fleet.nodes[node_id]["node_status"] = "ADDED"
+        return ScriptedResponse(status=201, body={"cluster_id": cluster_id})
+
+    def _get_cluster(self, request: _Request) -> ScriptedResponse:
+        cluster: Dict[str, Any] = self.fleet.clusters[request.params["cluster_id"]]
+        return ScriptedResponse(body={"cluster": cluster})
+
+    def _delete_cluster(self, request: _Request) -> ScriptedResponse:
+        cluster_id: str = request.params["cluster_id"]
+        node_ids: List[str] = self.fleet.cluster_node_ids(cluster_id)
+        del self.fleet.clusters[cluster_id]
+        for node_id in node_ids:
+            self.fleet.nodes[node_id]["node_status"] = "AVAILABLE"
+        return ScriptedResponse(body={"cluster_id": cluster_id, "node_ids": node_ids})
+
+    def _deploy_cluster(self, request: _Request) -> ScriptedResponse:
+        # Deployments finish at once.
+        cluster_id: str = request.params["cluster_id"]
+        self.fleet.clusters[cluster_id]["cluster_status"] = "READY"
+        for node_id in self.fleet.cluster_node_ids(cluster_id):
+            self.fleet.nodes[node_id]["node_status"] = "DEPLOYED"
+        return ScriptedResponse(status=202, body={"cluster_id": cluster_id})
+
+    def _cluster_nodes_body(self, cluster_id: str) -> Dict[str, Any]:
+        cluster: Dict[str, Any] = self.fleet.clusters[cluster_id]
+        return {
+            "cluster_id": cluster_id,
+            "control_plane_node_ids": cluster["control_plane_node_ids"],
+            "worker_node_ids": cluster["worker_node_ids"],
+            "total_nodes": len(self.fleet.cluster_node_ids(cluster_id)),
+        }
+
+    def _get_cluster_nodes(self, request: _Request) -> ScriptedResponse:
+        return ScriptedResponse(
+            body=self._cluster_nodes_body(request.params["cluster_id"])
+        )
+
+    def _add_cluster_nodes(self, request: _Request) -> ScriptedResponse:
+        cluster_id: str = request.params["cluster_id"]
+        cluster: Dict[str, Any] = self.fleet.clusters[cluster_id]
+        for node in request.json()["nodes_to_add"]:
+            role_key: str = (
+                "control_plane_node_ids"
+                if node["node_role"] == "CONTROL_PLANE"
+                else "worker_node_ids"
+            )
+            cluster[role_key].append(node["node_id"])
+            self.fleet.nodes[node["node_id"]]["node_status"] = "DEPLOYED"
+        return ScriptedResponse(status=201, body=self._cluster_nodes_body(cluster_id))
+
+    def _remove_cluster_node(self, request: _Request) -> ScriptedResponse:
+        cluster: Dict[str, Any] = self.fleet.clusters[request.params["cluster_id"]]
+        node_id: str = request.params["node_id"]
+        for key in ("control_plane_node_ids", "worker_node_ids"):
+            if node_id in cluster[key]:
+                cluster[key].remove(node_id)
+                self.fleet.nodes[node_id]["node_status"] = "AVAILABLE"
+                return ScriptedResponse(status=202, body={"node_id": node_id})
+        raise _NotFound(node_id)
+
+    def _get_cluster_resources(self, request: _Request) -> ScriptedResponse:
+        resources: List[Dict[str, Any]] = []
+        for node_id in self.fleet.cluster_node_ids(request.params["cluster_id"]):
+            node: Dict[str, Any] = self.fleet.nodes[node_id]
+            resources.append(
+                {
+                    "node_id": node_id,
+                    "node_name": node["hostname"],
+                    "available": node["hardware"],
+                    "occupied": {**node["hardware"], "gpu_count": 0, "cpu_cores": 0},
+                }
+            )
+        return ScriptedResponse(body={"resources": resources, "total": len(resources)})
+
+    def _get_kubeconfig(self, request: _Request) -> ScriptedResponse:
+        cluster: Dict[str, Any] = self.fleet.clusters[request.params["cluster_id"]]
+        return ScriptedResponse(
+            body={"kubeconfig": f"apiVersion: v1\nkind: Config\n# {cluster['name']}\n"}
+        )
+
+    def _stream_cluster_logs(self, request: _Request) -> ScriptedResponse:
+        cluster_id: str = request.params["cluster_id"]
+        if cluster_id not in self.fleet.clusters:
+            raise _NotFound(cluster_id)
+        # Materialized under the fleet lock; sent after it is released.
+        return ScriptedResponse(
+            ndjson_lines=list(self.fleet.cluster_events(cluster_id))
+        )
+
+    # Nodes
+
+    def _list_nodes(self, request: _Request) -> ScriptedResponse:
+        nodes: List[Dict[str, Any]] = [
+            node
+            for node in self.fleet.nodes.values()
+            if request.query.get("node_type") in (None, node.get("node_type"))
+            and request.query.get("provider") in (None, node.get("provider"))
+        ]
+        sort_field: Optional[str] = request.query.get("sort_field")
+        if sort_field is not None:
+            key: str = "import_time" if sort_field == "CREATED_AT" else "hostname"
+            nodes.sort(
+                key=lambda node: node[key],
+                reverse=request.query.get("order_by") == "DESC",
+            )
+        return ScriptedResponse(body={"nodes": nodes, "total": len(nodes)})
+
+    def _get_node(self, request: _Request) -> ScriptedResponse:
+        return ScriptedResponse(body=self.fleet.nodes[request.params["node_id"]])
+
+    def _delete_node(self, request: _Request) -> ScriptedResponse:
+        node_id: str = request.params["node_id"]
+        self.fleet.remove_node(node_id)
+        return ScriptedResponse(body={"node_id": node_id})
+
+    def _import_ssh_node(self, request: _Request) -> ScriptedResponse:
+        node_id: str = self.fleet.add_self_managed_node(request.json())
+        return ScriptedResponse(status=201, body={"node_ids": [node_id], "total": 1})
+
+    # Workspaces
+
+    def _list_workspaces(self, request: _Request) -> ScriptedResponse:
+        cluster_id: Optional[str] = request.query.get("cluster_id")
+        workspaces: List[Dict[str, Any]] = [
+            workspace
+            for workspace in self.fleet.workspaces.values()
+            if cluster_id is None or workspace["cluster_id"] == cluster_id
+        ]
+        return ScriptedResponse(
+            body={"workspaces": workspaces, "total": len(workspaces)}
+        )
+
+    def _create_workspace(self, request: _Request) -> ScriptedResponse:
+        payload: Dict[str, Any] = request.json()
+        if payload["cluster_id"] not in self.fleet.clusters:
+            raise _NotFound(payload["cluster_id"])
+        workspace_id: str = self.fleet.add_workspace(
+            name=payload["name"],
+            cluster_id=payload["cluster_id"],
+            template_name=payload["template"]["name"],
+            resources=payload["resources"],
+            status="RUNNING",
+        )
+        return ScriptedResponse(status=201, body={"workspace_id": workspace_id})
+
+    def _get_workspace(self, request: _Request) -> ScriptedResponse:
+        workspace: Dict[str, Any] = self.fleet.workspaces[
+            request.params["workspace_id"]
+        ]
+        return ScriptedResponse(body={"workspace": workspace})
+
+    def _delete_workspace(self, request: _Request) -> ScriptedResponse:
+        workspace_id: str = request.params["workspace_id"]
+        del self.fleet.workspaces[workspace_id]
+        return ScriptedResponse(body={"workspace_id": workspace_id})
+
+    # Management
+
+    def _list_ssh_keys(self, request: _Request) -> ScriptedResponse:
+        ssh_keys: List[Dict[str, Any]] = list(self.fleet.ssh_keys.values())
+        return ScriptedResponse(body={"ssh_keys": ssh_keys, "total": len(ssh_keys)})
+
+    def _add_ssh_key(self, request: _Request) -> ScriptedResponse:
+        ssh_key_id: str = self.fleet.add_ssh_key(name=request.json()["name"])
+        return ScriptedResponse(status=201, body={"ssh_key_id": ssh_key_id})
+
+    def _delete_ssh_key(self, request: _Request) -> ScriptedResponse:
+        del self.fleet.ssh_keys[request.params["ssh_key_id"]]
+        return ScriptedResponse(status=204)
+
+    def _list_workspace_templates(self, request: _Request) -> ScriptedResponse:
+        templates: List[Dict[str, Any]] = [
+            {"name": name, "variables": {}} for name in WORKSPACE_TEMPLATES
+        ]
+        return ScriptedResponse(
+            body={"workspace_templates": templates, "total": len(templates)}
+        )
+
+    def _get_dashboard_url(self, request: _Request) -> ScriptedResponse:
+        return ScriptedResponse(body={"url": f"{self.url}/dashboard"})
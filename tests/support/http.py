@@ -0,0 +1,140 @@
+import json
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, cast
+
+
+class ScriptedResponse:
+    """
+    A response of the test server.
+
+    The body is sent as one JSON document, or, if `ndjson_lines` is given, as
+    a chunked NDJSON stream with one line per item.
+    """
+
+    def __init__(
+        self,
+        status: int = 200,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        ndjson_lines: Optional[Iterable[Any]] = None,
+    ):
+        self.status: int = status
+        self.body: Optional[Any] = body
+        self.headers: Dict[str, str] = headers or {}
+        self.ndjson_lines: Optional[Iterable[Any]] = ndjson_lines
+
+
+class FaultInjectingServer(ThreadingHTTPServer):
+    """
+    A local HTTP server that answers with scripted responses.
+
+    Responses queued with `script` are returned in order for the requests to a
+    path; once they are used up, the server answers with `respond`, which
+    returns 200 with `default_body` unless a subclass overrides it. Every
+    request is recorded as a (method, path) tuple, and its headers in
+    `request_headers`.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, default_body: Any = None):
+        super().__init__(("127.0.0.1", 0), _ScriptedHandler)
+        self.default_body: Any = default_body if default_body is not None else {}
+        self.requests: List[Tuple[str, str]] = []
+        self.request_headers: List[Dict[str, str]] = []
+        self._scripts: Dict[str, Deque[ScriptedResponse]] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._thread: threading.Thread = threading.Thread(
+            target=self.serve_forever, daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def script(self, path: str, *responses: ScriptedResponse) -> None:
+        with self._lock:
+            self._scripts.setdefault(path, deque()).extend(responses)
+
+    def next_response(
+        self, method: str, path: str, headers: Dict[str, str], body: bytes = b""
+    ) -> ScriptedResponse:
+        with self._lock:
+            self.requests.append((method, path))
+            self.request_headers.append(headers)
+            queued: Optional[Deque[ScriptedResponse]] = self._scripts.get(path)
+            if queued:
+                return queued.popleft()
+        return self.respond(method, path, headers, body)
+
+    def respond(
+        self, method: str, path: str, headers: Dict[str, str], body: bytes
+    ) -> ScriptedResponse:
+        """Answer a request that has no scripted response."""
+        return ScriptedResponse(body=self.default_body)
+
+    def start(self) -> "FaultInjectingServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+
+class _ScriptedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # The headers and the body are written separately; with Nagle's algorithm
+    # the body of a keep-alive response would wait for the client's delayed ACK.
+    disable_nagle_algorithm = True
+
+    @property
+    def backend(self) -> FaultInjectingServer:
+        return cast(FaultInjectingServer, self.server)
+
+    def _respond(self) -> None:
+        length: int = int(self.headers.get("Content-Length") or 0)
+        request_body: bytes = self.rfile.read(length) if length else b""
+        response: ScriptedResponse = self.backend.next_response(
+            self.command, self.path, dict(self.headers.items()), request_body
+        )
+        if response.ndjson_lines is not None:
+            self._stream(response)
+            return
+        # Responses to these statuses have no body.
+        body: bytes = (
+            b"" if response.status in (204, 304) else json.dumps(response.body).encode()
+        )
+        self.send_response(response.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, response: ScriptedResponse) -> None:
+        assert response.ndjson_lines is not None
+        self.send_response(response.status)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        try:
+            for item in response.ndjson_lines:
+                line: bytes = json.dumps(item).encode() + b"\n"
+                self.wfile.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # The client closed the stream early.
+            self.close_connection = True
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
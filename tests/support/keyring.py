@@ -0,0 +1,52 @@
+import time
+from typing import Dict, Iterator, Optional, Tuple
+
+import keyring
+from keyring.backend import KeyringBackend
+from keyring.errors import PasswordDeleteError
+
+
+class InMemoryKeyring(KeyringBackend):
+    """
+    A keyring backend that keeps passwords in memory and counts round trips.
+
+    `latency_seconds` simulates the cost of a round trip to a real keyring
+    service, e.g. a D-Bus call to SecretService.
+    """
+
+    priority = 1  # pyright: ignore[reportAssignmentType]
+
+    def __init__(self, latency_seconds: float = 0.0):
+        super().__init__()
+        self.latency_seconds: float = latency_seconds
+        self.passwords: Dict[Tuple[str, str], str] = {}
+        self.round_trips: int = 0
+
+    def _round_trip(self) -> None:
+        self.round_trips += 1
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+
+    def get_password(self, service: str, username: str) -> Optional[str]:
+        self._round_trip()
+        return self.passwords.get((service, username))
+
+    def set_password(self, service: str, username: str, password: str) -> None:
+        self._round_trip()
+        self.passwords[(service, username)] = password
+
+    def delete_password(self, service: str, username: str) -> None:
+        self._round_trip()
+        if self.passwords.pop((service, username), None) is None:
+            raise PasswordDeleteError(f"{username} not found")
+
+
+def use_in_memory_keyring(latency_seconds: float = 0.0) -> Iterator[InMemoryKeyring]:
+    """Install an in-memory keyring for the duration of a fixture."""
+    previous: KeyringBackend = keyring.get_keyring()
+    backend: InMemoryKeyring = InMemoryKeyring(latency_seconds)
+    keyring.set_keyring(backend)
+    try:
+        yield backend
+    finally:
+        keyring.set_keyring(previous)
@@ -1,4 +1,6 @@
+import contextlib
 from datetime import datetime, timedelta, timezone
+from typing import Generator, List
 from unittest.mock import Mock
 
 import pytest
@@ -10,6 +12,7 @@ from exls.auth.core.domain import (
     User,
 )
 from exls.auth.core.ports.device_code_operations import DeviceCodeOperations
+from exls.auth.core.ports.lock import TokenRefreshLock, TokenRefreshLockTimeoutError
 from exls.auth.core.ports.operations import AuthError, AuthOperations
 from exls.auth.core.ports.repository import TokenRepository, TokenRepositoryError
 from exls.auth.core.service import AuthService, NotLoggedInWarning
@@ -262,3 +265,176 @@ def test_logout_delete_failed(
 
     with pytest.raises(Exception, match="Disk error"):
         auth_service.logout()
+
+
+class _FakeRefreshLock(TokenRefreshLock):
+    def __init__(self, timeout: bool = False):
+        self.timeout: bool = timeout
+        self.held_for: List[str] = []
+
+    @contextlib.contextmanager
+    def hold(self, client_id: str) -> Generator[None, None, None]:
+        if self.timeout:
+            raise TokenRefreshLockTimeoutError("timed out")
+        self.held_for.append(client_id)
+        yield
+
+
+def _loaded_token(expires_in: timedelta, access_token: str = "acc") -> LoadedToken:
+    return LoadedToken(
+        client_id="client-id",
+        access_token=access_token,
+        id_token="id-token",
+        refresh_token="refresh-token",
+        expiry=datetime.now(timezone.utc) + expires_in,
+    )
+
+
+def _refresh_ahead_service(
+    mock_auth_operations: Mock,
+    mock_device_code_operations: Mock,
+    mock_token_repository: Mock,
+    refresh_lock: TokenRefreshLock,
+) -> AuthService:
+    mock_auth_operations.get_client_id.return_value = "client-id"
+    mock_auth_operations.refresh_access_token.return_value = Token(
+        client_id="client-id",
+        access_token="new-access-token",
+        id_token="new-id-token",
+        scope="scope",
+        token_type="Bearer",
+        refresh_token="new-refresh-token",
+        expires_in=3600,
+    )
+    user: User = User(email="test@example.com", nickname="testuser", sub="user-123")
+    mock_auth_operations.validate_token.return_value = user
+    mock_auth_operations.decode_user_from_token.return_value = user
+    return AuthService(
+        mock_auth_operations,
+        mock_token_repository,
+        device_code_operations=mock_device_code_operations,
+        refresh_ahead_seconds=300,
+        refresh_lock=refresh_lock,
+    )
+
+
+def test_acquire_access_token_refreshes_ahead_of_expiry(
+    mock_auth_operations: Mock,
+    mock_device_code_operations: Mock,
+    mock_token_repository: Mock,
+):
+    lock = _FakeRefreshLock()
+    service = _refresh_ahead_service(
+        mock_auth_operations, mock_device_code_operations, mock_token_repository, lock
+    )
+    expiring_token: LoadedToken = _loaded_token(timedelta(minutes=2))
+    mock_token_repository.load.return_value = expiring_token
+    mock_token_repository.reload.return_value = expiring_token
+
+    session: AuthSession = service.acquire_access_token()
+
+    assert session.token.access_token == "new-access-token"
+    assert lock.held_for == ["client-id"]
+    mock_auth_operations.refresh_access_token.assert_called_once_with(
+        refresh_token="refresh-token"
+    )
+    mock_token_repository.store.assert_called_once()
+
+
+def test_acquire_access_token_outside_refresh_ahead_window_does_not_refresh(
+    mock_auth_operations: Mock,
+    mock_device_code_operations: Mock,
+    mock_token_repository: Mock,
+):
+    lock = _FakeRefreshLock()
+    service = _refresh_ahead_service(
+        mock_auth_operations, mock_device_code_operations, mock_token_repository, lock
+    )
+    mock_token_repository.load.return_value = _loaded_token(timedelta(minutes=30))
+
+    session: AuthSession = service.acquire_access_token()
+
+    assert session.token.access_token == "acc"
+    assert lock.held_for == []
+    mock_auth_operations.refresh_access_token.assert_not_called()
+
+
+def test_acquire_access_token_reuses_token_refreshed_by_another_process(
+    mock_auth_operations: Mock,
+    mock_device_code_operations: Mock,
+    mock_token_repository: Mock,
+):
+    service = _refresh_ahead_service(
+        mock_auth_operations,
+        mock_device_code_operations,
+        mock_token_repository,
+        _FakeRefreshLock(),
+    )
+    mock_token_repository.load.return_value = _loaded_token(timedelta(minutes=2))
+    mock_token_repository.reload.return_value = _loaded_token(
+        timedelta(hours=1), access_token="winner-access-token"
+    )
+
+    session: AuthSession = service.acquire_access_token()
+
+    assert session.token.access_token == "winner-access-token"
+    mock_auth_operations.refresh_access_token.assert_not_called()
+    mock_token_repository.store.assert_not_called()
+
+
+def test_acquire_access_token_lock_timeout_uses_still_valid_token(
+    mock_auth_operations: Mock,
+    mock_device_code_operations: Mock,
+    mock_token_repository: Mock,
+):
+    service = _refresh_ahead_service(
+        mock_auth_operations,
+        mock_device_code_operations,
+        mock_token_repository,
+        _FakeRefreshLock(timeout=True),
+    )
+    mock_token_repository.load.return_value = _loaded_token(timedelta(minutes=2))
+
+    session: AuthSession = service.acquire_access_token()
+
+    assert session.token.access_token == "acc"
+    mock_auth_operations.refresh_access_token.assert_not_called()
+
+
+def test_acquire_access_token_lock_timeout_refreshes_expired_token(
+    mock_auth_operations: Mock,
+    mock_device_code_operations: Mock,
+    mock_token_repository: Mock,
+):
+    service = _refresh_ahead_service(
+        mock_auth_operations,
+        mock_device_code_operations,
+        mock_token_repository,
+        _FakeRefreshLock(timeout=True),
+    )
+    mock_token_repository.load.return_value = _loaded_token(-timedelta(minutes=1))
+
+    session: AuthSession = service.acquire_access_token()
+
+    assert session.token.access_token == "new-access-token"
+
+
+def test_acquire_access_token_failed_early_refresh_falls_back_to_current_token(
+    mock_auth_operations: Mock,
+    mock_device_code_operations: Mock,
+    mock_token_repository: Mock,
+):
+    service = _refresh_ahead_service(
+        mock_auth_operations,
+        mock_device_code_operations,
+        mock_token_repository,
+        _FakeRefreshLock(),
+    )
+    expiring_token: LoadedToken = _loaded_token(timedelta(minutes=2))
+    mock_token_repository.load.return_value = expiring_token
+    mock_token_repository.reload.return_value = expiring_token
+    mock_auth_operations.refresh_access_token.side_effect = AuthError("unavailable")
+
+    session: AuthSession = service.acquire_access_token()
+
+    assert session.token.access_token == "acc"
@@ -3,7 +3,12 @@
 from unittest.mock import patch
 
 from exls.auth.adapters.bundle import AuthBundle
+from exls.auth.adapters.file.file import EncryptedFileTokenAdapter
+from exls.auth.adapters.keyring.keyring import KeyringAdapter
+from exls.auth.adapters.memory.memory import InMemoryTokenCache
 from exls.auth.core.domain import AuthFlowType
+from exls.config import AppConfig, TokenStoreBackend
+from exls.state import AppState
 
 
 class TestDetectAuthFlow:
@@ -85,3 +90,22 @@ class TestDetectAuthFlow:
             mock_sys.platform = "darwin"
             result = AuthBundle.detect_auth_flow()
             assert result == AuthFlowType.DEVICE_CODE
+
+
+class TestGetTokenRepository:
+    def _bundle(self, token_store: TokenStoreBackend) -> AuthBundle:
+        config: AppConfig = AppConfig(token_store=token_store)
+        return AuthBundle(config, AppState(config=config))
+
+    def test_defaults_to_keyring(self):
+        assert AppConfig().token_store == TokenStoreBackend.KEYRING
+        repository = self._bundle(TokenStoreBackend.KEYRING).get_token_repository()
+        assert isinstance(repository, InMemoryTokenCache)
+        assert isinstance(repository._backend, KeyringAdapter)  # type: ignore[reportPrivateUsage]
+
+    def test_encrypted_file(self):
+        repository = self._bundle(
+            TokenStoreBackend.ENCRYPTED_FILE
+        ).get_token_repository()
+        assert isinstance(repository, InMemoryTokenCache)
+        assert isinstance(repository._backend, EncryptedFileTokenAdapter)  # type: ignore[reportPrivateUsage]
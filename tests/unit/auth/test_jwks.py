@@ -0,0 +1,196 @@
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from unittest.mock import MagicMock, patch
+
+import jwt
+import pytest
+from auth0.authentication.exceptions import (  # type: ignore[reportMissingTypeStubs]
+    TokenValidationError,
+)
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from jwt.algorithms import RSAAlgorithm
+
+from exls.auth.adapters.auth0.commands import ValidateTokenCommand
+from exls.auth.adapters.auth0.jwks import (
+    JwksFetcherSignatureVerifier,
+    PersistentJwksFetcher,
+    get_jwks_fetcher,
+)
+from exls.auth.adapters.auth0.requests import ValidateTokenRequest
+from exls.auth.adapters.auth0.responses import ValidatedAuthUserResponse
+
+DOMAIN = "tenant.example.com"
+JWKS_URL = f"https://{DOMAIN}/.well-known/jwks.json"
+CLIENT_ID = "test-client"
+
+
+def _generate_key() -> RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _jwk(private_key: RSAPrivateKey, kid: str) -> Dict[str, Any]:
+    jwk: Dict[str, Any] = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+    return jwk
+
+
+def _id_token(private_key: RSAPrivateKey, kid: str) -> str:
+    now = int(time.time())
+    return jwt.encode(
+        {
+            "iss": f"https://{DOMAIN}/",
+            "aud": CLIENT_ID,
+            "sub": "auth0|123",
+            "email": "user@example.com",
+            "nickname": "user",
+            "iat": now,
+            "exp": now + 3600,
+        },
+        private_key,
+        algorithm="RS256",
+        headers={"kid": kid},
+    )
+
+
+@pytest.fixture(scope="module")
+def keys() -> Tuple[RSAPrivateKey, RSAPrivateKey]:
+    return _generate_key(), _generate_key()
+
+
+class FakeJwksEndpoint:
+    """Serves a local JWKS file in place of the Auth0 endpoint."""
+
+    def __init__(self, jwks_file: Path):
+        self.jwks_file: Path = jwks_file
+        self.requests: List[str] = []
+
+    def publish(self, jwks: Dict[str, Any]) -> None:
+        self.jwks_file.write_text(json.dumps(jwks))
+
+    def get(self, url: str, **_: Any) -> MagicMock:
+        self.requests.append(url)
+        response = MagicMock()
+        response.json.return_value = json.loads(self.jwks_file.read_text())
+        return response
+
+
+@pytest.fixture
+def endpoint(tmp_path: Path) -> Any:
+    fake = FakeJwksEndpoint(tmp_path / "jwks.json")
+    with patch("exls.auth.adapters.auth0.jwks.requests.get", side_effect=fake.get):
+        yield fake
+
+
+def _fetcher(cache_dir: Path, ttl: int = 600) -> PersistentJwksFetcher:
+    return PersistentJwksFetcher(
+        jwks_url=JWKS_URL, cache_file=cache_dir / f"{DOMAIN}.json", cache_ttl=ttl
+    )
+
+
+@pytest.mark.unit
+class TestPersistentJwksFetcher:
+    def test_validate_token_with_cached_key_set(
+        self,
+        tmp_path: Path,
+        endpoint: FakeJwksEndpoint,
+        keys: Tuple[RSAPrivateKey, RSAPrivateKey],
+    ) -> None:
+        endpoint.publish({"keys": [_jwk(keys[0], "kid-1")]})
+        verifier = JwksFetcherSignatureVerifier(_fetcher(tmp_path / "cache"))
+        request = ValidateTokenRequest(
+            domain=DOMAIN,
+            client_id=CLIENT_ID,
+            id_token=_id_token(keys[0], "kid-1"),
+            leeway=0,
+        )
+
+        for _ in range(3):
+            response: ValidatedAuthUserResponse = ValidateTokenCommand(
+                request=request, signature_verifier=verifier
+            ).execute()
+            assert response.email == "user@example.com"
+
+        assert len(endpoint.requests) == 1
+
+    def test_cache_is_shared_across_processes(
+        self,
+        tmp_path: Path,
+        endpoint: FakeJwksEndpoint,
+        keys: Tuple[RSAPrivateKey, RSAPrivateKey],
+    ) -> None:
+        endpoint.publish({"keys": [_jwk(keys[0], "kid-1")]})
+        _fetcher(tmp_path).get_key("kid-1")
+
+        # A new fetcher stands in for another process reading the cache file.
+        _fetcher(tmp_path).get_key("kid-1")
+
+        assert len(endpoint.requests) == 1
+
+    def test_expired_cache_is_refetched(
+        self,
+        tmp_path: Path,
+        endpoint: FakeJwksEndpoint,
+        keys: Tuple[RSAPrivateKey, RSAPrivateKey],
+    ) -> None:
+        endpoint.publish({"keys": [_jwk(keys[0], "kid-1")]})
+        _fetcher(tmp_path).get_key("kid-1")
+        cache_file: Path = tmp_path / f"{DOMAIN}.json"
+        entry: Dict[str, Any] = json.loads(cache_file.read_text())
+        entry["fetched_at"] -= 3600
+        cache_file.write_text(json.dumps(entry))
+
+        _fetcher(tmp_path, ttl=600).get_key("kid-1")
+
+        assert len(endpoint.requests) == 2
+
+    def test_unknown_kid_triggers_single_refetch(
+        self,
+        tmp_path: Path,
+        endpoint: FakeJwksEndpoint,
+        keys: Tuple[RSAPrivateKey, RSAPrivateKey],
+    ) -> None:
+        endpoint.publish({"keys": [_jwk(keys[0], "kid-1")]})
+        fetcher: PersistentJwksFetcher = _fetcher(tmp_path)
+        fetcher.get_key("kid-1")
+
+        # The keys are rotated.
+        endpoint.publish({"keys": [_jwk(keys[1], "kid-2")]})
+        fetcher.get_key("kid-2")
+        assert len(endpoint.requests) == 2
+
+        with pytest.raises(TokenValidationError):
+            _fetcher(tmp_path).get_key("kid-unknown")
+        assert len(endpoint.requests) == 3
+
+    def test_refetch_reuses_key_set_fetched_by_another_process(
+        self,
+        tmp_path: Path,
+        endpoint: FakeJwksEndpoint,
+        keys: Tuple[RSAPrivateKey, RSAPrivateKey],
+    ) -> None:
+        endpoint.publish({"keys": [_jwk(keys[0], "kid-1")]})
+        stale: PersistentJwksFetcher = _fetcher(tmp_path)
+        stale.get_key("kid-1")
+
+        endpoint.publish({"keys": [_jwk(keys[1], "kid-2")]})
+        time.sleep(0.01)
+        # Another process sees the rotated key first and updates the cache file.
+        _fetcher(tmp_path).get_key("kid-2")
+        requests_before: int = len(endpoint.requests)
+
+        stale.get_key("kid-2")
+
+        assert len(endpoint.requests) == requests_before
+
+
+@pytest.mark.unit
+def test_get_jwks_fetcher_is_shared_per_domain(tmp_path: Path) -> None:
+    assert get_jwks_fetcher(DOMAIN, tmp_path, 600) is get_jwks_fetcher(
+        DOMAIN, tmp_path, 600
+    )
+    assert get_jwks_fetcher(DOMAIN, tmp_path, 600) is not get_jwks_fetcher(
+        "other.example.com", tmp_path, 600
+    )
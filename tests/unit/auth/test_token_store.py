@@ -0,0 +1,254 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+from cryptography.fernet import Fernet
+from pydantic import SecretStr
+
+from exls.auth.adapters.file.commands import LoadOrCreateFernetKeyCommand
+from exls.auth.adapters.file.config import EncryptedFileTokenStoreConfig
+from exls.auth.adapters.file.file import EncryptedFileTokenAdapter
+from exls.auth.adapters.keyring.commands import (
+    KeyringKeys,
+    StoreTokenOnKeyringCommand,
+)
+from exls.auth.adapters.keyring.keyring import KeyringAdapter
+from exls.auth.adapters.lock.lock import FileTokenRefreshLock
+from exls.auth.adapters.memory.memory import InMemoryTokenCache
+from exls.auth.core.domain import LoadedToken, Token
+from exls.auth.core.ports.lock import TokenRefreshLockTimeoutError
+from exls.auth.core.ports.repository import TokenRepositoryError
+from tests.support.keyring import InMemoryKeyring, use_in_memory_keyring
+
+CLIENT_ID = "test-client"
+
+
+@pytest.fixture
+def fake_keyring() -> Iterator[InMemoryKeyring]:
+    yield from use_in_memory_keyring()
+
+
+@pytest.fixture(autouse=True)
+def clear_memory_cache() -> Iterator[None]:
+    InMemoryTokenCache.clear()
+    yield
+    InMemoryTokenCache.clear()
+
+
+@pytest.fixture
+def token() -> Token:
+    return Token(
+        client_id=CLIENT_ID,
+        access_token="access",
+        id_token="id",
+        scope="openid",
+        token_type="Bearer",
+        refresh_token="refresh",
+        expires_in=3600,
+    )
+
+
+def _assert_same_token(loaded: LoadedToken, token: Token) -> None:
+    assert loaded.client_id == token.client_id
+    assert loaded.access_token == token.access_token
+    assert loaded.id_token == token.id_token
+    assert loaded.refresh_token == token.refresh_token
+    assert abs((loaded.expiry - token.expiry).total_seconds()) < 5
+
+
+@pytest.mark.unit
+class TestKeyringAdapter:
+    def test_store_and_load_use_a_single_entry(
+        self, fake_keyring: InMemoryKeyring, token: Token
+    ) -> None:
+        adapter = KeyringAdapter()
+
+        adapter.store(token)
+        assert list(fake_keyring.passwords.keys()) == [
+            (KeyringKeys.SERVICE_KEY, f"{CLIENT_ID}_{KeyringKeys.TOKEN_RECORD_KEY}")
+        ]
+
+        fake_keyring.round_trips = 0
+        loaded: LoadedToken = adapter.load(CLIENT_ID)
+
+        assert fake_keyring.round_trips == 1
+        _assert_same_token(loaded, token)
+
+    def test_load_migrates_legacy_layout(
+        self, fake_keyring: InMemoryKeyring, token: Token
+    ) -> None:
+        StoreTokenOnKeyringCommand(token=token).execute()
+        adapter = KeyringAdapter()
+
+        loaded: LoadedToken = adapter.load(CLIENT_ID)
+
+        _assert_same_token(loaded, token)
+        assert list(fake_keyring.passwords.keys()) == [
+            (KeyringKeys.SERVICE_KEY, f"{CLIENT_ID}_{KeyringKeys.TOKEN_RECORD_KEY}")
+        ]
+        fake_keyring.round_trips = 0
+        _assert_same_token(adapter.load(CLIENT_ID), token)
+        assert fake_keyring.round_trips == 1
+
+    def test_load_without_token_raises(self, fake_keyring: InMemoryKeyring) -> None:
+        with pytest.raises(TokenRepositoryError):
+            KeyringAdapter().load(CLIENT_ID)
+
+    def test_delete_removes_record_and_legacy_entries(
+        self, fake_keyring: InMemoryKeyring, token: Token
+    ) -> None:
+        StoreTokenOnKeyringCommand(token=token).execute()
+        adapter = KeyringAdapter()
+        adapter.store(token)
+
+        adapter.delete(CLIENT_ID)
+
+        assert fake_keyring.passwords == {}
+
+
+@pytest.mark.unit
+class TestInMemoryTokenCache:
+    def test_load_hits_backend_once(
+        self, fake_keyring: InMemoryKeyring, token: Token
+    ) -> None:
+        KeyringAdapter().store(token)
+        fake_keyring.round_trips = 0
+
+        first = InMemoryTokenCache(KeyringAdapter()).load(CLIENT_ID)
+        second = InMemoryTokenCache(KeyringAdapter()).load(CLIENT_ID)
+
+        assert fake_keyring.round_trips == 1
+        assert first == second
+
+    def test_store_writes_through(
+        self, fake_keyring: InMemoryKeyring, token: Token
+    ) -> None:
+        cache = InMemoryTokenCache(KeyringAdapter())
+        cache.store(token)
+        fake_keyring.round_trips = 0
+
+        _assert_same_token(cache.load(CLIENT_ID), token)
+        assert fake_keyring.round_trips == 0
+        _assert_same_token(KeyringAdapter().load(CLIENT_ID), token)
+
+    def test_delete_evicts(self, fake_keyring: InMemoryKeyring, token: Token) -> None:
+        cache = InMemoryTokenCache(KeyringAdapter())
+        cache.store(token)
+
+        cache.delete(CLIENT_ID)
+
+        with pytest.raises(TokenRepositoryError):
+            cache.load(CLIENT_ID)
+
+    def test_reload_bypasses_cache(
+        self, fake_keyring: InMemoryKeyring, token: Token
+    ) -> None:
+        cache = InMemoryTokenCache(KeyringAdapter())
+        cache.store(token)
+        # Another process stores a refreshed token.
+        KeyringAdapter().store(token.model_copy(update={"access_token": "refreshed"}))
+
+        assert cache.load(CLIENT_ID).access_token == token.access_token
+        assert cache.reload(CLIENT_ID).access_token == "refreshed"
+        assert cache.load(CLIENT_ID).access_token == "refreshed"
+
+
+@pytest.mark.unit
+class TestFileTokenRefreshLock:
+    def test_hold_times_out_while_held_elsewhere(self, tmp_path: Path) -> None:
+        holder = FileTokenRefreshLock(lock_dir=tmp_path, timeout_seconds=0.1)
+        waiter = FileTokenRefreshLock(lock_dir=tmp_path, timeout_seconds=0.1)
+
+        with holder.hold(CLIENT_ID):
+            with pytest.raises(TokenRefreshLockTimeoutError):
+                with waiter.hold(CLIENT_ID):
+                    pass
+
+        with waiter.hold(CLIENT_ID):
+            pass
+
+
+@pytest.mark.unit
+class TestEncryptedFileTokenAdapter:
+    def test_store_and_load(self, tmp_path: Path, token: Token) -> None:
+        adapter = EncryptedFileTokenAdapter(
+            EncryptedFileTokenStoreConfig(token_dir=tmp_path)
+        )
+
+        adapter.store(token)
+
+        token_file: Path = tmp_path / f"{CLIENT_ID}.token"
+        assert b"access" not in token_file.read_bytes()
+        assert os.stat(token_file).st_mode & 0o777 == 0o600
+        assert os.stat(tmp_path / "token.key").st_mode & 0o777 == 0o600
+        _assert_same_token(
+            EncryptedFileTokenAdapter(
+                EncryptedFileTokenStoreConfig(token_dir=tmp_path)
+            ).load(CLIENT_ID),
+            token,
+        )
+
+    def test_configured_key(self, tmp_path: Path, token: Token) -> None:
+        key: str = Fernet.generate_key().decode()
+        config = EncryptedFileTokenStoreConfig(token_dir=tmp_path, key=SecretStr(key))
+        EncryptedFileTokenAdapter(config).store(token)
+
+        assert not (tmp_path / "token.key").exists()
+        _assert_same_token(EncryptedFileTokenAdapter(config).load(CLIENT_ID), token)
+
+    def test_wrong_key(self, tmp_path: Path, token: Token) -> None:
+        EncryptedFileTokenAdapter(
+            EncryptedFileTokenStoreConfig(token_dir=tmp_path)
+        ).store(token)
+        other_key = SecretStr(Fernet.generate_key().decode())
+
+        with pytest.raises(TokenRepositoryError):
+            EncryptedFileTokenAdapter(
+                EncryptedFileTokenStoreConfig(token_dir=tmp_path, key=other_key)
+            ).load(CLIENT_ID)
+
+    def test_concurrent_first_runs_agree_on_one_key(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        key_file: Path = tmp_path / "token.key"
+        start = threading.Barrier(4)
+        generate_key = Fernet.generate_key
+
+        def slow_generate_key() -> bytes:
+            # Widens the window between the check and the write of the file.
+            time.sleep(0.05)
+            return generate_key()
+
+        monkeypatch.setattr(Fernet, "generate_key", slow_generate_key)
+
+        def load_or_create(_: int) -> bytes:
+            start.wait(timeout=5)
+            return LoadOrCreateFernetKeyCommand(key_file).execute()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            keys: List[bytes] = list(pool.map(load_or_create, range(4)))
+
+        assert set(keys) == {key_file.read_bytes()}
+
+    def test_load_and_delete_missing_token(self, tmp_path: Path) -> None:
+        adapter = EncryptedFileTokenAdapter(
+            EncryptedFileTokenStoreConfig(token_dir=tmp_path)
+        )
+
+        with pytest.raises(TokenRepositoryError):
+            adapter.load(CLIENT_ID)
+        adapter.delete(CLIENT_ID)
+
+
+@pytest.mark.unit
+def test_loaded_token_from_token(token: Token) -> None:
+    loaded: LoadedToken = LoadedToken.from_token(token)
+
+    _assert_same_token(loaded, token)
+    assert loaded.expiry.tzinfo == timezone.utc
+    assert loaded.expiry > datetime.now(timezone.utc) + timedelta(minutes=59)
@@ -1,6 +1,7 @@
 import unittest
 from datetime import datetime
-from unittest.mock import MagicMock, Mock, patch
+from typing import Any, Callable
+from unittest.mock import MagicMock, patch
 
 from exls.clusters.core.domain import (
     Cluster,
@@ -29,6 +30,7 @@ from exls.clusters.core.results import ClusterScaleResult, DeployClusterResult
 from exls.clusters.core.service import ClustersService
 from exls.shared.core.exceptions import ServiceError
 from exls.shared.core.ports.file import FileWritePort
+from exls.shared.core.timeline import record_api_call
 
 
 class TestClustersService(unittest.TestCase):
@@ -281,19 +283,17 @@ class TestClustersService(unittest.TestCase):
         self.assertEqual(len(result_import.issues), 1)
         self.assertIn("Import failed", result_import.issues[0].error_message)
 
-    @patch("exls.clusters.core.service.poll_until")
-    def test_deploy_cluster_polling(self, mock_poll_until: Mock):
+    def test_deploy_cluster_polling(self):
         # Setup: node is in DISCOVERING state initially
         discovering_node = self.node1.model_copy(
             update={"status": ClusterNodeStatus.DISCOVERING}
         )
         self.mock_provider.list_available_nodes.side_effect = [
             [discovering_node],  # initial list
-            [self.node1],  # after polling (mocked)
+            [self.node1],  # first tick of the watcher
+            [self.node1],  # final check
         ]
 
-        mock_poll_until.return_value = [self.node1]
-
         deploy_req = ClusterDeployRequest(
             name="polling-cluster",
             type=ClusterType.REMOTE,
@@ -328,10 +328,66 @@ class TestClustersService(unittest.TestCase):
         result = self.service.deploy_cluster(deploy_req)
 
         self.assertTrue(result.is_success)
-        mock_poll_until.assert_called_once()
+        self.assertEqual(self.mock_provider.list_available_nodes.call_count, 3)
+
+    def test_deploy_cluster_records_a_timeline(self):
+        discovering_node = self.node1.model_copy(
+            update={"status": ClusterNodeStatus.DISCOVERING}
+        )
+        listings = iter([[discovering_node], [self.node1], [self.node1]])
+
+        def _list_available_nodes():
+            record_api_call()
+            return next(listings)
+
+        def _api_call(result: Any) -> Callable[..., Any]:
+            def _call(*args: Any, **kwargs: Any) -> Any:
+                record_api_call()
+                return result
+
+            return _call
+
+        self.mock_provider.list_available_nodes.side_effect = _list_available_nodes
+        self.mock_repo.create.side_effect = _api_call("cluster-new")
+        self.mock_ops.deploy.side_effect = _api_call("cluster-new")
+        self.mock_repo.get.side_effect = _api_call(
+            self.cluster1.model_copy(update={"id": "cluster-new"})
+        )
+        deploy_req = ClusterDeployRequest(
+            name="new-cluster",
+            type=ClusterType.REMOTE,
+            enable_vpn=False,
+            enable_telemetry=False,
+            enable_multinode_training=False,
+            prepare_llm_inference_environment=False,
+            worker_nodes=["node-1"],
+        )
+
+        result = self.service.deploy_cluster(deploy_req)
 
-    @patch("exls.clusters.core.service.poll_until")
-    def test_deploy_cluster_polling_control_plane(self, mock_poll_until: Mock):
+        phases = {phase.name: phase for phase in result.timeline}
+        self.assertEqual(
+            list(phases),
+            [
+                "list_available_nodes",
+                "validate_node_ids",
+                "import_worker_nodes",
+                "import_control_plane_nodes",
+                "wait_for_worker_nodes",
+                "create_cluster",
+                "deploy_cluster",
+                "get_cluster",
+            ],
+        )
+        self.assertEqual(phases["list_available_nodes"].items, 1)
+        self.assertEqual(phases["list_available_nodes"].api_calls, 1)
+        # The watcher's tick and the final check of the nodes.
+        self.assertEqual(phases["wait_for_worker_nodes"].api_calls, 2)
+        self.assertEqual(phases["create_cluster"].api_calls, 1)
+        self.assertEqual(phases["import_worker_nodes"].api_calls, 0)
+        self.assertTrue(all(p.duration_ms is not None for p in result.timeline))
+
+    def test_deploy_cluster_polling_control_plane(self):
         cp_node = self.node1.model_copy(
             update={"id": "cp-1", "role": ClusterNodeRole.CONTROL_PLANE}
         )
@@ -342,8 +398,8 @@ class TestClustersService(unittest.TestCase):
         self.mock_provider.list_available_nodes.side_effect = [
             [discovering_cp_node],
             [cp_node],
+            [cp_node],
         ]
-        mock_poll_until.return_value = [cp_node]
 
         deploy_req = ClusterDeployRequest(
             name="cp-cluster",
@@ -385,20 +441,17 @@ class TestClustersService(unittest.TestCase):
             result.deployed_cluster.nodes[0].role, ClusterNodeRole.CONTROL_PLANE
         )
 
-    @patch("exls.clusters.core.service.poll_until")
-    def test_deploy_cluster_polling_timeout(self, mock_poll_until: Mock):
-        from exls.shared.core.polling import PollingTimeoutError
-
+    @patch("exls.clusters.core.service.NODE_WAIT_TIMEOUT_SECONDS", 0)
+    def test_deploy_cluster_polling_timeout(self):
         discovering_node = self.node1.model_copy(
             update={"status": ClusterNodeStatus.DISCOVERING}
         )
         self.mock_provider.list_available_nodes.side_effect = [
             [discovering_node],
+            [discovering_node],  # the watcher times out on its first tick
             [discovering_node],  # fetch after timeout still returns discovering
         ]
 
-        mock_poll_until.side_effect = PollingTimeoutError("Timeout")
-
         deploy_req = ClusterDeployRequest(
             name="timeout-cluster",
             type=ClusterType.REMOTE,
@@ -0,0 +1,133 @@
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+from exalsius_api_client.api.nodes_api import NodesApi
+from exalsius_api_client.api_client import ApiClient
+from exalsius_api_client.configuration import Configuration
+
+from exls.nodes.adapters.gateway.sdk.sdk import SdkNodesGateway
+from exls.nodes.core.domain import BaseNode, NodeStatus
+from exls.nodes.core.requests import NodesFilterCriteria
+from exls.shared.adapters.retry import disable_transport_retries
+from exls.shared.adapters.sdk.command import ExalsiusSdkCommandError
+from tests.support.http import FaultInjectingServer, ScriptedResponse
+
+
+def _node(
+    id: str, hostname: str, status: str, gpu_vendor: str, gpu_count: int
+) -> Dict[str, Any]:
+    return {
+        "id": id,
+        "node_type": "SELF_MANAGED",
+        "hostname": hostname,
+        "price_per_hour": 1.0,
+        "node_status": status,
+        "endpoint": "10.0.0.1:22",
+        "username": "ubuntu",
+        "ssh_key_id": "key-1",
+        "hardware": {"gpu_vendor": gpu_vendor, "gpu_count": gpu_count},
+    }
+
+
+NODES: Dict[str, Any] = {
+    "nodes": [
+        _node("n-1", "gpu-a", "AVAILABLE", "NVIDIA", 8),
+        _node("n-2", "gpu-b", "AVAILABLE", "amd", 8),
+        _node("n-3", "gpu-c", "AVAILABLE", "nvidia", 2),
+        _node("n-4", "cpu-a", "AVAILABLE", "nvidia", 8),
+        _node("n-5", "gpu-d", "ADDED", "nvidia", 8),
+    ],
+    "total": 5,
+}
+
+
+@pytest.fixture
+def server() -> Iterator[FaultInjectingServer]:
+    server: FaultInjectingServer = FaultInjectingServer(default_body=NODES).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def gateway(server: FaultInjectingServer) -> SdkNodesGateway:
+    configuration: Configuration = Configuration(host=server.url)
+    disable_transport_retries(configuration)
+    return SdkNodesGateway(NodesApi(api_client=ApiClient(configuration)))
+
+
+def _ids(nodes: List[BaseNode]) -> List[str]:
+    return [node.id for node in nodes]
+
+
+@pytest.mark.unit
+class TestSdkNodesGatewayFilters:
+    def test_pushes_supported_criteria_to_the_api(
+        self, server: FaultInjectingServer, gateway: SdkNodesGateway
+    ) -> None:
+        gateway.list(
+            filter=NodesFilterCriteria(
+                node_type="CLOUD", provider="aws", sort_field="HOSTNAME", order_by="ASC"
+            )
+        )
+
+        [(_, path)] = server.requests
+        assert path == (
+            "/nodes?node_type=CLOUD&provider=aws&sort_field=HOSTNAME&order_by=ASC"
+        )
+
+    def test_applies_the_other_criteria_locally(
+        self, server: FaultInjectingServer, gateway: SdkNodesGateway
+    ) -> None:
+        nodes: List[BaseNode] = gateway.list(
+            filter=NodesFilterCriteria(
+                status=NodeStatus.AVAILABLE,
+                hostname_prefix="gpu-",
+                gpu_vendor="nvidia",
+                min_gpu_count=4,
+            )
+        )
+
+        assert _ids(nodes) == ["n-1"]
+        assert server.requests == [("GET", "/nodes")]
+
+    @pytest.mark.parametrize("filter", [None, NodesFilterCriteria()])
+    def test_without_criteria_returns_all_nodes(
+        self, gateway: SdkNodesGateway, filter: Optional[NodesFilterCriteria]
+    ) -> None:
+        assert _ids(gateway.list(filter=filter)) == ["n-1", "n-2", "n-3", "n-4", "n-5"]
+
+    def test_pages_only_hold_matching_nodes(self, gateway: SdkNodesGateway) -> None:
+        pages: List[List[BaseNode]] = list(
+            gateway.iter_pages(
+                filter=NodesFilterCriteria(gpu_vendor="NVIDIA"), page_size=2
+            )
+        )
+
+        assert [_ids(page) for page in pages] == [["n-1", "n-3"], ["n-4", "n-5"]]
+
+
+@pytest.mark.unit
+class TestSdkNodesGatewayFind:
+    def test_returns_the_node(
+        self, server: FaultInjectingServer, gateway: SdkNodesGateway
+    ) -> None:
+        server.script("/node/n-1", ScriptedResponse(body=NODES["nodes"][0]))
+
+        node: Optional[BaseNode] = gateway.find("n-1")
+
+        assert node is not None and node.id == "n-1"
+
+    def test_returns_none_for_missing_nodes(
+        self, server: FaultInjectingServer, gateway: SdkNodesGateway
+    ) -> None:
+        server.script("/node/n-9", ScriptedResponse(status=404, body={}))
+
+        assert gateway.find("n-9") is None
+
+    def test_raises_other_errors(
+        self, server: FaultInjectingServer, gateway: SdkNodesGateway
+    ) -> None:
+        server.script("/node/n-1", ScriptedResponse(status=403, body={}))
+
+        with pytest.raises(ExalsiusSdkCommandError):
+            gateway.find("n-1")
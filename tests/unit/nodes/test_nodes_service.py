@@ -1,5 +1,7 @@
+import asyncio
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 from unittest.mock import MagicMock, create_autospec
 
 import pytest
@@ -20,8 +22,9 @@ from exls.nodes.core.requests import (
     NodesSshKeySpecification,
 )
 from exls.nodes.core.results import DeleteNodesResult, ImportSelfmanagedNodesResult
-from exls.nodes.core.service import NodesService
+from exls.nodes.core.service import NODE_LOOKUP_MAX_GETS, NodesService
 from exls.shared.core.exceptions import ServiceError
+from exls.shared.core.parallel import ExecutionProgress, ExecutionStatus
 
 
 @pytest.fixture
@@ -49,6 +52,7 @@ def nodes_service(
         nodes_repository=mock_nodes_repository,
         nodes_operations=mock_nodes_operations,
         ssh_key_provider=mock_ssh_key_provider,
+        node_watch_interval_seconds=0.01,
     )
 
 
@@ -138,6 +142,41 @@ class TestNodesService:
         # Assert
         mock_nodes_repository.list.assert_called_once_with(filter=filter_criteria)
 
+    def test_iter_nodes_stops_after_limit(
+        self,
+        nodes_service: NodesService,
+        mock_nodes_repository: MagicMock,
+        mock_ssh_key_provider: MagicMock,
+        sample_self_managed_node: SelfManagedNode,
+        sample_ssh_key: NodeSshKey,
+    ) -> None:
+        # Arrange
+        pulled: List[int] = []
+
+        def _pages(filter: Optional[NodesFilterCriteria], page_size: int):
+            for number in range(3):
+                pulled.append(number)
+                yield [
+                    sample_self_managed_node.model_copy(
+                        update={"id": f"node-{number}-{i}"}
+                    )
+                    for i in range(page_size)
+                ]
+
+        mock_nodes_repository.iter_pages.side_effect = _pages
+        mock_ssh_key_provider.list_keys.return_value = [sample_ssh_key]
+
+        # Act
+        pages = list(nodes_service.iter_nodes(page_size=2, limit=3))
+
+        # Assert
+        assert [[node.id for node in page] for page in pages] == [
+            ["node-0-0", "node-0-1"],
+            ["node-1-0"],
+        ]
+        assert pages[1][0].ssh_key_name == sample_ssh_key.name
+        assert pulled == [0, 1]
+
     def test_get_node(
         self,
         nodes_service: NodesService,
@@ -158,6 +197,50 @@ class TestNodesService:
         assert result.ssh_key_name == "my-key"
         mock_nodes_repository.get.assert_called_once_with("node-1")
 
+    def test_get_nodes_by_ids_gets_each_node(
+        self,
+        nodes_service: NodesService,
+        mock_nodes_repository: MagicMock,
+        mock_ssh_key_provider: MagicMock,
+        sample_self_managed_node: SelfManagedNode,
+    ) -> None:
+        nodes = {
+            "node-1": sample_self_managed_node,
+            "node-2": sample_self_managed_node.model_copy(update={"id": "node-2"}),
+        }
+        mock_nodes_repository.find_async.side_effect = nodes.get
+
+        result = nodes_service.get_nodes_by_ids(["node-2", "node-9", "node-1"])
+
+        assert [node.id for node in result] == ["node-2", "node-1"]
+        mock_nodes_repository.list.assert_not_called()
+        mock_ssh_key_provider.list_keys.assert_not_called()
+
+    def test_get_nodes_by_ids_lists_nodes_for_many_ids(
+        self,
+        nodes_service: NodesService,
+        mock_nodes_repository: MagicMock,
+        sample_self_managed_node: SelfManagedNode,
+    ) -> None:
+        node_ids = [f"node-{i}" for i in range(NODE_LOOKUP_MAX_GETS + 1)]
+        mock_nodes_repository.list.return_value = [
+            sample_self_managed_node.model_copy(update={"id": node_id})
+            for node_id in reversed(node_ids[1:])
+        ]
+
+        result = nodes_service.get_nodes_by_ids(node_ids)
+
+        assert [node.id for node in result] == node_ids[1:]
+        mock_nodes_repository.find_async.assert_not_called()
+
+    def test_get_nodes_by_ids_raises_errors(
+        self, nodes_service: NodesService, mock_nodes_repository: MagicMock
+    ) -> None:
+        mock_nodes_repository.find_async.side_effect = RuntimeError("forbidden")
+
+        with pytest.raises(ServiceError, match="node-1"):
+            nodes_service.get_nodes_by_ids(["node-1"])
+
     def test_delete_nodes(
         self, nodes_service: NodesService, mock_nodes_repository: MagicMock
     ) -> None:
@@ -167,7 +250,7 @@ class TestNodesService:
         def return_arg(x: str) -> str:
             return x
 
-        mock_nodes_repository.delete.side_effect = return_arg
+        mock_nodes_repository.delete_async.side_effect = return_arg
 
         # Act
         result = nodes_service.delete_nodes(node_ids)
@@ -176,7 +259,7 @@ class TestNodesService:
         assert isinstance(result, DeleteNodesResult)
         assert set(result.deleted_node_ids) == set(node_ids)
         assert result.issues == []
-        assert mock_nodes_repository.delete.call_count == 2
+        assert mock_nodes_repository.delete_async.call_count == 2
 
     def test_delete_nodes_partial_failure(
         self, nodes_service: NodesService, mock_nodes_repository: MagicMock
@@ -189,7 +272,7 @@ class TestNodesService:
                 raise Exception("Failed to delete")
             return node_id
 
-        mock_nodes_repository.delete.side_effect = delete_side_effect
+        mock_nodes_repository.delete_async.side_effect = delete_side_effect
 
         # Act
         result = nodes_service.delete_nodes(node_ids)
@@ -201,6 +284,72 @@ class TestNodesService:
         assert result.issues[0].node_id == "node-2"
         assert "Failed to delete" in result.issues[0].error_message
 
+    def test_delete_nodes_reports_progress_and_stops_after_max_failures(
+        self,
+        mock_nodes_repository: MagicMock,
+        mock_nodes_operations: MagicMock,
+        mock_ssh_key_provider: MagicMock,
+    ) -> None:
+        # Arrange
+        service = NodesService(
+            nodes_repository=mock_nodes_repository,
+            nodes_operations=mock_nodes_operations,
+            ssh_key_provider=mock_ssh_key_provider,
+            max_concurrency=1,
+        )
+        mock_nodes_repository.delete_async.side_effect = Exception("Failed to delete")
+        progress: List[ExecutionProgress[str]] = []
+
+        # Act
+        result = service.delete_nodes(
+            ["node-1", "node-2", "node-3"],
+            on_progress=progress.append,
+            max_failures=1,
+        )
+
+        # Assert
+        assert result.deleted_node_ids == []
+        assert [issue.node_id for issue in result.issues] == [
+            "node-1",
+            "node-2",
+            "node-3",
+        ]
+        assert mock_nodes_repository.delete_async.call_count == 1
+        assert [p.completed for p in progress] == [1, 2, 3]
+        assert progress[-1].failed == 3
+
+    def test_delete_nodes_reports_the_status_of_each_issue(
+        self,
+        mock_nodes_repository: MagicMock,
+        mock_nodes_operations: MagicMock,
+        mock_ssh_key_provider: MagicMock,
+    ) -> None:
+        # Arrange
+        service = NodesService(
+            nodes_repository=mock_nodes_repository,
+            nodes_operations=mock_nodes_operations,
+            ssh_key_provider=mock_ssh_key_provider,
+            max_concurrency=1,
+            item_timeout_seconds=0.05,
+        )
+
+        async def delete_slowly(node_id: str) -> str:
+            if node_id == "node-2":
+                await asyncio.sleep(1)
+            return node_id
+
+        mock_nodes_repository.delete_async.side_effect = delete_slowly
+
+        # Act
+        result = service.delete_nodes(["node-1", "node-2", "node-3"])
+
+        # Assert
+        assert result.deleted_node_ids == ["node-1", "node-3"]
+        assert [(issue.node_id, issue.status) for issue in result.issues] == [
+            ("node-2", ExecutionStatus.TIMED_OUT)
+        ]
+        assert not result.interrupted
+
     def test_list_ssh_keys(
         self,
         nodes_service: NodesService,
@@ -266,7 +415,7 @@ class TestNodesService:
             price_per_hour=2.1,
         )
         mock_ssh_key_provider.list_keys.return_value = [sample_ssh_key]
-        mock_nodes_operations.import_selfmanaged_node.return_value = "node-1"
+        mock_nodes_operations.import_selfmanaged_node_async.return_value = "node-1"
         mock_nodes_repository.get.return_value = sample_self_managed_node
 
         # Act
@@ -278,6 +427,43 @@ class TestNodesService:
         assert result.imported_nodes[0].id == "node-1"
         assert len(result.issues) == 0
 
+    def test_import_selfmanaged_nodes_waits_without_listing_ssh_keys_per_poll(
+        self,
+        nodes_service: NodesService,
+        mock_nodes_operations: MagicMock,
+        mock_ssh_key_provider: MagicMock,
+        mock_nodes_repository: MagicMock,
+        sample_ssh_key: NodeSshKey,
+        sample_self_managed_node: SelfManagedNode,
+    ) -> None:
+        # Arrange
+        request = ImportSelfmanagedNodeRequest(
+            hostname="host1",
+            endpoint="1.2.3.4",
+            username="user",
+            ssh_key="key-1",
+            price_per_hour=2.1,
+        )
+        mock_ssh_key_provider.list_keys.return_value = [sample_ssh_key]
+        mock_nodes_operations.import_selfmanaged_node_async.return_value = "node-1"
+        deployed: SelfManagedNode = sample_self_managed_node.model_copy(
+            update={"status": NodeStatus.DEPLOYED}
+        )
+        mock_nodes_repository.list.side_effect = [
+            [sample_self_managed_node.model_copy()] for _ in range(3)
+        ] + [[deployed]]
+
+        # Act
+        result = nodes_service.import_selfmanaged_nodes(
+            [request], wait_for_available=True
+        )
+
+        # Assert
+        assert [node.ssh_key_name for node in result.imported_nodes] == ["my-key"]
+        assert mock_nodes_repository.list.call_count == 4
+        # Once to check the key of the request and once for the imported node.
+        assert mock_ssh_key_provider.list_keys.call_count == 2
+
     def test_import_selfmanaged_nodes_with_new_key(
         self,
         nodes_service: NodesService,
@@ -304,7 +490,7 @@ class TestNodesService:
         new_key = NodeSshKey(id="new-key-id", name="new-key")
         mock_ssh_key_provider.import_key.return_value = new_key
 
-        mock_nodes_operations.import_selfmanaged_node.return_value = "node-1"
+        mock_nodes_operations.import_selfmanaged_node_async.return_value = "node-1"
 
         # Return node with new key
         node_with_new_key = sample_self_managed_node.model_copy()
@@ -389,7 +575,7 @@ class TestNodesService:
             price_per_hour=2.1,
         )
         mock_ssh_key_provider.list_keys.return_value = [sample_ssh_key]
-        mock_nodes_operations.import_selfmanaged_node.return_value = "node-1"
+        mock_nodes_operations.import_selfmanaged_node_async.return_value = "node-1"
 
         # Mock polling behavior
         deploying_node = sample_self_managed_node.model_copy()
@@ -398,7 +584,7 @@ class TestNodesService:
         deployed_node = sample_self_managed_node.model_copy()
         deployed_node.status = NodeStatus.DEPLOYED
 
-        mock_nodes_repository.get.side_effect = [deploying_node, deployed_node]
+        mock_nodes_repository.list.side_effect = [[deploying_node], [deployed_node]]
 
         # Act
         result = nodes_service.import_selfmanaged_nodes(
@@ -427,11 +613,11 @@ class TestNodesService:
             price_per_hour=2.1,
         )
         mock_ssh_key_provider.list_keys.return_value = [sample_ssh_key]
-        mock_nodes_operations.import_selfmanaged_node.return_value = "node-1"
+        mock_nodes_operations.import_selfmanaged_node_async.return_value = "node-1"
 
         failed_node = sample_self_managed_node.model_copy()
         failed_node.status = NodeStatus.FAILED
-        mock_nodes_repository.get.return_value = failed_node
+        mock_nodes_repository.list.return_value = [failed_node]
 
         # Act
         result = nodes_service.import_selfmanaged_nodes(
@@ -461,7 +647,7 @@ class TestNodesService:
             price_per_hour=2.1,
         )
         mock_ssh_key_provider.list_keys.return_value = [sample_ssh_key]
-        mock_nodes_operations.import_selfmanaged_node.return_value = "node-1"
+        mock_nodes_operations.import_selfmanaged_node_async.return_value = "node-1"
 
         # Return a CloudNode instead of SelfManagedNode
         mock_nodes_repository.get.return_value = sample_cloud_node
@@ -500,7 +686,7 @@ class TestNodesService:
             price_per_hour=2.1,
         )
 
-        mock_nodes_operations.import_selfmanaged_node.return_value = "node-1"
+        mock_nodes_operations.import_selfmanaged_node_async.return_value = "node-1"
         mock_nodes_repository.get.return_value = sample_self_managed_node
 
         # Act
@@ -513,7 +699,7 @@ class TestNodesService:
         # Should proceed to import node using the EXISTING key ID
         assert len(result.imported_nodes) == 1
         # Verify call arguments to ensure correct ID was resolved
-        call_args = mock_nodes_operations.import_selfmanaged_node.call_args
+        call_args = mock_nodes_operations.import_selfmanaged_node_async.call_args
         assert call_args[1]["parameters"].ssh_key_id == "existing-id"
 
     def test_list_nodes_mixed_types_and_missing_keys(
@@ -0,0 +1,112 @@
+import asyncio
+import sys
+from importlib.metadata import version
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+
+from exls.config import AppConfig
+from exls.runtime import batch, capture
+from exls.runtime.batch import (
+    BatchCommand,
+    BatchCommandResult,
+    BatchParseError,
+    parse_batch,
+    run_batch,
+)
+from exls.shared.core.parallel import execute_concurrently
+from exls.state import AppState
+
+
+@pytest.fixture
+def restore_streams(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    # Batches replace the process' standard streams; restore them afterwards.
+    monkeypatch.setattr(capture, "_stdout", None)
+    monkeypatch.setattr(capture, "_stderr", None)
+    return monkeypatch
+
+
+def _run(
+    monkeypatch: pytest.MonkeyPatch, lines: List[str], jobs: int
+) -> List[BatchCommandResult]:
+    # Started in the test body, since pytest swaps the standard streams between
+    # the setup and the call phase of a test.
+    monkeypatch.setattr(sys, "stdout", sys.stdout)
+    monkeypatch.setattr(sys, "stderr", sys.stderr)
+    state: AppState = AppState(config=AppConfig(), access_token="token")
+    emitted: List[BatchCommandResult] = []
+
+    def _fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("The access token must be inherited from the batch")
+
+    with patch("exls.auth.adapters.bundle.AuthBundle.get_auth_service", _fail):
+        results: List[BatchCommandResult] = run_batch(
+            parse_batch(lines), lambda: state, emitted.append, jobs=jobs
+        )
+    assert sorted(emitted, key=lambda r: r.line) == results
+    return results
+
+
+@pytest.mark.unit
+class TestParseBatch:
+    def test_skips_comments_and_blank_lines(self) -> None:
+        commands: List[BatchCommand] = parse_batch(
+            ["# provision", "", "exls nodes get node-1", "  clusters get 'my cluster'"]
+        )
+
+        assert [(c.line, c.argv) for c in commands] == [
+            (3, ["nodes", "get", "node-1"]),
+            (4, ["clusters", "get", "my cluster"]),
+        ]
+
+    def test_rejects_unsupported_commands(self) -> None:
+        with pytest.raises(BatchParseError, match="Line 2"):
+            parse_batch(["nodes list", "login"])
+
+    def test_rejects_malformed_lines(self) -> None:
+        with pytest.raises(BatchParseError, match="Line 1"):
+            parse_batch(["nodes get 'unterminated"])
+
+
+@pytest.mark.unit
+class TestRunBatch:
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_runs_commands_with_shared_state(
+        self, restore_streams: pytest.MonkeyPatch, jobs: int
+    ) -> None:
+        results: List[BatchCommandResult] = _run(
+            restore_streams, ["--version", "no-such-command", "management"], jobs
+        )
+
+        assert [r.line for r in results] == [1, 2, 3]
+        assert results[0].exit_code == 0
+        assert results[0].stdout.strip() == version("exls")
+        assert results[1].exit_code == 2
+        assert "no-such-command" in results[1].stderr
+        assert results[2].exit_code == 0
+        assert "Usage: exls management" in results[2].stdout
+
+    def test_routes_the_workers_of_concurrent_commands_to_them(
+        self,
+        restore_streams: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        def _invoke(argv: List[str], obj: Any = None) -> int:
+            async def _report(item: str) -> None:
+                await asyncio.to_thread(print, f"{argv[-1]}: item {item}")
+
+            execute_concurrently(items=["1", "2"], func=_report)
+            return 0
+
+        restore_streams.setattr(batch, "invoke_app", _invoke)
+        results: List[BatchCommandResult] = _run(
+            restore_streams, ["nodes add a", "nodes add b"], jobs=2
+        )
+
+        # Only the results would be printed; the workers' output is in them.
+        assert capsys.readouterr().out == ""
+        assert [sorted(r.stdout.splitlines()) for r in results] == [
+            ["a: item 1", "a: item 2"],
+            ["b: item 1", "b: item 2"],
+        ]
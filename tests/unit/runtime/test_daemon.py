@@ -0,0 +1,354 @@
+import contextlib
+import io
+import os
+import socket
+import sys
+import threading
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Dict, Generator, Iterator, List
+
+import pytest
+
+from exls.auth.adapters.auth0.auth0 import Auth0Adapter
+from exls.auth.adapters.auth0.config import Auth0Config
+from exls.auth.adapters.keyring.keyring import KeyringAdapter
+from exls.auth.adapters.memory.memory import InMemoryTokenCache
+from exls.auth.core.domain import Token, User
+from exls.runtime import capture, client, daemon
+from exls.runtime.capture import CallbackStream, ThreadRoutedStream
+from exls.runtime.client import (
+    DaemonBusyError,
+    DaemonUnavailableError,
+    forward,
+    send_control,
+    should_forward,
+)
+from exls.runtime.daemon import DaemonServer
+from exls.runtime.protocol import RunRequest, send_frame
+from tests.support.keyring import InMemoryKeyring, use_in_memory_keyring
+
+
+@pytest.fixture
+def socket_file(tmp_path: Path) -> Path:
+    return tmp_path / "daemon.sock"
+
+
+# The daemon is started in the test body rather than in a fixture, because pytest
+# swaps the standard streams between the setup and the call phase of a test.
+@contextlib.contextmanager
+def _running_daemon(
+    socket_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[DaemonServer, None, None]:
+    # The daemon replaces the process' standard streams; restore them afterwards.
+    monkeypatch.setattr(sys, "stdout", sys.stdout)
+    monkeypatch.setattr(sys, "stderr", sys.stderr)
+    monkeypatch.setattr(capture, "_stdout", None)
+    monkeypatch.setattr(capture, "_stderr", None)
+
+    server: DaemonServer = DaemonServer(socket_file=socket_file)
+    thread: threading.Thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    for _ in range(500):
+        try:
+            send_control("ping", socket_file=socket_file)
+            break
+        except DaemonUnavailableError:
+            threading.Event().wait(0.01)
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        thread.join(timeout=5)
+
+
+def _forward(argv: List[str], socket_file: Path) -> Dict[str, Any]:
+    stdout: io.StringIO = io.StringIO()
+    stderr: io.StringIO = io.StringIO()
+    code: int = forward(argv, socket_file=socket_file, stdout=stdout, stderr=stderr)
+    return {"code": code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+@pytest.fixture
+def fake_keyring() -> Iterator[InMemoryKeyring]:
+    yield from use_in_memory_keyring()
+
+
+@pytest.mark.unit
+class TestDaemon:
+    def test_forwards_output_and_exit_code(
+        self, socket_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        with _running_daemon(socket_file, monkeypatch):
+            result: Dict[str, Any] = _forward(["--version"], socket_file)
+
+        assert result["code"] == 0
+        assert result["stdout"].strip() == version("exls")
+
+    def test_forwards_usage_errors(
+        self, socket_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        with _running_daemon(socket_file, monkeypatch):
+            result: Dict[str, Any] = _forward(["no-such-command"], socket_file)
+
+        assert result["code"] == 2
+        assert "no-such-command" in result["stderr"]
+
+    def test_socket_is_private(
+        self, socket_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        with _running_daemon(socket_file, monkeypatch):
+            assert socket_file.stat().st_mode & 0o777 == 0o600
+
+    def test_restores_cwd_and_environment(
+        self, socket_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cwd: str = os.getcwd()
+        monkeypatch.setenv("EXLS_DAEMON_TEST", "client")
+
+        with _running_daemon(socket_file, monkeypatch):
+            _forward(["--version"], socket_file)
+
+        assert os.getcwd() == cwd
+        assert os.environ["EXLS_DAEMON_TEST"] == "client"
+
+    def test_status_and_shutdown(
+        self, socket_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        with _running_daemon(socket_file, monkeypatch):
+            _forward(["--version"], socket_file)
+
+            status: Dict[str, Any] = send_control("ping", socket_file=socket_file)
+            assert status["pid"] == os.getpid()
+            assert status["requests_served"] == 1
+
+            send_control("shutdown", socket_file=socket_file)
+            for _ in range(500):
+                if not socket_file.exists():
+                    break
+                threading.Event().wait(0.01)
+            assert not socket_file.exists()
+
+    def test_sees_a_logout_between_invocations(
+        self,
+        socket_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        fake_keyring: InMemoryKeyring,
+    ) -> None:
+        monkeypatch.setenv("EXLS_TOKEN_STORE", "keyring")
+
+        def _decode_user(self: Auth0Adapter, id_token: str) -> User:
+            return User(email="user@example.com", nickname="user", sub="user")
+
+        monkeypatch.setattr(Auth0Adapter, "decode_user_from_token", _decode_user)
+        client_id: str = Auth0Config().client_id
+        KeyringAdapter().store(
+            Token(
+                client_id=client_id,
+                access_token="access",
+                id_token="id",
+                scope="openid",
+                token_type="Bearer",
+                refresh_token="refresh",
+                expires_in=3600,
+            )
+        )
+
+        try:
+            with _running_daemon(socket_file, monkeypatch):
+                logged_in: Dict[str, Any] = _forward(["nodes", "--help"], socket_file)
+                # `logout` runs in its own process and only changes the store.
+                KeyringAdapter().delete(client_id)
+                logged_out: Dict[str, Any] = _forward(["nodes", "--help"], socket_file)
+        finally:
+            InMemoryTokenCache.clear()
+
+        assert logged_in["code"] == 0
+        assert logged_out["code"] == 1
+        assert "not logged in" in logged_out["stdout"]
+
+    def test_answers_busy_while_serving_an_invocation(
+        self, socket_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        started: threading.Event = threading.Event()
+        release: threading.Event = threading.Event()
+
+        def _long_invocation(argv: List[str]) -> int:
+            started.set()
+            release.wait(timeout=5)
+            return 0
+
+        monkeypatch.setattr(daemon, "run_invocation", _long_invocation)
+        results: List[Dict[str, Any]] = []
+        with _running_daemon(socket_file, monkeypatch):
+            long_running: threading.Thread = threading.Thread(
+                target=lambda: results.append(
+                    _forward(["logs", "--follow"], socket_file)
+                )
+            )
+            long_running.start()
+            assert started.wait(timeout=5)
+
+            with pytest.raises(DaemonBusyError):
+                forward(["--version"], socket_file=socket_file)
+
+            release.set()
+            long_running.join(timeout=5)
+
+        assert results == [{"code": 0, "stdout": "", "stderr": ""}]
+
+    def test_interrupts_an_invocation_whose_client_disconnected(
+        self, socket_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        started: threading.Event = threading.Event()
+        interrupted: threading.Event = threading.Event()
+
+        def _quiet_invocation(argv: List[str]) -> int:
+            started.set()
+            try:
+                while True:
+                    threading.Event().wait(0.01)
+            except KeyboardInterrupt:
+                interrupted.set()
+                raise
+
+        def _quick_invocation(argv: List[str]) -> int:
+            return 0
+
+        monkeypatch.setattr(daemon, "run_invocation", _quiet_invocation)
+        with _running_daemon(socket_file, monkeypatch):
+            sock: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(str(socket_file))
+            request: RunRequest = {
+                "type": "run",
+                "argv": ["clusters", "deploy", "--wait"],
+                "cwd": os.getcwd(),
+                "env": {},
+                "stdout_isatty": False,
+                "stderr_isatty": False,
+            }
+            send_frame(sock, request)
+            assert started.wait(timeout=5)
+            sock.close()
+
+            assert interrupted.wait(timeout=5)
+            # The daemon frees up once the interrupted invocation unwound.
+            monkeypatch.setattr(daemon, "run_invocation", _quick_invocation)
+            for _ in range(500):
+                try:
+                    assert _forward(["--version"], socket_file)["code"] == 0
+                    break
+                except DaemonBusyError:
+                    threading.Event().wait(0.01)
+            else:
+                pytest.fail("The daemon stayed busy after its client disconnected")
+
+    def test_no_daemon(self, socket_file: Path) -> None:
+        with pytest.raises(DaemonUnavailableError):
+            forward(["--version"], socket_file=socket_file)
+
+    def test_stale_socket_is_replaced(
+        self, socket_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        stale: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_file))
+        stale.close()
+
+        with pytest.raises(DaemonUnavailableError):
+            send_control("ping", socket_file=socket_file)
+
+        with _running_daemon(socket_file, monkeypatch):
+            assert send_control("ping", socket_file=socket_file)["pid"] == os.getpid()
+
+
+@pytest.mark.unit
+class TestShouldForward:
+    @pytest.fixture(autouse=True)
+    def daemon_socket(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        socket_file: Path = tmp_path / "daemon.sock"
+        socket_file.touch()
+        monkeypatch.setattr(client, "DAEMON_SOCKET_FILE", socket_file)
+        monkeypatch.delenv(client.NO_DAEMON_ENV, raising=False)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["nodes", "list"],
+            ["--format", "json", "clusters", "get", "c1"],
+            ["clusters", "delete", "c1", "--yes"],
+            ["nodes", "delete", "-y", "n1", "n2"],
+            ["clusters", "deploy", "--name", "c1", "--worker-nodes", "n1"],
+            ["management", "ssh-keys", "import", "--key-path", "id_rsa"],
+            ["nodes", "import", "--help"],
+        ],
+    )
+    def test_forwards_commands_that_do_not_prompt(self, argv: List[str]) -> None:
+        assert should_forward(argv)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["nodes", "import"],
+            ["--format=json", "clusters", "delete", "c1"],
+            ["--log-level", "DEBUG", "workspaces", "delete", "w1"],
+            ["clusters", "deploy"],
+            ["clusters", "deploy", "--name", "c1", "--interactive"],
+            ["clusters", "add-nodes", "c1", "--nodes", "n1"],
+            ["workspaces", "deploy", "jupyter", "--name", "w1"],
+            ["management", "ssh-keys", "import"],
+            ["logout"],
+            ["nodes", "list", "--watch"],
+            ["clusters", "nodes", "c1", "-w"],
+        ],
+    )
+    def test_runs_prompting_and_watching_commands_in_process(
+        self, argv: List[str]
+    ) -> None:
+        assert not should_forward(argv)
+
+    def test_runs_in_process_without_a_daemon(self, tmp_path: Path) -> None:
+        (tmp_path / "daemon.sock").unlink()
+
+        assert not should_forward(["nodes", "list"])
+
+
+@pytest.mark.unit
+class TestThreadRoutedStream:
+    def test_routes_writes_per_thread(self) -> None:
+        fallback: io.StringIO = io.StringIO()
+        routed: ThreadRoutedStream = ThreadRoutedStream(fallback)
+        mine: io.StringIO = io.StringIO()
+
+        with routed.route(mine):
+            routed.write("mine")
+            other = threading.Thread(target=lambda: routed.write("other"))
+            other.start()
+            other.join()
+
+        assert mine.getvalue() == "mine"
+        assert fallback.getvalue() == "other"
+
+    def test_default_route_captures_unrouted_threads(self) -> None:
+        fallback: io.StringIO = io.StringIO()
+        routed: ThreadRoutedStream = ThreadRoutedStream(fallback)
+        invocation: io.StringIO = io.StringIO()
+
+        with routed.route(invocation, as_default=True):
+            worker = threading.Thread(target=lambda: routed.write("worker"))
+            worker.start()
+            worker.join()
+        routed.write("after")
+
+        assert invocation.getvalue() == "worker"
+        assert fallback.getvalue() == "after"
+
+    def test_callback_stream_rejects_bytes(self) -> None:
+        chunks: List[str] = []
+        stream: CallbackStream = CallbackStream(chunks.append, isatty=True)
+
+        with pytest.raises(TypeError):
+            stream.write(b"")  # type: ignore[arg-type]
+        stream.write("text")
+
+        assert chunks == ["text"]
+        assert stream.isatty()
@@ -0,0 +1,93 @@
+from typing import Any, Dict, Tuple, cast
+
+import pytest
+from exalsius_api_client.api_client import ApiClient
+from exalsius_api_client.configuration import Configuration
+
+from exls.clusters.adapters.bundle import ClustersBundle
+from exls.config import AppConfig, ConfigHttp
+from exls.management.adapters.bundle import ManagementBundle
+from exls.nodes.adapters.bundle import NodesBundle
+from exls.shared.adapters import bundle as shared_bundle
+from exls.state import AppState
+
+
+@pytest.fixture(autouse=True)
+def api_clients(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Dict[Tuple[str, str, int], ApiClient]:
+    clients: Dict[Tuple[str, str, int], ApiClient] = {}
+    monkeypatch.setattr(shared_bundle, "_api_clients", clients)
+    return clients
+
+
+def _state(config: AppConfig, token: str = "token") -> AppState:
+    return AppState(config=config, access_token=token)
+
+
+# The generated SDK does not type these attributes.
+def _pool_size(client: ApiClient) -> int:
+    configuration: Configuration = client.configuration  # pyright: ignore
+    return cast(int, configuration.connection_pool_maxsize)  # pyright: ignore
+
+
+def _authorization(client: ApiClient) -> str:
+    headers: Dict[str, str] = client.default_headers  # pyright: ignore
+    return headers["Authorization"]
+
+
+@pytest.mark.unit
+class TestCreateApiClient:
+    def test_bundles_share_one_client(self) -> None:
+        config: AppConfig = AppConfig()
+
+        client: ApiClient = ClustersBundle(config, _state(config)).create_api_client()
+
+        assert NodesBundle(config, _state(config)).create_api_client() is client
+        assert ManagementBundle(config, _state(config)).create_api_client() is client
+
+    def test_pool_size_follows_the_configured_concurrency(self) -> None:
+        config: AppConfig = AppConfig(http=ConfigHttp(max_concurrency=32))
+
+        client: ApiClient = NodesBundle(config, _state(config)).create_api_client()
+
+        assert _pool_size(client) == 32
+        assert _authorization(client) == "Bearer token"
+
+    def test_new_token_replaces_the_client(
+        self, api_clients: Dict[Tuple[str, str, int], ApiClient]
+    ) -> None:
+        config: AppConfig = AppConfig()
+        old: ApiClient = NodesBundle(config, _state(config, "old")).create_api_client()
+
+        new: ApiClient = NodesBundle(config, _state(config, "new")).create_api_client()
+
+        assert new is not old
+        assert _authorization(new) == "Bearer new"
+        assert list(api_clients.values()) == [new]
+
+    def test_replaced_client_closes_its_connections(self) -> None:
+        config: AppConfig = AppConfig()
+        old: ApiClient = NodesBundle(config, _state(config, "old")).create_api_client()
+        pool_manager: Any = old.rest_client.pool_manager  # pyright: ignore
+        pool_manager.connection_from_url(config.backend_host)
+
+        NodesBundle(config, _state(config, "new")).create_api_client()
+
+        assert len(pool_manager.pools) == 0
+
+
+@pytest.mark.unit
+class TestGetResponseCache:
+    def test_cache_is_off_by_default(self) -> None:
+        config: AppConfig = AppConfig()
+
+        assert NodesBundle(config, _state(config)).get_response_cache() is None
+
+    def test_cache_is_opt_in(self) -> None:
+        config: AppConfig = AppConfig(http=ConfigHttp(cache_enabled=True))
+        state: AppState = _state(config)
+
+        assert NodesBundle(config, state).get_response_cache() is not None
+        state.no_cache = True
+        assert NodesBundle(config, state).get_response_cache() is None
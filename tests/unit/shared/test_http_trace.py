@@ -0,0 +1,154 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from exalsius_api_client.api.management_api import ManagementApi
+from exalsius_api_client.api_client import ApiClient
+from exalsius_api_client.configuration import Configuration
+from pydantic import BaseModel
+
+from exls.management.adapters.gateway.sdk.commands import ListSshKeysSdkCommand
+from exls.shared.adapters import http_trace, retry
+from exls.shared.adapters.http.commands import PostRequestWithResponseCommand
+from exls.shared.adapters.http_trace import (
+    HttpTraceRecorder,
+    redact_url,
+    trace_http_call,
+)
+from exls.shared.adapters.retry import (
+    RetryBudget,
+    RetryPolicy,
+    disable_transport_retries,
+)
+from tests.support.http import FaultInjectingServer, ScriptedResponse
+
+SSH_KEYS_PATH = "/management/ssh-keys"
+SSH_KEYS: Dict[str, Any] = {
+    "ssh_keys": [{"id": "key-1", "name": "default", "scope": "private"}],
+    "total": 1,
+}
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(retry, "_policy", RetryPolicy(base_delay_seconds=0.001))
+    monkeypatch.setattr(retry, "_budget", RetryBudget(retries=10))
+
+
+@pytest.fixture
+def server() -> Iterator[FaultInjectingServer]:
+    server: FaultInjectingServer = FaultInjectingServer(default_body=SSH_KEYS).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def recorder(tmp_path: Path) -> Iterator[HttpTraceRecorder]:
+    yield http_trace.start_recording()
+    http_trace.finish_recording(tmp_path / "discarded.json")
+
+
+def _list_ssh_keys(server: FaultInjectingServer) -> None:
+    configuration: Configuration = Configuration(host=server.url)
+    disable_transport_retries(configuration)
+    ListSshKeysSdkCommand(ManagementApi(api_client=ApiClient(configuration))).execute()
+
+
+class _TokenResponse(BaseModel):
+    access_token: str
+
+
+class _PostTokenCommand(PostRequestWithResponseCommand[_TokenResponse]):
+    def __init__(self, url: str):
+        super().__init__(model=_TokenResponse)
+        self._url: str = url
+
+    def _get_url(self) -> str:
+        return self._url
+
+    def _get_payload(self) -> Dict[str, Any]:
+        return {"grant_type": "refresh_token", "refresh_token": "secret-token"}
+
+
+@pytest.mark.unit
+class TestHttpTrace:
+    def test_records_sdk_calls(
+        self, server: FaultInjectingServer, recorder: HttpTraceRecorder
+    ) -> None:
+        server.script(
+            SSH_KEYS_PATH,
+            ScriptedResponse(status=503, body={}, headers={"Retry-After": "0"}),
+        )
+
+        _list_ssh_keys(server)
+
+        [call] = recorder.calls
+        summary: Dict[str, Any] = call.summary()
+        assert call.name == "ListSshKeysSdkCommand"
+        assert summary["method"] == "GET"
+        assert summary["url"] == f"{server.url}{SSH_KEYS_PATH}"
+        assert summary["status"] == 200
+        assert summary["retries"] == 1
+        assert summary["connect_ms"] > 0
+        assert 0 < summary["first_byte_ms"] <= summary["total_ms"]
+        assert summary["deserialize_ms"] > 0
+        # The bodies of both attempts, including the "{}" of the 503.
+        assert summary["response_bytes"] == len(json.dumps(SSH_KEYS)) + 2
+
+    def test_records_post_requests(
+        self, server: FaultInjectingServer, recorder: HttpTraceRecorder
+    ) -> None:
+        server.script(
+            "/oauth/token?client_secret=s3cr3t",
+            ScriptedResponse(body={"access_token": "abc"}),
+        )
+
+        _PostTokenCommand(f"{server.url}/oauth/token?client_secret=s3cr3t").execute()
+
+        [call] = recorder.calls
+        summary: Dict[str, Any] = call.summary()
+        assert "s3cr3t" not in call.name
+        assert summary["method"] == "POST"
+        assert summary["url"].endswith("/oauth/token?client_secret=REDACTED")
+        assert summary["request_bytes"] > 0
+        assert summary["deserialize_ms"] > 0
+
+    def test_writes_a_chrome_trace(
+        self, server: FaultInjectingServer, tmp_path: Path
+    ) -> None:
+        http_trace.start_recording()
+        _list_ssh_keys(server)
+        http_trace.finish_recording(tmp_path / "trace.json")
+
+        trace: Dict[str, Any] = json.loads((tmp_path / "trace.json").read_text())
+        events: List[Dict[str, Any]] = trace["traceEvents"]
+        names: List[str] = [e["name"] for e in events if e["ph"] == "X"]
+        assert names[0] == "ListSshKeysSdkCommand"
+        assert f"GET {server.url}{SSH_KEYS_PATH}" in names
+        assert {"connect", "deserialize"} <= set(names)
+        assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in events)
+        assert all(e["dur"] >= 0 for e in events if e["ph"] == "X")
+
+    def test_is_inactive_without_a_recording(
+        self, server: FaultInjectingServer
+    ) -> None:
+        with trace_http_call("ListSshKeysSdkCommand") as call:
+            _list_ssh_keys(server)
+
+        assert call is None
+
+
+@pytest.mark.unit
+class TestRedactUrl:
+    def test_redacts_credentials_and_secret_parameters(self) -> None:
+        assert (
+            redact_url("https://user:pw@api.exalsius.ai/logs?access_token=t&limit=5")
+            == "https://api.exalsius.ai/logs?access_token=REDACTED&limit=5"
+        )
+
+    def test_keeps_plain_urls(self) -> None:
+        assert (
+            redact_url("https://api.exalsius.ai/nodes/n-1")
+            == "https://api.exalsius.ai/nodes/n-1"
+        )
@@ -0,0 +1,74 @@
+from typing import Any
+
+import pytest
+import typer
+import typer.main
+from typer.testing import CliRunner
+
+from exls.shared.adapters.ui.lazy import LazySubcommand, LazyTyperGroup
+
+sub_app = typer.Typer()
+
+
+@sub_app.command("hello")
+def hello() -> None:
+    """Say hello"""
+    typer.echo("hello")
+
+
+def standalone() -> None:
+    """A standalone command"""
+    typer.echo("standalone")
+
+
+class _Group(LazyTyperGroup):
+    lazy_subcommands = {
+        "sub": LazySubcommand(
+            import_path="tests.unit.shared.test_lazy:sub_app", help="A sub app"
+        ),
+        "standalone": LazySubcommand(
+            import_path="tests.unit.shared.test_lazy:standalone"
+        ),
+    }
+
+
+def _app() -> typer.Typer:
+    app = typer.Typer(cls=_Group)
+
+    @app.callback()
+    def root() -> None:  # pyright: ignore[reportUnusedFunction]
+        """Root"""
+
+    return app
+
+
+@pytest.mark.unit
+class TestLazyTyperGroup:
+    def test_subcommands_are_listed_in_declaration_order(self) -> None:
+        group: Any = typer.main.get_command(_app())
+        ctx = group.make_context("root", [], resilient_parsing=True)
+        assert group.list_commands(ctx) == ["sub", "standalone"]
+
+    def test_subcommands_are_loaded_on_first_use(self) -> None:
+        group: Any = typer.main.get_command(_app())
+        ctx = group.make_context("root", [], resilient_parsing=True)
+        assert "sub" not in group.commands
+
+        command = group.get_command(ctx, "sub")
+
+        assert command is not None
+        assert command.help == "A sub app"
+        assert group.commands["sub"] is command
+        assert group.get_command(ctx, "sub") is command
+
+    def test_unknown_subcommand(self) -> None:
+        group: Any = typer.main.get_command(_app())
+        ctx = group.make_context("root", [], resilient_parsing=True)
+        assert group.get_command(ctx, "unknown") is None
+
+    def test_invoke_lazy_subcommands(self) -> None:
+        runner = CliRunner()
+        app = _app()
+
+        assert runner.invoke(app, ["sub", "hello"]).output == "hello\n"
+        assert runner.invoke(app, ["standalone"]).output == "standalone\n"
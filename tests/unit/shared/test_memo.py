@@ -0,0 +1,126 @@
+import threading
+import time
+from typing import Iterator, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from exls.management.adapters.gateway.sdk.sdk import ManagementGatewaySdk
+from exls.shared.adapters import memo
+from exls.shared.adapters.memo import ReadMemo, invalidates, memoized_read
+from exls.shared.core.polling import poll_until
+
+
+class _Gateway:
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+        self.release: threading.Event = threading.Event()
+        self.release.set()
+
+    @memoized_read("clusters")
+    def get(self, cluster_id: str) -> List[str]:
+        self.release.wait(timeout=5)
+        self.calls.append(cluster_id)
+        return [cluster_id]
+
+    @memoized_read("clusters")
+    def fail(self) -> None:
+        self.calls.append("fail")
+        raise ConnectionError("down")
+
+    @invalidates("clusters")
+    def delete(self, cluster_id: str) -> str:
+        return cluster_id
+
+
+@pytest.fixture
+def read_memo() -> Iterator[ReadMemo]:
+    yield memo.start_invocation()
+    memo.finish_invocation()
+
+
+@pytest.mark.unit
+class TestReadMemo:
+    def test_repeated_reads_are_answered_from_memory(self, read_memo: ReadMemo) -> None:
+        gateway: _Gateway = _Gateway()
+
+        first: List[str] = gateway.get("c1")
+        first.append("mutated by the caller")
+
+        assert gateway.get("c1") == ["c1"]
+        assert gateway.get("c2") == ["c2"]
+        assert gateway.calls == ["c1", "c2"]
+        assert read_memo.counters["hits"] == 1
+
+    def test_concurrent_identical_reads_share_one_call(
+        self, read_memo: ReadMemo
+    ) -> None:
+        gateway: _Gateway = _Gateway()
+        gateway.release.clear()
+        results: List[List[str]] = []
+        threads: List[threading.Thread] = [
+            threading.Thread(target=lambda: results.append(gateway.get("c1")))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        gateway.release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == [["c1"]] * 5
+        assert gateway.calls == ["c1"]
+        assert read_memo.counters["shared"] == 4
+
+    def test_mutations_invalidate_the_resource(self, read_memo: ReadMemo) -> None:
+        gateway: _Gateway = _Gateway()
+        gateway.get("c1")
+
+        gateway.delete("c1")
+        gateway.get("c1")
+
+        assert gateway.calls == ["c1", "c1"]
+        assert read_memo.counters["invalidations"] == 1
+
+    def test_failures_are_not_remembered(self, read_memo: ReadMemo) -> None:
+        gateway: _Gateway = _Gateway()
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                gateway.fail()
+
+        assert gateway.calls == ["fail", "fail"]
+
+    def test_polling_bypasses_the_memo(self, read_memo: ReadMemo) -> None:
+        gateway: _Gateway = _Gateway()
+        gateway.get("c1")
+
+        poll_until(
+            fetcher=lambda: gateway.get("c1"),
+            predicate=lambda _: len(gateway.calls) == 3,
+            interval_seconds=0,
+        )
+
+        assert gateway.calls == ["c1", "c1", "c1"]
+        assert read_memo.counters["bypassed"] == 2
+
+    def test_reads_outside_of_an_invocation_are_not_memoized(self) -> None:
+        gateway: _Gateway = _Gateway()
+
+        gateway.get("c1")
+        gateway.get("c1")
+
+        assert gateway.calls == ["c1", "c1"]
+
+    def test_sdk_gateway_reads_are_memoized(self, read_memo: ReadMemo) -> None:
+        management_api: MagicMock = MagicMock()
+        management_api.list_ssh_keys.return_value.ssh_keys = []
+        gateway: ManagementGatewaySdk = ManagementGatewaySdk(management_api)
+
+        gateway.list_ssh_keys()
+        gateway.list_ssh_keys()
+        gateway.delete_ssh_key("key-1")
+        gateway.list_ssh_keys()
+
+        assert management_api.list_ssh_keys.call_count == 2
@@ -0,0 +1,61 @@
+import json
+from typing import Iterator, List
+
+import pytest
+from pydantic import BaseModel
+
+from exls.shared.adapters.ui.output.render.json import (
+    JsonListStringRenderer,
+    JsonRenderContext,
+)
+from exls.shared.core.pagination import limit_pages, paginate
+
+
+class _Item(BaseModel):
+    id: int
+
+
+def _pages(*sizes: int) -> List[List[_Item]]:
+    pages: List[List[_Item]] = []
+    next_id: int = 0
+    for size in sizes:
+        pages.append([_Item(id=next_id + i) for i in range(size)])
+        next_id += size
+    return pages
+
+
+@pytest.mark.unit
+class TestPagination:
+    def test_paginate_splits_items(self) -> None:
+        assert list(paginate(range(5), page_size=2)) == [[0, 1], [2, 3], [4]]
+        empty: List[int] = []
+        assert list(paginate(empty, page_size=2)) == []
+
+    def test_limit_pages_does_not_pull_further_pages(self) -> None:
+        pulled: List[int] = []
+
+        def _source() -> Iterator[List[int]]:
+            for page in ([1, 2], [3, 4], [5, 6]):
+                pulled.append(page[0])
+                yield page
+
+        assert list(limit_pages(_source(), limit=3)) == [[1, 2], [3]]
+        assert pulled == [1, 3]
+
+    def test_limit_pages_without_limit(self) -> None:
+        assert list(limit_pages([[1], [2]], limit=None)) == [[1], [2]]
+
+
+@pytest.mark.unit
+class TestJsonRenderPages:
+    @pytest.mark.parametrize("sizes", [(), (0,), (1,), (3,), (2, 0, 1), (1, 1, 1)])
+    def test_streams_the_same_array_as_render(self, sizes: tuple[int, ...]) -> None:
+        renderer: JsonListStringRenderer[_Item] = JsonListStringRenderer()
+        context: JsonRenderContext = JsonRenderContext(indent=2)
+        pages: List[List[_Item]] = _pages(*sizes)
+
+        chunks: List[str] = list(renderer.render_pages(iter(pages), context))
+
+        items: List[_Item] = [item for page in pages for item in page]
+        assert "\n".join(chunks) == renderer.render(items, context)
+        assert json.loads("\n".join(chunks)) == [{"id": i} for i in range(len(items))]
@@ -1,10 +1,26 @@
-from typing import Any, Callable, Iterable, List
+import asyncio
+import contextvars
+import threading
+import time
+from typing import Any, Callable, Iterable, List, Set
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from exls.shared.core.parallel import (
+    AdaptiveLimiter,
+    CancellationToken,
+    ExecutionAbortedError,
     ExecutionFailure,
+    ExecutionOutcome,
+    ExecutionProgress,
+    ExecutionStatus,
     ParallelExecutionResult,
+    call_concurrently,
+    execute_concurrently,
     execute_in_parallel,
+    iter_concurrently,
+    report_response,
 )
 
 
@@ -189,3 +205,335 @@ class TestParallelExecution:
         assert len(result.failures) == 2
         assert result.failures[0].item == 2
         assert result.failures[1].item == 4
+
+
+class TestConcurrentExecution:
+    """Tests for the execute_concurrently function."""
+
+    def test_execute_concurrently_bounds_in_flight_coroutines(self) -> None:
+        in_flight: List[int] = [0]
+        peak: List[int] = [0]
+
+        async def track(x: int) -> int:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.001)
+            in_flight[0] -= 1
+            return x * 2
+
+        result = execute_concurrently(list(range(100)), track, max_concurrency=7)
+
+        assert result.successes == [x * 2 for x in range(100)]
+        assert peak[0] == 7
+
+    def test_execute_concurrently_captures_failures(self) -> None:
+        async def fail_on_odd(x: int) -> int:
+            if x % 2:
+                raise ValueError(f"odd {x}")
+            return x
+
+        result = execute_concurrently([1, 2, 3, 4], fail_on_odd)
+
+        assert result.successes == [2, 4]
+        assert [failure.item for failure in result.failures] == [1, 3]
+        assert result.failures[0].message == "odd 1"
+
+    def test_execute_concurrently_runs_blocking_calls_in_bounded_threads(
+        self,
+    ) -> None:
+        threads: Set[str] = set()
+
+        def blocking(x: int) -> int:
+            threads.add(threading.current_thread().name)
+            time.sleep(0.005)
+            return x
+
+        async def offload(x: int) -> int:
+            return await asyncio.to_thread(blocking, x)
+
+        result = execute_concurrently(list(range(50)), offload, max_concurrency=4)
+
+        assert sorted(result.successes) == list(range(50))
+        assert len(threads) <= 4
+
+
+class TestStreamingExecution:
+    """Tests for iter_concurrently and the progress and abort options."""
+
+    def test_iter_concurrently_yields_outcomes_as_they_complete(self) -> None:
+        async def sleep_for(x: int) -> int:
+            await asyncio.sleep(x * 0.01)
+            return x
+
+        outcomes: List[ExecutionOutcome[int, int]] = list(
+            iter_concurrently([3, 1, 2], sleep_for, max_concurrency=3)
+        )
+
+        assert [outcome.result for outcome in outcomes] == [1, 2, 3]
+        assert [outcome.index for outcome in outcomes] == [1, 2, 0]
+
+    def test_iter_concurrently_cancels_the_rest_when_closed(self) -> None:
+        started: List[int] = []
+
+        async def record(x: int) -> int:
+            started.append(x)
+            await asyncio.sleep(0.01)
+            return x
+
+        outcomes = iter_concurrently(list(range(10)), record, max_concurrency=2)
+        next(outcomes)
+        outcomes.close()
+
+        assert len(started) < 10
+
+    def test_execute_concurrently_reports_progress(self) -> None:
+        async def fail_on_odd(x: int) -> int:
+            if x % 2:
+                raise ValueError(f"odd {x}")
+            return x
+
+        progress: List[ExecutionProgress[int]] = []
+        execute_concurrently([1, 2, 3, 4], fail_on_odd, on_progress=progress.append)
+
+        assert [p.completed for p in progress] == [1, 2, 3, 4]
+        assert progress[-1].total == 4
+        assert progress[-1].failed == 2
+        assert sorted(p.item for p in progress) == [1, 2, 3, 4]
+
+    def test_execute_concurrently_skips_the_rest_after_max_failures(self) -> None:
+        calls: List[int] = []
+
+        async def fail_always(x: int) -> int:
+            calls.append(x)
+            raise ValueError(f"failed {x}")
+
+        result = execute_concurrently(
+            list(range(10)), fail_always, max_concurrency=2, max_failures=3
+        )
+
+        assert len(calls) < 10
+        assert [failure.item for failure in result.failures] == list(range(10))
+        assert all(
+            isinstance(failure.error, ExecutionAbortedError)
+            for failure in result.failures[len(calls) :]
+        )
+
+
+class TestDeadlinesAndCancellation:
+    """Tests for the timeouts and the cancellation of a batch."""
+
+    def test_item_timeout_fails_only_the_slow_items(self) -> None:
+        async def sleep_for(x: int) -> int:
+            await asyncio.sleep(x)
+            return x
+
+        result = execute_concurrently(
+            [0, 5, 0], sleep_for, max_concurrency=3, item_timeout_seconds=0.05
+        )
+
+        assert result.successes == [0, 0]
+        assert [failure.status for failure in result.failures] == [
+            ExecutionStatus.TIMED_OUT
+        ]
+
+    def test_deadline_stops_the_batch(self) -> None:
+        async def sleep_briefly(x: int) -> int:
+            await asyncio.sleep(0.05)
+            return x
+
+        start: float = time.monotonic()
+        result = execute_concurrently(
+            list(range(20)), sleep_briefly, max_concurrency=2, timeout_seconds=0.08
+        )
+
+        counts = result.status_counts()
+        assert time.monotonic() - start < 0.5
+        assert counts[ExecutionStatus.SUCCEEDED] == 2
+        assert counts[ExecutionStatus.TIMED_OUT] == 2
+        assert counts[ExecutionStatus.NOT_STARTED] == 16
+
+    def test_cancellation_token_stops_running_and_queued_items(self) -> None:
+        token = CancellationToken()
+
+        async def cancel_on_first(x: int) -> int:
+            if x == 0:
+                token.cancel()
+            await asyncio.sleep(1)
+            return x
+
+        start: float = time.monotonic()
+        result = execute_concurrently(
+            list(range(10)), cancel_on_first, max_concurrency=2, cancellation=token
+        )
+
+        counts = result.status_counts()
+        assert time.monotonic() - start < 0.5
+        assert counts[ExecutionStatus.CANCELLED] == 2
+        assert counts[ExecutionStatus.NOT_STARTED] == 8
+        assert not result.interrupted
+
+    def test_cancellation_token_calls_late_callbacks_immediately(self) -> None:
+        token = CancellationToken()
+        calls: List[str] = []
+        unregister = token.on_cancel(lambda: calls.append("early"))
+        unregister()
+
+        token.cancel()
+        token.on_cancel(lambda: calls.append("late"))
+
+        assert token.is_cancelled
+        assert calls == ["late"]
+
+    def test_blocking_calls_are_not_waited_for_after_cancellation(self) -> None:
+        token = CancellationToken()
+        release = threading.Event()
+
+        def block(x: int) -> int:
+            token.cancel()
+            release.wait(timeout=5)
+            return x
+
+        async def block_in_thread(x: int) -> int:
+            return await asyncio.to_thread(block, x)
+
+        start: float = time.monotonic()
+        result = execute_concurrently(
+            [1, 2, 3], block_in_thread, max_concurrency=1, cancellation=token
+        )
+        release.set()
+
+        assert time.monotonic() - start < 1
+        assert result.status_counts()[ExecutionStatus.CANCELLED] == 1
+
+
+class TestAdaptiveLimiter:
+    """Tests for the AIMD concurrency limit."""
+
+    def test_slow_start_doubles_the_limit_per_round(self) -> None:
+        limiter = AdaptiveLimiter(min_limit=1, max_limit=100)
+
+        limits: List[int] = []
+        for _ in range(4):
+            for _ in range(limiter.limit):
+                limiter.on_response(0.01, overloaded=False)
+            limits.append(limiter.limit)
+
+        assert limits == [2, 4, 8, 16]
+
+    def test_overload_halves_the_limit_once_per_round(self) -> None:
+        limiter = AdaptiveLimiter(min_limit=2, max_limit=16)
+        for _ in range(14):
+            limiter.on_response(0.01, overloaded=False)
+        assert limiter.limit == 16
+
+        for _ in range(16):
+            limiter.on_response(0.01, overloaded=True)
+
+        assert limiter.limit == 8
+        assert limiter.counters["decreases"] == 1
+
+    def test_increases_by_one_per_round_after_a_decrease(self) -> None:
+        limiter = AdaptiveLimiter(min_limit=1, max_limit=100)
+        for _ in range(7):
+            limiter.on_response(0.01, overloaded=False)
+        limiter.on_response(0.01, overloaded=True)
+        assert limiter.limit == 4
+
+        # The responses to the other 7 requests sent at the old limit
+        for _ in range(7):
+            limiter.on_response(0.01, overloaded=False)
+        assert limiter.limit == 4
+        for _ in range(4):
+            limiter.on_response(0.01, overloaded=False)
+
+        assert limiter.limit == 5
+
+    def test_slow_responses_count_as_overload(self) -> None:
+        limiter = AdaptiveLimiter(min_limit=1, max_limit=10, latency_tolerance=3.0)
+        for _ in range(7):
+            limiter.on_response(0.01, overloaded=False)
+
+        limiter.on_response(0.02, overloaded=False)
+        assert limiter.limit == 9
+        limiter.on_response(0.5, overloaded=False)
+        assert limiter.limit == 4
+
+    def test_stays_within_floor_and_ceiling(self) -> None:
+        limiter = AdaptiveLimiter(min_limit=3, max_limit=5)
+        for _ in range(20):
+            limiter.on_response(0.01, overloaded=False)
+        assert limiter.limit == 5
+
+        for _ in range(20):
+            limiter.on_response(0.01, overloaded=True)
+        assert limiter.limit == 3
+
+    def test_batch_follows_the_limit_and_receives_reports(self) -> None:
+        limiter = AdaptiveLimiter(min_limit=1, max_limit=4)
+        in_flight: List[int] = [0]
+        peaks: List[int] = []
+
+        def request(x: int) -> int:
+            report_response(0.01, overloaded=x >= 20)
+            return x
+
+        async def track(x: int) -> int:
+            in_flight[0] += 1
+            peaks.append(in_flight[0])
+            await asyncio.sleep(0.001)
+            try:
+                return await asyncio.to_thread(request, x)
+            finally:
+                in_flight[0] -= 1
+
+        result = execute_concurrently(
+            list(range(40)), track, max_concurrency=10, limiter=limiter
+        )
+
+        assert len(result.successes) == 40
+        assert peaks[0] == 1
+        assert max(peaks) == 4
+        assert limiter.counters["decreases"] > 0
+        assert limiter.limit < 4
+
+
+class TestCallConcurrently:
+    """Tests for the call_concurrently function."""
+
+    def test_returns_the_results_in_the_order_of_the_calls(self) -> None:
+        def slow(value: int, seconds: float) -> Callable[[], int]:
+            def _call() -> int:
+                time.sleep(seconds)
+                return value
+
+            return _call
+
+        start = time.perf_counter()
+        results = call_concurrently(slow(1, 0.2), slow(2, 0.1), slow(3, 0.2))
+        elapsed = time.perf_counter() - start
+
+        assert results == [1, 2, 3]
+        assert elapsed < 0.4
+
+    def test_raises_the_error_of_the_first_failed_call(self) -> None:
+        def fail_later() -> None:
+            time.sleep(0.05)
+            raise ValueError("first")
+
+        def fail_now() -> None:
+            raise KeyError("second")
+
+        with pytest.raises(ValueError, match="first"):
+            call_concurrently(fail_later, fail_now)
+
+    def test_runs_the_calls_in_the_callers_context(self) -> None:
+        variable: contextvars.ContextVar[str] = contextvars.ContextVar(
+            "variable", default="unset"
+        )
+        token = variable.set("caller")
+        try:
+            results = call_concurrently(variable.get, variable.get)
+        finally:
+            variable.reset(token)
+
+        assert results == ["caller", "caller"]
@@ -1,8 +1,21 @@
+import itertools
+import threading
+from concurrent.futures import Future, wait
+from typing import Any, Dict, Generator, List
 from unittest.mock import Mock, patch
 
 import pytest
 
-from exls.shared.core.polling import PollingTimeoutError, poll_until
+from exls.shared.core.polling import (
+    BatchWatcher,
+    PollingTimeoutError,
+    SnapshotChanges,
+    WatchedResourceNotFoundError,
+    diff_snapshots,
+    is_polling,
+    poll_until,
+    watch_snapshots,
+)
 
 
 def test_poll_until_success_immediately() -> None:
@@ -158,3 +171,225 @@ def test_poll_until_interval_larger_than_timeout(mock_time: Mock) -> None:
     # because sleep happens before the next check in the loop
     # actually sleep happens after the check for timeout fails.
     mock_time.sleep.assert_called_with(10)
+
+
+class _Fleet:
+    """A fetcher whose resources become ready after a number of fetches."""
+
+    def __init__(self, ready_after: Dict[str, int]):
+        self.ready_after: Dict[str, int] = ready_after
+        self.fetches: int = 0
+        self.lock: threading.Lock = threading.Lock()
+
+    def fetch(self) -> Dict[str, str]:
+        with self.lock:
+            self.fetches += 1
+            return {
+                resource_id: "ready" if self.fetches >= ready_after else "pending"
+                for resource_id, ready_after in self.ready_after.items()
+            }
+
+
+def _is_ready(state: str) -> bool:
+    return state == "ready"
+
+
+def test_batch_watcher_uses_one_fetch_per_tick_for_all_waiters() -> None:
+    fleet = _Fleet({f"node-{i}": 1 + i % 3 for i in range(50)})
+    watcher: BatchWatcher[str] = BatchWatcher(fetch=fleet.fetch, interval_seconds=0.01)
+
+    futures: List[Future[str]] = [
+        watcher.watch(resource_id, _is_ready, timeout_seconds=5)
+        for resource_id in fleet.ready_after
+    ]
+    wait(futures, timeout=5)
+
+    assert [future.result() for future in futures] == ["ready"] * 50
+    assert fleet.fetches <= 4
+
+
+def test_batch_watcher_times_out_pending_resources() -> None:
+    watcher: BatchWatcher[str] = BatchWatcher(
+        fetch=lambda: {"node-1": "pending"}, interval_seconds=0.01
+    )
+
+    with pytest.raises(PollingTimeoutError, match="Custom timeout"):
+        watcher.wait(
+            "node-1", _is_ready, timeout_seconds=0.05, error_message="Custom timeout"
+        )
+
+
+def test_batch_watcher_fails_missing_resources_if_final() -> None:
+    watcher: BatchWatcher[str] = BatchWatcher(
+        fetch=lambda: {}, interval_seconds=0.01, missing_is_final=True
+    )
+
+    with pytest.raises(WatchedResourceNotFoundError):
+        watcher.wait("node-1", _is_ready, timeout_seconds=5)
+
+
+def test_batch_watcher_propagates_predicate_and_fetch_errors() -> None:
+    def explode(state: str) -> bool:
+        raise ValueError("Boom")
+
+    watcher: BatchWatcher[str] = BatchWatcher(
+        fetch=lambda: {"node-1": "ready"}, interval_seconds=0.01
+    )
+    failing: BatchWatcher[str] = BatchWatcher(
+        fetch=Mock(side_effect=RuntimeError("Down")), interval_seconds=0.01
+    )
+
+    with pytest.raises(ValueError, match="Boom"):
+        watcher.wait("node-1", explode, timeout_seconds=5)
+    with pytest.raises(RuntimeError, match="Down"):
+        failing.wait("node-1", _is_ready, timeout_seconds=5)
+
+
+def test_batch_watcher_drops_cancelled_waiters() -> None:
+    fleet = _Fleet({"node-1": 1000})
+    watcher: BatchWatcher[str] = BatchWatcher(fetch=fleet.fetch, interval_seconds=0.01)
+
+    future: Future[str] = watcher.watch("node-1", _is_ready, timeout_seconds=5)
+    future.cancel()
+    fetches: int = fleet.fetches
+    threading.Event().wait(0.05)
+
+    assert fleet.fetches <= fetches + 1
+
+
+def test_batch_watcher_ticks_on_wakeups() -> None:
+    fleet = _Fleet({"node-1": 2, "node-2": 1000})
+    released = threading.Event()
+
+    def wakeups() -> Generator[str, None, None]:
+        released.wait(timeout=5)
+        yield "node-1 is ready"
+
+    watcher: BatchWatcher[str] = BatchWatcher(
+        fetch=fleet.fetch,
+        interval_seconds=30,
+        wakeups=wakeups,
+        wakeup_interval_seconds=0,
+    )
+
+    first: Future[str] = watcher.watch("node-1", _is_ready, timeout_seconds=10)
+    second: Future[str] = watcher.watch("node-2", _is_ready, timeout_seconds=0.5)
+    fleet.ready_after["node-1"] = fleet.fetches + 1
+    released.set()
+
+    assert first.result(timeout=5) == "ready"
+    # The stream has ended; the other waiter is still checked at its deadline.
+    with pytest.raises(PollingTimeoutError):
+        second.result(timeout=5)
+
+
+class _QuietStream(Generator[str, None, None]):
+    """A stream without items whose close, like that of a socket, ends the read."""
+
+    def __init__(self):
+        self.closed: threading.Event = threading.Event()
+
+    def send(self, value: None) -> str:
+        self.closed.wait()
+        raise StopIteration
+
+    def throw(self, typ: Any, val: Any = None, tb: Any = None) -> str:
+        raise StopIteration
+
+    def close(self) -> None:
+        self.closed.set()
+
+
+def test_batch_watcher_closes_the_wakeup_stream_after_the_last_waiter() -> None:
+    fleet = _Fleet({"node-1": 2})
+    stream = _QuietStream()
+    watcher: BatchWatcher[str] = BatchWatcher(
+        fetch=fleet.fetch, interval_seconds=0.01, wakeups=lambda: stream
+    )
+
+    assert watcher.wait("node-1", _is_ready, timeout_seconds=5) == "ready"
+    assert stream.closed.wait(timeout=1)
+
+
+def test_batch_watcher_listener_goes_with_a_stream_that_ends_by_itself() -> None:
+    fleet = _Fleet({"node-1": 10})
+    opened: List[int] = []
+
+    def wakeups() -> Generator[str, None, None]:
+        # Like a stream with a read timeout, it ends after a while without items.
+        opened.append(1)
+        threading.Event().wait(0.05)
+        return
+        yield
+
+    watcher: BatchWatcher[str] = BatchWatcher(
+        fetch=fleet.fetch, interval_seconds=0.01, wakeups=wakeups
+    )
+
+    assert watcher.wait("node-1", _is_ready, timeout_seconds=5) == "ready"
+    # The stream was opened again while the waiter was pending.
+    assert len(opened) > 1
+    for _ in range(100):
+        if not any(
+            thread.name == "batch-watcher-wakeups" for thread in threading.enumerate()
+        ):
+            break
+        threading.Event().wait(0.01)
+    else:
+        pytest.fail("The wakeup listener outlived its waiters")
+
+
+def test_diff_snapshots_reports_added_changed_and_removed() -> None:
+    changes: SnapshotChanges[str] = diff_snapshots(
+        {"a": "pending", "b": "ready", "c": "ready"},
+        {"b": "failed", "c": "ready", "d": "pending"},
+    )
+
+    assert changes.added == ["d"]
+    assert changes.changed == ["b"]
+    assert changes.removed == {"a": "pending"}
+    assert list(changes.snapshot) == ["b", "c", "d"]
+
+
+@patch("exls.shared.core.polling.time")
+def test_watch_snapshots_yields_only_changes(mock_time: Mock) -> None:
+    listings: List[List[str]] = [["a"], ["a"], ["a", "b"], ["b"]]
+    polling: List[bool] = []
+
+    def fetch() -> List[str]:
+        polling.append(is_polling())
+        return listings.pop(0)
+
+    changes: List[SnapshotChanges[str]] = list(
+        itertools.islice(watch_snapshots(fetch, key=lambda item: item), 3)
+    )
+
+    assert [change.added for change in changes] == [["a"], ["b"], []]
+    assert list(changes[2].removed) == ["a"]
+    assert all(polling)
+    assert mock_time.sleep.call_count == 3
+
+
+@patch("exls.shared.core.polling.time")
+def test_watch_snapshots_keeps_watching_after_a_failed_fetch(mock_time: Mock) -> None:
+    listings: List[Any] = [["a"], RuntimeError("Backend down"), ["a"], ["a", "b"]]
+
+    def fetch() -> List[str]:
+        listing: Any = listings.pop(0)
+        if isinstance(listing, Exception):
+            raise listing
+        return listing
+
+    changes: List[SnapshotChanges[str]] = list(
+        itertools.islice(watch_snapshots(fetch, key=lambda item: item), 4)
+    )
+
+    assert [change.error for change in changes] == [None, "Backend down", None, None]
+    # The last known state is kept and shown again once the backend recovers.
+    assert [list(change.snapshot) for change in changes] == [
+        ["a"],
+        ["a"],
+        ["a"],
+        ["a", "b"],
+    ]
+    assert [change.added for change in changes] == [["a"], [], [], ["b"]]
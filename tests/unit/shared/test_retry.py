@@ -0,0 +1,281 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from exalsius_api_client.api.nodes_api import NodesApi
+from exalsius_api_client.api_client import ApiClient
+from exalsius_api_client.configuration import Configuration
+from exalsius_api_client.models.node_import_ssh_request import NodeImportSshRequest
+from pydantic import BaseModel
+
+from exls.auth.adapters.auth0 import auth0
+from exls.auth.adapters.auth0.auth0 import Auth0Adapter
+from exls.auth.adapters.auth0.commands import Auth0GetTokenFromDeviceCodeCommand
+from exls.auth.adapters.auth0.config import Auth0Config
+from exls.auth.core.domain import DeviceCode, Token
+from exls.nodes.adapters.gateway.sdk.commands import (
+    DeleteNodeSdkCommand,
+    ImportSSHNodeSdkCommand,
+)
+from exls.shared.adapters import retry
+from exls.shared.adapters.http.commands import (
+    HTTPCommandError,
+    PostRequestWithResponseCommand,
+)
+from exls.shared.adapters.retry import (
+    RetryBudget,
+    RetryPolicy,
+    TransientFailure,
+    call_with_retries,
+    disable_transport_retries,
+    parse_retry_after,
+)
+from exls.shared.adapters.sdk.command import ExalsiusSdkCommandError
+from tests.support.http import FaultInjectingServer, ScriptedResponse
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch: pytest.MonkeyPatch) -> RetryBudget:
+    budget: RetryBudget = RetryBudget(retries=10)
+    monkeypatch.setattr(retry, "_policy", RetryPolicy(base_delay_seconds=0.001))
+    monkeypatch.setattr(retry, "_budget", budget)
+    return budget
+
+
+@pytest.fixture
+def server() -> Iterator[FaultInjectingServer]:
+    server: FaultInjectingServer = FaultInjectingServer().start()
+    yield server
+    server.stop()
+
+
+def _nodes_api(server: FaultInjectingServer) -> NodesApi:
+    configuration: Configuration = Configuration(host=server.url)
+    disable_transport_retries(configuration)
+    return NodesApi(api_client=ApiClient(configuration))
+
+
+class _TokenResponse(BaseModel):
+    access_token: str
+
+
+class _PostTokenCommand(PostRequestWithResponseCommand[_TokenResponse]):
+    def __init__(self, url: str):
+        super().__init__(model=_TokenResponse)
+        self._url: str = url
+
+    def _get_url(self) -> str:
+        return self._url
+
+    def _get_payload(self) -> Dict[str, Any]:
+        return {"grant_type": "refresh_token"}
+
+
+@pytest.mark.unit
+class TestRetryPolicy:
+    @pytest.mark.parametrize(
+        "failure, idempotent, expected",
+        [
+            (TransientFailure(description="", status=502), True, True),
+            (TransientFailure(description="", status=502), False, False),
+            (TransientFailure(description="", status=429), False, True),
+            (TransientFailure(description="", status=404), True, False),
+            (TransientFailure(description=""), True, True),
+            (TransientFailure(description=""), False, False),
+            (TransientFailure(description="", request_sent=False), False, True),
+        ],
+    )
+    def test_should_retry(
+        self, failure: TransientFailure, idempotent: bool, expected: bool
+    ) -> None:
+        assert RetryPolicy().should_retry(failure, idempotent) is expected
+
+    def test_backoff_is_jittered_below_the_exponential_ceiling(self) -> None:
+        policy: RetryPolicy = RetryPolicy(base_delay_seconds=1, max_delay_seconds=5)
+        failure: TransientFailure = TransientFailure(description="")
+
+        assert all(0 <= policy.backoff_seconds(2, failure) <= 2 for _ in range(50))
+        assert all(0 <= policy.backoff_seconds(10, failure) <= 5 for _ in range(50))
+
+    def test_backoff_honors_retry_after(self) -> None:
+        failure: TransientFailure = TransientFailure(
+            description="", retry_after_seconds=7
+        )
+
+        assert RetryPolicy().backoff_seconds(1, failure) == 7
+
+
+@pytest.mark.unit
+class TestParseRetryAfter:
+    def test_seconds(self) -> None:
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date(self) -> None:
+        retry_at: datetime = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        seconds = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        assert seconds is not None and 25 < seconds <= 30
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_invalid(self, value: Any) -> None:
+        assert parse_retry_after(value) is None
+
+
+@pytest.mark.unit
+class TestCallWithRetries:
+    def test_stops_when_the_budget_is_used_up(self) -> None:
+        budget: RetryBudget = RetryBudget(retries=2)
+        calls: int = 0
+
+        def _fail() -> None:
+            nonlocal calls
+            calls += 1
+            raise ConnectionError("down")
+
+        with pytest.raises(ConnectionError):
+            call_with_retries(
+                _fail,
+                name="test",
+                idempotent=True,
+                classify=lambda e: TransientFailure(description=str(e)),
+                budget=budget,
+            )
+
+        assert calls == 3
+        assert budget.counters["retries"] == 2
+        assert budget.counters["budget_exhausted"] == 1
+
+    def test_gives_up_when_retry_after_exceeds_the_max_delay(self) -> None:
+        calls: int = 0
+
+        def _fail() -> None:
+            nonlocal calls
+            calls += 1
+            raise ConnectionError("busy")
+
+        with pytest.raises(ConnectionError):
+            call_with_retries(
+                _fail,
+                name="test",
+                idempotent=True,
+                classify=lambda e: TransientFailure(
+                    description=str(e), status=503, retry_after_seconds=3600
+                ),
+            )
+
+        assert calls == 1
+
+
+@pytest.mark.unit
+class TestRetriesAgainstFaultyServer:
+    def test_idempotent_sdk_call_recovers_from_transient_errors(
+        self, server: FaultInjectingServer, fast_retries: RetryBudget
+    ) -> None:
+        server.script(
+            "/node/node-1",
+            ScriptedResponse(status=502),
+            ScriptedResponse(status=429, headers={"Retry-After": "0"}),
+            ScriptedResponse(body={"node_id": "node-1"}),
+        )
+
+        response = DeleteNodeSdkCommand(_nodes_api(server), "node-1").execute()
+
+        assert response.node_id == "node-1"
+        assert server.requests == [("DELETE", "/node/node-1")] * 3
+        assert fast_retries.counters["retries"] == 2
+        assert fast_retries.counters["recovered"] == 1
+
+    def test_sdk_call_gives_up_after_max_retries(
+        self, server: FaultInjectingServer
+    ) -> None:
+        server.script("/node/node-1", *[ScriptedResponse(status=503)] * 10)
+
+        with pytest.raises(ExalsiusSdkCommandError) as exc_info:
+            DeleteNodeSdkCommand(_nodes_api(server), "node-1").execute()
+
+        assert exc_info.value.status == 503
+        assert len(server.requests) == 1 + RetryPolicy().max_retries
+
+    def test_non_idempotent_sdk_call_is_not_retried_after_server_error(
+        self, server: FaultInjectingServer
+    ) -> None:
+        server.script("/node/import/ssh", ScriptedResponse(status=502))
+        request: NodeImportSshRequest = NodeImportSshRequest(
+            hostname="node", endpoint="10.0.0.1:22", username="root", ssh_key_id="k"
+        )
+
+        with pytest.raises(ExalsiusSdkCommandError):
+            ImportSSHNodeSdkCommand(_nodes_api(server), request).execute()
+
+        assert len(server.requests) == 1
+
+    def test_post_is_retried_after_too_many_requests(
+        self, server: FaultInjectingServer
+    ) -> None:
+        server.script(
+            "/oauth/token",
+            ScriptedResponse(status=429, headers={"Retry-After": "0"}),
+            ScriptedResponse(body={"access_token": "token"}),
+        )
+
+        response = _PostTokenCommand(f"{server.url}/oauth/token").execute()
+
+        assert response.access_token == "token"
+        assert len(server.requests) == 2
+
+    def test_post_is_not_retried_after_server_error(
+        self, server: FaultInjectingServer
+    ) -> None:
+        server.script("/oauth/token", ScriptedResponse(status=502))
+
+        with pytest.raises(HTTPCommandError) as exc_info:
+            _PostTokenCommand(f"{server.url}/oauth/token").execute()
+
+        assert exc_info.value.status_code == 502
+        assert len(server.requests) == 1
+
+    def test_device_code_slow_down_reaches_the_login_loop(
+        self, server: FaultInjectingServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        server.script(
+            "/oauth/token",
+            ScriptedResponse(
+                status=429,
+                body={"error": "slow_down", "error_description": "Slow down"},
+            ),
+            ScriptedResponse(
+                body={
+                    "access_token": "access",
+                    "id_token": "id",
+                    "scope": "openid",
+                    "token_type": "Bearer",
+                    "expires_in": 3600,
+                }
+            ),
+        )
+
+        def token_url(_: Auth0GetTokenFromDeviceCodeCommand) -> str:
+            return f"{server.url}/oauth/token"
+
+        monkeypatch.setattr(Auth0GetTokenFromDeviceCodeCommand, "_get_url", token_url)
+        intervals: List[float] = []
+        monkeypatch.setattr(auth0, "sleep", intervals.append)
+        adapter: Auth0Adapter = Auth0Adapter(
+            Auth0Config(device_code_poll_interval_seconds=5)
+        )
+
+        token: Token = adapter.poll_for_authentication(
+            DeviceCode(
+                verification_uri="https://verify",
+                verification_uri_complete="https://verify?code=1",
+                user_code="1",
+                device_code="device",
+                expires_in=600,
+            )
+        )
+
+        assert token.access_token == "access"
+        assert len(server.requests) == 2
+        assert intervals == [5, 6]
@@ -0,0 +1,205 @@
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import jwt
+import pytest
+from exalsius_api_client.api.management_api import ManagementApi
+from exalsius_api_client.api_client import ApiClient
+from exalsius_api_client.configuration import Configuration
+from exalsius_api_client.models.ssh_keys_list_response import SshKeysListResponse
+
+from exls.management.adapters.gateway.sdk.commands import ListSshKeysSdkCommand
+from exls.shared.adapters.retry import disable_transport_retries
+from exls.shared.adapters.sdk.cache import (
+    SdkResponseCache,
+    api_client_of,
+    cache_namespace,
+)
+from exls.shared.adapters.sdk.command import ExalsiusSdkCommandError
+from exls.shared.core.polling import poll_until
+from tests.support.http import FaultInjectingServer, ScriptedResponse
+
+SSH_KEYS_PATH = "/management/ssh-keys"
+SSH_KEYS: Dict[str, Any] = {
+    "ssh_keys": [{"id": "key-1", "name": "default", "scope": "private"}],
+    "total": 1,
+}
+
+
+@pytest.fixture
+def server() -> Iterator[FaultInjectingServer]:
+    server: FaultInjectingServer = FaultInjectingServer(default_body=SSH_KEYS).start()
+    yield server
+    server.stop()
+
+
+def _management_api(server: FaultInjectingServer) -> ManagementApi:
+    configuration: Configuration = Configuration(host=server.url)
+    disable_transport_retries(configuration)
+    return ManagementApi(api_client=ApiClient(configuration))
+
+
+def _cache(
+    tmp_path: Path, max_age_seconds: int = 0, max_bytes: int = 1024 * 1024
+) -> SdkResponseCache:
+    return SdkResponseCache(
+        cache_dir=tmp_path,
+        namespace="user",
+        max_age_seconds=max_age_seconds,
+        max_bytes=max_bytes,
+    )
+
+
+def _list_ssh_keys(
+    server: FaultInjectingServer, cache: SdkResponseCache
+) -> SshKeysListResponse:
+    return ListSshKeysSdkCommand(
+        _management_api(server), response_cache=cache
+    ).execute()
+
+
+@pytest.mark.unit
+class TestSdkResponseCache:
+    def test_revalidates_with_etag(
+        self, server: FaultInjectingServer, tmp_path: Path
+    ) -> None:
+        server.script(
+            SSH_KEYS_PATH,
+            ScriptedResponse(body=SSH_KEYS, headers={"ETag": '"v1"'}),
+            ScriptedResponse(status=304),
+        )
+        cache: SdkResponseCache = _cache(tmp_path)
+
+        first: SshKeysListResponse = _list_ssh_keys(server, cache)
+        second: SshKeysListResponse = _list_ssh_keys(server, cache)
+
+        assert first == second
+        assert second.ssh_keys[0].id == "key-1"
+        assert "If-None-Match" not in server.request_headers[0]
+        assert server.request_headers[1]["If-None-Match"] == '"v1"'
+
+    def test_serves_fresh_entries_without_a_request(
+        self, server: FaultInjectingServer, tmp_path: Path
+    ) -> None:
+        cache: SdkResponseCache = _cache(tmp_path, max_age_seconds=60)
+
+        _list_ssh_keys(server, cache)
+        response: SshKeysListResponse = _list_ssh_keys(server, cache)
+
+        assert response.total == 1
+        assert len(server.requests) == 1
+
+    def test_revalidates_fresh_entries_while_polling(
+        self, server: FaultInjectingServer, tmp_path: Path
+    ) -> None:
+        server.script(
+            SSH_KEYS_PATH,
+            ScriptedResponse(body=SSH_KEYS, headers={"ETag": '"v1"'}),
+            ScriptedResponse(status=304),
+        )
+        cache: SdkResponseCache = _cache(tmp_path, max_age_seconds=60)
+
+        _list_ssh_keys(server, cache)
+        response: SshKeysListResponse = poll_until(
+            fetcher=lambda: _list_ssh_keys(server, cache),
+            predicate=lambda response: True,
+        )
+
+        assert response.total == 1
+        assert server.request_headers[1]["If-None-Match"] == '"v1"'
+
+    def test_fetches_again_without_etag(
+        self, server: FaultInjectingServer, tmp_path: Path
+    ) -> None:
+        cache: SdkResponseCache = _cache(tmp_path)
+
+        _list_ssh_keys(server, cache)
+        _list_ssh_keys(server, cache)
+
+        assert len(server.requests) == 2
+        assert "If-None-Match" not in server.request_headers[1]
+
+    def test_invalidate_drops_the_resource(
+        self, server: FaultInjectingServer, tmp_path: Path
+    ) -> None:
+        cache: SdkResponseCache = _cache(tmp_path, max_age_seconds=60)
+        _list_ssh_keys(server, cache)
+
+        cache.invalidate("ssh_keys")
+        _list_ssh_keys(server, cache)
+
+        assert len(server.requests) == 2
+
+    def test_error_responses_are_raised_and_not_cached(
+        self, server: FaultInjectingServer, tmp_path: Path
+    ) -> None:
+        server.script(SSH_KEYS_PATH, ScriptedResponse(status=404, body={}))
+        cache: SdkResponseCache = _cache(tmp_path, max_age_seconds=60)
+
+        with pytest.raises(ExalsiusSdkCommandError) as exc_info:
+            _list_ssh_keys(server, cache)
+
+        assert exc_info.value.status == 404
+        assert list(tmp_path.glob("*/*.json")) == []
+
+    def test_evicts_least_recently_used_entries(
+        self, server: FaultInjectingServer, tmp_path: Path
+    ) -> None:
+        def _get(cache: SdkResponseCache, key: str) -> None:
+            management_api: ManagementApi = _management_api(server)
+            cache.get(
+                api_client=api_client_of(management_api),
+                resource="ssh_keys",
+                key=key,
+                request=lambda headers: management_api.list_ssh_keys_without_preload_content(
+                    _headers=headers
+                ),
+                response_type="SshKeysListResponse",
+            )
+            # Keep the modification times of the entries apart.
+            time.sleep(0.02)
+
+        _get(_cache(tmp_path), "request a")
+        entry_size: int = next(tmp_path.glob("*/*.json")).stat().st_size
+        # Room for two entries, whose sizes differ by a few bytes.
+        cache: SdkResponseCache = _cache(
+            tmp_path, max_age_seconds=60, max_bytes=entry_size * 5 // 2
+        )
+
+        _get(cache, "request b")
+        _get(cache, "request a")
+        _get(cache, "request c")
+        _get(cache, "request a")
+        _get(cache, "request b")
+
+        assert len(list(tmp_path.glob("*/*.json"))) == 2
+        # a was used before c was stored, so b was evicted and fetched again.
+        assert len(server.requests) == 4
+
+
+@pytest.mark.unit
+class TestCacheNamespace:
+    def test_is_keyed_by_user_and_organization(self) -> None:
+        def _token(sub: str, org_id: str, exp: int) -> str:
+            return jwt.encode(
+                {"sub": sub, "org_id": org_id, "exp": exp},
+                "a-test-secret-that-is-long-enough-for-hs256",
+            )
+
+        host: str = "https://api.exalsius.ai"
+
+        assert cache_namespace(host, _token("u1", "o1", 1)) == cache_namespace(
+            host, _token("u1", "o1", 2)
+        )
+        assert cache_namespace(host, _token("u1", "o1", 1)) != cache_namespace(
+            host, _token("u1", "o2", 1)
+        )
+        assert cache_namespace(host, _token("u1", "o1", 1)) != cache_namespace(
+            host, _token("u2", "o1", 1)
+        )
+
+    def test_falls_back_to_opaque_tokens(self) -> None:
+        assert cache_namespace("host", "opaque-1") != cache_namespace(
+            "host", "opaque-2"
+        )
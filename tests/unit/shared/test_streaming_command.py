@@ -1,4 +1,5 @@
-from typing import Dict, Iterator
+import threading
+from typing import Dict, Iterator, Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,6 +11,7 @@ from exls.shared.adapters.http.commands import (
     StreamingGetRequestCommand,
 )
 from exls.shared.core.ports.command import CommandError
+from tests.support.http import FaultInjectingServer, ScriptedResponse
 
 
 class SampleModel(BaseModel):
@@ -18,8 +20,10 @@ class SampleModel(BaseModel):
 
 
 class _TestStreamingCommand(StreamingGetRequestCommand[SampleModel]):
-    def __init__(self, url: str, token: str):
-        super().__init__(model=SampleModel)
+    def __init__(
+        self, url: str, token: str, read_timeout_seconds: Optional[float] = None
+    ):
+        super().__init__(model=SampleModel, read_timeout_seconds=read_timeout_seconds)
         self._url = url
         self._token = token
 
@@ -203,3 +207,24 @@ def test_streaming_command_connection_error_during_iteration(
 
     assert len(result) == 1
     assert result[0].name == "a"
+
+
+def test_streaming_command_ends_after_the_read_timeout() -> None:
+    released: threading.Event = threading.Event()
+
+    def _quiet_after_one_line() -> Iterator[Dict[str, str]]:
+        yield {"name": "event1", "value": "val1"}
+        released.wait(timeout=5)
+
+    server: FaultInjectingServer = FaultInjectingServer().start()
+    server.script("/stream", ScriptedResponse(ndjson_lines=_quiet_after_one_line()))
+    try:
+        command = _TestStreamingCommand(
+            f"{server.url}/stream", "token123", read_timeout_seconds=0.2
+        )
+        result = list(command.execute())
+    finally:
+        released.set()
+        server.stop()
+
+    assert [event.name for event in result] == ["event1"]
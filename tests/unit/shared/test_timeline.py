@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from exls.shared.core.parallel import execute_concurrently, execute_in_parallel
+from exls.shared.core.timeline import PhaseTimeline, record_api_call
+
+
+def _call(item: int) -> int:
+    record_api_call()
+    return item
+
+
+async def _call_in_thread(item: int) -> int:
+    return await asyncio.to_thread(_call, item)
+
+
+class TestPhaseTimeline:
+    def test_counts_the_calls_of_each_phase(self) -> None:
+        timeline: PhaseTimeline = PhaseTimeline()
+
+        with timeline.phase("first", items=2):
+            record_api_call()
+            record_api_call()
+        record_api_call()
+        with timeline.phase("second"):
+            record_api_call()
+
+        assert [(p.name, p.items, p.api_calls) for p in timeline.phases] == [
+            ("first", 2, 2),
+            ("second", None, 1),
+        ]
+        assert all(p.duration_ms is not None for p in timeline.phases)
+
+    def test_counts_the_calls_of_workers(self) -> None:
+        timeline: PhaseTimeline = PhaseTimeline()
+
+        with timeline.phase("threads"):
+            execute_in_parallel(list(range(5)), _call, max_workers=3)
+        with timeline.phase("tasks"):
+            execute_concurrently(list(range(5)), _call_in_thread, max_concurrency=3)
+
+        assert [p.api_calls for p in timeline.phases] == [5, 5]
+
+    def test_records_the_error_of_a_failed_phase(self) -> None:
+        timeline: PhaseTimeline = PhaseTimeline()
+
+        with pytest.raises(ValueError):
+            with timeline.phase("failing"):
+                raise ValueError("boom")
+
+        assert timeline.phases[0].error == "ValueError"
+        assert timeline.phases[0].duration_ms is not None
@@ -0,0 +1,123 @@
+import io
+import json
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from pydantic import BaseModel
+from rich.console import Console
+
+from exls.shared.adapters.ui.output.output import TyperConsoleOutputManager
+from exls.shared.adapters.ui.output.values import OutputFormat
+from exls.shared.core.polling import SnapshotChanges, diff_snapshots
+
+
+class _Node(BaseModel):
+    id: str
+    status: str
+
+
+def _changes(*snapshots: List[_Node]) -> Iterator[SnapshotChanges[_Node]]:
+    previous: Dict[str, _Node] = {}
+    for snapshot in snapshots:
+        changes: SnapshotChanges[_Node] = diff_snapshots(
+            previous, {node.id: node for node in snapshot}
+        )
+        yield changes
+        previous = changes.snapshot
+
+
+def _output_manager(terminal: bool = False) -> TyperConsoleOutputManager[_Node]:
+    manager: TyperConsoleOutputManager[_Node] = TyperConsoleOutputManager()
+    manager.console = Console(
+        file=io.StringIO(), force_terminal=terminal, width=80, color_system=None
+    )
+    return manager
+
+
+def _output(manager: TyperConsoleOutputManager[_Node]) -> str:
+    file: Any = manager.console.file
+    return file.getvalue()
+
+
+@pytest.mark.unit
+class TestDisplayWatch:
+    def test_ndjson_emits_one_event_per_change(self) -> None:
+        manager = _output_manager()
+        a, b = _Node(id="a", status="pending"), _Node(id="b", status="ready")
+
+        manager.display_watch(
+            _changes([a], [a.model_copy(update={"status": "ready"}), b], [b]),
+            OutputFormat.NDJSON,
+        )
+
+        events: List[Dict[str, Any]] = [
+            json.loads(line) for line in _output(manager).splitlines()
+        ]
+        assert [(event["event"], event["id"]) for event in events] == [
+            ("added", "a"),
+            ("added", "b"),
+            ("changed", "a"),
+            ("removed", "a"),
+        ]
+        assert events[2]["object"]["status"] == "ready"
+
+    def test_ndjson_lines_are_not_wrapped(self) -> None:
+        manager = _output_manager()
+        node = _Node(id="a" * 200, status="pending")
+
+        manager.display_watch(_changes([node]), OutputFormat.NDJSON)
+
+        assert len(_output(manager).splitlines()) == 1
+
+    def test_other_formats_print_each_new_state(self) -> None:
+        manager = _output_manager()
+        a = _Node(id="a", status="pending")
+
+        manager.display_watch(
+            _changes([a], [a.model_copy(update={"status": "ready"})]),
+            OutputFormat.JSON,
+        )
+
+        assert _output(manager).count('"id": "a"') == 2
+
+    def test_live_table_shows_the_latest_state(self) -> None:
+        manager = _output_manager(terminal=True)
+        a, b = _Node(id="a", status="pending"), _Node(id="b", status="ready")
+
+        manager.display_watch(
+            _changes([a], [a.model_copy(update={"status": "ready"}), b]),
+            OutputFormat.TABLE,
+        )
+
+        output: str = _output(manager)
+        assert "1 added, 1 changed, 0 removed" in output
+        assert output.rindex("ready") > output.rindex("pending")
+
+    def test_shows_a_failed_refresh_and_keeps_going(self) -> None:
+        manager = _output_manager(terminal=True)
+        a = _Node(id="a", status="pending")
+
+        def _with_failure() -> Iterator[SnapshotChanges[_Node]]:
+            first: SnapshotChanges[_Node] = diff_snapshots({}, {"a": a})
+            yield first
+            yield SnapshotChanges(snapshot=first.snapshot, error="Backend down")
+            yield diff_snapshots(
+                first.snapshot, {"a": a.model_copy(update={"status": "ready"})}
+            )
+
+        manager.display_watch(_with_failure(), OutputFormat.TABLE)
+
+        output: str = _output(manager)
+        assert "trying again: Backend down" in output
+        assert output.rindex("ready") > output.rindex("Backend down")
+
+    def test_stops_on_ctrl_c(self) -> None:
+        manager = _output_manager()
+
+        def _interrupted() -> Iterator[SnapshotChanges[_Node]]:
+            yield from _changes([_Node(id="a", status="pending")])
+            raise KeyboardInterrupt
+
+        manager.display_watch(_interrupted(), OutputFormat.NDJSON)
+
+        assert '"added"' in _output(manager)
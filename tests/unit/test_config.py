@@ -0,0 +1,72 @@
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import pytest
+import yaml
+from filelock import FileLock
+
+from exls import config as cli_config
+from exls.config import AppConfig, ExalsiusYamlConfig, save_config
+
+
+@pytest.fixture
+def config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.setattr(cli_config, "CFG_DIR", tmp_path)
+    monkeypatch.setattr(cli_config, "CFG_FILE", tmp_path / "config.yaml")
+    monkeypatch.setattr(cli_config, "CONFIG_LOCK_FILE", tmp_path / "config.lock")
+    monkeypatch.setattr(
+        cli_config, "CONFIG_SNAPSHOT_FILE", tmp_path / "config.snapshot.json"
+    )
+    yield tmp_path
+
+
+def _load() -> Dict[str, Any]:
+    return ExalsiusYamlConfig(AppConfig)()
+
+
+@pytest.mark.unit
+class TestConfigFile:
+    def test_missing_config_file(self, config_dir: Path) -> None:
+        assert _load() == {}
+        assert not (config_dir / "config.snapshot.json").exists()
+
+    def test_save_and_load_round_trip(self, config_dir: Path) -> None:
+        save_config(AppConfig(backend_host="https://example.test"))
+
+        assert _load()["backend_host"] == "https://example.test"
+        assert not list(config_dir.glob(".config.yaml.*"))
+
+    def test_snapshot_skips_yaml_parsing(
+        self, config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (config_dir / "config.yaml").write_text("backend_host: https://a.test\n")
+        assert _load()["backend_host"] == "https://a.test"
+        assert (config_dir / "config.snapshot.json").exists()
+
+        def _fail(*args: Any, **kwargs: Any) -> Any:
+            raise AssertionError("YAML should not be parsed")
+
+        monkeypatch.setattr(yaml, "safe_load", _fail)
+        assert _load()["backend_host"] == "https://a.test"
+
+    def test_changed_file_invalidates_snapshot(self, config_dir: Path) -> None:
+        config_file: Path = config_dir / "config.yaml"
+        config_file.write_text("backend_host: https://a.test\n")
+        _load()
+
+        save_config(AppConfig(backend_host="https://b.test"))
+
+        assert _load()["backend_host"] == "https://b.test"
+
+    def test_corrupt_snapshot_is_ignored(self, config_dir: Path) -> None:
+        (config_dir / "config.yaml").write_text("backend_host: https://a.test\n")
+        (config_dir / "config.snapshot.json").write_text("{not json")
+
+        assert _load()["backend_host"] == "https://a.test"
+
+    def test_readers_do_not_take_the_lock(self, config_dir: Path) -> None:
+        (config_dir / "config.yaml").write_text("backend_host: https://a.test\n")
+        with FileLock(config_dir / "config.lock", timeout=0):
+            # Reading while a writer holds the lock must not block.
+            assert _load()["backend_host"] == "https://a.test"
+            assert (config_dir / "config.snapshot.json").exists()
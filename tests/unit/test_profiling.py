@@ -0,0 +1,79 @@
+import json
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from exls import profiling
+from exls.profiling import Profiler, enable_profiling, get_profiler, profile_span
+
+
+@pytest.fixture(autouse=True)
+def reset_profiler() -> Iterator[None]:
+    profiling.disable_profiling()
+    yield
+    profiling.disable_profiling()
+
+
+@pytest.mark.unit
+class TestProfiler:
+    def test_profile_span_is_noop_when_disabled(self) -> None:
+        with profile_span("load config"):
+            pass
+        assert get_profiler() is None
+
+    def test_enable_profiling_records_startup(self) -> None:
+        profiler: Profiler = enable_profiling()
+
+        assert enable_profiling() is profiler
+        assert [(s.category, s.name) for s in profiler.spans] == [
+            ("startup", "interpreter and imports")
+        ]
+
+    def test_profile_span_records_phase(self) -> None:
+        profiler: Profiler = enable_profiling()
+
+        with profile_span("load config"):
+            pass
+        with pytest.raises(ValueError):
+            with profile_span("ListNodesSdkCommand", "api"):
+                raise ValueError("boom")
+
+        spans = [(s.category, s.name) for s in profiler.spans]
+        assert ("phase", "load config") in spans
+        assert ("api", "ListNodesSdkCommand") in spans
+        assert all(s.duration_ms >= 0 for s in profiler.spans)
+
+    def test_spans_are_ordered_by_start(self) -> None:
+        profiler: Profiler = Profiler(origin=0.0)
+        profiler.record("second", "phase", 2.0, 3.0)
+        profiler.record("first", "phase", 1.0, 4.0)
+
+        assert [s.name for s in profiler.spans] == ["first", "second"]
+        assert profiler.spans[0].start_ms == 1000.0
+        assert profiler.spans[0].duration_ms == 3000.0
+
+    def test_render_waterfall(self) -> None:
+        profiler: Profiler = enable_profiling()
+        with profile_span("acquire access token"):
+            pass
+
+        waterfall: str = profiler.render_waterfall()
+
+        assert waterfall.startswith("exls profile - total")
+        assert "phase:acquire access token" in waterfall
+        assert "startup:interpreter and imports" in waterfall
+
+    def test_write_json(self, tmp_path: Path) -> None:
+        profiler: Profiler = enable_profiling()
+        with profile_span("display table", "render"):
+            pass
+
+        output: Path = tmp_path / "profile.json"
+        profiler.write_json(output)
+
+        data = json.loads(output.read_text())
+        assert data["total_ms"] > 0
+        assert {"name": "display table", "category": "render"}.items() <= data["spans"][
+            -1
+        ].items()
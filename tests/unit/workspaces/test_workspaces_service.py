@@ -1,4 +1,7 @@
+import threading
+import time
 from datetime import datetime
+from typing import Iterator, List, Optional
 from unittest.mock import Mock, call
 
 import pytest
@@ -10,6 +13,7 @@ from exls.workspaces.core.domain import (
     WorkerResources,
     Workspace,
     WorkspaceCluster,
+    WorkspaceClusterEvent,
     WorkspaceClusterStatus,
     WorkspaceGPUVendor,
     WorkspaceStatus,
@@ -27,7 +31,10 @@ from exls.workspaces.core.requests import (
     SingleNodeWorkerResourcesRequest,
     WorkerGroupResourcesRequest,
 )
-from exls.workspaces.core.service import WorkspacesService
+from exls.workspaces.core.service import (
+    WAKEUP_STREAM_IDLE_TIMEOUT_SECONDS,
+    WorkspacesService,
+)
 
 
 class TestWorkspacesService:
@@ -47,7 +54,9 @@ class TestWorkspacesService:
 
     @pytest.fixture
     def mock_clusters_provider(self) -> Mock:
-        return Mock(spec=ClustersProvider)
+        provider = Mock(spec=ClustersProvider)
+        provider.stream_cluster_events.return_value = iter([])
+        return provider
 
     @pytest.fixture
     def mock_templates_provider(self) -> Mock:
@@ -139,11 +148,19 @@ class TestWorkspacesService:
 
         service.delete_workspaces(workspace_ids)
 
-        assert mock_repository.delete.call_count == 2
-        mock_repository.delete.assert_has_calls(
-            [call(workspace_id="ws-1"), call(workspace_id="ws-2")]
+        assert mock_repository.delete_async.call_count == 2
+        mock_repository.delete_async.assert_has_calls(
+            [call(workspace_id="ws-1"), call(workspace_id="ws-2")], any_order=True
         )
 
+    def test_delete_workspaces_raises_failures(
+        self, service: WorkspacesService, mock_repository: Mock
+    ) -> None:
+        mock_repository.delete_async.side_effect = ServiceError("delete failed")
+
+        with pytest.raises(ServiceError, match="delete failed"):
+            service.delete_workspaces(["ws-1"])
+
     def test_get_cluster(
         self,
         service: WorkspacesService,
@@ -259,7 +276,7 @@ class TestWorkspacesService:
             update={"status": WorkspaceStatus.RUNNING}
         )
 
-        mock_repository.get.side_effect = [pending_workspace, running_workspace]
+        mock_repository.list.side_effect = [[pending_workspace], [running_workspace]]
 
         request = DeployWorkspaceRequest(
             cluster_id=sample_cluster.id,
@@ -274,7 +291,132 @@ class TestWorkspacesService:
         result = service.deploy_workspace(request, wait_for_ready=True)
 
         assert result.status == WorkspaceStatus.RUNNING
-        assert mock_repository.get.call_count == 2
+        assert mock_repository.list.call_count == 2
+        mock_repository.list.assert_called_with(cluster_id=sample_cluster.id)
+
+    def test_deploy_workspace_wait_for_ready_wakes_on_cluster_events(
+        self,
+        mock_operations: Mock,
+        mock_repository: Mock,
+        mock_clusters_provider: Mock,
+        mock_templates_provider: Mock,
+        sample_cluster: WorkspaceCluster,
+        sample_workspace: Workspace,
+    ) -> None:
+        # The interval is far longer than the test, so only the event can
+        # trigger the second check.
+        service = WorkspacesService(
+            workspace_creation_polling_config=ConfigWorkspaceCreationPolling(
+                timeout_seconds=30, polling_interval_seconds=30
+            ),
+            workspaces_operations=mock_operations,
+            workspaces_repository=mock_repository,
+            clusters_provider=mock_clusters_provider,
+            workspace_templates_provider=mock_templates_provider,
+        )
+        mock_clusters_provider.get_cluster.return_value = sample_cluster
+        mock_operations.deploy.return_value = sample_workspace.id
+        checked = threading.Event()
+        listings: List[List[Workspace]] = [
+            [sample_workspace.model_copy(update={"status": WorkspaceStatus.PENDING})],
+            [sample_workspace],
+        ]
+
+        def list_workspaces(cluster_id: str) -> List[Workspace]:
+            checked.set()
+            return listings.pop(0)
+
+        def stream_events(
+            cluster_id: str, idle_timeout_seconds: Optional[float] = None
+        ) -> Iterator[WorkspaceClusterEvent]:
+            checked.wait(timeout=5)
+            yield WorkspaceClusterEvent(
+                kind="Pod", name="test-ws-0", namespace="default", reason="Pulled"
+            )
+            yield WorkspaceClusterEvent(
+                kind="Pod", name="test-ws-0", namespace="default", reason="Started"
+            )
+            time.sleep(30)
+
+        mock_repository.list.side_effect = list_workspaces
+        mock_clusters_provider.stream_cluster_events.side_effect = stream_events
+
+        start: float = time.monotonic()
+        result = service.deploy_workspace(
+            DeployWorkspaceRequest(
+                cluster_id=sample_cluster.id,
+                workspace_name="test-ws",
+                template_id="jupyter",
+                template_variables={},
+                resources=WorkerResources(
+                    gpu_count=1, cpu_cores=2, memory_gb=4, storage_gb=10
+                ),
+            ),
+            wait_for_ready=True,
+        )
+
+        assert result.status == WorkspaceStatus.RUNNING
+        assert time.monotonic() - start < 5
+        mock_clusters_provider.stream_cluster_events.assert_called_once_with(
+            cluster_id=sample_cluster.id,
+            idle_timeout_seconds=WAKEUP_STREAM_IDLE_TIMEOUT_SECONDS,
+        )
+
+    def test_deploy_workspace_wait_for_ready_ignores_events_of_other_workspaces(
+        self,
+        mock_operations: Mock,
+        mock_repository: Mock,
+        mock_clusters_provider: Mock,
+        mock_templates_provider: Mock,
+        sample_cluster: WorkspaceCluster,
+        sample_workspace: Workspace,
+    ) -> None:
+        service = WorkspacesService(
+            workspace_creation_polling_config=ConfigWorkspaceCreationPolling(
+                timeout_seconds=1, polling_interval_seconds=30
+            ),
+            workspaces_operations=mock_operations,
+            workspaces_repository=mock_repository,
+            clusters_provider=mock_clusters_provider,
+            workspace_templates_provider=mock_templates_provider,
+        )
+        mock_clusters_provider.get_cluster.return_value = sample_cluster
+        mock_operations.deploy.return_value = sample_workspace.id
+        checked = threading.Event()
+
+        def list_workspaces(cluster_id: str) -> List[Workspace]:
+            checked.set()
+            return [
+                sample_workspace.model_copy(update={"status": WorkspaceStatus.PENDING})
+            ]
+
+        def stream_events(
+            cluster_id: str, idle_timeout_seconds: Optional[float] = None
+        ) -> Iterator[WorkspaceClusterEvent]:
+            checked.wait(timeout=5)
+            yield WorkspaceClusterEvent(
+                kind="Pod", name="other-ws-0", namespace="other-ws", reason="Started"
+            )
+
+        mock_repository.list.side_effect = list_workspaces
+        mock_clusters_provider.stream_cluster_events.side_effect = stream_events
+
+        with pytest.raises(ServiceError):
+            service.deploy_workspace(
+                DeployWorkspaceRequest(
+                    cluster_id=sample_cluster.id,
+                    workspace_name="test-ws",
+                    template_id="jupyter",
+                    template_variables={},
+                    resources=WorkerResources(
+                        gpu_count=1, cpu_cores=2, memory_gb=4, storage_gb=10
+                    ),
+                ),
+                wait_for_ready=True,
+            )
+
+        # Once after the deployment and once at the deadline.
+        assert mock_repository.list.call_count == 2
 
     def test_get_resources_for_single_node_worker(
         self,
@@ -554,7 +696,7 @@ class TestWorkspacesService:
         pending_workspace = sample_workspace.model_copy(
             update={"status": WorkspaceStatus.PENDING}
         )
-        mock_repository.get.return_value = pending_workspace
+        mock_repository.list.return_value = [pending_workspace]
 
         request = DeployWorkspaceRequest(
             cluster_id=sample_cluster.id,